@@ -2,6 +2,7 @@
 키워드 탐지 시스템 - 3단계 키워드 매칭
 """
 import csv
+import hashlib
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Set
@@ -44,12 +45,37 @@ class KeywordDetector:
 
         self.keywords = self._load_keywords(keywords_csv)
         self.patterns = self._load_patterns(patterns_csv)
+        self.ruleset_version = self._ruleset_version(keywords_csv, patterns_csv)
 
         # 티어별 키워드 인덱스
         self.tier1_keywords = [k for k in self.keywords if k['tier'] == '1']
         self.tier2_keywords = [k for k in self.keywords if k['tier'] == '2']
         self.tier3_keywords = [k for k in self.keywords if k['tier'] == '3']
 
+        # 탐지용으로 미리 변환한 규칙 (소문자 키워드, 정수 가중치) - 공고마다 다시 변환하지 않도록
+        self._compiled_tiers = {
+            tier: [(kw['keyword'], kw['keyword'].lower(), kw['category'], int(kw['weight'])) for kw in tier_keywords]
+            for tier, tier_keywords in ((1, self.tier1_keywords), (2, self.tier2_keywords), (3, self.tier3_keywords))
+        }
+        self._compiled_patterns = [
+            (
+                pattern,
+                pattern['keyword1'].lower(),
+                pattern['keyword2'].lower(),
+                (pattern.get('keyword3') or '').lower(),
+                int(pattern['weight']),
+            )
+            for pattern in self.patterns
+        ]
+
+    @staticmethod
+    def _ruleset_version(*csv_paths) -> str:
+        """규칙 파일(키워드/복합 패턴 CSV) 내용의 해시 - 같은 규칙이면 같은 값"""
+        digest = hashlib.sha256()
+        for csv_path in csv_paths:
+            digest.update(Path(csv_path).read_bytes())
+        return digest.hexdigest()[:12]
+
     def _load_keywords(self, csv_path: Path) -> List[Dict]:
         """CSV에서 키워드 로드"""
         keywords = []
@@ -70,9 +96,12 @@ class KeywordDetector:
 
     def _find_keyword_positions(self, text: str, keyword: str) -> List[int]:
         """텍스트에서 키워드 위치 찾기"""
+        return self._find_positions(text.lower(), keyword.lower())
+
+    @staticmethod
+    def _find_positions(text_lower: str, keyword_lower: str) -> List[int]:
+        """소문자로 변환된 텍스트에서 키워드 위치 찾기 (겹치는 출현 포함)"""
         positions = []
-        text_lower = text.lower()
-        keyword_lower = keyword.lower()
         start = 0
 
         while True:
@@ -84,69 +113,44 @@ class KeywordDetector:
 
         return positions
 
-    def detect_tier1(self, text: str) -> List[KeywordMatch]:
-        """1차 키워드 탐지 (기술 분야)"""
+    def _detect_tier(self, text_lower: str, tier: int) -> List[KeywordMatch]:
+        """소문자로 변환된 텍스트에서 티어별 키워드 탐지"""
         matches = []
 
-        for kw in self.tier1_keywords:
-            keyword = kw['keyword']
-            positions = self._find_keyword_positions(text, keyword)
-
-            if positions:
-                matches.append(KeywordMatch(
-                    keyword=keyword,
-                    tier=1,
-                    category=kw['category'],
-                    weight=int(kw['weight']),
-                    positions=positions
-                ))
+        for keyword, keyword_lower, category, weight in self._compiled_tiers[tier]:
+            if keyword_lower not in text_lower:
+                continue
+            matches.append(KeywordMatch(
+                keyword=keyword,
+                tier=tier,
+                category=category,
+                weight=weight,
+                positions=self._find_positions(text_lower, keyword_lower)
+            ))
 
         return matches
 
+    def detect_tier1(self, text: str) -> List[KeywordMatch]:
+        """1차 키워드 탐지 (기술 분야)"""
+        return self._detect_tier(text.lower(), 1)
+
     def detect_tier2(self, text: str) -> List[KeywordMatch]:
         """2차 키워드 탐지 (의심 패턴)"""
-        matches = []
-
-        for kw in self.tier2_keywords:
-            keyword = kw['keyword']
-            positions = self._find_keyword_positions(text, keyword)
-
-            if positions:
-                matches.append(KeywordMatch(
-                    keyword=keyword,
-                    tier=2,
-                    category=kw['category'],
-                    weight=int(kw['weight']),
-                    positions=positions
-                ))
-
-        return matches
+        return self._detect_tier(text.lower(), 2)
 
     def detect_tier3(self, text: str) -> List[KeywordMatch]:
         """3차 키워드 탐지 (위험 키워드)"""
-        matches = []
-
-        for kw in self.tier3_keywords:
-            keyword = kw['keyword']
-            positions = self._find_keyword_positions(text, keyword)
-
-            if positions:
-                matches.append(KeywordMatch(
-                    keyword=keyword,
-                    tier=3,
-                    category=kw['category'],
-                    weight=int(kw['weight']),
-                    positions=positions
-                ))
-
-        return matches
+        return self._detect_tier(text.lower(), 3)
 
     def detect_complex_patterns(self, text: str) -> List[PatternMatch]:
         """복합 패턴 탐지 (AND/OR 조합)"""
+        return self._detect_patterns(text.lower())
+
+    def _detect_patterns(self, text_lower: str) -> List[PatternMatch]:
+        """소문자로 변환된 텍스트에서 복합 패턴 탐지"""
         matches = []
-        text_lower = text.lower()
 
-        for pattern in self.patterns:
+        for pattern, kw1_lower, kw2_lower, kw3_lower, weight in self._compiled_patterns:
             kw1 = pattern['keyword1']
             kw2 = pattern['keyword2']
             kw3 = pattern.get('keyword3', '')
@@ -154,16 +158,16 @@ class KeywordDetector:
             op2 = pattern.get('operator2', '')
 
             # 기본 2-키워드 패턴
-            if kw1.lower() in text_lower and kw2.lower() in text_lower:
+            if kw1_lower in text_lower and kw2_lower in text_lower:
                 if op1 == 'AND':
                     # 3-키워드 패턴 확인
                     if kw3 and op2 == 'AND':
-                        if kw3.lower() in text_lower:
+                        if kw3_lower in text_lower:
                             matches.append(PatternMatch(
                                 pattern_id=pattern['pattern_id'],
                                 pattern_name=pattern['pattern_name'],
                                 keywords=[kw1, kw2, kw3],
-                                weight=int(pattern['weight']),
+                                weight=weight,
                                 description=pattern['description']
                             ))
                     else:
@@ -176,7 +180,7 @@ class KeywordDetector:
                             pattern_id=pattern['pattern_id'],
                             pattern_name=pattern['pattern_name'],
                             keywords=keywords,
-                            weight=int(pattern['weight']),
+                            weight=weight,
                             description=pattern['description']
                         ))
 
@@ -203,12 +207,13 @@ class KeywordDetector:
             job_info.get('detail', '')[:2000]  # detail은 앞부분만
         ]
         full_text = ' '.join([t for t in text_parts if t])
+        text_lower = full_text.lower()
 
         # 각 티어별 탐지
-        tier1_matches = self.detect_tier1(full_text)
-        tier2_matches = self.detect_tier2(full_text)
-        tier3_matches = self.detect_tier3(full_text)
-        pattern_matches = self.detect_complex_patterns(full_text)
+        tier1_matches = self._detect_tier(text_lower, 1)
+        tier2_matches = self._detect_tier(text_lower, 2)
+        tier3_matches = self._detect_tier(text_lower, 3)
+        pattern_matches = self._detect_patterns(text_lower)
 
         # 결과 구성
         result = {
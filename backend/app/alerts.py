@@ -0,0 +1,129 @@
+"""
+실시간 위험 공고 알림 허브
+구독자(SSE/WebSocket 연결)마다 큐를 두고, 새 분석 결과를 한 번 조회해 모든 구독자에게 나눠준다
+
+크롤러/파이프라인은 API와 다른 프로세스에서 DB에 저장하므로, 허브가 risk_analysis를 id 순으로
+poll_interval초마다 한 번 읽어 발행한다 (구독자 수와 관계없이 한 쿼리). 같은 프로세스의 분석 경로는
+publish()로 바로 발행할 수 있다. 이벤트 id는 risk_analysis.id이므로 Last-Event-ID로 이어받을 수 있다.
+"""
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.database.repositories import AnalysisRepository
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 읽는 최대 분석 결과 수 (가득 차면 대기 없이 이어서 조회)
+POLL_BATCH = 200
+
+
+class AlertFilter:
+    """위험도/사이트/키워드 조건 (비어 있는 조건은 모두 통과)"""
+
+    def __init__(self, risk_levels: Iterable[str] = (), sites: Iterable[str] = (), keywords: Iterable[str] = ()):
+        self.risk_levels = set(risk_levels)
+        self.sites = set(sites)
+        self.keywords = [keyword for keyword in keywords if keyword]
+
+    def matches(self, alert: Dict) -> bool:
+        if self.risk_levels and alert["risk_level"] not in self.risk_levels:
+            return False
+        if self.sites and alert["source_site"] not in self.sites:
+            return False
+        if self.keywords:
+            haystack = [*alert.get("keywords", []), alert.get("search_keyword") or "", alert.get("title") or ""]
+            if not any(keyword in text for keyword in self.keywords for text in haystack):
+                return False
+        return True
+
+
+class AlertHub:
+    """
+    분석 결과 pub/sub
+
+    Args:
+        poll_interval: DB에서 새 분석 결과를 확인하는 주기 (초)
+        queue_size: 구독자별 대기 큐 크기 (가득 차면 연결을 끊고 클라이언트가 Last-Event-ID로 재연결)
+    """
+
+    def __init__(self, poll_interval: float = 1.0, queue_size: int = 1000):
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self.last_id = 0
+        self._subscribers: List[asyncio.Queue] = []
+        self._task: Optional[asyncio.Task] = None
+        self._repo = AnalysisRepository()
+
+    async def subscribe(self) -> asyncio.Queue:
+        """구독 시작 (첫 구독자가 생기면 DB 확인 작업 시작)"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.append(queue)
+        if self._task is None or self._task.done():
+            self.last_id = await run_in_threadpool(self._repo.get_latest_analysis_id)
+            self._task = asyncio.create_task(self._poll_loop())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def publish(self, alert: Dict):
+        """
+        알림 발행 (이벤트 루프 스레드에서 호출)
+
+        대기 큐가 가득 찬 구독자는 None을 받고 연결이 종료된다.
+        """
+        self.last_id = max(self.last_id, alert["id"])
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(alert)
+            except asyncio.QueueFull:
+                self.unsubscribe(queue)
+                queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def _poll_loop(self):
+        while self._subscribers:
+            try:
+                alerts = await run_in_threadpool(self._repo.get_alerts_after, self.last_id, POLL_BATCH)
+                for alert in alerts:
+                    self.publish(alert)
+                if len(alerts) == POLL_BATCH:
+                    continue
+            except Exception:
+                logger.exception("알림 조회 실패")
+            await asyncio.sleep(self.poll_interval)
+        self._task = None
+
+    async def backlog(self, last_event_id: int, until_id: int,
+                      alert_filter: Optional[AlertFilter] = None) -> AsyncIterator[Dict]:
+        """
+        재연결한 클라이언트가 놓친 분석 결과 (last_event_id < id <= until_id, POLL_BATCH개씩 끝까지 조회)
+
+        위험도/사이트 조건은 DB에서 거르고, 키워드 조건은 호출한 쪽에서 alert_filter.matches()로 확인한다.
+        """
+        risk_levels = alert_filter.risk_levels if alert_filter else ()
+        sites = alert_filter.sites if alert_filter else ()
+        while last_event_id < until_id:
+            alerts = await run_in_threadpool(
+                self._repo.get_alerts_after, last_event_id, POLL_BATCH, until_id, risk_levels, sites
+            )
+            for alert in alerts:
+                yield alert
+            if len(alerts) < POLL_BATCH:
+                break
+            last_event_id = alerts[-1]["id"]
+
+
+_hub: Optional[AlertHub] = None
+
+
+def get_alert_hub() -> AlertHub:
+    """프로세스 공용 알림 허브"""
+    global _hub
+    if _hub is None:
+        _hub = AlertHub()
+    return _hub
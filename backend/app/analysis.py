@@ -0,0 +1,102 @@
+"""
+즉석 공고 분석 엔진 (POST /api/analyze)
+저장하지 않고 임의의 공고 텍스트를 키워드 탐지 + 위험도 분석한다
+
+- KeywordDetector/RiskScorer는 프로세스당 한 번만 만들어 재사용한다 (규칙 CSV 로드/변환은 시작 시 한 번)
+- 큰 배치는 프로세스 풀로 나눠 분석한다. 분석은 순수 파이썬 CPU 작업이라 스레드로는 GIL 때문에 빨라지지 않으며,
+  워커 프로세스도 시작할 때 엔진을 한 번 만들어 둔다
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from analyzers.keyword_detector import KeywordDetector
+from analyzers.risk_scorer import RiskScorer
+
+# 이 개수 이상인 배치는 프로세스 풀에서 분석 (그보다 작으면 프로세스 간 전달 비용이 더 큼)
+PARALLEL_MIN_BATCH = 500
+# 워커 프로세스에 한 번에 넘기는 공고 수
+POOL_CHUNK_SIZE = 100
+
+
+class AnalysisEngine:
+    """키워드 탐지 + 위험도 분석 (규칙을 미리 로드한 분석기 묶음)"""
+
+    def __init__(self):
+        self.detector = KeywordDetector()
+        self.scorer = RiskScorer()
+        self.ruleset_version = self.detector.ruleset_version
+
+    def analyze(self, job_info: Dict) -> Dict:
+        """
+        공고 하나 분석
+
+        Args:
+            job_info: 공고 정보 (title, company, location, salary, conditions, recruit_summary, detail)
+
+        Returns:
+            {"detection": {tier1~3_matches, pattern_matches, total_score, has_*}, "risk": {...}}
+        """
+        detection = self.detector.analyze(job_info)
+        risk = self.scorer.calculate_risk_score(detection)
+        detection.pop("job_info", None)
+        # 응답에 넣을 수 없는 enum과 탐지 결과를 다시 묶은 categories는 제외
+        risk.pop("risk_level_enum", None)
+        risk.pop("categories", None)
+        return {"detection": detection, "risk": risk}
+
+
+_engine: Optional[AnalysisEngine] = None
+_engine_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_analysis_engine() -> AnalysisEngine:
+    """프로세스 공용 분석 엔진 (처음 호출할 때 규칙 로드)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = AnalysisEngine()
+    return _engine
+
+
+def _analyze_chunk(jobs: List[Dict]) -> List[Dict]:
+    """워커 프로세스에서 실행되는 배치 분석"""
+    engine = get_analysis_engine()
+    return [engine.analyze(job_info) for job_info in jobs]
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=min(4, multiprocessing.cpu_count()),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=get_analysis_engine,
+            )
+        return _pool
+
+
+def analyze_many(jobs: List[Dict]) -> List[Dict]:
+    """
+    여러 공고 분석 (입력 순서 유지)
+
+    PARALLEL_MIN_BATCH개 이상이고 CPU가 여러 개면 프로세스 풀에서 POOL_CHUNK_SIZE개씩 나눠 분석한다.
+    """
+    if len(jobs) < PARALLEL_MIN_BATCH or multiprocessing.cpu_count() < 2:
+        return _analyze_chunk(jobs)
+    chunks = [jobs[i:i + POOL_CHUNK_SIZE] for i in range(0, len(jobs), POOL_CHUNK_SIZE)]
+    return [result for chunk_results in _get_pool().map(_analyze_chunk, chunks) for result in chunk_results]
+
+
+def shutdown_analysis_pool():
+    """분석 워커 프로세스 종료 (서버 종료 시)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
@@ -0,0 +1,45 @@
+"""
+즉석 분석 API 엔드포인트
+직접 찾은 공고 텍스트를 저장하지 않고 키워드 탐지 + 위험도 분석
+"""
+import time
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException
+
+from backend.app.analysis import analyze_many, get_analysis_engine
+from backend.app.schemas import AnalyzeRequest
+
+router = APIRouter()
+
+
+@router.post("/analyze")
+def analyze_jobs(request: AnalyzeRequest) -> Dict[str, Any]:
+    """
+    공고 하나 또는 여러 개 즉석 분석 (DB에 저장하지 않음)
+
+    Args:
+        request: {"job": {...}} 또는 {"jobs": [{...}, ...]}  # 필드: title, company, location, salary,
+                                                            #       conditions, recruit_summary, detail
+
+    Returns:
+        {
+            "ruleset_version": str,       # 탐지 규칙(키워드/복합 패턴 CSV) 버전
+            "result": {...},              # job으로 요청한 경우
+            "results": [{...}, ...],      # jobs로 요청한 경우 (요청 순서)
+            "elapsed_ms": float
+        }
+        결과 항목: {"detection": {tier1~3_matches, pattern_matches, total_score, ...}, "risk": {...}}
+    """
+    if (request.job is None) == (request.jobs is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of 'job' or 'jobs'")
+
+    engine = get_analysis_engine()
+    started = time.perf_counter()
+    if request.job is not None:
+        response = {"ruleset_version": engine.ruleset_version, "result": engine.analyze(request.job.model_dump())}
+    else:
+        results = analyze_many([job.model_dump() for job in request.jobs])
+        response = {"ruleset_version": engine.ruleset_version, "results": results}
+    response["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return response
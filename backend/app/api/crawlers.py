@@ -1,37 +1,22 @@
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from backend.app.dependencies import get_crawl_job_repo
 from backend.app.schemas import CrawlRequest
-from backend.cli import run_crawler, load_keywords
+from backend.database.repositories import CrawlJobRepository
 
 router = APIRouter()
 
-def background_crawl_task(site: str, keyword: str, max_jobs: int):
-    print(f"Starting background crawl for {site}...")
-    keywords = [keyword] if keyword else []
-    
-    if not keywords:
-         # Load defaults
-        keywords_data = load_keywords()
-        all_keywords = []
-        for category, kw_list in keywords_data.items():
-            all_keywords.extend(kw_list)
-        keywords = list(set(all_keywords))
-
-    # Determine industries
-    keywords_data = load_keywords()
-    industries = keywords_data.get("technology_fields", [])
-    
-    # Run
-    # Using a smaller max_companies logic for web triggers to be faster?
-    # Or respect user input.
-    max_companies = max(1, max_jobs // 10)
-    
-    run_crawler(site, keywords, industries, max_companies=max_companies, max_jobs_per_company=10, headless=True)
-    print(f"Background crawl for {site} finished.")
+SITES = ["jobkorea", "incruit", "alba", "albamon", "jobplanet", "jobposting", "worknet", "saramin", "hibrain", "blind"]
+JOB_STATUSES = ["pending", "running", "done", "failed", "cancelled"]
+
 
 @router.post("/crawlers/crawl")
-def trigger_crawl(request: CrawlRequest, background_tasks: BackgroundTasks):
+def trigger_crawl(request: CrawlRequest, crawl_job_repo: CrawlJobRepository = Depends(get_crawl_job_repo)):
     """
-    크롤러 실행 (백그라운드)
+    크롤링 작업 등록 (crawl_worker.py 워커 프로세스가 실행)
+
+    같은 조건(사이트, 키워드, 최대 개수)의 작업이 아직 대기 중이면 새로 만들지 않고 그 작업을 반환한다.
 
     Args:
         request: {
@@ -41,10 +26,57 @@ def trigger_crawl(request: CrawlRequest, background_tasks: BackgroundTasks):
         }
 
     Returns:
-        {"message": str, "status": str}
+        {"message": str, "status": "queued", "jobs": [작업, ...]}  # all이면 사이트별 작업
     """
-    if request.site not in ["jobkorea", "incruit", "alba", "albamon", "jobplanet", "jobposting", "worknet", "saramin", "hibrain", "blind", "all"]:
+    if request.site not in SITES + ["all"]:
         raise HTTPException(status_code=400, detail="Invalid site")
 
-    background_tasks.add_task(background_crawl_task, request.site, request.keyword, request.max_jobs)
-    return {"message": f"Crawler for {request.site} started in background", "status": "processing"}
+    sites = SITES if request.site == "all" else [request.site]
+    jobs = []
+    for site in sites:
+        job, created = crawl_job_repo.enqueue(site, request.keyword, request.max_jobs)
+        jobs.append({**job, "deduplicated": not created})
+
+    return {"message": f"Crawler for {request.site} queued", "status": "queued", "jobs": jobs}
+
+
+@router.get("/crawlers/jobs")
+def list_crawl_jobs(
+    status: Optional[str] = Query(None, description="작업 상태 필터 (pending, running, done, failed, cancelled)"),
+    limit: int = Query(50, ge=1, le=500, description="조회할 작업 수"),
+    crawl_job_repo: CrawlJobRepository = Depends(get_crawl_job_repo),
+):
+    """크롤링 작업 목록 (최신순)"""
+    if status and status not in JOB_STATUSES:
+        raise HTTPException(status_code=400, detail="Invalid status")
+    return crawl_job_repo.list_jobs(status, limit)
+
+
+@router.get("/crawlers/jobs/{job_id}")
+def get_crawl_job(job_id: int, crawl_job_repo: CrawlJobRepository = Depends(get_crawl_job_repo)):
+    """
+    크롤링 작업 상태 조회
+
+    Returns:
+        {"id", "site", "keyword", "max_jobs", "status", "cancel_requested", "worker",
+         "progress", "result", "error", "created_at", "started_at", "heartbeat_at", "finished_at"}
+    """
+    job = crawl_job_repo.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Crawl job not found")
+    return job
+
+
+@router.post("/crawlers/jobs/{job_id}/cancel")
+def cancel_crawl_job(job_id: int, crawl_job_repo: CrawlJobRepository = Depends(get_crawl_job_repo)):
+    """
+    크롤링 작업 취소
+
+    대기 중인 작업은 즉시 취소되고, 실행 중인 작업은 워커가 다음 확인 주기에 프로세스를 종료한다.
+    """
+    job = crawl_job_repo.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Crawl job not found")
+    if job["status"] not in ("pending", "running"):
+        raise HTTPException(status_code=409, detail=f"Crawl job already {job['status']}")
+    return crawl_job_repo.request_cancel(job_id)
@@ -1,95 +1,397 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional, Dict, Any
-from backend.database.repositories import JobRepository, AnalysisRepository
-from backend.app.schemas import JobResponse
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Iterator, List, Optional, Dict, Any
+from datetime import datetime
+from backend.database.connection import DatabaseConnection
+from backend.database.repositories import JobRepository
+from backend.app.dependencies import get_job_repo
+from backend.app.facets import get_facet_index
+from backend.app.schemas import JobBatchRequest, JobListItem, JobSearchResponse
+import csv
+import io
 import json
 
 router = APIRouter()
-job_repo = JobRepository()
-analysis_repo = AnalysisRepository()
 
-@router.get("/jobs", response_model=List[JobResponse])
+# fields 파라미터로 선택할 수 있는 필드 → SQL 컬럼
+JOB_FIELDS = {
+    name: f"j.{name}" for name in (
+        "title", "company", "location", "salary", "conditions", "recruit_summary", "detail", "url",
+        "posted_date", "source_site", "search_keyword", "crawled_at", "crawled_date", "crawled_weekday",
+        "crawled_hour",
+    )
+}
+RISK_FIELDS = {
+    name: f"r.{name}" for name in (
+        "base_score", "combo_multiplier", "final_score", "risk_level", "risk_factors", "recommendations",
+        "analysis_summary",
+    )
+}
+RISK_JSON_FIELDS = ("risk_factors", "recommendations")
+# 상세 응답의 risk_analysis 필드
+RISK_DETAIL_FIELDS = (
+    "base_score", "combo_multiplier", "final_score", "risk_level", "risk_factors", "recommendations",
+    "analysis_summary",
+)
+
+# fields 미지정 시 목록 기본 필드 (JobListItem)
+LIST_FIELDS = (
+    "title", "company", "location", "salary", "url", "posted_date", "source_site", "search_keyword",
+    "crawled_at", "final_score", "risk_level",
+)
+
+
+# 내보내기 기본 필드 (fields 미지정 시, keywords/patterns는 항상 포함)
+EXPORT_FIELDS = LIST_FIELDS + ("base_score", "combo_multiplier", "analysis_summary")
+# 내보내기에서 한 번에 읽어 전송하는 행 수
+EXPORT_CHUNK_SIZE = 1000
+# 공고별 키워드/패턴 매칭 집계 (행마다 job_id 인덱스로 조회하므로 전체 결과를 모으지 않고 흘려보낸다)
+EXPORT_MATCH_COLUMNS = """
+    (SELECT GROUP_CONCAT(keyword, '|') FROM (
+        SELECT keyword FROM keyword_matches WHERE job_id = j.id ORDER BY tier, weight DESC
+    )) AS keywords,
+    (SELECT GROUP_CONCAT(pattern_name, '|') FROM (
+        SELECT pattern_name FROM pattern_matches WHERE job_id = j.id ORDER BY weight DESC
+    )) AS patterns
+"""
+
+
+def _parse_fields(fields: Optional[str], default: tuple = LIST_FIELDS) -> List[str]:
+    """fields 파라미터 검증 (쉼표 구분, 알 수 없는 필드는 400)"""
+    if not fields:
+        return list(default)
+    names = [name.strip() for name in fields.split(",") if name.strip() and name.strip() != "id"]
+    unknown = [name for name in names if name not in JOB_FIELDS and name not in RISK_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: id, {', '.join([*JOB_FIELDS, *RISK_FIELDS])})"
+        )
+    return list(dict.fromkeys(names))
+
+
+@router.get("/jobs", response_model=List[JobListItem])
 def get_jobs(
     limit: int = 50,
     skip: int = 0,
-    risk_level: Optional[str] = None
+    risk_level: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분, 예: title,company,final_score)"),
+    job_repo: JobRepository = Depends(get_job_repo),
 ):
     """
     공고 목록 조회 (JOIN으로 N+1 쿼리 해결)
 
+    목록에는 본문(detail, conditions, recruit_summary)을 포함하지 않으며, 요청한 필드만 SELECT 한다.
+
     Args:
         limit: 조회할 공고 개수 (기본값: 50)
         skip: 건너뛸 공고 개수 (기본값: 0)
         risk_level: 위험도 필터 (고위험, 중위험, 저위험)
+        fields: 반환할 필드 (미지정 시 JobListItem 필드, 위험도 필드는 risk_analysis 아래에 반환)
 
     Returns:
-        공고 목록 (위험도 분석 포함)
+        공고 목록 (위험도 요약 포함)
     """
+    names = _parse_fields(fields)
+    job_names = [name for name in names if name in JOB_FIELDS]
+    risk_names = [name for name in names if name in RISK_FIELDS]
+
+    columns = ["j.id"] + [JOB_FIELDS[name] for name in job_names]
+    if risk_names:
+        columns += ["r.job_id AS risk_job_id"] + [RISK_FIELDS[name] for name in risk_names]
+    where = "WHERE r.risk_level = ?" if risk_level else ""
+    params = ([risk_level] if risk_level else []) + [limit, skip]
+
     with job_repo.db as conn:
         cursor = conn.cursor()
-
-        # JOIN으로 한번에 조회 (N+1 쿼리 해결)
-        if risk_level:
-            cursor.execute("""
-                SELECT
-                    j.*,
-                    r.id as risk_id,
-                    r.base_score,
-                    r.combo_multiplier,
-                    r.final_score,
-                    r.risk_level,
-                    r.risk_factors,
-                    r.recommendations,
-                    r.analysis_summary
-                FROM jobs j
-                LEFT JOIN risk_analysis r ON j.id = r.job_id
-                WHERE r.risk_level = ?
-                ORDER BY j.crawled_at DESC
-                LIMIT ? OFFSET ?
-            """, (risk_level, limit, skip))
-        else:
-            cursor.execute("""
-                SELECT
-                    j.*,
-                    r.id as risk_id,
-                    r.base_score,
-                    r.combo_multiplier,
-                    r.final_score,
-                    r.risk_level,
-                    r.risk_factors,
-                    r.recommendations,
-                    r.analysis_summary
-                FROM jobs j
-                LEFT JOIN risk_analysis r ON j.id = r.job_id
-                ORDER BY j.crawled_at DESC
-                LIMIT ? OFFSET ?
-            """, (limit, skip))
+        cursor.execute(f"""
+            SELECT {', '.join(columns)}
+            FROM jobs j
+            LEFT JOIN risk_analysis r ON j.id = r.job_id
+            {where}
+            ORDER BY j.crawled_at DESC
+            LIMIT ? OFFSET ?
+        """, params)
 
         results = []
         for row in cursor.fetchall():
-            job_dict = dict(row)
-
-            # risk_analysis 분리
-            risk_data = None
-            if job_dict.get('risk_id'):
-                risk_data = {
-                    'base_score': job_dict.pop('base_score'),
-                    'combo_multiplier': job_dict.pop('combo_multiplier'),
-                    'final_score': job_dict.pop('final_score'),
-                    'risk_level': job_dict.pop('risk_level'),
-                    'risk_factors': json.loads(job_dict.pop('risk_factors', '[]')),
-                    'recommendations': json.loads(job_dict.pop('recommendations', '[]')),
-                    'analysis_summary': job_dict.pop('analysis_summary', '')
-                }
-                job_dict.pop('risk_id')
-
-            job_dict['risk_analysis'] = risk_data
+            job_dict = {"id": row["id"], **{name: row[name] for name in job_names}}
+            if risk_names:
+                risk_data = None
+                if row["risk_job_id"] is not None:
+                    risk_data = {name: row[name] for name in risk_names}
+                    for name in RISK_JSON_FIELDS:
+                        if name in risk_data:
+                            risk_data[name] = json.loads(risk_data[name] or "[]")
+                job_dict["risk_analysis"] = risk_data
             results.append(job_dict)
 
+    if fields:
+        # 선택 필드 응답은 JobListItem 검증 없이 그대로 반환
+        return JSONResponse(content=jsonable_encoder(results))
     return results
 
+
+def _export_chunks(db: DatabaseConnection, sql: str, params: list, names: List[str],
+                   export_format: str) -> Iterator[str]:
+    """
+    내보내기 쿼리 결과를 EXPORT_CHUNK_SIZE행씩 읽어 NDJSON/CSV 문자열로 반환
+
+    응답을 보내는 동안 커서를 열어 두고 조금씩 읽으므로 메모리 사용량은 행 수와 무관하다.
+    """
+    # StreamingResponse는 청크마다 다른 스레드에서 이 제너레이터를 진행할 수 있다
+    conn = db.get_connection(check_same_thread=False)
+    try:
+        cursor = conn.execute(sql, params)
+        columns = ["id", *names, "keywords", "patterns"]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == "csv":
+            writer.writerow(columns)
+            # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+            yield "\ufeff" + buffer.getvalue()
+
+        while True:
+            rows = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+            if not rows:
+                break
+            buffer.seek(0)
+            buffer.truncate()
+            for row in rows:
+                if export_format == "csv":
+                    writer.writerow([row[column] for column in columns])
+                    continue
+                record = {column: row[column] for column in columns}
+                for name in RISK_JSON_FIELDS:
+                    if name in record and record[name] is not None:
+                        record[name] = json.loads(record[name])
+                record["keywords"] = row["keywords"].split("|") if row["keywords"] else []
+                record["patterns"] = row["patterns"].split("|") if row["patterns"] else []
+                buffer.write(json.dumps(record, ensure_ascii=False))
+                buffer.write("\n")
+            yield buffer.getvalue()
+    finally:
+        conn.close()
+
+
+@router.get("/jobs/export")
+def export_jobs(
+    format: str = Query("ndjson", description="ndjson 또는 csv"),
+    fields: Optional[str] = Query(None, description="내보낼 필드 (쉼표 구분, 미지정 시 목록 필드 + 위험도 점수)"),
+    risk_level: List[str] = Query([], description="위험도 필터 (반복 지정 가능)"),
+    site: List[str] = Query([], description="사이트 필터 (반복 지정 가능)"),
+    keyword: Optional[str] = Query(None, description="검색 키워드 필터"),
+    min_score: Optional[float] = Query(None, description="최소 위험도 점수"),
+    date_from: Optional[str] = Query(None, description="수집일 시작 (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, description="수집일 끝 (YYYY-MM-DD)"),
+    after_id: int = Query(0, ge=0, description="이 ID 이후의 공고만 (이어받기/증분 내보내기)"),
+    limit: Optional[int] = Query(None, ge=1, description="최대 행 수"),
+    job_repo: JobRepository = Depends(get_job_repo),
+):
+    """
+    공고 + 분석 결과 대량 내보내기 (스트리밍)
+
+    공고 ID 순으로 내보내며, 키워드/패턴 매칭은 SQL에서 공고별로 집계해 keywords/patterns 열로 붙인다.
+
+    Returns:
+        ndjson: 한 줄에 공고 하나 ({"id", ...fields, "keywords": [...], "patterns": [...]})
+        csv: 헤더 + 공고별 행 (keywords/patterns는 | 로 구분)
+    """
+    if format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=400, detail="format은 ndjson 또는 csv만 지원합니다")
+    names = _parse_fields(fields, default=EXPORT_FIELDS)
+
+    columns = ["j.id"] + [JOB_FIELDS.get(name) or RISK_FIELDS[name] for name in names]
+    conditions = ["j.id > ?"]
+    params: list = [after_id]
+    if risk_level:
+        conditions.append(f"r.risk_level IN ({', '.join('?' * len(risk_level))})")
+        params.extend(risk_level)
+    if site:
+        conditions.append(f"j.source_site IN ({', '.join('?' * len(site))})")
+        params.extend(site)
+    if keyword:
+        conditions.append("j.id IN (SELECT job_id FROM job_search_keywords WHERE keyword = ?)")
+        params.append(keyword)
+    if min_score is not None:
+        conditions.append("r.final_score >= ?")
+        params.append(min_score)
+    if date_from:
+        conditions.append("j.crawled_date >= ?")
+        params.append(date_from)
+    if date_to:
+        conditions.append("j.crawled_date <= ?")
+        params.append(date_to)
+
+    # ID(rowid) 순서라 정렬용 임시 테이블 없이 인덱스 순서대로 읽는다
+    sql = f"""
+        SELECT {', '.join(columns)}, {EXPORT_MATCH_COLUMNS}
+        FROM jobs j
+        LEFT JOIN risk_analysis r ON j.id = r.job_id
+        WHERE {' AND '.join(conditions)}
+        ORDER BY j.id
+    """
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    media_type = "text/csv; charset=utf-8" if format == "csv" else "application/x-ndjson"
+    filename = f"jobs_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
+    return StreamingResponse(
+        _export_chunks(job_repo.db, sql, params, names, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/jobs/search", response_model=JobSearchResponse)
+def search_jobs(
+    site: List[str] = Query([], description="사이트 (source_site, 반복 지정 시 OR)"),
+    search_keyword: List[str] = Query([], description="수집 검색 키워드 (반복 지정 시 OR)"),
+    risk_level: List[str] = Query([], description="위험도 (반복 지정 시 OR)"),
+    keyword: List[str] = Query([], description="매칭된 탐지 키워드 (반복 지정 시 OR)"),
+    category: List[str] = Query([], description="매칭된 키워드 카테고리 (반복 지정 시 OR)"),
+    date_from: Optional[str] = Query(None, description="수집일 시작 (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, description="수집일 끝 (YYYY-MM-DD)"),
+    limit: int = Query(50, ge=0, le=200, description="조회할 공고 개수 (0이면 개수만)"),
+    skip: int = Query(0, ge=0, description="건너뛸 공고 개수"),
+    counts: bool = Query(True, description="패싯 값별 개수 포함 여부"),
+    job_repo: JobRepository = Depends(get_job_repo),
+):
+    """
+    패싯 검색 (조합 필터 + 패싯 값별 개수)
+
+    필터와 개수는 메모리 패싯 인덱스(app/facets.py)에서 계산하고, DB에서는 현재 페이지의 공고만 ID로 읽는다.
+    다른 패싯끼리는 AND, 같은 패싯의 여러 값은 OR로 결합하며, 각 패싯의 개수에는 그 패싯 자신의 선택을 적용하지 않는다.
+
+    Returns:
+        {
+            "total": int,                           # 필터에 맞는 공고 수
+            "items": [JobListItem, ...],            # 최신 공고(ID 내림차순)부터
+            "facets": {"site": {"saramin": 120, ...}, "search_keyword": {...}, "risk_level": {...},
+                       "keyword": {...}, "category": {...}, "crawled_date": {"2024-01-15": 30, ...}}
+        }
+    """
+    filters = {
+        "site": site, "search_keyword": search_keyword, "risk_level": risk_level,
+        "keyword": keyword, "category": category,
+    }
+    result = get_facet_index().search(filters, date_from, date_to, offset=skip, limit=limit, with_counts=counts)
+
+    items = []
+    if result["ids"]:
+        with job_repo.db as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT j.id, {', '.join(JOB_FIELDS[name] for name in LIST_FIELDS if name in JOB_FIELDS)},
+                       r.job_id AS risk_job_id, r.final_score, r.risk_level
+                FROM jobs j
+                LEFT JOIN risk_analysis r ON j.id = r.job_id
+                WHERE j.id IN ({', '.join('?' * len(result['ids']))})
+            """, result["ids"])
+            rows = {row["id"]: row for row in cursor.fetchall()}
+        for job_id in result["ids"]:
+            row = rows.get(job_id)
+            if row is None:
+                continue  # 인덱스 갱신 전에 삭제된 공고
+            job_dict = {name: row[name] for name in row.keys() if name not in RISK_FIELDS and name != "risk_job_id"}
+            job_dict["risk_analysis"] = (
+                {"final_score": row["final_score"], "risk_level": row["risk_level"]}
+                if row["risk_job_id"] is not None else None
+            )
+            items.append(job_dict)
+
+    return {"total": result["total"], "items": items, "facets": result.get("facets")}
+
+
+def _risk_detail(row) -> Dict[str, Any]:
+    """risk_analysis 행 → 상세 응답의 risk_analysis (JSON 필드 파싱)"""
+    risk_data = {field: row[field] for field in RISK_DETAIL_FIELDS}
+    risk_data['risk_factors'] = json.loads(risk_data['risk_factors'] or '[]')
+    risk_data['recommendations'] = json.loads(risk_data['recommendations'] or '[]')
+    risk_data['analysis_summary'] = risk_data['analysis_summary'] or ''
+    return risk_data
+
+
+def _pattern_detail(row) -> Dict[str, Any]:
+    """pattern_matches 행 → 상세 응답의 패턴 매칭 항목"""
+    pattern_dict = {field: row[field] for field in ("pattern_name", "keywords", "weight", "description")}
+    pattern_dict['keywords'] = json.loads(pattern_dict['keywords'])
+    return pattern_dict
+
+
+@router.post("/jobs/batch")
+def get_job_details_batch(request: JobBatchRequest, job_repo: JobRepository = Depends(get_job_repo)) -> Dict[str, Any]:
+    """
+    공고 일괄 상세 조회 (검토 목록/상세 패널용)
+
+    공고 수와 관계없이 IN 목록 쿼리 4번(공고, 위험도, 키워드 매칭, 패턴 매칭)으로 조회한 뒤 공고별로 묶는다.
+
+    Args:
+        request: {"ids": [int, ...]}  # 최대 200개
+
+    Returns:
+        {
+            "jobs": [{"job", "risk_analysis", "keyword_matches", "pattern_matches"}, ...],  # 요청 순서, GET /jobs/{job_id}와 같은 구조
+            "not_found": [int, ...]                                                          # 없는 ID
+        }
+    """
+    ids = list(dict.fromkeys(request.ids))
+    placeholders = ", ".join("?" * len(ids))
+
+    with job_repo.db as conn:
+        cursor = conn.cursor()
+
+        # 1. 공고 기본 정보
+        cursor.execute(f"SELECT * FROM jobs WHERE id IN ({placeholders})", ids)
+        details = {
+            row['id']: {"job": dict(row), "risk_analysis": None, "keyword_matches": [], "pattern_matches": []}
+            for row in cursor.fetchall()
+        }
+
+        # 2. 위험도 분석 (공고별 최신 결과)
+        cursor.execute(f"""
+            SELECT job_id, {', '.join(RISK_DETAIL_FIELDS)}
+            FROM risk_analysis
+            WHERE job_id IN ({placeholders})
+            ORDER BY id
+        """, ids)
+        for row in cursor.fetchall():
+            if row['job_id'] in details:
+                details[row['job_id']]["risk_analysis"] = _risk_detail(row)
+
+        # 3. 키워드 매칭 결과
+        cursor.execute(f"""
+            SELECT job_id, tier, keyword, category, weight, match_count
+            FROM keyword_matches
+            WHERE job_id IN ({placeholders})
+            ORDER BY job_id, tier, weight DESC
+        """, ids)
+        for row in cursor.fetchall():
+            if row['job_id'] in details:
+                match = dict(row)
+                details[match.pop('job_id')]["keyword_matches"].append(match)
+
+        # 4. 패턴 매칭 결과
+        cursor.execute(f"""
+            SELECT job_id, pattern_name, keywords, weight, description
+            FROM pattern_matches
+            WHERE job_id IN ({placeholders})
+            ORDER BY job_id, weight DESC
+        """, ids)
+        for row in cursor.fetchall():
+            if row['job_id'] in details:
+                details[row['job_id']]["pattern_matches"].append(_pattern_detail(row))
+
+    return {
+        "jobs": [details[job_id] for job_id in ids if job_id in details],
+        "not_found": [job_id for job_id in ids if job_id not in details],
+    }
+
+
 @router.get("/jobs/{job_id}")
-def get_job_detail(job_id: int) -> Dict[str, Any]:
+def get_job_detail(job_id: int, job_repo: JobRepository = Depends(get_job_repo)) -> Dict[str, Any]:
     """
     공고 상세 조회 (키워드 매칭, 패턴 매칭 포함)
 
@@ -130,21 +432,8 @@ def get_job_detail(job_id: int) -> Dict[str, Any]:
         job_dict = dict(job_row)
 
         # risk_analysis 분리
-        risk_data = None
-        if job_dict.get('base_score') is not None:
-            risk_data = {
-                'base_score': job_dict.pop('base_score'),
-                'combo_multiplier': job_dict.pop('combo_multiplier'),
-                'final_score': job_dict.pop('final_score'),
-                'risk_level': job_dict.pop('risk_level'),
-                'risk_factors': json.loads(job_dict.pop('risk_factors', '[]')),
-                'recommendations': json.loads(job_dict.pop('recommendations', '[]')),
-                'analysis_summary': job_dict.pop('analysis_summary', '')
-            }
-        else:
-            # 필드 제거
-            for field in ['base_score', 'combo_multiplier', 'final_score', 'risk_level', 'risk_factors', 'recommendations', 'analysis_summary']:
-                job_dict.pop(field, None)
+        risk_values = {field: job_dict.pop(field, None) for field in RISK_DETAIL_FIELDS}
+        risk_data = _risk_detail(risk_values) if risk_values['base_score'] is not None else None
 
         # 2. 키워드 매칭 결과
         cursor.execute("""
@@ -162,11 +451,7 @@ def get_job_detail(job_id: int) -> Dict[str, Any]:
             WHERE job_id = ?
             ORDER BY weight DESC
         """, (job_id,))
-        pattern_matches = []
-        for row in cursor.fetchall():
-            pattern_dict = dict(row)
-            pattern_dict['keywords'] = json.loads(pattern_dict['keywords'])
-            pattern_matches.append(pattern_dict)
+        pattern_matches = [_pattern_detail(row) for row in cursor.fetchall()]
 
     return {
         "job": job_dict,
@@ -2,20 +2,18 @@
 리포트 API 엔드포인트
 일일 리포트 조회 및 생성
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict, Any
 from datetime import date
-from backend.database.repositories import JobRepository, AnalysisRepository, ReportRepository
+from backend.app.dependencies import get_job_repo
+from backend.database.repositories import JobRepository
 import json
 
 router = APIRouter()
-job_repo = JobRepository()
-analysis_repo = AnalysisRepository()
-report_repo = ReportRepository()
 
 
 @router.get("/reports/daily")
-def get_daily_reports(limit: int = 30, skip: int = 0) -> List[Dict[str, Any]]:
+def get_daily_reports(limit: int = 30, skip: int = 0, job_repo: JobRepository = Depends(get_job_repo)) -> List[Dict[str, Any]]:
     """
     일일 리포트 목록 조회
 
@@ -68,7 +66,7 @@ def get_daily_reports(limit: int = 30, skip: int = 0) -> List[Dict[str, Any]]:
 
 
 @router.get("/reports/daily/{report_date}")
-def get_daily_report(report_date: str) -> Dict[str, Any]:
+def get_daily_report(report_date: str, job_repo: JobRepository = Depends(get_job_repo)) -> Dict[str, Any]:
     """
     특정 날짜 일일 리포트 조회 (상세)
 
@@ -128,7 +126,7 @@ def get_daily_report(report_date: str) -> Dict[str, Any]:
 
 
 @router.get("/reports/summary")
-def get_reports_summary() -> Dict[str, Any]:
+def get_reports_summary(job_repo: JobRepository = Depends(get_job_repo)) -> Dict[str, Any]:
     """
     리포트 요약 통계
 
@@ -2,18 +2,17 @@
 통계 API 엔드포인트
 대시보드 통합 통계 제공
 """
-from fastapi import APIRouter
-from typing import Dict, List, Any
+from fastapi import APIRouter, Depends
+from typing import Dict, List, Any, Optional
 from datetime import date
-from backend.database.repositories import JobRepository, AnalysisRepository
+from backend.app.dependencies import get_analysis_repo, get_job_repo, get_telemetry_repo
+from backend.database.repositories import JobRepository, AnalysisRepository, TelemetryRepository
 
 router = APIRouter()
-job_repo = JobRepository()
-analysis_repo = AnalysisRepository()
 
 
 @router.get("/stats/overview")
-def get_stats_overview() -> Dict[str, Any]:
+def get_stats_overview(job_repo: JobRepository = Depends(get_job_repo)) -> Dict[str, Any]:
     """
     종합 통계 조회
 
@@ -72,7 +71,7 @@ def get_stats_overview() -> Dict[str, Any]:
 
 
 @router.get("/stats/trends")
-def get_stats_trends(days: int = 7) -> List[Dict[str, Any]]:
+def get_stats_trends(days: int = 7, job_repo: JobRepository = Depends(get_job_repo)) -> List[Dict[str, Any]]:
     """
     일별 트렌드 조회
 
@@ -122,7 +121,7 @@ def get_stats_trends(days: int = 7) -> List[Dict[str, Any]]:
 
 
 @router.get("/stats/keywords")
-def get_top_keywords(limit: int = 10) -> List[Dict[str, Any]]:
+def get_top_keywords(limit: int = 10, job_repo: JobRepository = Depends(get_job_repo)) -> List[Dict[str, Any]]:
     """
     상위 키워드 조회
 
@@ -171,7 +170,10 @@ def get_top_keywords(limit: int = 10) -> List[Dict[str, Any]]:
 
 
 @router.get("/stats/dashboard")
-def get_dashboard_stats() -> Dict[str, Any]:
+def get_dashboard_stats(
+    job_repo: JobRepository = Depends(get_job_repo),
+    analysis_repo: AnalysisRepository = Depends(get_analysis_repo),
+) -> Dict[str, Any]:
     """
     대시보드 통합 통계 조회
 
@@ -254,3 +256,31 @@ def get_dashboard_stats() -> Dict[str, Any]:
         "top_keywords": top_keywords,
         "recent_high_risk": recent_high_risk
     }
+
+
+@router.get("/stats/crawl-timings")
+def get_crawl_timings(
+    run_id: Optional[str] = None,
+    site: Optional[str] = None,
+    days: Optional[int] = 7,
+    telemetry_repo: TelemetryRepository = Depends(get_telemetry_repo),
+) -> Dict[str, Any]:
+    """
+    크롤링 구간별 소요 시간 분포 조회
+
+    Args:
+        run_id: 실행 ID (지정하면 days 무시)
+        site: 사이트 (cli 사이트 키, 예: saramin)
+        days: 최근 N일 (기본값: 7)
+
+    Returns:
+        {
+            "runs": List[Dict],     # 최근 실행 (run_id, site, status, jobs, started_at, finished_at)
+            "timings": List[Dict]   # 사이트/구간별 count, p50_ms, p95_ms, max_ms, total_ms,
+                                    # bytes, requests, retries, failures
+        }
+    """
+    return {
+        "runs": telemetry_repo.get_runs(),
+        "timings": telemetry_repo.get_stage_timings(run_id=run_id, site=site, days=None if run_id else days),
+    }
@@ -0,0 +1,138 @@
+"""
+실시간 알림 API 엔드포인트
+새로 분석된 위험 공고를 SSE(Server-Sent Events) / WebSocket으로 전달
+"""
+import asyncio
+import json
+from typing import List, Optional
+
+from fastapi import APIRouter, Header, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from backend.app.alerts import AlertFilter, get_alert_hub
+
+router = APIRouter()
+
+# 연결 유지용 주석 전송 주기 (초) - 프록시 유휴 타임아웃 방지
+HEARTBEAT_INTERVAL = 15
+# 클라이언트 재연결 대기 시간 (ms)
+RETRY_MS = 3000
+
+
+def _sse(alert: dict) -> str:
+    data = json.dumps(alert, ensure_ascii=False, default=str)
+    return f"id: {alert['id']}\nevent: alert\ndata: {data}\n\n"
+
+
+async def _alerts(alert_filter: AlertFilter, last_event_id: Optional[int], is_disconnected):
+    """
+    구독 → 놓친 결과 재전송 → 실시간 전달 순으로 알림 생성
+
+    구독을 먼저 해야 재전송 조회와 실시간 발행 사이에 빠지는 결과가 없다.
+    None은 하트비트 시점, 종료는 허브가 구독을 끊었거나 연결이 끊긴 경우.
+    """
+    hub = get_alert_hub()
+    queue = await hub.subscribe()
+    sent_id = hub.last_id
+    try:
+        if last_event_id is not None and last_event_id < sent_id:
+            async for alert in hub.backlog(last_event_id, sent_id, alert_filter):
+                if alert_filter.matches(alert):
+                    yield alert
+        while not await is_disconnected():
+            try:
+                alert = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if alert is None:
+                break
+            if alert["id"] > sent_id and alert_filter.matches(alert):
+                sent_id = alert["id"]
+                yield alert
+    finally:
+        hub.unsubscribe(queue)
+
+
+def _parse_last_event_id(header: Optional[str], query: Optional[int]) -> Optional[int]:
+    if query is not None:
+        return query
+    if header and header.isdigit():
+        return int(header)
+    return None
+
+
+@router.get("/stream/alerts")
+async def stream_alerts(
+    request: Request,
+    risk_level: List[str] = Query(["고위험"], description="알림 받을 위험도 (반복 지정 가능)"),
+    site: List[str] = Query([], description="사이트 필터 (반복 지정 가능)"),
+    keyword: List[str] = Query([], description="매칭 키워드/검색어/제목 포함 필터 (반복 지정 가능)"),
+    last_event_id: Optional[int] = Query(None, description="이 ID 이후의 결과부터 재전송"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    위험 공고 실시간 알림 (SSE)
+
+    EventSource는 재연결 시 Last-Event-ID 헤더를 자동으로 보내므로 끊긴 동안의 결과도 받는다.
+
+    Returns:
+        text/event-stream
+            id: <risk_analysis.id>
+            event: alert
+            data: {"id", "job_id", "title", "company", "location", "url", "source_site",
+                   "search_keyword", "final_score", "risk_level", "risk_factors", "keywords", "analyzed_at"}
+    """
+    alert_filter = AlertFilter(risk_level, site, keyword)
+    resume_id = _parse_last_event_id(last_event_id_header, last_event_id)
+
+    async def events():
+        yield f"retry: {RETRY_MS}\n\n"
+        async for alert in _alerts(alert_filter, resume_id, request.is_disconnected):
+            yield ": heartbeat\n\n" if alert is None else _sse(alert)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/stream/alerts/ws")
+async def stream_alerts_ws(
+    websocket: WebSocket,
+    risk_level: List[str] = Query(["고위험"]),
+    site: List[str] = Query([]),
+    keyword: List[str] = Query([]),
+    last_event_id: Optional[int] = Query(None),
+):
+    """
+    위험 공고 실시간 알림 (WebSocket)
+
+    SSE와 같은 필터/이어받기를 지원하며 메시지는 {"type": "alert", "data": {...}} 또는
+    {"type": "heartbeat"} JSON 텍스트로 전송된다.
+    """
+    await websocket.accept()
+    closed = asyncio.Event()
+
+    async def receive_until_close():
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            closed.set()
+
+    async def is_disconnected() -> bool:
+        return closed.is_set()
+
+    receiver = asyncio.create_task(receive_until_close())
+    try:
+        async for alert in _alerts(AlertFilter(risk_level, site, keyword), last_event_id, is_disconnected):
+            if alert is None:
+                await websocket.send_text(json.dumps({"type": "heartbeat"}))
+            else:
+                await websocket.send_text(json.dumps({"type": "alert", "data": alert}, ensure_ascii=False, default=str))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
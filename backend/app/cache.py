@@ -0,0 +1,180 @@
+"""
+API 응답 캐시
+집계 엔드포인트(통계/리포트 요약)의 GET 응답을 경로+쿼리 파라미터 단위로 메모리에 보관한다
+
+- 데이터가 바뀌면 DB 트리거가 data_generation.generation을 올리고, 캐시는 세대가 달라진 항목을 버린다
+  (크롤러/파이프라인은 별도 프로세스이므로 세대는 DB에서 읽되, 최대 check_interval초에 한 번만 조회)
+- 세대가 같아도 ttl이 지나면 다시 계산한다 (오늘 날짜 기준 집계 등)
+- 응답에는 ETag/Last-Modified를 붙이고, If-None-Match가 일치하면 본문 없이 304를 반환한다
+
+    app.add_middleware(ResponseCacheMiddleware, paths=["/api/stats/overview", ...])
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.database.connection import get_db_connection
+
+
+class DataGeneration:
+    """DB 데이터 세대 조회 (check_interval초 동안은 마지막 값을 재사용)"""
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        self._value: Tuple[int, str] = (-1, "")
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> Tuple[int, str]:
+        """
+        Returns:
+            (generation, updated_at) - updated_at은 HTTP 날짜 형식
+        """
+        with self._lock:
+            if time.monotonic() - self._checked_at < self.check_interval:
+                return self._value
+        conn = get_db_connection()
+        try:
+            row = conn.execute("SELECT generation, updated_at FROM data_generation WHERE id = 1").fetchone()
+        finally:
+            conn.close()
+        if row:
+            # updated_at은 SQLite CURRENT_TIMESTAMP (UTC)
+            updated = datetime.strptime(row["updated_at"], "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+            value = (row["generation"], format_datetime(updated, usegmt=True))
+        else:
+            value = (0, "")
+        with self._lock:
+            self._value = value
+            self._checked_at = time.monotonic()
+        return value
+
+
+class ResponseCache:
+    """세대/TTL/크기 제한이 있는 LRU 응답 캐시"""
+
+    def __init__(self, max_entries: int = 256, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+    def get(self, key: str, generation: int) -> Optional[Dict]:
+        """유효한 항목 반환 (세대가 다르거나 ttl이 지났으면 제거 후 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["generation"] != generation or time.monotonic() - entry["stored_at"] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, generation: int, entry: Dict):
+        with self._lock:
+            self._entries[key] = {**entry, "generation": generation, "stored_at": time.monotonic()}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def _etag(generation: int, body: bytes) -> str:
+    return f'W/"{generation}-{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class ResponseCacheMiddleware:
+    """
+    지정한 경로의 GET 응답을 캐시하는 ASGI 미들웨어
+
+    Args:
+        app: ASGI 앱
+        paths: 캐시할 경로 (정확히 일치)
+        ttl: 항목 최대 유지 시간 (초)
+        max_entries: 최대 항목 수 (LRU)
+        check_interval: DB 세대 확인 주기 (초)
+    """
+
+    def __init__(self, app, paths: Iterable[str], ttl: float = 60.0, max_entries: int = 256,
+                 check_interval: float = 1.0):
+        self.app = app
+        self.paths = set(paths)
+        self.cache = ResponseCache(max_entries=max_entries, ttl=ttl)
+        self.generation = DataGeneration(check_interval=check_interval)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        query = "&".join(sorted(scope.get("query_string", b"").decode("latin-1").split("&")))
+        key = f"{scope['path']}?{query}"
+        request_headers = dict(scope["headers"])
+        if_none_match = request_headers.get(b"if-none-match", b"").decode("latin-1")
+        generation, last_modified = await run_in_threadpool(self.generation.current)
+
+        entry = self.cache.get(key, generation)
+        if entry is None:
+            self.cache.count("misses")
+            entry = await self._render(scope, receive, generation, last_modified)
+            if entry["status"] == 200:
+                self.cache.put(key, generation, entry)
+            cache_status = b"MISS"
+        else:
+            self.cache.count("hits")
+            cache_status = b"HIT"
+
+        if entry["status"] == 200 and if_none_match and _etag_matches(if_none_match, entry["etag"]):
+            self.cache.count("not_modified")
+            headers = [(b"etag", entry["etag"].encode()), (b"x-cache", cache_status)]
+            if last_modified:
+                headers.append((b"last-modified", last_modified.encode()))
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers = list(entry["headers"]) + [(b"x-cache", cache_status)]
+        await send({"type": "http.response.start", "status": entry["status"], "headers": headers})
+        await send({"type": "http.response.body", "body": entry["body"]})
+
+    async def _render(self, scope, receive, generation: int, last_modified: str) -> Dict:
+        """하위 앱을 실행해 응답 전체를 모은 뒤 캐시 항목으로 반환"""
+        start = {}
+        chunks = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        body = b"".join(chunks)
+        etag = _etag(generation, body)
+        headers = [(name, value) for name, value in start.get("headers", [])
+                   if name.lower() not in (b"etag", b"last-modified", b"cache-control")]
+        if start.get("status") == 200:
+            headers += [(b"etag", etag.encode()), (b"cache-control", b"no-cache")]
+            if last_modified:
+                headers.append((b"last-modified", last_modified.encode()))
+        return {"status": start.get("status", 500), "headers": headers, "body": body, "etag": etag}
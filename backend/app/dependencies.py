@@ -0,0 +1,42 @@
+"""
+API 의존성 제공자 (FastAPI Depends)
+저장소는 모듈 import 시점이 아니라 그 저장소를 쓰는 첫 요청에서 만들고 이후 재사용한다
+
+    def get_jobs(job_repo: JobRepository = Depends(get_job_repo)): ...
+
+테스트에서는 app.dependency_overrides[get_job_repo]로 교체할 수 있다.
+"""
+from functools import lru_cache
+
+from backend.database.repositories import (
+    AnalysisRepository,
+    CrawlJobRepository,
+    JobRepository,
+    ReportRepository,
+    TelemetryRepository,
+)
+
+
+@lru_cache(maxsize=None)
+def get_job_repo() -> JobRepository:
+    return JobRepository()
+
+
+@lru_cache(maxsize=None)
+def get_analysis_repo() -> AnalysisRepository:
+    return AnalysisRepository()
+
+
+@lru_cache(maxsize=None)
+def get_report_repo() -> ReportRepository:
+    return ReportRepository()
+
+
+@lru_cache(maxsize=None)
+def get_telemetry_repo() -> TelemetryRepository:
+    return TelemetryRepository()
+
+
+@lru_cache(maxsize=None)
+def get_crawl_job_repo() -> CrawlJobRepository:
+    return CrawlJobRepository()
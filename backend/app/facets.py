@@ -0,0 +1,245 @@
+"""
+공고 목록 패싯 인덱스 (GET /api/jobs/search)
+사이트/검색 키워드/위험도/매칭 키워드/카테고리/수집일 조합 필터와 값별 개수를 메모리 비트맵으로 계산한다
+
+- 공고마다 인덱스 안의 순번(공고 ID 오름차순)을 정하고, 패싯 값마다 해당 공고의 순번 비트를 켠 정수 비트맵을 둔다
+  필터는 비트맵 OR(같은 패싯)/AND(다른 패싯), 개수는 int.bit_count()이므로 공고 수가 많아도 SQL 집계 없이 응답한다
+- 값별 개수는 자기 패싯의 선택은 빼고 나머지 필터만 적용한다 (선택한 사이트 외 다른 사이트의 개수도 보이도록)
+- 크롤러/파이프라인은 다른 프로세스에서 저장하므로 data_generation이 바뀌었을 때만(최대 check_interval초에 한 번)
+  새 공고와 재분석된 공고를 증분 반영한다. 공고가 삭제된 경우에만 전체를 다시 만든다
+"""
+import bisect
+import threading
+import time
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from backend.database.repositories import FacetRepository
+
+# 패싯 이름 (GET /api/jobs/search 필터 파라미터 이름과 같음)
+FACETS = ("site", "search_keyword", "risk_level", "keyword", "category", "crawled_date")
+# 전체 구성 시 한 번에 읽는 공고 수
+BUILD_BATCH = 50_000
+# 결과 페이지를 찾을 때 한 번에 살펴보는 비트 수
+PAGE_BLOCK_BITS = 1 << 16
+
+
+def _posting_values(posting: Dict) -> Dict[str, Iterable[str]]:
+    """공고 하나의 패싯별 값 (값이 없으면 해당 패싯에 포함하지 않음)"""
+    return {
+        "site": [posting["source_site"]],
+        "search_keyword": set(posting["search_keywords"]) or ([posting["search_keyword"]] if posting["search_keyword"] else []),
+        "risk_level": [posting["risk_level"]] if posting["risk_level"] else [],
+        "keyword": {keyword for keyword, _ in posting["matches"]},
+        "category": {category for _, category in posting["matches"]},
+        "crawled_date": [posting["crawled_date"]] if posting["crawled_date"] else [],
+    }
+
+
+def _bitmap(positions: List[int]) -> int:
+    """순번 목록 → 비트맵 (해당 비트만 켠 정수)"""
+    if not positions:
+        return 0
+    low = min(positions)
+    buffer = bytearray(((max(positions) - low) >> 3) + 1)
+    for position in positions:
+        offset = position - low
+        buffer[offset >> 3] |= 1 << (offset & 7)
+    return int.from_bytes(buffer, "little") << low
+
+
+def _top_positions(bits: int, offset: int, limit: int) -> List[int]:
+    """켜진 비트 중 높은 순번부터 offset개를 건너뛰고 limit개 (최신 공고 순)"""
+    positions = []
+    high = bits.bit_length()
+    while high > 0 and len(positions) < limit:
+        low = max(0, high - PAGE_BLOCK_BITS)
+        block = (bits >> low) & ((1 << (high - low)) - 1)
+        count = block.bit_count()
+        if offset >= count:
+            offset -= count
+        else:
+            while block and len(positions) < limit:
+                bit = block.bit_length() - 1
+                block ^= 1 << bit
+                if offset:
+                    offset -= 1
+                else:
+                    positions.append(low + bit)
+        high = low
+    return positions
+
+
+class FacetIndex:
+    """
+    패싯 비트맵 인덱스
+
+    Args:
+        check_interval: DB 변경 여부(data_generation) 확인 주기 (초)
+    """
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        self._repo = FacetRepository()
+        self._lock = threading.Lock()
+        self._reset()
+        self._checked_at = 0.0
+        self._generation: Optional[int] = None
+
+    def _reset(self):
+        self._ids = array("q")  # 순번 → 공고 ID (오름차순)
+        self._bitmaps: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+        self._max_job_id = 0
+        self._max_analysis_id = 0
+
+    @property
+    def size(self) -> int:
+        """인덱스에 포함된 공고 수"""
+        return len(self._ids)
+
+    def refresh(self, force: bool = False):
+        """DB 변경 사항 반영 (check_interval 안에는 다시 확인하지 않음)"""
+        if not force and time.monotonic() - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if not force and time.monotonic() - self._checked_at < self.check_interval:
+                return
+            generation = self._repo.get_generation()
+            if force or generation != self._generation:
+                self._sync()
+                self._generation = generation
+            self._checked_at = time.monotonic()
+
+    def _sync(self):
+        state = self._repo.get_state(self._max_job_id)
+        if state["indexed_count"] != self.size:
+            # 인덱스에 있던 공고가 삭제됨 - 순번을 다시 매김
+            self._reset()
+            state = self._repo.get_state(0)
+
+        reanalyzed = self._repo.get_reanalyzed_job_ids(
+            self._max_analysis_id, state["max_analysis_id"], self._max_job_id
+        )
+        self._apply(self._repo.get_postings_by_ids(reanalyzed), replace=True)
+
+        while self._max_job_id < state["max_job_id"]:
+            upper = min(self._max_job_id + BUILD_BATCH, state["max_job_id"])
+            self._apply(self._repo.get_postings_in_range(self._max_job_id, upper))
+            self._max_job_id = upper
+        self._max_analysis_id = state["max_analysis_id"]
+
+    def _apply(self, postings: List[Dict], replace: bool = False):
+        """
+        공고 패싯 값 반영
+
+        Args:
+            postings: FacetRepository 조회 결과 (replace=False면 기존 공고보다 ID가 큰 새 공고, ID 순)
+            replace: 이미 인덱스에 있는 공고의 값을 교체 (재분석)
+        """
+        if not postings:
+            return
+        added: Dict[str, Dict[str, List[int]]] = {facet: defaultdict(list) for facet in FACETS}
+        replaced = []
+        for posting in postings:
+            if replace:
+                position = bisect.bisect_left(self._ids, posting["id"])
+                if position == len(self._ids) or self._ids[position] != posting["id"]:
+                    continue
+                replaced.append(position)
+            else:
+                position = len(self._ids)
+                self._ids.append(posting["id"])
+            for facet, values in _posting_values(posting).items():
+                for value in values:
+                    added[facet][value].append(position)
+
+        cleared = ~_bitmap(replaced) if replaced else None
+        bitmaps = {}
+        for facet in FACETS:
+            values = dict(self._bitmaps[facet])
+            if cleared is not None:
+                values = {value: bits & cleared for value, bits in values.items()}
+            for value, positions in added[facet].items():
+                values[value] = values.get(value, 0) | _bitmap(positions)
+            bitmaps[facet] = {value: bits for value, bits in values.items() if bits}
+        # 조회 중인 요청이 갱신 도중의 상태를 보지 않도록 한 번에 교체
+        self._bitmaps = bitmaps
+
+    def search(self, filters: Dict[str, List[str]], date_from: Optional[str] = None,
+               date_to: Optional[str] = None, offset: int = 0, limit: int = 50,
+               with_counts: bool = True) -> Dict:
+        """
+        필터에 맞는 공고 ID(최신순)와 패싯 값별 개수
+
+        Args:
+            filters: 패싯 → 선택 값 목록 (같은 패싯은 OR, 다른 패싯끼리는 AND)
+            date_from: 수집일 시작 (YYYY-MM-DD, 포함)
+            date_to: 수집일 끝 (YYYY-MM-DD, 포함)
+            offset: 건너뛸 공고 수
+            limit: 반환할 공고 ID 수
+            with_counts: 패싯 값별 개수 계산 여부
+
+        Returns:
+            {"total": int, "ids": [공고 ID, ...], "facets": {패싯: {값: 개수}}}
+        """
+        self.refresh()
+        ids, bitmaps = self._ids, self._bitmaps
+        everything = (1 << len(ids)) - 1
+
+        selections: Dict[str, int] = {}
+        for facet, values in filters.items():
+            if values:
+                selections[facet] = 0
+                for value in values:
+                    selections[facet] |= bitmaps[facet].get(value, 0)
+        if date_from or date_to:
+            selections["crawled_date"] = 0
+            for value, bits in bitmaps["crawled_date"].items():
+                if (not date_from or value >= date_from) and (not date_to or value <= date_to):
+                    selections["crawled_date"] |= bits
+
+        matched = everything
+        for bits in selections.values():
+            matched &= bits
+
+        result = {
+            "total": matched.bit_count(),
+            "ids": [ids[position] for position in _top_positions(matched, offset, limit)],
+        }
+        if with_counts:
+            result["facets"] = self._counts(bitmaps, selections, everything)
+        return result
+
+    @staticmethod
+    def _counts(bitmaps: Dict[str, Dict[str, int]], selections: Dict[str, int], everything: int) -> Dict:
+        counts = {}
+        for facet in FACETS:
+            base = everything
+            for other, bits in selections.items():
+                if other != facet:
+                    base &= bits
+            if base == everything:
+                values = {value: bits.bit_count() for value, bits in bitmaps[facet].items()}
+            else:
+                values = {value: (bits & base).bit_count() for value, bits in bitmaps[facet].items()}
+            values = {value: count for value, count in values.items() if count}
+            if facet == "crawled_date":
+                counts[facet] = dict(sorted(values.items(), reverse=True))
+            else:
+                counts[facet] = dict(sorted(values.items(), key=lambda item: (-item[1], item[0])))
+        return counts
+
+
+_index: Optional[FacetIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_facet_index() -> FacetIndex:
+    """프로세스 공용 패싯 인덱스 (처음 조회할 때 구성)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = FacetIndex()
+    return _index
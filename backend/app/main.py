@@ -1,5 +1,9 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -7,12 +11,56 @@ from pathlib import Path
 BACKEND_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(BACKEND_DIR))
 
+# API 프로세스가 함께 띄울 크롤링 작업 워커 동시 실행 수
+# 기본 0: uvicorn --workers N이면 API 프로세스마다 워커가 생기므로 crawl_worker.py는 별도로 한 번만 실행한다
+# (API 프로세스 하나로 운영할 때만 CRAWL_WORKERS=2처럼 지정)
+CRAWL_WORKERS = int(os.environ.get("CRAWL_WORKERS", "0"))
+
+from backend.app.analysis import get_analysis_engine, shutdown_analysis_pool
+from backend.database.connection import DatabaseConnection
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DB 스키마 확인/생성은 import 시점이 아니라 서버 시작 시 한 번 (저장소는 app/dependencies.py에서 첫 요청 때 생성)
+    DatabaseConnection().initialize()
+    # 크롤링은 API 프로세스 밖의 워커 프로세스에서 실행 (브라우저가 요청 처리와 경쟁하지 않도록)
+    worker = None
+    if CRAWL_WORKERS > 0:
+        worker = subprocess.Popen(
+            [sys.executable, str(BACKEND_DIR / "crawl_worker.py"), "--workers", str(CRAWL_WORKERS)],
+            cwd=BACKEND_DIR,
+        )
+    # 즉석 분석 규칙을 첫 요청 전에 로드
+    get_analysis_engine()
+    yield
+    shutdown_analysis_pool()
+    if worker:
+        worker.terminate()
+        try:
+            worker.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            worker.kill()
+
+
 app = FastAPI(
     title="채용 시스템 API",
     description="채용 공고 크롤링 및 분석 시스템을 위한 API 서버",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# 집계 응답 캐시 (데이터가 바뀌면 DB 세대 카운터로 자동 무효화, CORS보다 안쪽에 위치)
+from backend.app.cache import ResponseCacheMiddleware
+CACHED_PATHS = [
+    "/api/stats/overview",
+    "/api/stats/trends",
+    "/api/stats/keywords",
+    "/api/stats/dashboard",
+    "/api/reports/summary",
+]
+app.add_middleware(ResponseCacheMiddleware, paths=CACHED_PATHS, ttl=60, max_entries=256)
+
 # CORS Middleware (Frontend integration)
 app.add_middleware(
     CORSMiddleware,
@@ -22,12 +70,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from backend.app.api import jobs, crawlers, stats, reports, news
+# 라우트별 요청 메트릭 + SQL 지문별 쿼리 시간 (GET /metrics, 가장 바깥쪽에서 측정)
+# METRICS_SLOW_QUERY_MS를 지정하면 그 이상 걸린 쿼리를 경고 로그로 남김
+from backend.app.metrics import MetricsMiddleware, enable_db_metrics, render_metrics
+app.add_middleware(MetricsMiddleware)
+enable_db_metrics(slow_query_ms=float(os.environ.get("METRICS_SLOW_QUERY_MS", "0")) or None)
+
+from backend.app.api import jobs, crawlers, stats, reports, news, stream, analyze
 app.include_router(jobs.router, prefix="/api", tags=["jobs"])
 app.include_router(crawlers.router, prefix="/api", tags=["crawlers"])
 app.include_router(stats.router, prefix="/api", tags=["stats"])
 app.include_router(reports.router, prefix="/api", tags=["reports"])
 app.include_router(news.router, prefix="/api", tags=["news"])
+app.include_router(stream.router, prefix="/api", tags=["stream"])
+app.include_router(analyze.router, prefix="/api", tags=["analyze"])
 
 
 @app.get("/")
@@ -37,3 +93,8 @@ def read_root():
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 수집용 메트릭"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,198 @@
+"""
+API 서버 메트릭 (Prometheus 텍스트 형식, GET /metrics)
+
+- 경로(라우트 템플릿)별 요청 수/응답 시간/응답 크기 히스토그램, 메서드별 처리 중인 요청 수
+- SQL 지문별 쿼리 시간 히스토그램 (database.instrumentation), 느린 쿼리 로그 (선택)
+
+    app.add_middleware(MetricsMiddleware)
+    enable_db_metrics(slow_query_ms=200)
+
+라벨은 라우트 템플릿(/api/jobs/{job_id})과 SQL 지문 해시만 사용하므로 시계열 수는 라우트/문장 수에 비례한다.
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.database.instrumentation import enable_query_timing
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(key: LabelKey, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Metric:
+    """라벨 조합별 값을 보관하는 메트릭 (counter/gauge)"""
+
+    def __init__(self, name: str, help_text: str, kind: str):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(labels.items())
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            values = list(self._values.items())
+        lines += [f"{self.name}{_labels(key)} {value:g}" for key, value in values]
+        return lines
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # 라벨 조합 → [버킷별 개수..., 합계, 개수]
+        self._values: Dict[LabelKey, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.items())
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            values = [(key, list(state)) for key, state in self._values.items()]
+        bounds = [f'le="{bound:g}"' for bound in self.buckets] + ['le="+Inf"']
+        for key, state in values:
+            for bound, count in zip(bounds, state[:-2] + [state[-1]]):
+                lines.append(f"{self.name}_bucket{_labels(key, bound)} {count}")
+            lines.append(f"{self.name}_sum{_labels(key)} {state[-2]:g}")
+            lines.append(f"{self.name}_count{_labels(key)} {state[-1]}")
+        return lines
+
+
+HTTP_REQUESTS = Metric("http_requests_total", "처리한 HTTP 요청 수", "counter")
+HTTP_IN_PROGRESS = Metric("http_requests_in_progress", "처리 중인 HTTP 요청 수", "gauge")
+HTTP_DURATION = Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)", LATENCY_BUCKETS)
+HTTP_RESPONSE_SIZE = Histogram("http_response_size_bytes", "HTTP 응답 본문 크기", SIZE_BUCKETS)
+DB_QUERY_DURATION = Histogram("db_query_duration_seconds", "SQL 문장 실행 시간 (결과 읽기 포함)", QUERY_BUCKETS)
+DB_SLOW_QUERIES = Metric("db_slow_queries_total", "느린 쿼리 기준을 넘은 실행 수", "counter")
+
+# 쿼리 라벨(지문 해시) → 지문 (db_query_info로 노출)
+_statements: Dict[str, str] = {}
+_slow_query_seconds: Optional[float] = None
+
+
+def _query_id(statement: str) -> str:
+    query_id = hashlib.blake2b(statement.encode(), digest_size=6).hexdigest()
+    if query_id not in _statements:
+        _statements[query_id] = statement
+    return query_id
+
+
+def _observe_query(statement: str, seconds: float):
+    query_id = _query_id(statement)
+    DB_QUERY_DURATION.observe(seconds, query=query_id)
+    if _slow_query_seconds is not None and seconds >= _slow_query_seconds:
+        DB_SLOW_QUERIES.inc(query=query_id)
+        logger.warning(f"느린 쿼리 {seconds * 1000:.1f}ms [{query_id}] {statement}")
+
+
+def enable_db_metrics(slow_query_ms: Optional[float] = None):
+    """
+    DB 쿼리 계측 시작
+
+    Args:
+        slow_query_ms: 이 시간(ms) 이상 걸린 문장을 경고 로그로 남김 (None이면 로그 없음)
+    """
+    global _slow_query_seconds
+    _slow_query_seconds = slow_query_ms / 1000 if slow_query_ms else None
+    enable_query_timing(_observe_query)
+
+
+def render_metrics() -> str:
+    """전체 메트릭을 Prometheus 텍스트 형식으로 반환"""
+    lines = []
+    for metric in (HTTP_REQUESTS, HTTP_IN_PROGRESS, HTTP_DURATION, HTTP_RESPONSE_SIZE,
+                   DB_QUERY_DURATION, DB_SLOW_QUERIES):
+        lines += metric.render()
+    lines += ["# HELP db_query_info 쿼리 라벨과 SQL 지문 대응", "# TYPE db_query_info gauge"]
+    lines += [f'db_query_info{{query="{query_id}",statement="{_escape(statement)}"}} 1'
+              for query_id, statement in list(_statements.items())]
+    return "\n".join(lines) + "\n"
+
+
+def _route_template(scope) -> str:
+    """
+    라우터가 매칭한 라우트 템플릿 (예: /api/jobs/3 → /api/jobs/{job_id}, 매칭 실패 시 <unmatched>)
+
+    include_router의 prefix 처리 방식은 FastAPI 버전마다 달라 route.path에 prefix가 없을 수 있으므로,
+    요청 경로에서 경로 파라미터 값과 같은 구간을 {이름}으로 되돌려 만든다.
+    """
+    if scope.get("route") is None:
+        return "<unmatched>"
+    names = {str(value): f"{{{name}}}" for name, value in scope.get("path_params", {}).items()}
+    return "/".join(names.get(segment, segment) for segment in scope["path"].split("/"))
+
+
+class MetricsMiddleware:
+    """요청 수/처리 시간/응답 크기를 라우트별로, 처리 중인 요청 수를 메서드별로 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def measure(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_PROGRESS.inc(method=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, measure)
+        finally:
+            HTTP_IN_PROGRESS.dec(method=method)
+            labels = {"method": method, "route": _route_template(scope)}
+            HTTP_DURATION.observe(time.perf_counter() - started, **labels)
+            HTTP_RESPONSE_SIZE.observe(size, **labels)
+            HTTP_REQUESTS.inc(**labels, status=str(status))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -32,6 +32,49 @@ class JobResponse(JobBase):
     id: int
     risk_analysis: Optional[RiskAnalysisBase] = None
 
+class RiskSummary(BaseModel):
+    final_score: float
+    risk_level: str
+
+class JobListItem(BaseModel):
+    """공고 목록용 요약 (본문 필드 제외, 전체 내용은 /jobs/{job_id})"""
+    id: int
+    title: str
+    company: str
+    location: str
+    salary: str
+    url: str
+    posted_date: str
+    source_site: str
+    search_keyword: str
+    crawled_at: datetime
+    risk_analysis: Optional[RiskSummary] = None
+
+class JobSearchResponse(BaseModel):
+    """패싯 검색 결과 (GET /jobs/search)"""
+    total: int
+    items: List[JobListItem]
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+
+class JobBatchRequest(BaseModel):
+    """공고 일괄 상세 조회 요청 (POST /jobs/batch)"""
+    ids: List[int] = Field(..., min_length=1, max_length=200)
+
+class AnalyzeJob(BaseModel):
+    """즉석 분석할 공고 텍스트 (없는 필드는 빈 문자열)"""
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    salary: str = ""
+    conditions: str = ""
+    recruit_summary: str = ""
+    detail: str = ""
+
+class AnalyzeRequest(BaseModel):
+    """즉석 분석 요청 (POST /analyze) - job 또는 jobs 중 하나"""
+    job: Optional[AnalyzeJob] = None
+    jobs: Optional[List[AnalyzeJob]] = Field(None, min_length=1, max_length=10000)
+
 class CrawlRequest(BaseModel):
     site: str
     keyword: Optional[str] = None
@@ -0,0 +1,132 @@
+"""
+시작 시간 벤치마크
+새 프로세스에서 API 앱 import / 첫 요청 / CLI --help 시간을 재고,
+시작 단계에서 DB 접근이나 크롤러(Playwright) 모듈 import가 일어나지 않는지 확인합니다.
+
+사용법:
+    python benchmark_startup.py                 # 기본 5회 측정 (중앙값)
+    python benchmark_startup.py --runs 10
+    python benchmark_startup.py --max-import-ms 1500 --max-cli-ms 1000   # 초과 시 종료 코드 1
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BACKEND_DIR.parent
+
+# 시작 단계에서 불러오면 안 되는 모듈 (크롤러/브라우저 자동화)
+HEAVY_MODULES = ("playwright", "sites.jobkorea.crawler", "sites.saramin.crawler", "utils.pipeline")
+
+# 새 프로세스에서 실행: 임시 DB 경로로 앱을 import하고 lifespan 시작 + 첫 요청까지 시간 측정
+API_PROBE = """
+import json, sys, time
+from pathlib import Path
+started = time.perf_counter()
+sys.path[:0] = [{root!r}, {backend!r}]
+from backend.database.connection import DatabaseConnection
+DatabaseConnection._db_path = Path({db_path!r})
+from backend.app.main import app
+imported = time.perf_counter()
+db_after_import = DatabaseConnection._db_path.exists()
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    ready = time.perf_counter()
+    status = client.get("/health").status_code
+    first = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+    "first_request_ms": (first - ready) * 1000,
+    "db_after_import": db_after_import,
+    "heavy_modules": heavy,
+    "status": status,
+}}))
+"""
+
+
+def measure_api() -> dict:
+    """API 앱 import + 시작 + 첫 요청 (새 프로세스, 빈 임시 DB)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        code = API_PROBE.format(
+            root=str(PROJECT_ROOT), backend=str(BACKEND_DIR),
+            db_path=str(Path(tmp) / "recruitment.db"), heavy=HEAVY_MODULES,
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "CRAWL_WORKERS": "0"},
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_cli() -> dict:
+    """cli.py --help 전체 실행 시간 (ms)과 그 사이 import된 무거운 모듈"""
+    code = (
+        "import runpy, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"sys.path.insert(0, {str(BACKEND_DIR)!r})\n"
+        f"sys.argv = [{str(BACKEND_DIR / 'cli.py')!r}, '--help']\n"
+        "try:\n"
+        f"    runpy.run_path({str(BACKEND_DIR / 'cli.py')!r}, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = [name for name in %r if name in sys.modules]\n"
+        "print('%%.3f %%s' %% ((time.perf_counter() - started) * 1000, ','.join(heavy)), file=sys.stderr)\n"
+    ) % (HEAVY_MODULES,)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=str(BACKEND_DIR))
+    elapsed, _, heavy = result.stderr.strip().splitlines()[-1].partition(" ")
+    return {"cli_ms": float(elapsed), "heavy_modules": heavy.split(",") if heavy else []}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API/CLI 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (중앙값 출력)")
+    parser.add_argument("--max-import-ms", type=float, help="API import 중앙값 허용치 (ms)")
+    parser.add_argument("--max-cli-ms", type=float, help="cli.py --help 중앙값 허용치 (ms)")
+    args = parser.parse_args()
+
+    api_runs = [measure_api() for _ in range(args.runs)]
+    cli_runs = [measure_cli() for _ in range(args.runs)]
+
+    import_ms = statistics.median(run["import_ms"] for run in api_runs)
+    startup_ms = statistics.median(run["startup_ms"] for run in api_runs)
+    first_ms = statistics.median(run["first_request_ms"] for run in api_runs)
+    cli_ms = statistics.median(run["cli_ms"] for run in cli_runs)
+
+    print(f"API import            : {import_ms:8.1f} ms")
+    print(f"API startup (lifespan): {startup_ms:8.1f} ms")
+    print(f"API first request     : {first_ms:8.1f} ms")
+    print(f"cli.py --help         : {cli_ms:8.1f} ms")
+
+    failures = []
+    if any(run["db_after_import"] for run in api_runs):
+        failures.append("API import 중 DB 파일이 생성됨")
+    heavy = sorted({name for run in api_runs for name in run["heavy_modules"]})
+    if heavy:
+        failures.append(f"API 시작 중 무거운 모듈 import: {', '.join(heavy)}")
+    heavy = sorted({name for run in cli_runs for name in run["heavy_modules"]})
+    if heavy:
+        failures.append(f"cli.py --help 중 무거운 모듈 import: {', '.join(heavy)}")
+    if any(run["status"] != 200 for run in api_runs):
+        failures.append("GET /health 실패")
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"API import {import_ms:.1f}ms > {args.max_import_ms}ms")
+    if args.max_cli_ms is not None and cli_ms > args.max_cli_ms:
+        failures.append(f"cli.py --help {cli_ms:.1f}ms > {args.max_cli_ms}ms")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+    print("✅ 시작 단계 지연 로딩 확인")
+
+
+if __name__ == "__main__":
+    main()
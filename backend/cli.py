@@ -2,21 +2,36 @@
 채용 사이트 크롤러 메인 실행 스크립트
 """
 import json
+import re
+import sys
+import time
 import argparse
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Iterator, List
 
-from sites.jobkorea.crawler import JobKoreaCrawler
-from sites.incruit.crawler import IncruitCrawler
-from sites.alba.crawler import AlbaCrawler
-from sites.albamon.crawler import AlbamonCrawler
-from sites.jobplanet.crawler import JobplanetCrawler
-from sites.jobposting.crawler import JobPostingCrawler
-from sites.worknet.crawler import WorknetCrawler
-from sites.saramin.crawler import SaraminCrawler
-from sites.hibrain.crawler import HibrainCrawler
-from sites.blind.crawler import BlindCrawler
-from utils.logger import setup_logger
+try:
+    import psutil
+except ImportError:  # 선택 의존성 (--memory-limit-mb 사용 시에만 필요)
+    psutil = None
+
+# 사이트명 → 크롤러 클래스 (사이트 모듈과 Playwright는 크롤러를 만들 때 처음 import)
+from sites.registry import CRAWLER_CLASSES
+from utils.logger import redirect_to_queue, setup_logger, start_queue_listener
+from utils.seen_urls import SeenUrlFilter
+from utils.frontier import iter_keyword_jobs, publish_job
+from utils.file_handler import JsonResultWriter, save_json
+from utils.scheduler import get_scheduler
+from utils.resilience import export_breaker_states, get_breaker
+from utils.checkpoint import CrawlCheckpoint, new_run_id
+from utils.telemetry import get_telemetry
+from utils.paths import DATA_DIR
+
+if TYPE_CHECKING:
+    # 분석 엔진/DB 모듈은 파이프라인을 실제로 시작할 때 import
+    from utils.pipeline import CrawlPipeline
 
 
 def load_keywords() -> dict:
@@ -38,7 +53,17 @@ def load_keywords() -> dict:
         return json.load(f)
 
 
-def run_crawler(site: str, keywords: List[str], industries: List[str] = None, max_companies: int = 50, max_jobs_per_company: int = 10, headless: bool = True):
+def load_site_config(site: str) -> dict:
+    """사이트 config.json 로드 (브라우저를 띄우지 않고 설정만 필요할 때)"""
+    with open(Path(__file__).parent / "sites" / site / "config.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# 재개 시 체크포인트의 값으로 복원하는 실행 인자
+RESUMED_ARGS = ("site", "max_jobs", "full_crawl", "revisit_days", "jobkorea_mode")
+
+
+def run_crawler(site: str, keywords: List[str], industries: List[str] = None, max_companies: int = 50, max_jobs_per_company: int = 10, headless: bool = True, incremental: bool = True, revisit_days: int = None, jobkorea_mode: str = None, checkpoint: CrawlCheckpoint = None, pipeline: "CrawlPipeline" = None):
     """
     특정 사이트의 크롤러 실행
     
@@ -49,69 +74,392 @@ def run_crawler(site: str, keywords: List[str], industries: List[str] = None, ma
         max_companies: 최대 수집할 기업 수
         max_jobs_per_company: 기업당 최대 수집할 공고 수
         headless: 헤드리스 모드 여부
+        incremental: 이미 수집된 공고의 상세 페이지 접속 생략 여부
+        revisit_days: 재방문 주기 (None이면 사이트 config의 revisit_days, 기본 7일)
+        jobkorea_mode: 잡코리아 크롤링 방식 (search/hybrid/industry, None이면 config의 crawl_mode)
+        checkpoint: 실행 체크포인트 (None이면 진행 상황을 기록하지 않음)
+        pipeline: 스트리밍 분석/저장 파이프라인 (None이면 JSON 파일로만 저장)
+    
+    Returns:
+        사이트 실행 요약 (status: ok/failed/skipped, jobs, duration, error, breaker, timings)
     """
     logger = setup_logger()
+    started = time.monotonic()
+    summary = {"site": site, "status": "failed", "jobs": 0, "duration": 0.0, "error": None, "breaker": None, "timings": []}
     
     # 크롤러 인스턴스 생성
-    crawler_map = {
-        "jobkorea": JobKoreaCrawler,
-        "incruit": IncruitCrawler,
-        "alba": AlbaCrawler,
-        "albamon": AlbamonCrawler,
-        "jobplanet": JobplanetCrawler,
-        "jobposting": JobPostingCrawler,
-        "worknet": WorknetCrawler,
-        "saramin": SaraminCrawler,
-        "hibrain": HibrainCrawler,
-        "blind": BlindCrawler,
-    }
-    
-    if site not in crawler_map:
+    if site not in CRAWLER_CLASSES:
         logger.error(f"지원하지 않는 사이트: {site}")
-        return
+        summary["error"] = "지원하지 않는 사이트"
+        return summary
     
-    crawler_class = crawler_map[site]
+    if checkpoint and checkpoint.is_site_done(site):
+        logger.info(f"{site} - 체크포인트 기준 이미 완료된 사이트이므로 건너뜁니다")
+        summary["status"] = "skipped"
+        return summary
+    
+    crawler_class = CRAWLER_CLASSES[site]
     crawler = crawler_class(headless=headless)
+    crawler.checkpoint = checkpoint
+    crawler.pipeline = pipeline
+    
+    if incremental:
+        if revisit_days is None:
+            revisit_days = crawler.config.get("revisit_days", 7)
+        crawler.seen_filter = SeenUrlFilter(
+            crawler.config["site_name"],
+            revisit_days=revisit_days,
+            use_bloom=crawler.config.get("use_bloom_filter", True)
+        )
+    
+    telemetry = get_telemetry()
+    telemetry.start_run(checkpoint.run_id if checkpoint else new_run_id(), site)
     
     try:
+        if checkpoint:
+            checkpoint.mark_site(site, "running")
         crawler.start()
         
-        if site == "jobkorea":
-            # 잡코리아는 산업별 크롤링 방식 사용
-            jobs = crawler.crawl_by_industry(keywords, industries, max_companies, max_jobs_per_company)
-        elif site == "blind":
-            # 블라인드는 영문 키워드만 사용 (첫 번째 키워드만 사용)
-            keyword = keywords[0] if keywords else "semiconductor"
-            jobs = crawler.crawl(keyword, max_jobs=max_jobs_per_company * max_companies)
-        else:
-            # 나머지 크롤러는 키워드별로 순회하며 수집
-            all_jobs = []
-            for keyword in keywords:
-                keyword_jobs = crawler.crawl(keyword, max_jobs=max_jobs_per_company * max_companies)
-                all_jobs.extend(keyword_jobs)
-            jobs = all_jobs
+        jobs = _iter_site_jobs(site, crawler, keywords, industries, max_companies, max_jobs_per_company, jobkorea_mode)
         
-        if jobs:
-            keyword_str = ", ".join(keywords[:3])  # 처음 3개만 표시
-            if len(keywords) > 3:
-                keyword_str += f" 외 {len(keywords) - 3}개"
-            crawler.save_results(keyword_str, jobs)
-            logger.info(f"{site} - 키워드({keyword_str}): {len(jobs)}개 공고 수집 완료")
+        # 공고는 파싱되는 즉시 파이프라인에 투입되므로 여기서는 개수만 센다 (파이프라인이 없으면 JSON 파일에 바로 기록)
+        keyword_str = ", ".join(keywords[:3])  # 처음 3개만 표시
+        if len(keywords) > 3:
+            keyword_str += f" 외 {len(keywords) - 3}개"
+        output = None if pipeline else _result_writer(site, crawler, keyword_str)
+        job_count = 0
+        try:
+            for job_info in jobs:
+                job_count += 1
+                if output:
+                    output.write(job_info)
+        finally:
+            result_path = output.close() if output else None
+        
+        if job_count:
+            if result_path:
+                logger.info(f"결과 저장 완료: {result_path}")
+            logger.info(f"{site} - 키워드({keyword_str}): {job_count}개 공고 수집 완료")
         else:
             logger.warning(f"{site} - 키워드({', '.join(keywords[:3])}): 수집된 공고가 없습니다")
+        if checkpoint:
+            checkpoint.mark_site(site, "done", job_count)
+        summary.update(status="ok", jobs=job_count)
+        
+        queue_stats = get_scheduler().for_site(crawler.config).report()
+        logger.info(
+            f"{site} - 요청 {queue_stats['requests']}회, 속도 제한 대기 합계 {queue_stats['total_wait']}초 "
+            f"(평균 {queue_stats['avg_wait']}초, 최대 {queue_stats['max_wait']}초)"
+        )
+
+        breaker = summary["breaker"] = get_breaker(crawler.config).snapshot()
+        logger.info(
+            f"{site} - 서킷 브레이커 {breaker['state']}: 성공 {breaker['success']}회, 실패 {breaker['failure']}회 "
+            f"{breaker['failure_kinds']}, 차단 {breaker['rejected']}회"
+        )
+
+        if crawler.seen_filter:
+            stats = crawler.seen_filter.stats
+            logger.info(f"{site} - 증분 필터: 확인 {stats['checked']}개, 신규 {stats['new']}개, 재방문 {stats['revisit']}개, 건너뜀 {stats['skipped']}개")
     except Exception as e:
         logger.error(f"{site} 크롤링 중 오류: {e}", exc_info=True)
+        summary["error"] = str(e)
+        if checkpoint:
+            checkpoint.mark_site(site, "failed")
+    finally:
+        crawler.close()
+        summary["duration"] = round(time.monotonic() - started, 1)
+        summary["timings"] = telemetry.finish_run(summary["status"], summary["jobs"])
+        for timing in summary["timings"]:
+            logger.info(
+                f"{site} - {timing['stage']:<10} {timing['count']:>5}회  p50 {timing['p50_ms']:>8.0f}ms  "
+                f"p95 {timing['p95_ms']:>8.0f}ms  합계 {timing['total_ms'] / 1000:.1f}초"
+            )
+    
+    return summary
+
+
+def _iter_site_jobs(site: str, crawler, keywords: List[str], industries: List[str], max_companies: int, max_jobs_per_company: int, jobkorea_mode: str = None) -> Iterator[dict]:
+    """
+    사이트별 수집 방식으로 공고를 파싱되는 대로 반환 (crawler.pipeline이 설정되어 있으면 파싱 즉시 투입됨)
+    
+    Yields:
+        수집된 공고 정보
+    """
+    logger = setup_logger()
+    max_jobs = max_jobs_per_company * max_companies
+    if site == "jobkorea":
+        mode = jobkorea_mode or crawler.config.get("crawl_mode", "search")
+        logger.info(f"잡코리아 크롤링 방식: {mode}")
+        if mode == "industry":
+            # 산업별 기업 페이지를 모두 순회 (느림)
+            return crawler.iter_by_industry(keywords, industries, max_companies, max_jobs_per_company)
+        if mode == "hybrid":
+            # 검색 결과 중 산업별 기업 목록에 속한 공고만 수집
+            return crawler.iter_hybrid(keywords, industries, max_companies, max_jobs=max_jobs)
+        # 키워드 검색 결과 페이지 기반 수집
+        return iter_keyword_jobs(crawler, keywords, max_jobs=max_jobs)
+    if site == "blind":
+        # 블라인드는 영문 키워드만 사용 (첫 번째 키워드만 사용)
+        return iter_keyword_jobs(crawler, [keywords[0] if keywords else "semiconductor"], max_jobs=max_jobs)
+    if site == "hibrain":
+        # 하이브레인넷은 목록을 한 번만 렌더링하고 모든 키워드를 한 번에 매칭
+        return crawler.iter_multi(keywords, max_jobs=max_jobs)
+    if hasattr(crawler, "get_job_links"):
+        # 모든 키워드의 검색 결과를 프런티어로 합쳐 공고당 한 번만 수집
+        return iter_keyword_jobs(crawler, keywords, max_jobs=max_jobs)
+    return _iter_keyword_crawls(crawler, keywords, max_jobs)
+
+
+def _iter_keyword_crawls(crawler, keywords: List[str], max_jobs: int) -> Iterator[dict]:
+    """프런티어를 지원하지 않는 크롤러: 키워드별로 crawl()을 실행하고 키워드가 끝날 때마다 투입"""
+    for keyword in keywords:
+        for job_info in crawler.crawl(keyword, max_jobs=max_jobs):
+            publish_job(crawler, job_info)
+            yield job_info
+
+
+def _result_writer(site: str, crawler, keyword: str) -> JsonResultWriter:
+    """파이프라인 없이 실행할 때 공고를 바로 기록할 JSON 결과 파일 (backend/data/json_results/<사이트>_<키워드>_<시각>.json)"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_keyword = re.sub(r'[<>:"/\\|?*]', '_', keyword)
+    return JsonResultWriter(crawler.config["site_name"], keyword, f"{site}_{safe_keyword}_{timestamp}.json")
+
+
+def _run_site_process(site: str, run_kwargs: dict, run_id: str, use_pipeline: bool, log_queue) -> dict:
+    """
+    --parallel 워커 프로세스에서 사이트 하나 실행 (자체 브라우저/파이프라인 사용)
+    
+    Args:
+        site: 사이트명
+        run_kwargs: run_crawler 인자 (checkpoint, pipeline 제외)
+        run_id: 체크포인트 실행 ID
+        use_pipeline: 스트리밍 분석/저장 사용 여부
+        log_queue: 부모 프로세스 로그 큐
+    
+    Returns:
+        run_crawler 실행 요약 (pipeline 통계 포함)
+    """
+    redirect_to_queue(log_queue, site)
+    checkpoint = CrawlCheckpoint.open_existing(run_id)
+    pipeline = None
+    if use_pipeline:
+        from utils.pipeline import CrawlPipeline
+        pipeline = CrawlPipeline()
+        pipeline.start()
+    try:
+        summary = run_crawler(site, checkpoint=checkpoint, pipeline=pipeline, **run_kwargs)
+    finally:
+        if pipeline:
+            pipeline_stats = pipeline.close()
+        checkpoint.close()
+    if pipeline:
+        summary["pipeline"] = pipeline_stats
+    return summary
+
+
+def _process_tree_memory_mb() -> float:
+    """현재 프로세스와 모든 하위 프로세스(워커, 브라우저)의 메모리 사용량 합계 (MB)"""
+    current = psutil.Process()
+    total = 0
+    for process in [current, *current.children(recursive=True)]:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / (1024 * 1024)
+
+
+def run_sites_parallel(sites: List[str], run_kwargs: dict, run_id: str, use_pipeline: bool, max_workers: int, memory_limit_mb: int = None) -> List[dict]:
+    """
+    사이트별 워커 프로세스로 동시에 크롤링
+    
+    동시에 실행되는 브라우저는 max_workers개로 제한되고, memory_limit_mb가 주어지면
+    전체 프로세스 트리의 메모리 사용량이 제한 아래로 내려갈 때까지 다음 사이트 시작을 미룬다.
+    
+    Args:
+        sites: 사이트명 리스트
+        run_kwargs: run_crawler 인자 (checkpoint, pipeline 제외)
+        run_id: 체크포인트 실행 ID
+        use_pipeline: 스트리밍 분석/저장 사용 여부
+        max_workers: 동시 실행 사이트(브라우저) 수
+        memory_limit_mb: 새 사이트를 시작할 수 있는 최대 메모리 사용량 (MB, psutil 필요)
+    
+    Returns:
+        사이트별 실행 요약 리스트 (sites 순서)
+    """
+    logger = setup_logger()
+    if memory_limit_mb and psutil is None:
+        logger.warning("psutil이 설치되지 않아 메모리 제한을 적용하지 않습니다 (pip install psutil)")
+        memory_limit_mb = None
+    
+    manager = multiprocessing.Manager()
+    log_queue = manager.Queue()
+    listener = start_queue_listener(log_queue)
+    pending = list(sites)
+    running = {}
+    summaries = {}
+    try:
+        # 사이트마다 새 프로세스 사용 (브라우저/메모리를 사이트 종료 시 완전히 반환)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                 max_tasks_per_child=1) as executor:
+            while pending or running:
+                while pending and len(running) < max_workers:
+                    if running and memory_limit_mb and _process_tree_memory_mb() >= memory_limit_mb:
+                        break
+                    site = pending.pop(0)
+                    logger.info(f"{site} 워커 시작 (실행 중 {len(running) + 1}/{max_workers})")
+                    future = executor.submit(_run_site_process, site, run_kwargs, run_id, use_pipeline, log_queue)
+                    running[future] = (site, time.monotonic())
+                
+                done, _ = wait(running, timeout=5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    site, started = running.pop(future)
+                    try:
+                        summaries[site] = future.result()
+                    except Exception as e:
+                        logger.error(f"{site} 워커 프로세스 오류: {e}")
+                        summaries[site] = {
+                            "site": site, "status": "failed", "jobs": 0, "error": str(e),
+                            "duration": round(time.monotonic() - started, 1), "breaker": None,
+                        }
+    finally:
+        listener.stop()
+        manager.shutdown()
+    
+    return [summaries[site] for site in sites]
+
+
+def log_run_summary(summaries: List[dict], wall_time: float):
+    """사이트별 수집 결과/소요 시간/실패를 한곳에 출력"""
+    logger = setup_logger()
+    logger.info("\n" + "=" * 50)
+    logger.info("실행 요약")
+    logger.info("=" * 50)
+    for summary in summaries:
+        line = f"{summary['site']:<12} {summary['status']:<8} 공고 {summary['jobs']:>5}개  {summary['duration']:>7.1f}초"
+        if summary.get("pipeline"):
+            line += f"  저장 {summary['pipeline']['written']}개 (고위험 {summary['pipeline']['high_risk']}개)"
+        if summary.get("error"):
+            line += f"  오류: {summary['error']}"
+        logger.info(line)
+    
+    site_time = sum(summary["duration"] for summary in summaries)
+    failed = [summary["site"] for summary in summaries if summary["status"] == "failed"]
+    failed_str = f" ({', '.join(failed)})" if failed else ""
+    logger.info(
+        f"총 {sum(summary['jobs'] for summary in summaries)}개 공고, 실패 {len(failed)}개 사이트{failed_str}, "
+        f"소요 시간 {wall_time:.1f}초 (사이트별 합계 {site_time:.1f}초)"
+    )
+
+
+def healthcheck_main(argv: List[str]) -> int:
+    """
+    사이트 상태 점검 실행 (python cli.py healthcheck ...)
+    
+    Returns:
+        종료 코드 (접속 실패 사이트나 직전 점검 대비 regression이 있으면 1)
+    """
+    from utils.healthcheck import run_healthcheck
+
+    parser = argparse.ArgumentParser(prog="cli.py healthcheck", description="사이트 접속/셀렉터 상태 점검")
+    parser.add_argument("--site", action="append", choices=list(CRAWLER_CLASSES), help="점검할 사이트 (여러 번 지정 가능, 기본값: 전체)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 점검할 사이트 수 (기본값: 4)")
+    parser.add_argument("--timeout", type=int, default=30, help="페이지별 제한 시간 (초, 기본값: 30)")
+    parser.add_argument("--no-headless", action="store_true", help="브라우저 창 표시")
+    args = parser.parse_args(argv)
+    
+    logger = setup_logger()
+    sites = args.site or list(CRAWLER_CLASSES)
+    logger.info(f"사이트 상태 점검 시작: {len(sites)}개 사이트 (동시 {args.workers}개)")
+    report = run_healthcheck(
+        {site: load_site_config(site) for site in sites},
+        workers=args.workers, headless=not args.no_headless, timeout=args.timeout * 1000
+    )
+    
+    for result in report["sites"].values():
+        search = result["search_functionality"]
+        logger.info(
+            f"{result['site']:<12} {result['overall_status']:<8} 메인 {result['main_page']['load_time_ms'] or 0:.0f}ms  "
+            f"검색 {search['search_load_time_ms'] or 0:.0f}ms  공고 링크 {search['job_links_found']}개"
+        )
+        for issue in result["issues"]:
+            logger.warning(f"{result['site']} - {issue}")
+        for regression in result["regressions"]:
+            logger.warning(f"{result['site']} - [regression] {regression}")
+    
+    summary = report["summary"]
+    logger.info(
+        f"정상 {summary['healthy']}개, 경고 {summary['warning']}개, 실패 {summary['failed']}개, "
+        f"regression {summary['regressions']}건"
+    )
+    report_path = save_json(
+        report, f"웹체크상세_{report['check_id']}.json",
+        directory=str(Path(__file__).parent.parent / "data" / "analysis_results")
+    )
+    logger.info(f"점검 리포트 저장: {report_path}")
+    return 1 if summary["failed"] or summary["regressions"] else 0
+
+
+def reextract_main(argv: List[str]) -> int:
+    """
+    저장된 HTML 스냅샷에서 공고 재추출 (python cli.py reextract ...)
+    
+    사이트를 다시 방문하지 않고 스냅샷(save_html_snapshots)으로 추출 규칙 변경을 반영한다.
+    
+    Returns:
+        종료 코드 (재추출된 공고가 없으면 1)
+    """
+    parser = argparse.ArgumentParser(prog="cli.py reextract", description="저장된 HTML 스냅샷에서 공고 재추출 (재크롤링 없음)")
+    parser.add_argument("--site", choices=["jobkorea"], default="jobkorea", help="재추출할 사이트 (기본값: jobkorea)")
+    parser.add_argument("--no-pipeline", action="store_true", help="분석/DB 저장 없이 JSON 파일로만 저장")
+    args = parser.parse_args(argv)
+    
+    logger = setup_logger()
+    crawler = CRAWLER_CLASSES[args.site](headless=True)
+    pipeline = None
+    if not args.no_pipeline:
+        from utils.pipeline import CrawlPipeline
+        pipeline = CrawlPipeline()
+        pipeline.start()
+    
+    output = None if pipeline else _result_writer(args.site, crawler, "스냅샷 재추출")
+    job_count = 0
+    try:
+        for job_info in crawler.reextract_snapshots():
+            job_count += 1
+            if pipeline:
+                pipeline.submit(crawler.config["site_name"], job_info)
+            else:
+                output.write(job_info)
     finally:
         crawler.close()
+        if output:
+            result_path = output.close()
+            if result_path:
+                logger.info(f"결과 저장 완료: {result_path}")
+        if pipeline:
+            pipeline_stats = pipeline.close()
+            logger.info(
+                f"재추출 공고 저장 {pipeline_stats['written']}/{pipeline_stats['submitted']}개, "
+                f"고위험 {pipeline_stats['high_risk']}개, 실패 {pipeline_stats['failed']}개"
+            )
+    
+    return 0 if job_count else 1
 
 
 def main():
     """메인 실행 함수"""
+    if len(sys.argv) > 1 and sys.argv[1] == "healthcheck":
+        sys.exit(healthcheck_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "reextract":
+        sys.exit(reextract_main(sys.argv[2:]))
+    
     parser = argparse.ArgumentParser(description="채용 사이트 크롤러")
     parser.add_argument(
         "--site",
         type=str,
-        choices=["jobkorea", "incruit", "alba", "albamon", "jobplanet", "jobposting", "worknet", "saramin", "hibrain", "blind", "all"],
+        choices=[*CRAWLER_CLASSES, "all"],
         default="all",
         help="크롤링할 사이트 선택 (기본값: all)"
     )
@@ -137,6 +485,49 @@ def main():
         action="store_true",
         help="헤드리스 모드 비활성화 (브라우저 창 표시)"
     )
+    parser.add_argument(
+        "--full-crawl",
+        action="store_true",
+        help="증분 크롤링 비활성화 (이미 수집된 공고도 상세 페이지 재수집)"
+    )
+    parser.add_argument(
+        "--revisit-days",
+        type=int,
+        default=None,
+        help="이미 수집된 공고를 다시 방문할 주기 (일, 기본값: 사이트 config 또는 7)"
+    )
+    parser.add_argument(
+        "--jobkorea-mode",
+        type=str,
+        choices=["search", "hybrid", "industry"],
+        default=None,
+        help="잡코리아 크롤링 방식 (search: 키워드 검색, hybrid: 검색+산업별 기업 교집합, industry: 산업별 기업 순회, 기본값: config의 crawl_mode)"
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="중단된 실행을 체크포인트에서 이어서 수행 (완료된 사이트/검색/공고는 건너뜀)"
+    )
+    parser.add_argument(
+        "--no-pipeline",
+        action="store_true",
+        help="스트리밍 분석/DB 저장 비활성화 (JSON 파일로만 저장)"
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="사이트를 최대 N개 프로세스로 동시에 크롤링 (사이트마다 별도 브라우저, 기본값: 1 = 순차 실행)"
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=None,
+        help="--parallel 실행 시 전체 메모리 사용량이 이 값 이상이면 다음 사이트 시작을 대기 (psutil 필요)"
+    )
     
     args = parser.parse_args()
     
@@ -145,8 +536,22 @@ def main():
     logger.info("채용 사이트 크롤러 시작")
     logger.info("=" * 50)
     
+    # 체크포인트 (재개 시 중단된 실행의 설정을 그대로 사용)
+    if args.resume:
+        checkpoint = CrawlCheckpoint.open_existing(args.resume)
+        run_meta = checkpoint.load_meta()
+        for key in RESUMED_ARGS:
+            setattr(args, key, run_meta[key])
+        logger.info(f"실행 {checkpoint.run_id} 재개: {checkpoint.path}")
+    else:
+        checkpoint = CrawlCheckpoint(new_run_id())
+        run_meta = {}
+        logger.info(f"실행 ID: {checkpoint.run_id} (중단 시 --resume {checkpoint.run_id} 로 재개)")
+    
     # 키워드 결정
-    if args.keyword:
+    if run_meta:
+        keywords = run_meta["keywords"]
+    elif args.keyword:
         keywords = [args.keyword]
     else:
         # keywords.json에서 모든 키워드 로드
@@ -160,7 +565,7 @@ def main():
     
     # 산업 필터 결정 (기술 분야 사용)
     keywords_data = load_keywords()
-    industries = keywords_data.get("technology_fields", [])
+    industries = run_meta.get("industries", keywords_data.get("technology_fields", []))
     logger.info(f"산업 필터: {industries}")
     
     # 헤드리스 모드 결정
@@ -176,16 +581,71 @@ def main():
     else:
         sites = [args.site]
     
-    # 크롤링 실행
-    for site in sites:
-        logger.info(f"\n{'='*50}")
-        logger.info(f"{site.upper()} 크롤링 시작")
-        logger.info(f"{'='*50}")
+    if not run_meta:
+        checkpoint.save_meta({
+            "keywords": keywords,
+            "industries": industries,
+            "sites": sites,
+            **{key: getattr(args, key) for key in RESUMED_ARGS},
+        })
+    
+    # 산업별 기업 크롤링 방식 사용
+    max_companies = max(1, args.max_jobs // 10)  # 기업당 평균 10개 공고 가정, 최소 1개
+    run_kwargs = dict(
+        keywords=keywords, industries=industries,
+        max_companies=max_companies, max_jobs_per_company=10, headless=headless,
+        incremental=not args.full_crawl, revisit_days=args.revisit_days,
+        jobkorea_mode=args.jobkorea_mode
+    )
+    run_started = time.monotonic()
+    
+    if args.parallel > 1 and len(sites) > 1:
+        # 사이트별 워커 프로세스로 동시 실행 (사이트마다 파이프라인/브라우저 별도)
+        logger.info(f"{len(sites)}개 사이트를 최대 {args.parallel}개 프로세스로 동시 실행")
+        summaries = run_sites_parallel(
+            sites, run_kwargs, checkpoint.run_id, not args.no_pipeline,
+            max_workers=args.parallel, memory_limit_mb=args.memory_limit_mb
+        )
+    else:
+        # 공고를 파싱하는 즉시 분석/DB 저장
+        pipeline = None
+        if not args.no_pipeline:
+            from utils.pipeline import CrawlPipeline
+            pipeline = CrawlPipeline()
+            pipeline.start()
         
-        # 산업별 기업 크롤링 방식 사용
-        max_companies = max(1, args.max_jobs // 10)  # 기업당 평균 10개 공고 가정, 최소 1개
-        run_crawler(site, keywords, industries, max_companies=max_companies, max_jobs_per_company=10, headless=headless)
+        summaries = []
+        for site in sites:
+            logger.info(f"\n{'='*50}")
+            logger.info(f"{site.upper()} 크롤링 시작")
+            logger.info(f"{'='*50}")
+            summaries.append(run_crawler(site, checkpoint=checkpoint, pipeline=pipeline, **run_kwargs))
+        
+        if pipeline:
+            pipeline_stats = pipeline.close()
+            logger.info(
+                f"파이프라인: 저장 {pipeline_stats['written']}/{pipeline_stats['submitted']}개, "
+                f"고위험 {pipeline_stats['high_risk']}개, 실패 {pipeline_stats['failed']}개, "
+                f"수집→저장 지연 평균 {pipeline_stats['avg_latency']}초 (최대 {pipeline_stats['max_latency']}초)"
+            )
+    
+    wall_time = time.monotonic() - run_started
+    log_run_summary(summaries, wall_time)
     
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_dir = DATA_DIR / "crawl_runs"
+    breaker_path = export_breaker_states(
+        run_dir / f"breaker_state_{timestamp}.json",
+        {summary["breaker"]["site"]: summary["breaker"] for summary in summaries if summary.get("breaker")}
+    )
+    logger.info(f"서킷 브레이커 상태 저장: {breaker_path}")
+    summary_path = save_json(
+        {"run_id": checkpoint.run_id, "parallel": args.parallel, "wall_time": round(wall_time, 1), "sites": summaries},
+        f"run_summary_{timestamp}.json", directory=str(run_dir)
+    )
+    logger.info(f"실행 요약 저장: {summary_path}")
+    checkpoint.close()
+
     logger.info("\n" + "=" * 50)
     logger.info("모든 크롤링 완료")
     logger.info("=" * 50)
@@ -0,0 +1,210 @@
+"""
+크롤링 작업 워커
+API(POST /api/crawlers/crawl)가 crawl_jobs 테이블에 등록한 작업을 API 서버와 분리된 프로세스에서 실행한다
+
+- 감독 프로세스가 작업을 가져와(claim) 작업마다 새 프로세스(자체 브라우저/파이프라인)로 실행한다
+- 전역/사이트별 동시 실행 수는 DB에서 세므로 워커를 여러 개 띄워도 제한이 지켜진다
+- 실행 중인 작업의 진행 상황(처리한 상세 페이지 수)을 주기적으로 기록하고,
+  취소 요청이 오면 해당 프로세스를 종료한다
+
+사용 예:
+    python crawl_worker.py                                  # 동시 2개, 사이트당 1개
+    python crawl_worker.py --workers 4 --site-limit saramin=2
+
+API 서버와 별도로 한 번만 실행한다 (API 프로세스 하나로 운영할 때는 CRAWL_WORKERS=N으로 서버가 함께 띄울 수 있음).
+"""
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+from database.repositories import CrawlJobRepository
+from utils.checkpoint import CrawlCheckpoint
+from utils.logger import setup_logger
+
+logger = setup_logger("CrawlWorker")
+
+DEFAULT_WORKERS = 2
+DEFAULT_SITE_LIMIT = 1
+# 이 시간 동안 heartbeat가 없는 running 작업은 워커가 죽은 것으로 보고 실패 처리
+STALE_TIMEOUT = 120
+
+
+def job_run_id(job_id: int) -> str:
+    """작업의 체크포인트/계측 실행 ID"""
+    return f"crawljob_{job_id}"
+
+
+def resolve_keywords(keyword: Optional[str]) -> Tuple[List[str], List[str]]:
+    """
+    작업 키워드와 산업 필터 결정
+
+    Returns:
+        (keywords, industries) - keyword가 없으면 config/keywords.json의 모든 키워드
+    """
+    from cli import load_keywords
+
+    keywords_data = load_keywords()
+    if keyword:
+        keywords = [keyword]
+    else:
+        keywords = sorted({kw for kw_list in keywords_data.values() for kw in kw_list})
+    return keywords, keywords_data.get("technology_fields", [])
+
+
+def execute_job(job: Dict):
+    """
+    작업 하나 실행 (작업 전용 프로세스에서 호출)
+
+    수집한 공고는 스트리밍 파이프라인으로 분석/저장하고, 실행 요약을 작업 결과로 기록한다.
+    """
+    from cli import run_crawler
+    from utils.pipeline import CrawlPipeline
+
+    repo = CrawlJobRepository()
+    keywords, industries = resolve_keywords(job["keyword"])
+    checkpoint = CrawlCheckpoint(job_run_id(job["id"]))
+    pipeline = CrawlPipeline()
+    pipeline.start()
+    try:
+        summary = run_crawler(
+            job["site"], keywords, industries,
+            max_companies=max(1, job["max_jobs"] // 10), max_jobs_per_company=10, headless=True,
+            checkpoint=checkpoint, pipeline=pipeline,
+        )
+    except Exception as e:
+        logger.error(f"작업 {job['id']} 실행 오류: {e}", exc_info=True)
+        summary = {"site": job["site"], "status": "failed", "jobs": 0, "error": str(e)}
+    finally:
+        pipeline_stats = pipeline.close()
+        checkpoint.close()
+
+    summary["pipeline"] = pipeline_stats
+    summary["run_id"] = job_run_id(job["id"])
+    status = "done" if summary["status"] == "ok" else "failed"
+    repo.finish(job["id"], status, result=summary, error=summary.get("error"))
+
+
+class CrawlWorkerPool:
+    """
+    작업 감독 프로세스
+
+    Args:
+        workers: 이 워커의 동시 실행 작업 수 (DB 기준 전역 상한으로도 사용)
+        site_limits: 사이트별 동시 실행 작업 수
+        poll_interval: 작업 확인/진행 상황 기록 주기 (초)
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, site_limits: Dict[str, int] = None,
+                 poll_interval: float = 2.0):
+        self.workers = workers
+        self.site_limits = site_limits or {}
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.repo = CrawlJobRepository()
+        self.context = multiprocessing.get_context("spawn")
+        self.running: Dict[int, multiprocessing.Process] = {}
+        self._stopping = False
+
+    def stop(self, *_):
+        self._stopping = True
+
+    def run(self):
+        logger.info(
+            f"[{self.worker_id}] 크롤링 워커 시작 (동시 {self.workers}개, "
+            f"사이트당 {DEFAULT_SITE_LIMIT}개, 예외 {self.site_limits or '없음'})"
+        )
+        try:
+            while not self._stopping:
+                self.tick()
+                time.sleep(self.poll_interval)
+        finally:
+            self.shutdown()
+
+    def tick(self):
+        """종료된 작업 정리 → 진행 상황/취소 확인 → 빈 자리에 새 작업 시작"""
+        self._reap()
+        self._heartbeat()
+        stale = self.repo.fail_stale(STALE_TIMEOUT)
+        if stale:
+            logger.warning(f"응답 없는 워커의 작업 {stale}개를 실패 처리했습니다")
+        while len(self.running) < self.workers:
+            job = self.repo.claim(self.worker_id, self.workers, self.site_limits, DEFAULT_SITE_LIMIT)
+            if job is None:
+                break
+            process = self.context.Process(target=execute_job, args=(job,), name=job_run_id(job["id"]))
+            process.start()
+            self.running[job["id"]] = process
+            logger.info(f"작업 {job['id']} 시작: {job['site']} (키워드: {job['keyword'] or '전체'}, "
+                        f"최대 {job['max_jobs']}개, PID {process.pid})")
+
+    def _reap(self):
+        for job_id, process in list(self.running.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del self.running[job_id]
+            # 작업 프로세스가 결과를 기록하지 못하고 끝난 경우
+            if self.repo.finish(job_id, "failed", error=f"크롤링 프로세스 비정상 종료 (exit code {process.exitcode})"):
+                logger.error(f"작업 {job_id} 비정상 종료 (exit code {process.exitcode})")
+            else:
+                logger.info(f"작업 {job_id} 종료")
+
+    def _heartbeat(self):
+        for job_id, process in list(self.running.items()):
+            try:
+                checkpoint = CrawlCheckpoint.open_existing(job_run_id(job_id))
+                progress = checkpoint.fetched_count()
+                checkpoint.close()
+            except Exception:
+                progress = 0  # 작업 프로세스가 아직 체크포인트를 만들기 전
+            if self.repo.heartbeat(job_id, progress):
+                self._terminate(process)
+                del self.running[job_id]
+                self.repo.finish(job_id, "cancelled", error="사용자 취소")
+                logger.info(f"작업 {job_id} 취소 (처리 {progress}건)")
+
+    @staticmethod
+    def _terminate(process: multiprocessing.Process):
+        process.terminate()
+        process.join(10)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    def shutdown(self):
+        """실행 중인 작업 프로세스 종료 (작업은 실패로 기록)"""
+        for job_id, process in list(self.running.items()):
+            self._terminate(process)
+            self.repo.finish(job_id, "failed", error="워커 종료")
+        self.running.clear()
+        logger.info(f"[{self.worker_id}] 크롤링 워커 종료")
+
+
+def _site_limit(value: str) -> Tuple[str, int]:
+    site, _, limit = value.partition("=")
+    if not site or not limit.isdigit():
+        raise argparse.ArgumentTypeError("사이트=개수 형식이어야 합니다 (예: saramin=2)")
+    return site, int(limit)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="크롤링 작업 워커 (crawl_jobs 테이블 처리)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"동시 실행 작업(브라우저) 수 (기본값: {DEFAULT_WORKERS})")
+    parser.add_argument("--site-limit", type=_site_limit, action="append", default=[],
+                        help=f"사이트별 동시 실행 수 (예: saramin=2, 기본값: 사이트당 {DEFAULT_SITE_LIMIT})")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="작업 확인 주기 (초, 기본값: 2)")
+    args = parser.parse_args(argv)
+
+    pool = CrawlWorkerPool(args.workers, dict(args.site_limit), args.poll_interval)
+    signal.signal(signal.SIGTERM, pool.stop)
+    signal.signal(signal.SIGINT, pool.stop)
+    pool.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 """
 데이터베이스 연결 관리자
 Singleton 패턴 + Context Manager
+
+스키마 초기화는 인스턴스 생성이 아니라 첫 연결(또는 initialize()) 때 한 번 실행하므로,
+저장소 객체를 만들거나 모듈을 import하는 것만으로는 DB 파일에 접근하지 않는다.
 """
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +16,8 @@ class DatabaseConnection:
 
     _instance: Optional['DatabaseConnection'] = None
     _db_path: Path = Path(__file__).parent.parent.parent / "data" / "recruitment.db"
+    # 연결 클래스 (쿼리 계측 시 database.instrumentation.TimedConnection으로 교체)
+    connection_factory: type = sqlite3.Connection
 
     def __new__(cls):
         if cls._instance is None:
@@ -22,8 +28,20 @@ class DatabaseConnection:
     def __init__(self):
         if not self._initialized:
             self._initialized = True
-            self._ensure_db_directory()
-            self._initialize_schema()
+            self._schema_ready = False
+            self._schema_lock = threading.Lock()
+            # with 블록별 연결 (스레드마다 스택 - 중첩/동시 with 블록이 서로의 연결을 닫지 않도록)
+            self._local = threading.local()
+
+    def initialize(self):
+        """데이터 디렉토리 생성 + 스키마 초기화 (프로세스당 한 번, 이후 호출은 무시)"""
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if not self._schema_ready:
+                self._ensure_db_directory()
+                self._initialize_schema()
+                self._schema_ready = True
 
     def _ensure_db_directory(self):
         """데이터 디렉토리 생성"""
@@ -45,26 +63,45 @@ class DatabaseConnection:
 
         print(f"✅ 데이터베이스 초기화 완료: {self._db_path}")
 
-    def get_connection(self) -> sqlite3.Connection:
-        """데이터베이스 연결 반환"""
-        conn = sqlite3.connect(self._db_path)
+    def get_connection(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """
+        데이터베이스 연결 반환
+
+        Args:
+            check_same_thread: False면 다른 스레드에서도 사용 가능 (스트리밍 응답처럼 한 번에 한 스레드만 쓰는 경우)
+        """
+        self.initialize()
+        conn = sqlite3.connect(self._db_path, check_same_thread=check_same_thread, factory=self.connection_factory)
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _connection_stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """현재 스레드에서 가장 안쪽 with 블록의 연결"""
+        stack = self._connection_stack()
+        return stack[-1] if stack else None
+
     def __enter__(self):
         """Context Manager 진입"""
-        self.conn = self.get_connection()
-        return self.conn
+        conn = self.get_connection()
+        self._connection_stack().append(conn)
+        return conn
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context Manager 종료"""
-        if self.conn:
-            if exc_type:
-                self.conn.rollback()
-                print(f"❌ 트랜잭션 롤백: {exc_val}")
-            else:
-                self.conn.commit()
-            self.conn.close()
+        conn = self._connection_stack().pop()
+        if exc_type:
+            conn.rollback()
+            print(f"❌ 트랜잭션 롤백: {exc_val}")
+        else:
+            conn.commit()
+        conn.close()
         return False
 
 
@@ -0,0 +1,133 @@
+"""
+쿼리 실행 시간 계측
+DatabaseConnection이 만드는 모든 연결의 cursor.execute/executemany(+ 결과 읽기) 시간을
+SQL 지문(fingerprint)별로 관찰자 함수에 전달한다
+
+    enable_query_timing(lambda fingerprint, seconds: ...)
+
+SQLite는 execute에서 첫 행만 계산하고 나머지는 fetch 시점에 읽으므로, 한 문장의 시간은
+execute부터 결과를 다 읽을 때(또는 다음 execute/close)까지의 합계로 기록한다.
+"""
+import re
+import sqlite3
+import time
+from typing import Callable, Optional
+
+from .connection import DatabaseConnection
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+_observer: Optional[Callable[[str, float], None]] = None
+
+
+def fingerprint(sql: str) -> str:
+    """
+    SQL 지문: 리터럴을 ?로 바꾸고 공백/IN 목록 길이를 정규화한 문장
+
+    예: "SELECT * FROM jobs WHERE id IN (?, ?, ?) LIMIT 50" → "SELECT * FROM jobs WHERE id IN (?...) LIMIT ?"
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(?...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+class TimedCursor(sqlite3.Cursor):
+    """실행~결과 읽기 시간을 문장별로 합산해 관찰자에게 전달하는 커서"""
+
+    _statement: Optional[str] = None
+    _elapsed = 0.0
+
+    def _start(self, sql: str):
+        self._flush()
+        self._statement = sql
+        self._elapsed = 0.0
+
+    def _flush(self):
+        if self._statement is not None and _observer is not None:
+            _observer(fingerprint(self._statement), self._elapsed)
+        self._statement = None
+
+    def _timed(self, method, *args):
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._elapsed += time.perf_counter() - started
+
+    def execute(self, sql, parameters=()):
+        self._start(sql)
+        return self._timed(super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._start(sql)
+        result = self._timed(super().executemany, sql, seq_of_parameters)
+        self._flush()
+        return result
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._flush()
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        rows = self._timed(super().fetchmany, size)
+        if len(rows) < size:
+            self._flush()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self._flush()
+        return rows
+
+    def __next__(self):
+        try:
+            return self._timed(super().__next__)
+        except StopIteration:
+            self._flush()
+            raise
+
+    def close(self):
+        self._flush()
+        super().close()
+
+    def __del__(self):
+        self._flush()
+
+
+class TimedConnection(sqlite3.Connection):
+    """conn.execute/conn.cursor 모두 TimedCursor를 사용하는 연결"""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    # sqlite3.Connection.execute는 내부에서 기본 커서를 만들므로 직접 위임
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def enable_query_timing(observer: Callable[[str, float], None]):
+    """
+    이후 만들어지는 DB 연결의 쿼리 시간 계측 시작
+
+    Args:
+        observer: observer(fingerprint, seconds) - 문장 실행이 끝날 때마다 호출 (여러 스레드에서 호출됨)
+    """
+    global _observer
+    _observer = observer
+    DatabaseConnection.connection_factory = TimedConnection
+
+
+def disable_query_timing():
+    global _observer
+    _observer = None
+    DatabaseConnection.connection_factory = sqlite3.Connection
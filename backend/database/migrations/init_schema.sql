@@ -79,6 +79,129 @@ CREATE TABLE IF NOT EXISTS daily_reports (
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 6. 크롤링 실행 테이블 (실행 ID × 사이트)
+CREATE TABLE IF NOT EXISTS crawl_runs (
+    run_id TEXT NOT NULL,
+    site TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'running',  -- running, ok, failed
+    jobs INTEGER NOT NULL DEFAULT 0,
+    started_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at DATETIME,
+    PRIMARY KEY (run_id, site)
+);
+
+-- 7. 크롤링 구간별 계측 테이블
+CREATE TABLE IF NOT EXISTS crawl_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    site TEXT NOT NULL,
+    stage TEXT NOT NULL,               -- navigation, throttle, ready_wait, extract, sleep
+    url TEXT,
+    duration_ms REAL NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 1,  -- 같은 페이지에서 합산된 호출 수
+    status_code INTEGER,
+    bytes INTEGER NOT NULL DEFAULT 0,
+    requests INTEGER NOT NULL DEFAULT 0,
+    retries INTEGER NOT NULL DEFAULT 0,
+    outcome TEXT NOT NULL DEFAULT 'ok', -- ok 또는 오류 종류
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 8. 사이트 상태 점검 테이블 (cli.py healthcheck)
+CREATE TABLE IF NOT EXISTS site_health_checks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    check_id TEXT NOT NULL,
+    site TEXT NOT NULL,
+    site_name TEXT NOT NULL,
+    overall_status TEXT NOT NULL,      -- healthy, warning, failed
+    main_accessible INTEGER NOT NULL,
+    main_status_code INTEGER,
+    main_load_ms REAL,
+    search_accessible INTEGER NOT NULL,
+    search_load_ms REAL,
+    job_items_count INTEGER NOT NULL DEFAULT 0,
+    job_links_found INTEGER NOT NULL DEFAULT 0,
+    selectors_working TEXT NOT NULL,   -- JSON 객체 형태로 저장 (셀렉터 → 요소 수)
+    detail_accessible INTEGER NOT NULL,
+    detail_load_ms REAL,
+    title_found INTEGER NOT NULL DEFAULT 0,
+    company_found INTEGER NOT NULL DEFAULT 0,
+    content_length INTEGER NOT NULL DEFAULT 0,
+    issues TEXT NOT NULL,              -- JSON 배열 형태로 저장
+    regressions TEXT NOT NULL,         -- JSON 배열 형태로 저장 (직전 점검 대비)
+    checked_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 9. 데이터 세대 카운터 (API 응답 캐시 무효화용)
+-- 공고/분석/리포트가 바뀔 때마다 트리거가 generation을 올린다
+CREATE TABLE IF NOT EXISTS data_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+INSERT OR IGNORE INTO data_generation (id, generation) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_jobs_insert_generation AFTER INSERT ON jobs
+BEGIN
+    UPDATE data_generation SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_jobs_update_generation AFTER UPDATE ON jobs
+BEGIN
+    UPDATE data_generation SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_jobs_delete_generation AFTER DELETE ON jobs
+BEGIN
+    UPDATE data_generation SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_risk_analysis_insert_generation AFTER INSERT ON risk_analysis
+BEGIN
+    UPDATE data_generation SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_risk_analysis_delete_generation AFTER DELETE ON risk_analysis
+BEGIN
+    UPDATE data_generation SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_daily_reports_insert_generation AFTER INSERT ON daily_reports
+BEGIN
+    UPDATE data_generation SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_daily_reports_delete_generation AFTER DELETE ON daily_reports
+BEGIN
+    UPDATE data_generation SET generation = generation + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1;
+END;
+
+-- 10. 크롤링 작업 큐 (POST /api/crawlers/crawl → crawl_worker.py)
+CREATE TABLE IF NOT EXISTS crawl_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    site TEXT NOT NULL,
+    keyword TEXT,                      -- NULL이면 config/keywords.json 전체
+    max_jobs INTEGER NOT NULL,
+    dedupe_key TEXT NOT NULL,          -- site|keyword|max_jobs (대기 중인 동일 요청 병합)
+    status TEXT NOT NULL DEFAULT 'pending',  -- pending, running, done, failed, cancelled
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,                       -- 실행 중인 워커 (host:pid)
+    progress INTEGER NOT NULL DEFAULT 0,     -- 처리한 상세 페이지 수
+    result TEXT,                       -- JSON 객체 형태로 저장 (run_crawler 실행 요약)
+    error TEXT,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at DATETIME,
+    heartbeat_at DATETIME,
+    finished_at DATETIME
+);
+
+-- 11. 공고별 검색 키워드 (공고를 노출시킨 모든 검색 키워드, jobs.search_keyword는 첫 번째 키워드)
+CREATE TABLE IF NOT EXISTS job_search_keywords (
+    job_id INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (job_id, keyword),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+);
+-- 기존 DB: 테이블이 비어 있을 때 한 번만 jobs.search_keyword로 채움
+INSERT OR IGNORE INTO job_search_keywords (job_id, keyword)
+SELECT id, search_keyword FROM jobs
+WHERE search_keyword != '' AND NOT EXISTS (SELECT 1 FROM job_search_keywords);
+
 -- 인덱스 생성 (검색 성능 향상)
 
 -- 시간별 분석을 위한 인덱스
@@ -88,6 +211,7 @@ CREATE INDEX IF NOT EXISTS idx_jobs_crawled_date ON jobs(crawled_date);
 
 -- 검색 키워드 인덱스
 CREATE INDEX IF NOT EXISTS idx_jobs_search_keyword ON jobs(search_keyword);
+CREATE INDEX IF NOT EXISTS idx_job_search_keywords_keyword ON job_search_keywords(keyword, job_id);
 
 -- 위험도 레벨 인덱스
 CREATE INDEX IF NOT EXISTS idx_risk_analysis_risk_level ON risk_analysis(risk_level);
@@ -101,3 +225,14 @@ CREATE INDEX IF NOT EXISTS idx_keyword_matches_keyword ON keyword_matches(keywor
 CREATE INDEX IF NOT EXISTS idx_keyword_matches_job_id ON keyword_matches(job_id);
 CREATE INDEX IF NOT EXISTS idx_pattern_matches_job_id ON pattern_matches(job_id);
 CREATE INDEX IF NOT EXISTS idx_risk_analysis_job_id ON risk_analysis(job_id);
+
+-- 크롤링 계측 인덱스
+CREATE INDEX IF NOT EXISTS idx_crawl_events_run_site ON crawl_events(run_id, site, stage);
+CREATE INDEX IF NOT EXISTS idx_crawl_events_created_at ON crawl_events(created_at);
+
+-- 사이트 상태 점검 인덱스
+CREATE INDEX IF NOT EXISTS idx_site_health_checks_site ON site_health_checks(site, checked_at);
+
+-- 크롤링 작업 큐 인덱스 (대기 중인 동일 요청은 하나만)
+CREATE INDEX IF NOT EXISTS idx_crawl_jobs_status ON crawl_jobs(status, id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_jobs_pending_dedupe ON crawl_jobs(dedupe_key) WHERE status = 'pending';
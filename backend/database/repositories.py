@@ -3,12 +3,122 @@
 데이터베이스 CRUD 작업 추상화
 """
 import json
+import math
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from .connection import DatabaseConnection
 from .models import Job, KeywordMatch, PatternMatch, RiskAnalysis, DailyReport
 
 
+def _upsert_job(cursor, job_data: dict) -> int:
+    """jobs 행 upsert (호출한 쪽의 트랜잭션 안에서 실행) 후 job_id 반환"""
+    now = datetime.now()
+    crawled_at = job_data.get('crawled_at', now)
+
+    cursor.execute("""
+        INSERT INTO jobs (
+            title, company, location, salary, conditions,
+            recruit_summary, detail, url, posted_date,
+            source_site, search_keyword,
+            crawled_at, crawled_date, crawled_weekday, crawled_hour
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(url) DO UPDATE SET
+            title = excluded.title,
+            company = excluded.company,
+            location = excluded.location,
+            salary = excluded.salary,
+            conditions = excluded.conditions,
+            recruit_summary = excluded.recruit_summary,
+            detail = excluded.detail,
+            posted_date = excluded.posted_date,
+            updated_at = CURRENT_TIMESTAMP
+    """, (
+        job_data.get('title', ''),
+        job_data.get('company', ''),
+        job_data.get('location', ''),
+        job_data.get('salary', ''),
+        job_data.get('conditions', ''),
+        job_data.get('recruit_summary', ''),
+        job_data.get('detail', ''),
+        job_data.get('url', ''),
+        job_data.get('posted_date', ''),
+        job_data.get('source_site', '잡코리아'),
+        job_data.get('search_keyword', ''),
+        crawled_at,
+        crawled_at.date().isoformat(),
+        crawled_at.weekday(),
+        crawled_at.hour
+    ))
+
+    cursor.execute("SELECT id FROM jobs WHERE url = ?", (job_data.get('url', ''),))
+    job_id = cursor.fetchone()['id']
+    _save_search_keywords(cursor, job_id, job_data)
+    return job_id
+
+
+def _save_search_keywords(cursor, job_id: int, job_data: dict):
+    """공고를 노출시킨 검색 키워드 기록 (search_keywords, 없으면 search_keyword, 기존 키워드는 유지)"""
+    keywords = job_data.get('search_keywords') or [job_data.get('search_keyword', '')]
+    cursor.executemany(
+        "INSERT OR IGNORE INTO job_search_keywords (job_id, keyword) VALUES (?, ?)",
+        [(job_id, keyword) for keyword in dict.fromkeys(keywords) if keyword]
+    )
+
+
+def _insert_analysis(cursor, job_id: int, detection_result: dict, risk_result: dict):
+    """키워드/패턴 매칭과 위험도 분석 행 추가 (호출한 쪽의 트랜잭션 안에서 실행)"""
+    # 1. 키워드 매칭 결과 저장
+    for tier in [1, 2, 3]:
+        key = f'tier{tier}_matches'
+        if key in detection_result:
+            for match in detection_result[key]:
+                cursor.execute("""
+                    INSERT INTO keyword_matches (
+                        job_id, tier, keyword, category, weight, match_count
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    job_id,
+                    tier,
+                    match['keyword'],
+                    match['category'],
+                    match['weight'],
+                    match['count']
+                ))
+
+    # 2. 복합 패턴 매칭 결과 저장
+    if 'pattern_matches' in detection_result:
+        for pattern in detection_result['pattern_matches']:
+            cursor.execute("""
+                INSERT INTO pattern_matches (
+                    job_id, pattern_id, pattern_name, keywords, weight, description
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                job_id,
+                pattern['pattern_id'],
+                pattern['pattern_name'],
+                json.dumps(pattern['keywords'], ensure_ascii=False),
+                pattern['weight'],
+                pattern['description']
+            ))
+
+    # 3. 위험도 분석 결과 저장
+    cursor.execute("""
+        INSERT INTO risk_analysis (
+            job_id, base_score, combo_multiplier, final_score, risk_level,
+            risk_factors, recommendations, analysis_summary
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        job_id,
+        risk_result['base_score'],
+        risk_result['combo_multiplier'],
+        risk_result['final_score'],
+        risk_result['risk_level'],
+        json.dumps(risk_result['risk_factors'], ensure_ascii=False),
+        json.dumps(risk_result['recommendations'], ensure_ascii=False),
+        risk_result['analysis_summary']
+    ))
+
+
 class JobRepository:
     """채용 공고 데이터 저장소"""
 
@@ -60,7 +170,59 @@ class JobRepository:
                 crawled_hour
             ))
 
-            return cursor.lastrowid
+            job_id = cursor.lastrowid
+            _save_search_keywords(cursor, job_id, job_data)
+            return job_id
+
+    def upsert_job(self, job_data: dict) -> int:
+        """
+        채용 공고 저장 (이미 있는 URL이면 내용 갱신)
+
+        재방문한 공고는 UNIQUE 제약 위반 대신 본문과 updated_at만 갱신하고,
+        최초 수집 시각(crawled_at 등)은 유지한다.
+
+        Args:
+            job_data: 채용 공고 정보 딕셔너리
+
+        Returns:
+            저장된 job_id
+        """
+        with self.db as conn:
+            return _upsert_job(conn.cursor(), job_data)
+
+    def get_urls_by_site(self, source_site: str) -> List[str]:
+        """출처 사이트별 수집된 공고 URL 전체 조회"""
+        with self.db as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT url FROM jobs WHERE source_site = ?", (source_site,))
+            return [row['url'] for row in cursor.fetchall()]
+
+    def get_known_urls(self, urls: List[str], revisit_days: int = 0) -> Dict[str, bool]:
+        """
+        이미 수집된 URL 일괄 조회
+
+        Args:
+            urls: 확인할 URL 목록
+            revisit_days: 재방문 주기 (일). 0 이하이면 재방문하지 않음
+
+        Returns:
+            {url: 재방문 주기 내 수집 여부} - 수집된 적 없는 URL은 포함되지 않음
+        """
+        known = {}
+        with self.db as conn:
+            cursor = conn.cursor()
+            # SQLite 바인딩 변수 제한(999)을 고려하여 나누어 조회
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT url, updated_at >= datetime('now', ?) as fresh
+                    FROM jobs
+                    WHERE url IN ({placeholders})
+                """, (f'-{max(revisit_days, 0)} days', *chunk))
+                for row in cursor.fetchall():
+                    known[row['url']] = bool(row['fresh']) or revisit_days <= 0
+        return known
 
     def get_job_by_id(self, job_id: int) -> Optional[dict]:
         """ID로 채용 공고 조회"""
@@ -102,11 +264,12 @@ class JobRepository:
             return [dict(row) for row in cursor.fetchall()]
 
     def get_jobs_by_keyword(self, keyword: str) -> List[dict]:
-        """검색 키워드별 채용 공고 조회"""
+        """검색 키워드별 채용 공고 조회 (해당 키워드로 노출된 적 있는 모든 공고)"""
         with self.db as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT * FROM jobs WHERE search_keyword = ?
+                SELECT * FROM jobs
+                WHERE id IN (SELECT job_id FROM job_search_keywords WHERE keyword = ?)
                 ORDER BY crawled_at DESC
             """, (keyword,))
             return [dict(row) for row in cursor.fetchall()]
@@ -127,59 +290,86 @@ class AnalysisRepository:
             detection_result: 키워드 탐지 결과
             risk_result: 위험도 분석 결과
         """
+        with self.db as conn:
+            _insert_analysis(conn.cursor(), job_id, detection_result, risk_result)
+
+    def save_jobs_with_analysis(self, items: List[tuple]) -> List[int]:
+        """
+        공고와 분석 결과를 한 트랜잭션으로 일괄 저장 (스트리밍 파이프라인용)
+
+        재방문한 공고는 이전 분석 결과를 지우고 새 결과로 교체한다.
+
+        Args:
+            items: (job_data, detection_result, risk_result) 튜플 리스트
+
+        Returns:
+            저장된 job_id 리스트 (items 순서)
+        """
+        job_ids = []
         with self.db as conn:
             cursor = conn.cursor()
+            for job_data, detection_result, risk_result in items:
+                job_id = _upsert_job(cursor, job_data)
+                for table in ("keyword_matches", "pattern_matches", "risk_analysis"):
+                    cursor.execute(f"DELETE FROM {table} WHERE job_id = ?", (job_id,))
+                _insert_analysis(cursor, job_id, detection_result, risk_result)
+                job_ids.append(job_id)
+        return job_ids
+
+    def get_latest_analysis_id(self) -> int:
+        """가장 최근 risk_analysis.id (없으면 0)"""
+        with self.db as conn:
+            row = conn.execute("SELECT MAX(id) AS last_id FROM risk_analysis").fetchone()
+            return row['last_id'] or 0
 
-            # 1. 키워드 매칭 결과 저장
-            for tier in [1, 2, 3]:
-                key = f'tier{tier}_matches'
-                if key in detection_result:
-                    for match in detection_result[key]:
-                        cursor.execute("""
-                            INSERT INTO keyword_matches (
-                                job_id, tier, keyword, category, weight, match_count
-                            ) VALUES (?, ?, ?, ?, ?, ?)
-                        """, (
-                            job_id,
-                            tier,
-                            match['keyword'],
-                            match['category'],
-                            match['weight'],
-                            match['count']
-                        ))
-
-            # 2. 복합 패턴 매칭 결과 저장
-            if 'pattern_matches' in detection_result:
-                for pattern in detection_result['pattern_matches']:
-                    cursor.execute("""
-                        INSERT INTO pattern_matches (
-                            job_id, pattern_id, pattern_name, keywords, weight, description
-                        ) VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        job_id,
-                        pattern['pattern_id'],
-                        pattern['pattern_name'],
-                        json.dumps(pattern['keywords'], ensure_ascii=False),
-                        pattern['weight'],
-                        pattern['description']
-                    ))
-
-            # 3. 위험도 분석 결과 저장
-            cursor.execute("""
-                INSERT INTO risk_analysis (
-                    job_id, base_score, combo_multiplier, final_score, risk_level,
-                    risk_factors, recommendations, analysis_summary
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job_id,
-                risk_result['base_score'],
-                risk_result['combo_multiplier'],
-                risk_result['final_score'],
-                risk_result['risk_level'],
-                json.dumps(risk_result['risk_factors'], ensure_ascii=False),
-                json.dumps(risk_result['recommendations'], ensure_ascii=False),
-                risk_result['analysis_summary']
-            ))
+    def get_alerts_after(self, last_id: int, limit: int = 200, until_id: Optional[int] = None,
+                         risk_levels: Iterable[str] = (), sites: Iterable[str] = ()) -> List[dict]:
+        """
+        last_id 이후 저장된 분석 결과 (실시간 알림 스트림용, 오래된 순)
+
+        Args:
+            last_id: 마지막으로 전달한 risk_analysis.id
+            limit: 최대 개수
+            until_id: 이 id까지만 조회 (None이면 제한 없음)
+            risk_levels: 위험도 필터 (비어 있으면 전체)
+            sites: 사이트(source_site) 필터 (비어 있으면 전체)
+
+        Returns:
+            [{"id", "job_id", "title", "company", "location", "url", "source_site", "search_keyword",
+              "final_score", "risk_level", "risk_factors", "keywords", "analyzed_at"}, ...]
+        """
+        conditions = ["r.id > ?"]
+        params: list = [last_id]
+        if until_id is not None:
+            conditions.append("r.id <= ?")
+            params.append(until_id)
+        risk_levels, sites = list(risk_levels), list(sites)
+        if risk_levels:
+            conditions.append(f"r.risk_level IN ({', '.join('?' * len(risk_levels))})")
+            params.extend(risk_levels)
+        if sites:
+            conditions.append(f"j.source_site IN ({', '.join('?' * len(sites))})")
+            params.extend(sites)
+        with self.db as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT
+                    r.id, r.job_id, j.title, j.company, j.location, j.url, j.source_site, j.search_keyword,
+                    r.final_score, r.risk_level, r.risk_factors, r.created_at AS analyzed_at,
+                    (SELECT GROUP_CONCAT(k.keyword, '|') FROM keyword_matches k WHERE k.job_id = r.job_id) AS keywords
+                FROM risk_analysis r
+                JOIN jobs j ON j.id = r.job_id
+                WHERE {' AND '.join(conditions)}
+                ORDER BY r.id
+                LIMIT ?
+            """, (*params, limit))
+            alerts = []
+            for row in cursor.fetchall():
+                alert = dict(row)
+                alert['risk_factors'] = json.loads(alert['risk_factors'])
+                alert['keywords'] = sorted(set(alert['keywords'].split('|'))) if alert['keywords'] else []
+                alerts.append(alert)
+            return alerts
 
     def get_high_risk_jobs(self, limit: int = 100) -> List[dict]:
         """고위험 공고 조회"""
@@ -291,6 +481,438 @@ class ReportRepository:
             return reports
 
 
+
+def _percentile(sorted_values: List[float], ratio: float) -> float:
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(ratio * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class TelemetryRepository:
+    """크롤링 실행/구간 계측 저장소"""
+
+    def __init__(self):
+        self.db = DatabaseConnection()
+
+    def start_run(self, run_id: str, site: str):
+        """사이트 실행 시작 기록 (재개된 실행이면 상태만 running으로 되돌림)"""
+        with self.db as conn:
+            conn.execute("""
+                INSERT INTO crawl_runs (run_id, site, status, started_at)
+                VALUES (?, ?, 'running', ?)
+                ON CONFLICT(run_id, site) DO UPDATE SET status = 'running', finished_at = NULL
+            """, (run_id, site, datetime.now()))
+
+    def finish_run(self, run_id: str, site: str, status: str, jobs: int):
+        """사이트 실행 종료 기록"""
+        with self.db as conn:
+            conn.execute("""
+                UPDATE crawl_runs SET status = ?, jobs = ?, finished_at = ?
+                WHERE run_id = ? AND site = ?
+            """, (status, jobs, datetime.now(), run_id, site))
+
+    def insert_events(self, events: List[dict]):
+        """구간 계측 이벤트 일괄 저장"""
+        if not events:
+            return
+        with self.db as conn:
+            conn.executemany("""
+                INSERT INTO crawl_events (
+                    run_id, site, stage, url, duration_ms, calls, status_code,
+                    bytes, requests, retries, outcome, created_at
+                ) VALUES (
+                    :run_id, :site, :stage, :url, :duration_ms, :calls, :status_code,
+                    :bytes, :requests, :retries, :outcome, :created_at
+                )
+            """, events)
+
+    def get_runs(self, limit: int = 20) -> List[dict]:
+        """최근 크롤링 실행 목록"""
+        with self.db as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM crawl_runs ORDER BY started_at DESC LIMIT ?
+            """, (limit,))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_stage_timings(self, run_id: Optional[str] = None, site: Optional[str] = None,
+                          days: Optional[int] = None) -> List[dict]:
+        """
+        사이트/구간별 소요 시간 분포
+
+        Args:
+            run_id: 실행 ID (None이면 전체 실행)
+            site: 사이트 (None이면 전체 사이트)
+            days: 최근 N일 이벤트만 집계 (None이면 전체 기간)
+
+        Returns:
+            [{"site", "stage", "count", "p50_ms", "p95_ms", "max_ms", "total_ms",
+              "bytes", "requests", "retries", "failures"}, ...]
+        """
+        conditions, params = [], []
+        if run_id:
+            conditions.append("run_id = ?")
+            params.append(run_id)
+        if site:
+            conditions.append("site = ?")
+            params.append(site)
+        if days:
+            conditions.append("created_at >= datetime('now', 'localtime', ?)")
+            params.append(f"-{int(days)} days")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        groups: Dict[tuple, dict] = {}
+        with self.db as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT site, stage, duration_ms, bytes, requests, retries, outcome
+                FROM crawl_events {where}
+            """, params)
+            for row in cursor.fetchall():
+                group = groups.setdefault((row['site'], row['stage']), {
+                    "durations": [], "bytes": 0, "requests": 0, "retries": 0, "failures": 0,
+                })
+                group["durations"].append(row['duration_ms'])
+                group["bytes"] += row['bytes']
+                group["requests"] += row['requests']
+                group["retries"] += row['retries']
+                if row['outcome'] != 'ok':
+                    group["failures"] += 1
+
+        timings = []
+        for (site_name, stage), group in sorted(groups.items()):
+            durations = sorted(group.pop("durations"))
+            timings.append({
+                "site": site_name,
+                "stage": stage,
+                "count": len(durations),
+                "p50_ms": round(_percentile(durations, 0.5), 1),
+                "p95_ms": round(_percentile(durations, 0.95), 1),
+                "max_ms": round(durations[-1], 1),
+                "total_ms": round(sum(durations), 1),
+                **group,
+            })
+        return timings
+
+
+class HealthCheckRepository:
+    """사이트 상태 점검 결과 저장소"""
+
+    JSON_FIELDS = ('selectors_working', 'issues', 'regressions')
+
+    def __init__(self):
+        self.db = DatabaseConnection()
+
+    def save_results(self, check_id: str, results: List[dict]):
+        """한 번의 점검에서 나온 사이트별 결과 저장 (utils.healthcheck.probe_site 결과의 평탄화 형태)"""
+        with self.db as conn:
+            conn.executemany("""
+                INSERT INTO site_health_checks (
+                    check_id, site, site_name, overall_status,
+                    main_accessible, main_status_code, main_load_ms,
+                    search_accessible, search_load_ms, job_items_count, job_links_found, selectors_working,
+                    detail_accessible, detail_load_ms, title_found, company_found, content_length,
+                    issues, regressions, checked_at
+                ) VALUES (
+                    :check_id, :site, :site_name, :overall_status,
+                    :main_accessible, :main_status_code, :main_load_ms,
+                    :search_accessible, :search_load_ms, :job_items_count, :job_links_found, :selectors_working,
+                    :detail_accessible, :detail_load_ms, :title_found, :company_found, :content_length,
+                    :issues, :regressions, :checked_at
+                )
+            """, [
+                {**row, 'check_id': check_id,
+                 **{field: json.dumps(row.get(field, []), ensure_ascii=False) for field in self.JSON_FIELDS}}
+                for row in results
+            ])
+
+    def get_latest(self, site: str) -> Optional[dict]:
+        """사이트의 가장 최근 점검 결과"""
+        history = self.get_history(site, limit=1)
+        return history[0] if history else None
+
+    def get_history(self, site: Optional[str] = None, limit: int = 30) -> List[dict]:
+        """점검 이력 (최신순, site가 None이면 전체 사이트)"""
+        with self.db as conn:
+            cursor = conn.cursor()
+            if site:
+                cursor.execute("""
+                    SELECT * FROM site_health_checks WHERE site = ?
+                    ORDER BY checked_at DESC, id DESC LIMIT ?
+                """, (site, limit))
+            else:
+                cursor.execute("""
+                    SELECT * FROM site_health_checks ORDER BY checked_at DESC, id DESC LIMIT ?
+                """, (limit,))
+            rows = []
+            for row in cursor.fetchall():
+                result = dict(row)
+                for field in self.JSON_FIELDS:
+                    result[field] = json.loads(result[field])
+                rows.append(result)
+            return rows
+
+
+class CrawlJobRepository:
+    """
+    크롤링 작업 큐 저장소 (API가 등록하고 crawl_worker.py가 실행)
+
+    상태: pending → running → done / failed / cancelled
+    """
+
+    def __init__(self):
+        self.db = DatabaseConnection()
+
+    @staticmethod
+    def _to_dict(row) -> dict:
+        job = dict(row)
+        job['cancel_requested'] = bool(job['cancel_requested'])
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        job.pop('dedupe_key', None)
+        return job
+
+    def enqueue(self, site: str, keyword: Optional[str], max_jobs: int) -> tuple:
+        """
+        작업 등록 (같은 조건의 대기 중인 작업이 있으면 그 작업을 반환)
+
+        Args:
+            site: 사이트 키 (cli 사이트명)
+            keyword: 검색 키워드 (None이면 전체 키워드)
+            max_jobs: 최대 수집 개수
+
+        Returns:
+            (작업 dict, 새로 등록했는지 여부)
+        """
+        dedupe_key = f"{site}|{keyword or ''}|{max_jobs}"
+        with self.db as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR IGNORE INTO crawl_jobs (site, keyword, max_jobs, dedupe_key)
+                VALUES (?, ?, ?, ?)
+            """, (site, keyword, max_jobs, dedupe_key))
+            created = cursor.rowcount > 0
+            if created:
+                cursor.execute("SELECT * FROM crawl_jobs WHERE id = ?", (cursor.lastrowid,))
+            else:
+                cursor.execute("""
+                    SELECT * FROM crawl_jobs WHERE dedupe_key = ? AND status = 'pending'
+                """, (dedupe_key,))
+            return self._to_dict(cursor.fetchone()), created
+
+    def get(self, job_id: int) -> Optional[dict]:
+        with self.db as conn:
+            row = conn.execute("SELECT * FROM crawl_jobs WHERE id = ?", (job_id,)).fetchone()
+            return self._to_dict(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 50) -> List[dict]:
+        """작업 목록 (최신순)"""
+        with self.db as conn:
+            if status:
+                rows = conn.execute("""
+                    SELECT * FROM crawl_jobs WHERE status = ? ORDER BY id DESC LIMIT ?
+                """, (status, limit)).fetchall()
+            else:
+                rows = conn.execute("SELECT * FROM crawl_jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+            return [self._to_dict(row) for row in rows]
+
+    def request_cancel(self, job_id: int) -> Optional[dict]:
+        """
+        작업 취소 요청
+
+        대기 중인 작업은 즉시 cancelled가 되고, 실행 중인 작업은 cancel_requested만 표시하면
+        워커가 크롤링 프로세스를 종료한 뒤 cancelled로 바꾼다.
+
+        Returns:
+            변경 후 작업 dict (없는 작업이면 None)
+        """
+        with self.db as conn:
+            conn.execute("""
+                UPDATE crawl_jobs SET status = 'cancelled', cancel_requested = 1, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status = 'pending'
+            """, (job_id,))
+            conn.execute("""
+                UPDATE crawl_jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'
+            """, (job_id,))
+            row = conn.execute("SELECT * FROM crawl_jobs WHERE id = ?", (job_id,)).fetchone()
+            return self._to_dict(row) if row else None
+
+    def claim(self, worker: str, max_running: int, site_limits: Dict[str, int] = None,
+              default_site_limit: int = 1) -> Optional[dict]:
+        """
+        실행할 작업 하나를 가져와 running으로 표시 (전역/사이트별 동시 실행 수 제한)
+
+        여러 워커 프로세스가 같은 DB를 써도 쓰기 잠금(BEGIN IMMEDIATE) 안에서 세므로 제한을 넘지 않는다.
+
+        Args:
+            worker: 워커 식별자
+            max_running: 전체 동시 실행 작업 수
+            site_limits: 사이트별 동시 실행 작업 수
+            default_site_limit: site_limits에 없는 사이트의 동시 실행 작업 수
+
+        Returns:
+            작업 dict 또는 None (대기 작업이 없거나 제한에 걸림)
+        """
+        site_limits = site_limits or {}
+        with self.db as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            running = dict(conn.execute("""
+                SELECT site, COUNT(*) FROM crawl_jobs WHERE status = 'running' GROUP BY site
+            """).fetchall())
+            if sum(running.values()) >= max_running:
+                return None
+            full_sites = [site for site, count in running.items()
+                          if count >= site_limits.get(site, default_site_limit)]
+            row = conn.execute(f"""
+                SELECT id FROM crawl_jobs
+                WHERE status = 'pending' AND site NOT IN ({', '.join('?' * len(full_sites))})
+                ORDER BY id LIMIT 1
+            """, full_sites).fetchone()
+            if row is None:
+                return None
+            conn.execute("""
+                UPDATE crawl_jobs
+                SET status = 'running', worker = ?, started_at = CURRENT_TIMESTAMP, heartbeat_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (worker, row['id']))
+            return self._to_dict(conn.execute("SELECT * FROM crawl_jobs WHERE id = ?", (row['id'],)).fetchone())
+
+    def heartbeat(self, job_id: int, progress: int) -> bool:
+        """
+        실행 중인 작업의 진행 상황 기록
+
+        Returns:
+            취소 요청 여부
+        """
+        with self.db as conn:
+            conn.execute("""
+                UPDATE crawl_jobs SET progress = ?, heartbeat_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status = 'running'
+            """, (progress, job_id))
+            row = conn.execute("SELECT cancel_requested FROM crawl_jobs WHERE id = ?", (job_id,)).fetchone()
+            return bool(row and row['cancel_requested'])
+
+    def finish(self, job_id: int, status: str, result: Optional[dict] = None, error: Optional[str] = None) -> bool:
+        """
+        실행 중인 작업 종료 기록 (이미 종료된 작업이면 무시)
+
+        Args:
+            status: done, failed, cancelled
+            result: 실행 요약
+            error: 오류 메시지
+
+        Returns:
+            반영 여부
+        """
+        with self.db as conn:
+            cursor = conn.execute("""
+                UPDATE crawl_jobs
+                SET status = ?, result = COALESCE(?, result), error = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status = 'running'
+            """, (status, json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+                  error, job_id))
+            return cursor.rowcount > 0
+
+    def fail_stale(self, timeout_seconds: int) -> int:
+        """heartbeat가 timeout_seconds 이상 없는 실행 중 작업을 실패 처리 (워커가 죽은 경우)"""
+        with self.db as conn:
+            cursor = conn.execute("""
+                UPDATE crawl_jobs
+                SET status = 'failed', error = '워커 응답 없음', finished_at = CURRENT_TIMESTAMP
+                WHERE status = 'running' AND heartbeat_at < datetime('now', ?)
+            """, (f"-{int(timeout_seconds)} seconds",))
+            return cursor.rowcount
+
+
+
+class FacetRepository:
+    """공고 목록 패싯 인덱스(app/facets.py)용 조회"""
+
+    def __init__(self):
+        self.db = DatabaseConnection()
+
+    def get_generation(self) -> int:
+        """데이터 세대 (공고/분석이 바뀔 때마다 증가)"""
+        with self.db as conn:
+            row = conn.execute("SELECT generation FROM data_generation WHERE id = 1").fetchone()
+            return row['generation'] if row else 0
+
+    def get_state(self, indexed_job_id: int) -> dict:
+        """
+        인덱스 갱신 기준값
+
+        Args:
+            indexed_job_id: 인덱스에 반영된 마지막 공고 ID
+
+        Returns:
+            {"max_job_id", "indexed_count" (indexed_job_id 이하 공고 수), "max_analysis_id"}
+        """
+        with self.db as conn:
+            row = conn.execute("""
+                SELECT
+                    (SELECT COALESCE(MAX(id), 0) FROM jobs) AS max_job_id,
+                    (SELECT COUNT(*) FROM jobs WHERE id <= ?) AS indexed_count,
+                    (SELECT COALESCE(MAX(id), 0) FROM risk_analysis) AS max_analysis_id
+            """, (indexed_job_id,)).fetchone()
+            return dict(row)
+
+    def get_reanalyzed_job_ids(self, after_analysis_id: int, max_analysis_id: int, max_job_id: int) -> List[int]:
+        """after_analysis_id 이후 분석 결과가 다시 저장된 공고 ID (max_job_id 이하, 재방문 공고)"""
+        with self.db as conn:
+            rows = conn.execute("""
+                SELECT DISTINCT job_id FROM risk_analysis
+                WHERE id > ? AND id <= ? AND job_id <= ?
+                ORDER BY job_id
+            """, (after_analysis_id, max_analysis_id, max_job_id)).fetchall()
+            return [row['job_id'] for row in rows]
+
+    def _get_postings(self, where: str, params: tuple) -> List[dict]:
+        with self.db as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT
+                    j.id, j.source_site, j.search_keyword, j.crawled_date,
+                    (SELECT r.risk_level FROM risk_analysis r WHERE r.job_id = j.id ORDER BY r.id DESC LIMIT 1)
+                        AS risk_level
+                FROM jobs j
+                WHERE {where.format(column='j.id')}
+                ORDER BY j.id
+            """, params)
+            postings = {row['id']: {**dict(row), 'search_keywords': [], 'matches': []} for row in cursor.fetchall()}
+            cursor.execute(f"""
+                SELECT job_id, keyword FROM job_search_keywords
+                WHERE {where.format(column='job_id')}
+            """, params)
+            for row in cursor.fetchall():
+                if row['job_id'] in postings:
+                    postings[row['job_id']]['search_keywords'].append(row['keyword'])
+            cursor.execute(f"""
+                SELECT job_id, keyword, category FROM keyword_matches
+                WHERE {where.format(column='job_id')}
+            """, params)
+            for row in cursor.fetchall():
+                if row['job_id'] in postings:
+                    postings[row['job_id']]['matches'].append((row['keyword'], row['category']))
+            return list(postings.values())
+
+    def get_postings_in_range(self, after_id: int, max_id: int) -> List[dict]:
+        """
+        ID 구간 (after_id, max_id]의 공고 패싯 값 (ID 순)
+
+        Returns:
+            [{"id", "source_site", "search_keyword", "crawled_date", "risk_level",
+              "search_keywords": [검색 키워드, ...], "matches": [(keyword, category), ...]}, ...]
+        """
+        return self._get_postings("{column} > ? AND {column} <= ?", (after_id, max_id))
+
+    def get_postings_by_ids(self, job_ids: List[int]) -> List[dict]:
+        """지정한 공고들의 패싯 값 (get_postings_in_range와 같은 형식)"""
+        if not job_ids:
+            return []
+        return self._get_postings(f"{{column}} IN ({', '.join('?' * len(job_ids))})", tuple(job_ids))
+
+
 if __name__ == "__main__":
     # 테스트
     print("Repository 테스트...")
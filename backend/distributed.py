@@ -0,0 +1,279 @@
+"""
+분산 크롤링 실행 스크립트
+공유 작업 큐(utils.work_queue)를 통해 여러 워커 호스트가 검색/상세 작업을 나누어 수집한다
+
+사용 예:
+    # 1. 작업 큐에 키워드 검색 작업 등록
+    python distributed.py seed --queue data/work_queue/nightly.sqlite --site all
+
+    # 2. 코디네이터 실행 (워커 결과를 스트리밍 파이프라인으로 DB에 저장)
+    #    기본은 로컬 전용 바인딩이며, 다른 호스트의 워커를 받으려면 --host 0.0.0.0
+    export WORK_QUEUE_TOKEN=<공유 토큰>
+    python distributed.py coordinator --queue data/work_queue/nightly.sqlite --host 0.0.0.0 --port 8765
+
+    # 3. 워커 실행 (호스트마다, 또는 한 호스트에서 여러 개, 같은 WORK_QUEUE_TOKEN 필요)
+    python distributed.py worker --coordinator http://10.0.0.5:8765
+    python distributed.py worker --queue data/work_queue/nightly.sqlite   # 코디네이터 없이 같은 파일 공유
+
+    # 진행 상황 / 결과 JSON 저장
+    python distributed.py status --queue data/work_queue/nightly.sqlite
+    python distributed.py export --queue data/work_queue/nightly.sqlite
+"""
+import argparse
+import json
+import os
+import secrets
+import socket
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from cli import CRAWLER_CLASSES, load_keywords, load_site_config
+from utils.file_handler import create_job_data, save_json
+from utils.frontier import canonicalize_url
+from utils.logger import setup_logger
+from utils.pipeline import CrawlPipeline
+from utils.resilience import DEFAULT_BREAKER, CircuitOpenError
+from utils.scheduler import get_scheduler
+from utils.work_queue import HttpWorkQueue, SqliteWorkQueue, serve_work_queue
+
+logger = setup_logger("Distributed")
+
+# 검색 작업을 상세 작업보다 먼저 처리 (같은 공고를 노출시킨 키워드가 상세 수집 전에 모두 모이도록)
+SEARCH_PRIORITY = 1
+DETAIL_PRIORITY = 0
+
+# 코디네이터 공유 토큰 환경 변수 (--token을 지정하지 않은 경우 사용)
+TOKEN_ENV = "WORK_QUEUE_TOKEN"
+
+
+def seed(queue: SqliteWorkQueue, sites: List[str], keywords: List[str], max_jobs: int) -> int:
+    """
+    사이트별 키워드 검색 작업 등록과 사이트 전역 요청 속도 설정
+
+    검색 결과 링크 수집(get_job_links)을 지원하는 사이트만 등록한다.
+
+    Returns:
+        새로 등록된 작업 수
+    """
+    added = 0
+    for site in sites:
+        if not hasattr(CRAWLER_CLASSES[site], "get_job_links"):
+            logger.warning(f"{site}: 검색 결과 링크 수집을 지원하지 않아 분산 크롤링에서 제외합니다")
+            continue
+        config = load_site_config(site)
+        politeness = config.get("politeness", {})
+        if "requests_per_second" in politeness:
+            queue.set_site_rate(site, politeness["requests_per_second"])
+        for keyword in keywords:
+            if queue.enqueue(site, "search", {"keyword": keyword, "max_jobs": max_jobs},
+                             dedupe_key=keyword, priority=SEARCH_PRIORITY):
+                added += 1
+    return added
+
+
+def execute_task(queue, crawler, task: Dict) -> Dict:
+    """
+    작업 하나 실행 (기존 크롤러의 검색/상세 파싱 함수 사용)
+
+    - search: 검색 결과 링크를 수집하고 링크마다 detail 작업 등록 (이미 등록된 공고면 검색 키워드만 추가)
+    - detail: 공고 상세 파싱 (공고를 노출시킨 검색 키워드 전체 기록)
+
+    Returns:
+        complete()에 보고할 결과
+    """
+    payload = task["payload"]
+    if task["kind"] == "search":
+        links = crawler.get_job_links(payload["keyword"], payload.get("max_jobs", 50))
+        for url in links:
+            queue.enqueue(task["site"], "detail", {"url": url, "keywords": [payload["keyword"]]},
+                          dedupe_key=canonicalize_url(url), priority=DETAIL_PRIORITY, merge="keywords")
+        return {"links": links}
+
+    if task["kind"] == "detail":
+        job_info = crawler.parse_job_detail(payload["url"])
+        if job_info:
+            # 이전 버전 큐에 등록된 작업은 keyword 하나만 가짐
+            keywords = payload.get("keywords") or [payload.get("keyword", "")]
+            job_info["search_keyword"] = keywords[0]
+            job_info["search_keywords"] = keywords
+        return {"site_name": crawler.config["site_name"], "job": job_info}
+
+    raise ValueError(f"알 수 없는 작업 종류: {task['kind']}")
+
+
+def run_worker(queue, worker_id: str, sites: List[str] = None, headless: bool = True,
+               poll_interval: float = 2.0) -> Dict[str, int]:
+    """
+    작업 큐가 빌 때까지 작업을 임대해 처리
+
+    사이트별 크롤러(브라우저)는 해당 사이트 작업을 처음 받을 때 시작해 종료 시까지 재사용하며,
+    크롤러의 페이지 이동마다 큐의 사이트 전역 요청 간격을 차감한다 (검색 작업의 여러 결과 페이지 포함).
+
+    Args:
+        queue: SqliteWorkQueue 또는 HttpWorkQueue
+        worker_id: 워커 식별자
+        sites: 처리할 사이트 (None이면 전체)
+        headless: 헤드리스 모드 여부
+        poll_interval: 처리할 작업이 없을 때 대기 시간 (초)
+
+    Returns:
+        처리 통계 (done, failed)
+    """
+    crawlers = {}
+    stats = {"done": 0, "failed": 0}
+    try:
+        while True:
+            task = queue.lease(worker_id, sites)
+            if task is None:
+                totals = queue.stats()["totals"]
+                if not totals.get("pending") and not totals.get("leased"):
+                    logger.info(f"[{worker_id}] 남은 작업이 없어 종료합니다")
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            site = task["site"]
+            try:
+                if site not in crawlers:
+                    crawlers[site] = CRAWLER_CLASSES[site](headless=headless)
+                    get_scheduler().for_site(crawlers[site].config).global_limiter = (
+                        lambda site=site: queue.reserve_slot(site)
+                    )
+                    crawlers[site].start()
+                result = execute_task(queue, crawlers[site], task)
+                queue.complete(task["id"], task["lease_token"], result)
+                stats["done"] += 1
+                logger.info(f"[{worker_id}] {site} {task['kind']} 완료 (작업 {task['id']})")
+            except Exception as e:
+                # 서킷 브레이커가 열린 경우 cooldown 뒤에 다시 시도
+                retry_after = None
+                if isinstance(e, CircuitOpenError):
+                    retry_after = {**DEFAULT_BREAKER, **load_site_config(site).get("circuit_breaker", {})}["cooldown"]
+                status = queue.fail(task["id"], task["lease_token"], f"{type(e).__name__}: {e}", retry_after)
+                stats["failed"] += 1
+                logger.error(f"[{worker_id}] {site} {task['kind']} 실패 (작업 {task['id']}, {status}): {e}")
+    finally:
+        for crawler in crawlers.values():
+            crawler.close()
+    return stats
+
+
+def export_results(queue: SqliteWorkQueue) -> List[Path]:
+    """완료된 상세 작업 결과를 사이트별 JSON 파일로 저장"""
+    by_site: Dict[str, List[Dict]] = {}
+    site_names = {}
+    for item in queue.iter_results("detail"):
+        result = item["result"] or {}
+        if result.get("job"):
+            by_site.setdefault(item["site"], []).append(result["job"])
+            site_names[item["site"]] = result.get("site_name", item["site"])
+
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    paths = []
+    for site, jobs in by_site.items():
+        data = create_job_data(site=site_names[site], keyword="distributed", jobs=jobs)
+        paths.append(save_json(data, f"{site}_distributed_{timestamp}.json"))
+        logger.info(f"{site}: {len(jobs)}개 공고 저장")
+    return paths
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="분산 크롤링 (공유 작업 큐)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = subparsers.add_parser("seed", help="키워드 검색 작업 등록")
+    seed_parser.add_argument("--queue", required=True, help="작업 큐 SQLite 파일")
+    seed_parser.add_argument("--site", default="all", choices=[*CRAWLER_CLASSES, "all"], help="사이트 (기본값: all)")
+    seed_parser.add_argument("--keyword", default=None, help="검색 키워드 (기본값: config/keywords.json 전체)")
+    seed_parser.add_argument("--max-jobs", type=int, default=50, help="키워드당 최대 공고 수 (기본값: 50)")
+
+    coordinator_parser = subparsers.add_parser("coordinator", help="작업 큐 HTTP 코디네이터 실행")
+    coordinator_parser.add_argument("--queue", required=True, help="작업 큐 SQLite 파일")
+    coordinator_parser.add_argument("--host", default="127.0.0.1",
+                                    help="바인딩 주소 (기본값: 127.0.0.1, 다른 호스트의 워커를 받으려면 0.0.0.0)")
+    coordinator_parser.add_argument("--port", type=int, default=8765, help="포트 (기본값: 8765)")
+    coordinator_parser.add_argument("--token", default=os.environ.get(TOKEN_ENV),
+                                    help=f"워커와 공유할 토큰 (기본값: 환경 변수 {TOKEN_ENV}, 없으면 새로 생성)")
+    coordinator_parser.add_argument("--no-pipeline", action="store_true", help="완료된 공고를 DB에 저장하지 않음")
+
+    worker_parser = subparsers.add_parser("worker", help="작업을 임대해 크롤링하는 워커 실행")
+    source = worker_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--coordinator", help="코디네이터 주소 (예: http://10.0.0.5:8765)")
+    source.add_argument("--queue", help="작업 큐 SQLite 파일 (같은 호스트에서 직접 사용)")
+    worker_parser.add_argument("--site", action="append", choices=list(CRAWLER_CLASSES), help="처리할 사이트 (여러 번 지정 가능, 기본값: 전체)")
+    worker_parser.add_argument("--token", default=os.environ.get(TOKEN_ENV),
+                               help=f"코디네이터 공유 토큰 (기본값: 환경 변수 {TOKEN_ENV})")
+    worker_parser.add_argument("--worker-id", default=None, help="워커 식별자 (기본값: 호스트명-PID)")
+    worker_parser.add_argument("--no-headless", action="store_true", help="브라우저 창 표시")
+
+    status_parser = subparsers.add_parser("status", help="작업 진행 상황 출력")
+    status_parser.add_argument("--queue", required=True, help="작업 큐 SQLite 파일")
+
+    export_parser = subparsers.add_parser("export", help="완료된 공고를 JSON 파일로 저장")
+    export_parser.add_argument("--queue", required=True, help="작업 큐 SQLite 파일")
+
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        queue = SqliteWorkQueue(args.queue)
+        if args.keyword:
+            keywords = [args.keyword]
+        else:
+            keywords = sorted({keyword for kw_list in load_keywords().values() for keyword in kw_list})
+        sites = list(CRAWLER_CLASSES) if args.site == "all" else [args.site]
+        added = seed(queue, sites, keywords, args.max_jobs)
+        logger.info(f"검색 작업 {added}개 등록 ({len(sites)}개 사이트 × {len(keywords)}개 키워드)")
+        queue.close()
+
+    elif args.command == "coordinator":
+        queue = SqliteWorkQueue(args.queue)
+        pipeline = None
+        on_complete = None
+        if not args.no_pipeline:
+            pipeline = CrawlPipeline()
+            pipeline.start()
+
+            def on_complete(task_id: int, result: Dict):
+                if result.get("job"):
+                    pipeline.submit(result["site_name"], result["job"])
+
+        token = args.token
+        if not token:
+            token = secrets.token_urlsafe(32)
+            logger.info(f"공유 토큰 생성: {token} (워커에 --token 또는 {TOKEN_ENV}로 전달)")
+        server = serve_work_queue(queue, token, args.host, args.port, on_complete=on_complete)
+        logger.info(f"코디네이터 시작: http://{args.host}:{args.port} (큐: {args.queue})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("코디네이터 종료")
+        finally:
+            server.server_close()
+            if pipeline:
+                logger.info(f"파이프라인: {pipeline.close()}")
+            queue.close()
+
+    elif args.command == "worker":
+        if args.coordinator and not args.token:
+            parser.error(f"--coordinator 사용 시 --token 또는 환경 변수 {TOKEN_ENV}가 필요합니다")
+        queue = HttpWorkQueue(args.coordinator, args.token) if args.coordinator else SqliteWorkQueue(args.queue)
+        worker_id = args.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        stats = run_worker(queue, worker_id, sites=args.site, headless=not args.no_headless)
+        logger.info(f"[{worker_id}] 완료 {stats['done']}개, 실패 {stats['failed']}개")
+        queue.close()
+
+    elif args.command == "status":
+        queue = SqliteWorkQueue(args.queue)
+        print(json.dumps(queue.stats(), ensure_ascii=False, indent=2))
+        queue.close()
+
+    elif args.command == "export":
+        queue = SqliteWorkQueue(args.queue)
+        export_results(queue)
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,8 @@
 """
 import json
 import re
-import time
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 from typing import List, Dict, Optional
 import sys
 
@@ -13,6 +12,11 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.logger import setup_logger
 from utils.file_handler import save_json, create_job_data
+from utils.resilience import get_breaker, record_empty, record_extracted
+from utils.navigation import goto, settle
+from utils.telemetry import TimedPage
+from utils import browser_state
+from utils.pagination import paginate_links
 
 
 class AlbaCrawler:
@@ -27,7 +31,11 @@ class AlbaCrawler:
         self.headless = headless
         self.config = self._load_config()
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.seen_filter = None  # 증분 크롤링용 SeenUrlFilter (cli에서 설정)
+        self.checkpoint = None  # 실행 체크포인트 CrawlCheckpoint (cli에서 설정)
+        self.pipeline = None  # 스트리밍 분석/저장 CrawlPipeline (cli에서 설정)
 
     def _load_config(self) -> dict:
         """설정 파일 로드"""
@@ -46,20 +54,25 @@ class AlbaCrawler:
                 '--disable-dev-shm-usage',
             ]
         )
-        self.page = self.browser.new_page(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        # 결과 페이지 탭(pagination)도 같은 쿠키/user agent/viewport를 쓰도록 컨텍스트를 직접 생성
+        self.context = self.browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={"width": 1920, "height": 1080},
+            **browser_state.context_options(self.config)  # 저장된 쿠키/localStorage
         )
-        self.page.set_viewport_size({"width": 1920, "height": 1080})
-        self.page.add_init_script("""
+        self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
         """)
+        self.page = self.context.new_page()
+        self.page = TimedPage(self.page)  # 준비 대기/추출 시간 계측
         self.logger.info("브라우저 시작 완료 (Bot Detection 회피 적용)")
 
     def close(self):
         """브라우저 종료"""
         if self.browser:
+            browser_state.save_state(self.page, self.config)
             self.browser.close()
         if hasattr(self, 'playwright'):
             self.playwright.stop()
@@ -106,7 +119,7 @@ class AlbaCrawler:
                     popup_btn = self.page.query_selector(selector)
                     if popup_btn and popup_btn.is_visible():
                         popup_btn.click()
-                        time.sleep(0.5)
+                        settle(0.5)
                         self.logger.debug(f"팝업 닫음: {selector}")
                 except:
                     continue
@@ -127,12 +140,12 @@ class AlbaCrawler:
             # 검색 URL로 직접 이동 (더 안정적)
             search_url = self.config["search_url"].format(keyword=keyword)
             self.logger.info(f"검색 URL로 이동: {search_url}")
-            self.page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(2)
+            goto(self.page, self.config, search_url, wait_until="domcontentloaded", timeout=60000)
+            settle(2)
             
             # 검색 결과 로딩 대기
             self.page.wait_for_load_state('networkidle', timeout=10000)
-            time.sleep(2)
+            settle(2)
 
             # 팝업 닫기
             self._close_popups()
@@ -148,17 +161,21 @@ class AlbaCrawler:
             self.logger.error(f"검색 중 오류 발생: {e}", exc_info=True)
             return False
 
-    def get_job_list(self) -> List[str]:
+    def get_job_list(self, page: Page = None) -> List[str]:
         """
         현재 페이지의 공고 목록에서 공고 링크 수집
 
+        Args:
+            page: 공고 목록이 로드된 페이지 (None이면 현재 페이지)
+
         Returns:
             공고 링크 리스트
         """
+        page = page or self.page
         job_links = []
         try:
             # JavaScript로 링크 수집 - 알바천국의 실제 패턴: /job/Detail?adid=
-            links_data = self.page.evaluate("""
+            links_data = page.evaluate("""
                 () => {
                     const links = [];
 
@@ -205,154 +222,147 @@ class AlbaCrawler:
         Returns:
             파싱된 공고 정보 딕셔너리
         """
-        max_retries = self.config.get("max_retries", 3)
-        for attempt in range(max_retries):
-            try:
-                self.logger.debug(f"공고 상세 페이지 접속: {job_url} (시도 {attempt + 1}/{max_retries})")
-                self.page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(self.config.get("wait_time", 3))
-
-                # 팝업 닫기
-                self._close_popups()
-
-                job_info = {
-                    "url": job_url,
-                    "title": "",
-                    "company": "",
-                    "location": "",
-                    "salary": "",
-                    "conditions": "",
-                    "detail": "",
-                    "recruit_summary": "",
-                    "posted_date": ""
-                }
+        try:
+            self.logger.debug(f"공고 상세 페이지 접속: {job_url}")
+            goto(self.page, self.config, job_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 3))
 
-                # JavaScript로 정확한 정보 추출
-                parsed_data = self.page.evaluate("""
-                () => {
-                    const result = {
-                        title: '',
-                        company: '',
-                        location: '',
-                        salary: '',
-                        conditions: '',
-                        detail: '',
-                        recruit_summary: '',
-                        posted_date: ''
-                    };
-
-                    // 제목 추출 (h1, h2, .title 등)
-                    const titleSelectors = ['h1', 'h2', '.title', '[class*="title"]', '.job-title'];
-                    for (const sel of titleSelectors) {
-                        const el = document.querySelector(sel);
-                        if (el && el.innerText.trim()) {
-                            result.title = el.innerText.trim();
-                            break;
-                        }
-                    }
+            # 팝업 닫기
+            self._close_popups()
 
-                    // 회사명 추출
-                    const companySelectors = [
-                        '[class*="company"]',
-                        '[class*="corp"]',
-                        'h3',
-                        '.brand-name',
-                        '[class*="brand"]'
-                    ];
-                    for (const sel of companySelectors) {
-                        const el = document.querySelector(sel);
-                        if (el && el.innerText.trim()) {
-                            const text = el.innerText.trim();
-                            if (text && text !== result.title) {
-                                result.company = text;
-                                break;
-                            }
-                        }
+            job_info = {
+                "url": job_url,
+                "title": "",
+                "company": "",
+                "location": "",
+                "salary": "",
+                "conditions": "",
+                "detail": "",
+                "recruit_summary": "",
+                "posted_date": ""
+            }
+
+            # JavaScript로 정확한 정보 추출
+            parsed_data = self.page.evaluate("""
+            () => {
+                const result = {
+                    title: '',
+                    company: '',
+                    location: '',
+                    salary: '',
+                    conditions: '',
+                    detail: '',
+                    recruit_summary: '',
+                    posted_date: ''
+                };
+
+                // 제목 추출 (h1, h2, .title 등)
+                const titleSelectors = ['h1', 'h2', '.title', '[class*="title"]', '.job-title'];
+                for (const sel of titleSelectors) {
+                    const el = document.querySelector(sel);
+                    if (el && el.innerText.trim()) {
+                        result.title = el.innerText.trim();
+                        break;
                     }
+                }
 
-                    // 상세 내용 (main 또는 body)
-                    const mainEl = document.querySelector('main') ||
-                                   document.querySelector('.content') ||
-                                   document.body;
-                    if (mainEl) {
-                        result.detail = mainEl.innerText.trim();
+                // 회사명 추출
+                const companySelectors = [
+                    '[class*="company"]',
+                    '[class*="corp"]',
+                    'h3',
+                    '.brand-name',
+                    '[class*="brand"]'
+                ];
+                for (const sel of companySelectors) {
+                    const el = document.querySelector(sel);
+                    if (el && el.innerText.trim()) {
+                        const text = el.innerText.trim();
+                        if (text && text !== result.title) {
+                            result.company = text;
+                            break;
+                        }
                     }
+                }
 
-                    // detail에서 정보 추출
-                    const detail = result.detail;
+                // 상세 내용 (main 또는 body)
+                const mainEl = document.querySelector('main') ||
+                               document.querySelector('.content') ||
+                               document.body;
+                if (mainEl) {
+                    result.detail = mainEl.innerText.trim();
+                }
 
-                    // 급여 패턴 찾기
-                    const salaryMatch = detail.match(/(?:급여|시급|일급|월급|연봉)[\\s\\n]*:?[\\s\\n]*([^\\n]{0,100})/i);
-                    if (salaryMatch) {
-                        result.salary = salaryMatch[1].trim();
-                    }
+                // detail에서 정보 추출
+                const detail = result.detail;
 
-                    // 근무지 패턴 찾기
-                    const locationMatch = detail.match(/(?:근무지|근무지역|지역|주소)[\\s\\n]*:?[\\s\\n]*([^\\n]{0,150})/i);
-                    if (locationMatch) {
-                        result.location = locationMatch[1].trim();
-                    } else {
-                        // 지역 패턴으로 찾기
-                        const regionMatch = detail.match(/(서울|경기|인천|부산|대구|광주|대전|울산|세종|강원|충북|충남|전북|전남|경북|경남|제주)[^\\n]{0,100}/);
-                        if (regionMatch) {
-                            result.location = regionMatch[0].trim();
-                        }
-                    }
+                // 급여 패턴 찾기
+                const salaryMatch = detail.match(/(?:급여|시급|일급|월급|연봉)[\\s\\n]*:?[\\s\\n]*([^\\n]{0,100})/i);
+                if (salaryMatch) {
+                    result.salary = salaryMatch[1].trim();
+                }
 
-                    // 지원자격/모집조건 패턴 찾기
-                    const conditionsMatch = detail.match(/(?:지원자격|자격요건|모집조건|지원조건)[\\s\\S]{0,800}/i);
-                    if (conditionsMatch) {
-                        result.conditions = conditionsMatch[0].trim();
+                // 근무지 패턴 찾기
+                const locationMatch = detail.match(/(?:근무지|근무지역|지역|주소)[\\s\\n]*:?[\\s\\n]*([^\\n]{0,150})/i);
+                if (locationMatch) {
+                    result.location = locationMatch[1].trim();
+                } else {
+                    // 지역 패턴으로 찾기
+                    const regionMatch = detail.match(/(서울|경기|인천|부산|대구|광주|대전|울산|세종|강원|충북|충남|전북|전남|경북|경남|제주)[^\\n]{0,100}/);
+                    if (regionMatch) {
+                        result.location = regionMatch[0].trim();
                     }
+                }
 
-                    // 모집요강 패턴 찾기
-                    const recruitMatch = detail.match(/(?:모집요강|채용내용|상세내용|업무내용)[\\s\\S]{0,1500}/i);
-                    if (recruitMatch) {
-                        result.recruit_summary = recruitMatch[0].trim();
-                    }
+                // 지원자격/모집조건 패턴 찾기
+                const conditionsMatch = detail.match(/(?:지원자격|자격요건|모집조건|지원조건)[\\s\\S]{0,800}/i);
+                if (conditionsMatch) {
+                    result.conditions = conditionsMatch[0].trim();
+                }
 
-                    // 등록일/마감일 패턴 찾기
-                    const dateMatch = detail.match(/(?:마감일|등록일|접수기간|게시일)[\\s\\n]*:?[\\s\\n]*(\\d{4}[\\s\\-./]\\d{1,2}[\\s\\-./]\\d{1,2}[^\\n]{0,30})/);
-                    if (dateMatch) {
-                        result.posted_date = dateMatch[1].trim();
-                    }
+                // 모집요강 패턴 찾기
+                const recruitMatch = detail.match(/(?:모집요강|채용내용|상세내용|업무내용)[\\s\\S]{0,1500}/i);
+                if (recruitMatch) {
+                    result.recruit_summary = recruitMatch[0].trim();
+                }
 
-                    return result;
+                // 등록일/마감일 패턴 찾기
+                const dateMatch = detail.match(/(?:마감일|등록일|접수기간|게시일)[\\s\\n]*:?[\\s\\n]*(\\d{4}[\\s\\-./]\\d{1,2}[\\s\\-./]\\d{1,2}[^\\n]{0,30})/);
+                if (dateMatch) {
+                    result.posted_date = dateMatch[1].trim();
                 }
-                """)
 
-                # 파싱된 데이터를 job_info에 반영
-                job_info.update(parsed_data)
+                return result;
+            }
+            """)
 
-                # 정규표현식으로 재추출 (fallback)
-                if job_info["detail"]:
-                    job_info = self._extract_fields_from_detail(job_info)
+            # 파싱된 데이터를 job_info에 반영
+            job_info.update(parsed_data)
 
-                # 텍스트 정리
-                job_info["location"] = self._clean_text(job_info["location"], max_length=200)
-                job_info["salary"] = self._clean_text(job_info["salary"], max_length=100)
-                job_info["conditions"] = self._clean_text(job_info["conditions"], max_length=500)
-                job_info["recruit_summary"] = self._clean_text(job_info["recruit_summary"], max_length=2000)
-                job_info["posted_date"] = self._clean_text(job_info["posted_date"], max_length=50)
+            # 정규표현식으로 재추출 (fallback)
+            if job_info["detail"]:
+                job_info = self._extract_fields_from_detail(job_info)
 
-                # 제목이 없으면 스킵
-                if not job_info["title"]:
-                    self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
-                    return None
+            # 텍스트 정리
+            job_info["location"] = self._clean_text(job_info["location"], max_length=200)
+            job_info["salary"] = self._clean_text(job_info["salary"], max_length=100)
+            job_info["conditions"] = self._clean_text(job_info["conditions"], max_length=500)
+            job_info["recruit_summary"] = self._clean_text(job_info["recruit_summary"], max_length=2000)
+            job_info["posted_date"] = self._clean_text(job_info["posted_date"], max_length=50)
 
-                self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
-                return job_info
+            # 제목이 없으면 스킵
+            if not job_info["title"]:
+                self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
+                record_empty(self.config, job_url)
+                return None
 
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    self.logger.warning(f"공고 상세 파싱 시도 {attempt + 1} 실패, 재시도 중: {e}")
-                    time.sleep(2)
-                    continue
-                else:
-                    self.logger.error(f"공고 상세 파싱 최종 실패 ({job_url}): {e}", exc_info=True)
-                    return None
-        
-        return None
+            self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
+            record_extracted(self.config)
+            return job_info
+
+        except Exception as e:
+            self.logger.error(f"공고 상세 파싱 중 오류 ({job_url}): {e}", exc_info=True)
+            return None
 
     def _extract_fields_from_detail(self, job_info: Dict) -> Dict:
         """
@@ -423,39 +433,60 @@ class AlbaCrawler:
 
         return job_info
 
-    def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
+    def get_job_links(self, keyword: str, max_jobs: int = 50) -> List[str]:
         """
-        키워드로 검색하여 공고 수집
+        키워드로 검색하여 상세 페이지를 방문할 공고 링크 수집
 
         Args:
             keyword: 검색 키워드
             max_jobs: 최대 수집할 공고 수
 
         Returns:
-            수집된 공고 정보 리스트
+            공고 링크 리스트 (증분 필터 적용 후)
         """
-        self.logger.info(f"'{keyword}' 키워드로 크롤링 시작")
-
         if not self.search(keyword):
             return []
 
-        all_jobs = []
-        job_links = self.get_job_list()
+        # 결과 페이지를 넘기며 수집 (이미 수집된 공고는 페이지 단위로 제외)
+        job_links = paginate_links(
+            self.page, self.config, self.get_job_list,
+            max_links=max_jobs,
+            filter_new=self.seen_filter.filter_new if self.seen_filter else None
+        )
 
         if not job_links:
             self.logger.warning("공고 링크를 찾을 수 없습니다")
+
+        return job_links
+
+    def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
+        """
+        키워드로 검색하여 공고 수집
+
+        Args:
+            keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수
+
+        Returns:
+            수집된 공고 정보 리스트
+        """
+        self.logger.info(f"'{keyword}' 키워드로 크롤링 시작")
+
+        job_links = self.get_job_links(keyword, max_jobs)
+        if not job_links:
             return []
 
-        # 최대 개수만큼만 수집
-        job_links = job_links[:max_jobs]
+        all_jobs = []
 
         for i, job_url in enumerate(job_links, 1):
+            if get_breaker(self.config).is_open():
+                self.logger.error("서킷 브레이커가 열려 남은 공고 수집을 중단합니다")
+                break
             try:
                 self.logger.info(f"진행 중: {i}/{len(job_links)}")
                 job_info = self.parse_job_detail(job_url)
                 if job_info:
                     all_jobs.append(job_info)
-                time.sleep(1)  # 요청 간 대기
             except Exception as e:
                 self.logger.error(f"공고 처리 중 오류 ({job_url}): {e}")
                 continue
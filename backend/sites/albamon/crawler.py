@@ -3,9 +3,8 @@
 """
 import json
 import re
-import time
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 from typing import List, Dict, Optional
 import sys
 
@@ -13,6 +12,11 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.logger import setup_logger
 from utils.file_handler import save_json, create_job_data
+from utils.resilience import get_breaker, record_empty, record_extracted
+from utils.navigation import goto, settle
+from utils.telemetry import TimedPage
+from utils import browser_state
+from utils.pagination import paginate_links
 
 
 class AlbamonCrawler:
@@ -27,7 +31,11 @@ class AlbamonCrawler:
         self.headless = headless
         self.config = self._load_config()
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.seen_filter = None  # 증분 크롤링용 SeenUrlFilter (cli에서 설정)
+        self.checkpoint = None  # 실행 체크포인트 CrawlCheckpoint (cli에서 설정)
+        self.pipeline = None  # 스트리밍 분석/저장 CrawlPipeline (cli에서 설정)
 
     def _load_config(self) -> dict:
         """설정 파일 로드"""
@@ -46,20 +54,25 @@ class AlbamonCrawler:
                 '--disable-dev-shm-usage',
             ]
         )
-        self.page = self.browser.new_page(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        # 결과 페이지 탭(pagination)도 같은 쿠키/user agent/viewport를 쓰도록 컨텍스트를 직접 생성
+        self.context = self.browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={"width": 1920, "height": 1080},
+            **browser_state.context_options(self.config)  # 저장된 쿠키/localStorage
         )
-        self.page.set_viewport_size({"width": 1920, "height": 1080})
-        self.page.add_init_script("""
+        self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
         """)
+        self.page = self.context.new_page()
+        self.page = TimedPage(self.page)  # 준비 대기/추출 시간 계측
         self.logger.info("브라우저 시작 완료 (Bot Detection 회피 적용)")
 
     def close(self):
         """브라우저 종료"""
         if self.browser:
+            browser_state.save_state(self.page, self.config)
             self.browser.close()
         if hasattr(self, 'playwright'):
             self.playwright.stop()
@@ -89,12 +102,13 @@ class AlbamonCrawler:
 
         return text
 
-    def get_job_list(self, keyword: str) -> List[str]:
+    def get_job_list(self, keyword: str, max_jobs: int = 50) -> List[str]:
         """
         검색 결과에서 공고 링크 수집
 
         Args:
             keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수 (증분 필터 적용 후 기준)
 
         Returns:
             공고 링크 리스트
@@ -104,33 +118,16 @@ class AlbamonCrawler:
             # 검색 URL로 이동
             search_url = self.config["search_url"].format(keyword=keyword)
             self.logger.info(f"검색 페이지로 이동: {search_url}")
-            self.page.goto(search_url, wait_until="networkidle", timeout=60000)
-            time.sleep(self.config.get("wait_time", 3))
-
-            # 공고 링크 수집 (JavaScript 사용)
-            links_data = self.page.evaluate("""
-                () => {
-                    const links = [];
-                    // 알바몬의 공고 링크 패턴: /jobs/detail/[숫자]
-                    const jobLinks = document.querySelectorAll('a[href*="/jobs/detail/"]');
-
-                    jobLinks.forEach(link => {
-                        const href = link.getAttribute('href');
-                        if (href && !links.includes(href)) {
-                            const fullUrl = href.startsWith('http') ? href : 'https://www.albamon.com' + href;
-                            // searchRow, logpath 등 쿼리 파라미터 제거 (고유 URL만 유지)
-                            const cleanUrl = fullUrl.split('?')[0];
-                            if (!links.includes(cleanUrl)) {
-                                links.push(cleanUrl);
-                            }
-                        }
-                    });
-
-                    return [...new Set(links)]; // 중복 제거
-                }
-            """)
-
-            job_links = links_data if links_data else []
+            goto(self.page, self.config, search_url, wait_until="networkidle", timeout=60000)
+            settle(self.config.get("wait_time", 3))
+
+            # 결과 페이지를 넘기며 공고 링크 수집 (이미 수집된 공고는 페이지 단위로 제외)
+            job_links = paginate_links(
+                self.page, self.config, self._extract_job_links,
+                first_url=search_url,
+                max_links=max_jobs,
+                filter_new=self.seen_filter.filter_new if self.seen_filter else None
+            )
             self.logger.info(f"총 {len(job_links)}개의 공고 링크 발견")
 
         except Exception as e:
@@ -138,6 +135,39 @@ class AlbamonCrawler:
 
         return job_links
 
+    def _extract_job_links(self, page: Page) -> List[str]:
+        """
+        결과 페이지에서 공고 링크 추출
+
+        Args:
+            page: 검색 결과가 로드된 페이지
+
+        Returns:
+            공고 링크 리스트
+        """
+        links_data = page.evaluate("""
+            () => {
+                const links = [];
+                // 알바몬의 공고 링크 패턴: /jobs/detail/[숫자]
+                const jobLinks = document.querySelectorAll('a[href*="/jobs/detail/"]');
+
+                jobLinks.forEach(link => {
+                    const href = link.getAttribute('href');
+                    if (href && !links.includes(href)) {
+                        const fullUrl = href.startsWith('http') ? href : 'https://www.albamon.com' + href;
+                        // searchRow, logpath 등 쿼리 파라미터 제거 (고유 URL만 유지)
+                        const cleanUrl = fullUrl.split('?')[0];
+                        if (!links.includes(cleanUrl)) {
+                            links.push(cleanUrl);
+                        }
+                    }
+                });
+
+                return [...new Set(links)]; // 중복 제거
+            }
+        """)
+        return links_data if links_data else []
+
     def parse_job_detail(self, job_url: str) -> Optional[Dict]:
         """
         공고 상세 페이지에서 정보 파싱
@@ -150,8 +180,8 @@ class AlbamonCrawler:
         """
         try:
             self.logger.debug(f"공고 상세 페이지 접속: {job_url}")
-            self.page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(self.config.get("wait_time", 3))
+            goto(self.page, self.config, job_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 3))
 
             job_info = {
                 "url": job_url,
@@ -281,15 +311,35 @@ class AlbamonCrawler:
             # 제목이 없으면 스킵
             if not job_info["title"]:
                 self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
+                record_empty(self.config, job_url)
                 return None
 
             self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
+            record_extracted(self.config)
             return job_info
 
         except Exception as e:
             self.logger.error(f"공고 상세 파싱 중 오류 ({job_url}): {e}", exc_info=True)
             return None
 
+    def get_job_links(self, keyword: str, max_jobs: int = 50) -> List[str]:
+        """
+        키워드로 검색하여 상세 페이지를 방문할 공고 링크 수집
+
+        Args:
+            keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수
+
+        Returns:
+            공고 링크 리스트 (증분 필터 적용 후)
+        """
+        job_links = self.get_job_list(keyword, max_jobs)
+
+        if not job_links:
+            self.logger.warning(f"'{keyword}' 검색 결과가 없습니다")
+
+        return job_links
+
     def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
         """
         키워드로 검색하여 공고 수집
@@ -304,19 +354,18 @@ class AlbamonCrawler:
         self.logger.info(f"알바몬 크롤링 시작 (키워드: {keyword}, 최대: {max_jobs}개)")
 
         # 공고 링크 수집
-        job_links = self.get_job_list(keyword)
-
+        job_links = self.get_job_links(keyword, max_jobs)
         if not job_links:
-            self.logger.warning(f"'{keyword}' 검색 결과가 없습니다")
             return []
 
-        # 최대 개수만큼만 처리
-        job_links = job_links[:max_jobs]
         self.logger.info(f"{len(job_links)}개 공고 상세 정보 수집 시작")
 
         # 각 공고 상세 정보 수집
         all_jobs = []
         for i, job_url in enumerate(job_links, 1):
+            if get_breaker(self.config).is_open():
+                self.logger.error("서킷 브레이커가 열려 남은 공고 수집을 중단합니다")
+                break
             try:
                 self.logger.info(f"[{i}/{len(job_links)}] 공고 처리 중...")
                 job_info = self.parse_job_detail(job_url)
@@ -325,9 +374,6 @@ class AlbamonCrawler:
                     all_jobs.append(job_info)
                     self.logger.info(f"✓ 수집 완료: {job_info['title'][:50]}")
 
-                # 요청 간 대기
-                time.sleep(1)
-
             except Exception as e:
                 self.logger.error(f"공고 처리 중 오류 ({job_url}): {e}")
                 continue
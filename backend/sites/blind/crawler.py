@@ -3,10 +3,8 @@
 """
 import json
 import re
-import time
-import urllib.parse
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 from typing import List, Dict, Optional
 import sys
 
@@ -14,6 +12,11 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.logger import setup_logger
 from utils.file_handler import save_json, create_job_data
+from utils.resilience import get_breaker, record_empty, record_extracted
+from utils.navigation import goto, navigation_slot, settle
+from utils.telemetry import TimedPage
+from utils import browser_state
+from utils.pagination import paginate_links
 
 
 class BlindCrawler:
@@ -28,7 +31,11 @@ class BlindCrawler:
         self.headless = headless
         self.config = self._load_config()
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.seen_filter = None  # 증분 크롤링용 SeenUrlFilter (cli에서 설정)
+        self.checkpoint = None  # 실행 체크포인트 CrawlCheckpoint (cli에서 설정)
+        self.pipeline = None  # 스트리밍 분석/저장 CrawlPipeline (cli에서 설정)
 
     def _load_config(self) -> dict:
         """설정 파일 로드"""
@@ -47,20 +54,25 @@ class BlindCrawler:
                 '--disable-dev-shm-usage',
             ]
         )
-        self.page = self.browser.new_page(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        # 결과 페이지 탭(pagination)도 같은 쿠키/user agent/viewport를 쓰도록 컨텍스트를 직접 생성
+        self.context = self.browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={"width": 1920, "height": 1080},
+            **browser_state.context_options(self.config)  # 저장된 쿠키/localStorage
         )
-        self.page.set_viewport_size({"width": 1920, "height": 1080})
-        self.page.add_init_script("""
+        self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
         """)
+        self.page = self.context.new_page()
+        self.page = TimedPage(self.page)  # 준비 대기/추출 시간 계측
         self.logger.info("브라우저 시작 완료 (Bot Detection 회피 적용)")
 
     def close(self):
         """브라우저 종료"""
         if self.browser:
+            browser_state.save_state(self.page, self.config)
             self.browser.close()
         if hasattr(self, 'playwright'):
             self.playwright.stop()
@@ -103,18 +115,19 @@ class BlindCrawler:
         try:
             # /jobs 페이지로 이동
             self.logger.info(f"블라인드 Jobs 페이지로 이동")
-            self.page.goto(self.config["jobs_url"], wait_until="domcontentloaded", timeout=60000)
-            time.sleep(3)
+            goto(self.page, self.config, self.config["jobs_url"], wait_until="domcontentloaded", timeout=60000)
+            settle(3)
 
             # 검색창 찾기 및 입력
             search_input = self.page.query_selector('input[placeholder*="Search by job title or company"], input[type="search"], input[aria-label*="Search"]')
             if search_input:
                 search_input.fill(keyword)
-                time.sleep(1)
+                settle(1)
                 
                 # Enter 키로 검색
-                search_input.press("Enter")
-                time.sleep(3)
+                with navigation_slot(self.config):
+                    search_input.press("Enter")
+                settle(3)
                 
                 self.page.wait_for_load_state("networkidle", timeout=15000)
                 self.logger.info(f"'{keyword}' 검색 완료")
@@ -127,7 +140,7 @@ class BlindCrawler:
             self.logger.error(f"검색 중 오류 발생: {e}", exc_info=True)
             return False
 
-    def get_job_list(self) -> List[str]:
+    def get_job_list(self, page: Page = None) -> List[str]:
         """
         현재 페이지의 공고 목록에서 공고 링크 수집
 
@@ -139,13 +152,17 @@ class BlindCrawler:
 
         자세한 내용은 IMPLEMENTATION_STATUS.md 참조
 
+        Args:
+            page: 공고 목록이 로드된 페이지 (None이면 현재 페이지)
+
         Returns:
             공고 링크 리스트 (현재는 항상 빈 리스트 또는 에러)
         """
+        page = page or self.page
         job_links = []
         try:
             # 페이지 상태 확인
-            body_text = self.page.evaluate("document.body.innerText")
+            body_text = page.evaluate("document.body.innerText")
 
             # Bot Detection 에러 체크
             if "Oops" in body_text or "Something went wrong" in body_text:
@@ -160,16 +177,9 @@ class BlindCrawler:
                 self.logger.info("💡 현재 버전에서는 Blind 크롤링을 지원하지 않습니다")
                 return []
 
-            # 페이지가 완전히 로드될 때까지 대기
-            time.sleep(3)
-
-            # 스크롤하여 더 많은 공고 로드
-            for i in range(3):
-                self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(2)
-
+            # 추가 공고 로드(스크롤)는 paginate_links의 infinite_scroll 설정으로 처리
             # JavaScript로 링크 수집 - 실제 페이지 구조에 맞게
-            links_data = self.page.evaluate("""
+            links_data = page.evaluate("""
                 () => {
                     const links = [];
                     const baseUrl = 'https://www.teamblind.com';
@@ -242,8 +252,8 @@ class BlindCrawler:
         """
         try:
             self.logger.debug(f"공고 상세 페이지 접속: {job_url}")
-            self.page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(self.config.get("wait_time", 5))
+            goto(self.page, self.config, job_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 5))
 
             # 네트워크 안정화 대기
             try:
@@ -347,9 +357,11 @@ class BlindCrawler:
             # 제목이 없으면 스킵
             if not job_info["title"]:
                 self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
+                record_empty(self.config, job_url)
                 return None
 
             self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
+            record_extracted(self.config)
             return job_info
 
         except Exception as e:
@@ -396,39 +408,60 @@ class BlindCrawler:
 
         return job_info
 
-    def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
+    def get_job_links(self, keyword: str, max_jobs: int = 50) -> List[str]:
         """
-        키워드로 검색하여 공고 수집
+        키워드로 검색하여 상세 페이지를 방문할 공고 링크 수집
 
         Args:
             keyword: 검색 키워드
             max_jobs: 최대 수집할 공고 수
 
         Returns:
-            수집된 공고 정보 리스트
+            공고 링크 리스트 (증분 필터 적용 후)
         """
-        self.logger.info(f"'{keyword}' 키워드로 크롤링 시작")
-
         if not self.search(keyword):
             return []
 
-        all_jobs = []
-        job_links = self.get_job_list()
+        # 결과 페이지를 넘기며 수집 (이미 수집된 공고는 페이지 단위로 제외)
+        job_links = paginate_links(
+            self.page, self.config, self.get_job_list,
+            max_links=max_jobs,
+            filter_new=self.seen_filter.filter_new if self.seen_filter else None
+        )
 
         if not job_links:
             self.logger.warning("공고 링크를 찾을 수 없습니다")
+
+        return job_links
+
+    def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
+        """
+        키워드로 검색하여 공고 수집
+
+        Args:
+            keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수
+
+        Returns:
+            수집된 공고 정보 리스트
+        """
+        self.logger.info(f"'{keyword}' 키워드로 크롤링 시작")
+
+        job_links = self.get_job_links(keyword, max_jobs)
+        if not job_links:
             return []
 
-        # 최대 개수만큼만 수집
-        job_links = job_links[:max_jobs]
+        all_jobs = []
 
         for i, job_url in enumerate(job_links, 1):
+            if get_breaker(self.config).is_open():
+                self.logger.error("서킷 브레이커가 열려 남은 공고 수집을 중단합니다")
+                break
             try:
                 self.logger.info(f"진행 중: {i}/{len(job_links)}")
                 job_info = self.parse_job_detail(job_url)
                 if job_info:
                     all_jobs.append(job_info)
-                time.sleep(self.config.get("request_delay", 2))
             except Exception as e:
                 self.logger.error(f"공고 처리 중 오류 ({job_url}): {e}")
                 continue
@@ -3,16 +3,21 @@
 """
 import json
 import re
-import time
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, Browser
-from typing import List, Dict, Optional
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
+from typing import Iterator, List, Dict, Optional
 import sys
 
 # 프로젝트 루트를 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.logger import setup_logger
 from utils.file_handler import save_json, create_job_data
+from utils.resilience import record_empty, record_extracted
+from utils.navigation import goto, settle
+from utils.telemetry import TimedPage
+from utils import browser_state
+from utils.pagination import paginate_links
+from utils.frontier import publish_job
 
 
 class HibrainCrawler:
@@ -27,7 +32,12 @@ class HibrainCrawler:
         self.headless = headless
         self.config = self._load_config()
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.seen_filter = None  # 증분 크롤링용 SeenUrlFilter (cli에서 설정)
+        self.checkpoint = None  # 실행 체크포인트 CrawlCheckpoint (cli에서 설정)
+        self.pipeline = None  # 스트리밍 분석/저장 CrawlPipeline (cli에서 설정)
+        self._list_cache: Dict[str, List[Dict]] = {}  # list_type -> 실행 중 캐시된 공고 미리보기
 
     def _load_config(self) -> dict:
         """설정 파일 로드"""
@@ -50,24 +60,27 @@ class HibrainCrawler:
             ]
         )
 
-        # User Agent 설정 (일반 브라우저로 위장)
-        self.page = self.browser.new_page(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        # User Agent 설정 (일반 브라우저로 위장) - 결과 페이지 탭(pagination)도 같은 쿠키/user agent/viewport를 쓰도록 컨텍스트에 설정
+        self.context = self.browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={"width": 1920, "height": 1080},
+            **browser_state.context_options(self.config)  # 저장된 쿠키/localStorage
         )
 
         # navigator.webdriver 제거 (봇 감지 회피)
-        self.page.add_init_script("""
+        self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
         """)
-
-        self.page.set_viewport_size({"width": 1920, "height": 1080})
+        self.page = self.context.new_page()
+        self.page = TimedPage(self.page)  # 준비 대기/추출 시간 계측
         self.logger.info("브라우저 시작 완료")
 
     def close(self):
         """브라우저 종료"""
         if self.browser:
+            browser_state.save_state(self.page, self.config)
             self.browser.close()
         if hasattr(self, 'playwright'):
             self.playwright.stop()
@@ -90,6 +103,8 @@ class HibrainCrawler:
         React SPA에서 공고 목록과 미리보기 정보를 함께 수집
         (상세 페이지 접근 불필요 - 리스트 페이지에서 충분한 정보 확보)
 
+        같은 실행 안에서는 list_type별로 한 번만 렌더링하고 캐시된 목록을 재사용한다.
+
         Args:
             list_type: "RECOMM"(추천), "D3NEW"(신규), "ING"(진행), "D0END"(오늘마감), "DEND"(마감)
             max_jobs: 최대 수집할 공고 수
@@ -97,6 +112,26 @@ class HibrainCrawler:
         Returns:
             공고 정보 리스트 (title, company, date, content, link 포함)
         """
+        if list_type not in self._list_cache:
+            jobs = self._load_job_previews(list_type)
+            if not jobs:
+                return []
+            self._list_cache[list_type] = jobs
+        else:
+            self.logger.info(f"캐시된 '{list_type}' 공고 목록 사용 ({len(self._list_cache[list_type])}개)")
+
+        return self._list_cache[list_type][:max_jobs]
+
+    def _load_job_previews(self, list_type: str) -> List[Dict]:
+        """
+        React SPA 목록 페이지를 렌더링하고 추가 로딩(스크롤)까지 마친 뒤 전체 미리보기 수집
+
+        Args:
+            list_type: 공고 목록 유형 (예: "ING")
+
+        Returns:
+            공고 미리보기 리스트
+        """
         jobs = []
         try:
             # React SPA 메인 페이지로 이동
@@ -104,7 +139,7 @@ class HibrainCrawler:
             self.logger.info(f"React SPA 페이지로 이동: {recruitment_url}")
 
             # Level 1: domcontentloaded (빠르고 안정적)
-            self.page.goto(recruitment_url, wait_until="domcontentloaded", timeout=60000)
+            goto(self.page, self.config, recruitment_url, wait_until="domcontentloaded", timeout=60000)
 
             # Level 2: networkidle (선택적, 타임아웃 허용)
             try:
@@ -121,54 +156,10 @@ class HibrainCrawler:
                 self.logger.warning("공고 요소를 찾지 못함 - React 렌더링 실패 가능성")
 
             # Level 4: React 안정화 대기 (중요!)
-            time.sleep(3)
+            settle(3)
 
-            # JavaScript로 공고 정보 수집 (리스트 페이지에서 모든 정보 추출)
-            jobs_data = self.page.evaluate("""
-                () => {
-                    const jobs = [];
-                    const recruitTitles = document.querySelectorAll('.recruitTitle');
-
-                    recruitTitles.forEach(titleEl => {
-                        // 부모 컨테이너에서 모든 정보 추출
-                        let container = titleEl.closest('a[href*="/recruitment/recruits/"]');
-
-                        if (container) {
-                            const job = {
-                                title: titleEl.innerText.trim(),
-                                company: titleEl.innerText.trim(),  // 회사명이 제목
-                                content: '',
-                                date: '',
-                                link: ''
-                            };
-
-                            // 내용 추출
-                            const contentEl = container.querySelector('.recruitContent');
-                            if (contentEl) {
-                                job.content = contentEl.innerText.trim();
-                            }
-
-                            // 날짜 추출
-                            const dateEl = container.querySelector('.recruitDate');
-                            if (dateEl) {
-                                job.date = dateEl.innerText.trim();
-                            }
-
-                            // 링크 추출
-                            const href = container.getAttribute('href');
-                            if (href) {
-                                job.link = href.startsWith('http') ? href : 'https://www.hibrain.net' + href;
-                            }
-
-                            jobs.push(job);
-                        }
-                    });
-
-                    return jobs;
-                }
-            """)
-
-            jobs = jobs_data[:max_jobs] if jobs_data else []
+            # Level 5: 추가 로딩(무한 스크롤)은 paginate_links의 infinite_scroll 설정으로 처리
+            jobs = paginate_links(self.page, self.config, self._extract_previews, key=lambda job: job.get("link"))
             self.logger.info(f"총 {len(jobs)}개의 공고 정보 수집")
 
             return jobs
@@ -177,6 +168,61 @@ class HibrainCrawler:
             self.logger.error(f"공고 목록 수집 중 오류: {e}", exc_info=True)
             return []
 
+    def _extract_previews(self, page) -> List[Dict]:
+        """
+        현재 렌더링된 목록의 공고 미리보기 추출 (리스트 페이지에서 모든 정보 추출)
+
+        Args:
+            page: 목록이 렌더링된 Playwright Page
+
+        Returns:
+            공고 미리보기 리스트 (title, company, date, content, link)
+        """
+        jobs_data = page.evaluate("""
+            () => {
+                const jobs = [];
+                const recruitTitles = document.querySelectorAll('.recruitTitle');
+
+                recruitTitles.forEach(titleEl => {
+                    // 부모 컨테이너에서 모든 정보 추출
+                    let container = titleEl.closest('a[href*="/recruitment/recruits/"]');
+
+                    if (container) {
+                        const job = {
+                            title: titleEl.innerText.trim(),
+                            company: titleEl.innerText.trim(),  // 회사명이 제목
+                            content: '',
+                            date: '',
+                            link: ''
+                        };
+
+                        // 내용 추출
+                        const contentEl = container.querySelector('.recruitContent');
+                        if (contentEl) {
+                            job.content = contentEl.innerText.trim();
+                        }
+
+                        // 날짜 추출
+                        const dateEl = container.querySelector('.recruitDate');
+                        if (dateEl) {
+                            job.date = dateEl.innerText.trim();
+                        }
+
+                        // 링크 추출
+                        const href = container.getAttribute('href');
+                        if (href) {
+                            job.link = href.startsWith('http') ? href : 'https://www.hibrain.net' + href;
+                        }
+
+                        jobs.push(job);
+                    }
+                });
+
+                return jobs;
+            }
+        """)
+        return jobs_data if jobs_data else []
+
     def parse_job_detail(self, job_url: str) -> Optional[Dict]:
         """
         공고 상세 페이지에서 정보 파싱 (React SPA)
@@ -191,7 +237,7 @@ class HibrainCrawler:
             self.logger.debug(f"공고 상세 페이지 접속: {job_url}")
 
             # Level 1: domcontentloaded
-            self.page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
+            goto(self.page, self.config, job_url, wait_until="domcontentloaded", timeout=60000)
 
             # Level 2: networkidle (선택적)
             try:
@@ -206,7 +252,7 @@ class HibrainCrawler:
                 self.logger.warning("제목 요소를 찾지 못함")
 
             # Level 4: React 렌더링 안정화
-            time.sleep(3)
+            settle(3)
 
             job_info = {
                 "url": job_url,
@@ -295,9 +341,11 @@ class HibrainCrawler:
             # 제목이 없으면 스킵
             if not job_info["title"]:
                 self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
+                record_empty(self.config, job_url)
                 return None
 
             self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
+            record_extracted(self.config)
             return job_info
 
         except Exception as e:
@@ -329,84 +377,139 @@ class HibrainCrawler:
 
         return keyword_lower in text_to_search
 
-    def _matches_keyword_preview(self, job: Dict, keyword: str) -> bool:
+    def _build_keyword_matcher(self, keywords: List[str]):
         """
-        공고가 키워드와 매칭되는지 확인 (미리보기 정보 기반)
+        여러 키워드를 한 번에 찾는 매처 생성 (미리보기 정보 기반)
+
+        모든 키워드를 하나의 정규식으로 묶어 텍스트를 한 번만 훑는다.
+        위치마다 lookahead로 가장 긴 키워드를 잡고, 같은 위치에서 시작하는
+        더 짧은 키워드(예: '중국어' 안의 '중국')는 접두사 관계로 보완한다.
 
         Args:
-            job: 리스트 페이지에서 추출한 공고 미리보기 정보
-            keyword: 검색 키워드
+            keywords: 검색 키워드 리스트
 
         Returns:
-            매칭 여부
+            미리보기 dict를 받아 매칭된 키워드 리스트(입력 순서)를 반환하는 함수
         """
-        # 검색할 텍스트 구성 (리스트 페이지에서 사용 가능한 필드만)
-        search_fields = [
-            job.get('title', ''),
-            job.get('company', ''),
-            job.get('content', ''),
-            job.get('date', ''),
-        ]
-
-        text_to_search = ' '.join(search_fields).lower()
-        keyword_lower = keyword.lower()
-
-        return keyword_lower in text_to_search
-
-    def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
+        lowered = {}
+        for keyword in keywords:
+            lowered.setdefault(keyword.lower(), []).append(keyword)
+        alternatives = sorted(lowered, key=len, reverse=True)
+        pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in alternatives) + "))")
+        prefixes = {k: [p for p in alternatives if k.startswith(p)] for k in alternatives}
+        order = {keyword: i for i, keyword in enumerate(keywords)}
+
+        def match(job: Dict) -> List[str]:
+            # 검색할 텍스트 구성 (리스트 페이지에서 사용 가능한 필드만)
+            text_to_search = ' '.join([
+                job.get('title', ''),
+                job.get('company', ''),
+                job.get('content', ''),
+                job.get('date', ''),
+            ]).lower()
+
+            found = set()
+            for m in pattern.finditer(text_to_search):
+                for prefix in prefixes[m.group(1)]:
+                    found.update(lowered[prefix])
+            return sorted(found, key=order.get)
+
+        return match
+
+    def crawl_multi(self, keywords: List[str], max_jobs: int = 50) -> List[Dict]:
         """
-        키워드로 검색하여 공고 수집 (클라이언트 사이드 필터링)
+        여러 키워드로 공고 수집 (목록은 한 번만 렌더링, 키워드 매칭은 한 번에)
 
         Args:
-            keyword: 검색 키워드
-            max_jobs: 최대 수집할 공고 수
+            keywords: 검색 키워드 리스트
+            max_jobs: 키워드당 최대 수집할 공고 수
 
         Returns:
-            수집된 공고 정보 리스트
+            수집된 공고 정보 리스트 (search_keyword, search_keywords 포함)
+        """
+        return list(self.iter_multi(keywords, max_jobs=max_jobs))
+
+    def iter_multi(self, keywords: List[str], max_jobs: int = 50) -> Iterator[Dict]:
+        """
+        crawl_multi와 같은 방식으로 수집하되, 키워드에 매칭된 공고를 즉시 반환
+        (self.pipeline이 설정되어 있으면 반환하기 전에 투입)
+
+        Yields:
+            공고 정보 (search_keyword, search_keywords 포함)
         """
-        self.logger.info(f"'{keyword}' 키워드로 크롤링 시작 (React SPA)")
+        self.logger.info(f"{len(keywords)}개 키워드로 크롤링 시작 (React SPA): {keywords}")
 
-        # React SPA에서 진행 중인 공고 목록과 미리보기 정보를 함께 수집
-        all_jobs = self.get_job_list_with_preview(list_type="ING", max_jobs=max_jobs * 3)
+        if not keywords:
+            return
+
+        # React SPA에서 진행 중인 공고 목록과 미리보기 정보를 함께 수집 (실행당 1회)
+        all_jobs = self.get_job_list_with_preview(list_type="ING", max_jobs=max_jobs * 3 * len(keywords))
 
         if not all_jobs:
             self.logger.warning("수집된 공고가 없습니다")
-            return []
+            return
 
-        # 키워드 필터링
-        matching_jobs = []
+        # 이미 수집된 공고 제외 (증분 크롤링)
+        if self.seen_filter:
+            new_links = set(self.seen_filter.filter_new([job.get("link", "") for job in all_jobs]))
+            all_jobs = [job for job in all_jobs if job.get("link", "") in new_links]
+
+        # 키워드 필터링 (공고당 한 번의 다중 패턴 매칭)
+        match_keywords = self._build_keyword_matcher(keywords)
+        keyword_counts = {keyword: 0 for keyword in keywords}
+        matched_count = 0
         for i, job in enumerate(all_jobs, 1):
             try:
-                # 키워드 매칭 확인 (리스트 페이지의 미리보기 정보로 필터링)
-                if self._matches_keyword_preview(job, keyword):
-                    # 데이터베이스 스키마에 맞게 변환
-                    formatted_job = {
-                        "url": job.get("link", ""),
-                        "title": job.get("title", ""),
-                        "company": job.get("company", ""),
-                        "location": "",  # 리스트 페이지에 없음
-                        "salary": "",  # 리스트 페이지에 없음
-                        "conditions": "",  # 리스트 페이지에 없음
-                        "detail": job.get("content", ""),
-                        "recruit_summary": job.get("content", ""),
-                        "posted_date": job.get("date", "")
-                    }
-
-                    matching_jobs.append(formatted_job)
-                    self.logger.info(f"✓ 키워드 매칭 ({i}/{len(all_jobs)}): {job.get('title', 'N/A')}")
-
-                    # 목표 개수 달성 시 중단
-                    if len(matching_jobs) >= max_jobs:
-                        break
-                else:
+                matched = [k for k in match_keywords(job) if keyword_counts[k] < max_jobs]
+                if not matched:
                     self.logger.debug(f"✗ 키워드 미매칭 ({i}/{len(all_jobs)}): {job.get('title', 'N/A')}")
+                    continue
+
+                # 데이터베이스 스키마에 맞게 변환
+                formatted_job = {
+                    "url": job.get("link", ""),
+                    "title": job.get("title", ""),
+                    "company": job.get("company", ""),
+                    "location": "",  # 리스트 페이지에 없음
+                    "salary": "",  # 리스트 페이지에 없음
+                    "conditions": "",  # 리스트 페이지에 없음
+                    "detail": job.get("content", ""),
+                    "recruit_summary": job.get("content", ""),
+                    "posted_date": job.get("date", ""),
+                    "search_keyword": matched[0],
+                    "search_keywords": matched
+                }
+
+                for keyword in matched:
+                    keyword_counts[keyword] += 1
+                self.logger.info(f"✓ 키워드 매칭 ({i}/{len(all_jobs)}) {matched}: {job.get('title', 'N/A')}")
+                publish_job(self, formatted_job)
 
             except Exception as e:
                 self.logger.error(f"공고 처리 중 오류: {e}")
                 continue
 
-        self.logger.info(f"총 {len(matching_jobs)}개의 키워드 매칭 공고 수집 완료")
-        return matching_jobs
+            matched_count += 1
+            yield formatted_job
+
+            # 모든 키워드가 목표 개수 달성 시 중단
+            if all(count >= max_jobs for count in keyword_counts.values()):
+                break
+
+        self.logger.info(f"총 {matched_count}개의 키워드 매칭 공고 수집 완료")
+
+    def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
+        """
+        키워드로 검색하여 공고 수집 (클라이언트 사이드 필터링)
+
+        Args:
+            keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수
+
+        Returns:
+            수집된 공고 정보 리스트
+        """
+        return self.crawl_multi([keyword], max_jobs=max_jobs)
 
     def save_results(self, keyword: str, jobs: List[Dict]):
         """
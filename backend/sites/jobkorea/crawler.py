@@ -3,16 +3,26 @@
 """
 import json
 import re
-import time
+import urllib.parse
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, Browser
-from typing import List, Dict, Optional
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
+from typing import Iterator, List, Dict, Optional
+from collections import deque
+from concurrent.futures import Future
 import sys
 
 # 프로젝트 루트를 경로에 추가
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.logger import setup_logger
 from utils.file_handler import save_json, create_job_data
+from utils.resilience import get_breaker, record_empty, record_extracted
+from utils.navigation import goto, navigation_slot, settle
+from utils.telemetry import TimedPage
+from utils import browser_state
+from utils.frontier import crawl_keywords, iter_keyword_jobs, publish_job
+from utils.pagination import paginate_links
+from utils.html_extractor import HtmlExtractor, iter_snapshots, prune_snapshots, save_snapshot
+from sites.jobkorea.extractor import extract_job_fields
 
 
 class JobKoreaCrawler:
@@ -27,7 +37,13 @@ class JobKoreaCrawler:
         self.headless = headless
         self.config = self._load_config()
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.seen_filter = None  # 증분 크롤링용 SeenUrlFilter (cli에서 설정)
+        self.checkpoint = None  # 실행 체크포인트 CrawlCheckpoint (cli에서 설정)
+        self.pipeline = None  # 스트리밍 분석/저장 CrawlPipeline (cli에서 설정)
+        self.company_filter: Optional[set] = None  # 하이브리드 모드용 기업 ID 필터
+        self.extractor = HtmlExtractor(self.config.get("extract_workers"))  # HTML 필드 추출 워커 풀
         
     def _load_config(self) -> dict:
         """설정 파일 로드"""
@@ -39,13 +55,22 @@ class JobKoreaCrawler:
         """브라우저 시작"""
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=self.headless)
-        self.page = self.browser.new_page()
-        self.page.set_viewport_size({"width": 1920, "height": 1080})
+        # 결과 페이지 탭(pagination)도 같은 쿠키/viewport를 쓰도록 컨텍스트를 직접 생성
+        self.context = self.browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            **browser_state.context_options(self.config)  # 저장된 쿠키/localStorage
+        )
+        self.page = self.context.new_page()
+        self.page = TimedPage(self.page)  # 준비 대기/추출 시간 계측
+        if self.config.get("save_html_snapshots", False):
+            prune_snapshots("jobkorea", self.config.get("snapshot_retention_days", 7))
         self.logger.info("브라우저 시작 완료")
     
     def close(self):
         """브라우저 종료"""
+        self.extractor.close()
         if self.browser:
+            browser_state.save_state(self.page, self.config)
             self.browser.close()
         if hasattr(self, 'playwright'):
             self.playwright.stop()
@@ -96,8 +121,8 @@ class JobKoreaCrawler:
         try:
             industry_url = self.config.get("industry_search_url", "https://www.jobkorea.co.kr/recruit/joblist?menucode=industry")
             self.logger.info(f"산업별 검색 페이지로 이동: {industry_url}")
-            self.page.goto(industry_url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(self.config.get("wait_time", 3))
+            goto(self.page, self.config, industry_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 3))
             
             # 산업 필터 적용 (있는 경우)
             if industry_filter:
@@ -113,13 +138,14 @@ class JobKoreaCrawler:
                                 # 체크박스가 체크되어 있지 않으면 클릭
                                 if not input_elem.is_checked():
                                     label.click()
-                                    time.sleep(2)
+                                    settle(2)
                                     self.logger.info(f"산업 필터 적용: {industry_filter} (라벨: {label_text})")
                                     # 검색 버튼 클릭하여 필터 적용
                                     search_btn = self.page.query_selector('button[type="submit"], button.search')
                                     if search_btn:
-                                        search_btn.click()
-                                        time.sleep(3)
+                                        with navigation_slot(self.config):
+                                            search_btn.click()
+                                        settle(3)
                                     break
                 except Exception as e:
                     self.logger.warning(f"산업 필터 적용 실패: {e}")
@@ -169,8 +195,8 @@ class JobKoreaCrawler:
         job_links = []
         try:
             self.logger.debug(f"기업 페이지 접속: {company_url}")
-            self.page.goto(company_url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(self.config.get("wait_time", 2))
+            goto(self.page, self.config, company_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 2))
             
             # 기업의 공고 링크 수집
             links_data = self.page.evaluate("""
@@ -198,6 +224,154 @@ class JobKoreaCrawler:
             self.logger.error(f"기업 공고 수집 중 오류 ({company_url}): {e}")
             return []
     
+    def search_jobs(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
+        """
+        키워드 검색 결과 페이지를 순회하며 공고 링크 수집
+
+        결과 페이지는 config의 pagination 설정(Page_No 파라미터)에 따라 여러 탭에서 동시에 로드한다.
+
+        Args:
+            keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수
+
+        Returns:
+            공고 정보 리스트 [{"url": "공고URL", "company_id": "기업ID"}]
+        """
+        search_url = self.config["search_url"].format(keyword=urllib.parse.quote_plus(keyword))
+        try:
+            self.logger.info(f"검색 결과 페이지 이동: {search_url}")
+            goto(self.page, self.config, search_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 2))
+
+            # 하이브리드 모드의 기업 필터로 걸러질 수 있으므로 여유 있게 수집
+            results = paginate_links(
+                self.page, self.config, self._extract_search_results,
+                first_url=search_url,
+                max_links=max_jobs * 2,
+                key=lambda item: self._extract_job_id(item["url"])
+            )
+        except Exception as e:
+            self.logger.error(f"검색 결과 수집 중 오류: {e}")
+            return []
+
+        self.logger.info(f"'{keyword}' 검색 결과: 공고 {len(results)}개")
+        return results
+
+    def _extract_search_results(self, page: Page) -> List[Dict]:
+        """
+        검색 결과 페이지에서 공고 링크와 (같은 카드 안의) 기업 ID 추출
+
+        Args:
+            page: 검색 결과가 로드된 페이지
+
+        Returns:
+            공고 정보 리스트 [{"url": "공고URL", "company_id": "기업ID"}]
+        """
+        return page.evaluate("""
+            () => {
+                const results = [];
+                const jobLinks = document.querySelectorAll('a[href*="/Recruit/GI_Read/"]');
+
+                jobLinks.forEach(link => {
+                    const href = link.getAttribute('href');
+                    if (!href) return;
+                    const fullUrl = href.startsWith('http') ? href : 'https://www.jobkorea.co.kr' + href;
+
+                    // 공고 카드에서 기업 링크 찾기 (상위 요소로 올라가며 탐색)
+                    let companyId = null;
+                    let node = link.parentElement;
+                    for (let depth = 0; node && depth < 6 && !companyId; depth++) {
+                        const companyLink = node.querySelector('a[href*="/Co_Read/C/"], a[href*="/company/"]');
+                        if (companyLink) {
+                            const companyHref = companyLink.getAttribute('href') || '';
+                            companyId = companyHref.match(/\\/(?:Co_Read\\/C|company)\\/(\\d+)/)?.[1] || null;
+                        }
+                        node = node.parentElement;
+                    }
+                    results.push({url: fullUrl, company_id: companyId});
+                });
+
+                return results;
+            }
+        """) or []
+
+    def _extract_job_id(self, job_url: str) -> str:
+        """공고 URL에서 공고 ID 추출 (없으면 URL 그대로 반환)"""
+        match = re.search(r'/GI_Read/(\d+)', job_url)
+        return match.group(1) if match else job_url
+
+    def get_job_links(self, keyword: str, max_jobs: int = 50) -> List[str]:
+        """
+        키워드 검색 결과에서 상세 페이지를 방문할 공고 링크 수집
+
+        company_filter가 설정되어 있으면 해당 기업의 공고만 남긴다 (하이브리드 모드).
+
+        Args:
+            keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수
+
+        Returns:
+            공고 링크 리스트
+        """
+        results = self.search_jobs(keyword, max_jobs)
+
+        if self.company_filter is not None:
+            before = len(results)
+            results = [item for item in results if item.get("company_id") in self.company_filter]
+            self.logger.info(f"'{keyword}': 산업별 기업 필터 적용 {before}개 → {len(results)}개")
+
+        job_links = [item["url"] for item in results]
+
+        # 이미 수집된 공고는 상세 페이지 접속 생략 (증분 크롤링)
+        if self.seen_filter:
+            job_links = self.seen_filter.filter_new(job_links)
+
+        return job_links[:max_jobs]
+
+    def fetch_job_html(self, job_url: str) -> Optional[str]:
+        """
+        공고 상세 페이지의 렌더링된 HTML을 한 번만 캡처
+
+        Args:
+            job_url: 공고 상세 페이지 URL
+
+        Returns:
+            렌더링된 HTML (실패 시 None)
+        """
+        try:
+            self.logger.debug(f"공고 상세 페이지 접속: {job_url}")
+            goto(self.page, self.config, job_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 3))
+            html = self.page.content()
+        except Exception as e:
+            self.logger.error(f"공고 상세 페이지 로드 중 오류 ({job_url}): {e}")
+            return None
+
+        # 재크롤링 없이 재추출할 수 있도록 스냅샷 저장 (config의 save_html_snapshots, 기본값: 저장 안 함)
+        if self.config.get("save_html_snapshots", False):
+            try:
+                save_snapshot("jobkorea", job_url, html)
+            except OSError as e:
+                self.logger.warning(f"HTML 스냅샷 저장 실패 ({job_url}): {e}")
+        return html
+
+    def submit_job_detail(self, job_url: str) -> Optional[Future]:
+        """
+        공고 상세 HTML을 캡처하고 필드 추출을 워커 프로세스에 제출
+
+        브라우저는 추출 완료를 기다리지 않고 다음 공고로 이동할 수 있다.
+
+        Args:
+            job_url: 공고 상세 페이지 URL
+
+        Returns:
+            extract_job_fields 결과 Future (페이지 로드 실패 시 None)
+        """
+        html = self.fetch_job_html(job_url)
+        if html is None:
+            return None
+        return self.extractor.submit(extract_job_fields, html)
+
     def parse_job_detail(self, job_url: str) -> Optional[Dict]:
         """
         공고 상세 페이지에서 정보 파싱 (모집요강 섹션 중심, 정확도 향상)
@@ -209,215 +383,95 @@ class JobKoreaCrawler:
             파싱된 공고 정보 딕셔너리
         """
         try:
-            self.logger.debug(f"공고 상세 페이지 접속: {job_url}")
-            self.page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(self.config.get("wait_time", 3))
-            
-            job_info = {
-                "url": job_url,
-                "title": "",
-                "company": "",
-                "location": "",
-                "salary": "",
-                "conditions": "",
-                "detail": "",
-                "recruit_summary": "",
-                "posted_date": ""
-            }
-            
-            # JavaScript로 정확한 정보 추출
-            parsed_data = self.page.evaluate("""
-                () => {
-                    const result = {
-                        title: '',
-                        company: '',
-                        location: '',
-                        salary: '',
-                        conditions: '',
-                        detail: '',
-                        recruit_summary: '',
-                        posted_date: ''
-                    };
-                    
-                    // 제목 추출 (h1)
-                    const titleEl = document.querySelector('h1');
-                    if (titleEl) result.title = titleEl.innerText.trim();
-                    
-                    // 회사명 추출 (h2 또는 h2 a)
-                    const companyEl = document.querySelector('h2 a, h2');
-                    if (companyEl) result.company = companyEl.innerText.trim();
-                    
-                    // 모집요강 섹션 찾기
-                    const recruitSection = Array.from(document.querySelectorAll('*')).find(el => 
-                        el.innerText && el.innerText.includes('모집요강')
-                    );
-                    
-                    if (recruitSection) {
-                        const section = recruitSection.closest('div') || recruitSection.parentElement;
-                        if (section) {
-                            // 모집요강 전체 텍스트 (요약용)
-                            result.recruit_summary = section.innerText.trim();
-                            
-                            // 급여/연봉 추출
-                            const salaryLabels = Array.from(section.querySelectorAll('*')).filter(el => 
-                                el.innerText && (el.innerText.includes('급여') || el.innerText.includes('연봉'))
-                            );
-                            if (salaryLabels.length > 0) {
-                                const salaryParent = salaryLabels[0].closest('div');
-                                if (salaryParent) {
-                                    // 급여 다음 형제 요소 찾기
-                                    const allText = salaryParent.innerText;
-                                    const lines = allText.split('\\n').map(l => l.trim()).filter(l => l);
-                                    for (let i = 0; i < lines.length; i++) {
-                                        if (lines[i].includes('급여') || lines[i].includes('연봉')) {
-                                            // 다음 줄이 값인 경우
-                                            if (i + 1 < lines.length && !lines[i + 1].includes('근무시간')) {
-                                                result.salary = lines[i + 1];
-                                                break;
-                                            }
-                                        }
-                                    }
-                                    // 구조적으로 찾기 (div 구조)
-                                    if (!result.salary) {
-                                        const salaryDivs = salaryParent.querySelectorAll('div');
-                                        for (let i = 0; i < salaryDivs.length; i++) {
-                                            const div = salaryDivs[i];
-                                            if (div.innerText.includes('급여') || div.innerText.includes('연봉')) {
-                                                if (i + 1 < salaryDivs.length) {
-                                                    const valueDiv = salaryDivs[i + 1];
-                                                    const value = valueDiv.innerText.trim();
-                                                    if (value && !value.includes('급여') && !value.includes('연봉')) {
-                                                        result.salary = value;
-                                                        break;
-                                                    }
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                            
-                            // 근무지주소 추출
-                            const locationLabels = Array.from(section.querySelectorAll('*')).filter(el => 
-                                el.innerText && (el.innerText.includes('근무지주소') || el.innerText.includes('근무지'))
-                            );
-                            if (locationLabels.length > 0) {
-                                const locationParent = locationLabels[0].closest('div');
-                                if (locationParent) {
-                                    const allText = locationParent.innerText;
-                                    // 주소 패턴 찾기 (시/도로 시작하는 패턴)
-                                    const addressMatch = allText.match(/(서울|경기|인천|부산|대구|광주|대전|울산|세종|강원|충북|충남|전북|전남|경북|경남|제주|중국|홍콩|UAE|상하이|베이징|광저우|심천|대만|싱가포르|일본|미국|유럽)[^\\n]{0,150}/);
-                                    if (addressMatch) {
-                                        let location = addressMatch[0].trim();
-                                        // 불필요한 텍스트 제거
-                                        location = location.split('\\n')[0];
-                                        location = location.replace(/지도보기|인근지하철|지원자격.*/g, '').trim();
-                                        if (location) result.location = location;
-                                    }
-                                    // 구조적으로 찾기
-                                    if (!result.location) {
-                                        const locationDivs = locationParent.querySelectorAll('div');
-                                        for (let i = 0; i < locationDivs.length; i++) {
-                                            const div = locationDivs[i];
-                                            if (div.innerText.includes('근무지') || div.innerText.includes('주소')) {
-                                                if (i + 1 < locationDivs.length) {
-                                                    const valueDiv = locationDivs[i + 1];
-                                                    const value = valueDiv.innerText.trim();
-                                                    if (value && !value.includes('근무지') && !value.includes('지도보기')) {
-                                                        result.location = value.split('\\n')[0];
-                                                        break;
-                                                    }
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                            
-                            // 지원자격 추출
-                            const qualificationSection = Array.from(document.querySelectorAll('*')).find(el => 
-                                el.innerText && el.innerText.includes('지원자격')
-                            );
-                            if (qualificationSection) {
-                                const qualParent = qualificationSection.closest('div');
-                                if (qualParent) {
-                                    // 지원자격 섹션의 핵심 정보만 추출
-                                    const qualText = qualParent.innerText;
-                                    // 지원자격부터 다음 섹션(접수기간, 기업정보 등) 전까지 추출
-                                    const qualMatch = qualText.match(/지원자격[\\s\\S]{0,1000}(?=접수기간|기업정보|이 기업과|$)/);
-                                    if (qualMatch) {
-                                        result.conditions = qualMatch[0].trim();
-                                    } else {
-                                        // 전체 텍스트에서 지원자격 부분만 추출
-                                        result.conditions = qualText.trim();
-                                    }
-                                }
-                            }
-                            
-                            // 모집요강 요약 (모집요강 섹션 전체)
-                            if (section && !result.recruit_summary) {
-                                result.recruit_summary = section.innerText.trim();
-                            }
-                        }
-                    }
-                    
-                    // 상세 내용 (main 섹션)
-                    const mainEl = document.querySelector('main');
-                    if (mainEl) {
-                        result.detail = mainEl.innerText.trim();
-                    }
-                    
-                    // 접수기간에서 마감일 추출
-                    const deadlineLabel = Array.from(document.querySelectorAll('*')).find(el => 
-                        el.innerText && (el.innerText.includes('마감일') || el.innerText.includes('접수기간'))
-                    );
-                    if (deadlineLabel) {
-                        const deadlineParent = deadlineLabel.closest('div');
-                        if (deadlineParent) {
-                            const deadlineText = deadlineParent.innerText;
-                            // 날짜 패턴 찾기 (YYYY.MM.DD 형식)
-                            const dateMatch = deadlineText.match(/(\\d{4}\\.\\d{1,2}\\.\\d{1,2}[^\\n]{0,30})/);
-                            if (dateMatch) {
-                                result.posted_date = dateMatch[1].trim();
-                            } else {
-                                // 다른 형식 시도 (YYYY-MM-DD, YYYY/MM/DD)
-                                const altDateMatch = deadlineText.match(/(\\d{4}[\\s\\-./]\\d{1,2}[\\s\\-./]\\d{1,2}[^\\n]{0,30})/);
-                                if (altDateMatch) {
-                                    result.posted_date = altDateMatch[1].trim();
-                                }
-                            }
-                        }
-                    }
-                    
-                    return result;
-                }
-            """)
-            
-            # 파싱된 데이터를 job_info에 반영
-            job_info.update(parsed_data)
-            
-            # 정규표현식으로 재추출 및 정리 (fallback)
-            if job_info["detail"]:
-                job_info = self._extract_fields_from_detail(job_info)
-            
-            # 텍스트 정리
-            job_info["location"] = self._clean_text(job_info["location"], max_length=200)
-            job_info["salary"] = self._clean_text(job_info["salary"], max_length=100)
-            job_info["conditions"] = self._clean_text(job_info["conditions"], max_length=500)
-            job_info["recruit_summary"] = self._clean_text(job_info["recruit_summary"], max_length=2000)
-            job_info["posted_date"] = self._clean_text(job_info["posted_date"], max_length=50)
-            
-            # 제목이 없으면 스킵
-            if not job_info["title"]:
-                self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
+            future = self.submit_job_detail(job_url)
+            if future is None:
                 return None
-            
-            self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
-            return job_info
-            
+            return self.finish_job_detail(job_url, future.result())
         except Exception as e:
             self.logger.error(f"공고 상세 파싱 중 오류 ({job_url}): {e}", exc_info=True)
             return None
+
+    def finish_job_detail(self, job_url: str, parsed_data: Dict) -> Optional[Dict]:
+        """
+        추출된 필드 후처리 (정규표현식 fallback 및 텍스트 정리)
+
+        Args:
+            job_url: 공고 상세 페이지 URL
+            parsed_data: extract_job_fields 결과
+
+        Returns:
+            파싱된 공고 정보 딕셔너리 (제목이 없으면 None)
+        """
+        job_info = {
+            "url": job_url,
+            "title": "",
+            "company": "",
+            "location": "",
+            "salary": "",
+            "conditions": "",
+            "detail": "",
+            "recruit_summary": "",
+            "posted_date": ""
+        }
+
+        # 파싱된 데이터를 job_info에 반영
+        job_info.update(parsed_data)
+        
+        # 정규표현식으로 재추출 및 정리 (fallback)
+        if job_info["detail"]:
+            job_info = self._extract_fields_from_detail(job_info)
+        
+        # 텍스트 정리
+        job_info["location"] = self._clean_text(job_info["location"], max_length=200)
+        job_info["salary"] = self._clean_text(job_info["salary"], max_length=100)
+        job_info["conditions"] = self._clean_text(job_info["conditions"], max_length=500)
+        job_info["recruit_summary"] = self._clean_text(job_info["recruit_summary"], max_length=2000)
+        job_info["posted_date"] = self._clean_text(job_info["posted_date"], max_length=50)
+        
+        # 제목이 없으면 스킵
+        if not job_info["title"]:
+            self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
+            record_empty(self.config, job_url)
+            return None
+        
+        self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
+        record_extracted(self.config)
+        return job_info
+
+    def reextract_snapshots(self) -> Iterator[Dict]:
+        """
+        저장된 HTML 스냅샷에서 공고 정보 재추출 (재크롤링 없음, 브라우저 불필요)
+
+        미완료 추출 작업은 워커 수의 2배로 제한하므로 스냅샷이 많아도 HTML이 메모리에 쌓이지 않는다.
+
+        Yields:
+            재추출된 공고 정보
+        """
+        max_pending = max(2, self.extractor.max_workers * 2)
+        pending = deque()
+        total = extracted = 0
+
+        def collect(url, future):
+            try:
+                return self.finish_job_detail(url, future.result())
+            except Exception as e:
+                self.logger.error(f"스냅샷 재추출 중 오류 ({url}): {e}")
+                return None
+
+        for url, html in iter_snapshots("jobkorea"):
+            total += 1
+            pending.append((url, self.extractor.submit(extract_job_fields, html)))
+            while len(pending) > max_pending:
+                job_info = collect(*pending.popleft())
+                if job_info:
+                    extracted += 1
+                    yield job_info
+        while pending:
+            job_info = collect(*pending.popleft())
+            if job_info:
+                extracted += 1
+                yield job_info
+        self.logger.info(f"스냅샷 {total}개 중 {extracted}개 공고 재추출 완료")
     
     def _extract_fields_from_detail(self, job_info: Dict) -> Dict:
         """
@@ -569,9 +623,19 @@ class JobKoreaCrawler:
         Returns:
             수집된 공고 정보 리스트
         """
+        return list(self.iter_by_industry(keywords, industries, max_companies, max_jobs_per_company))
+    
+    def iter_by_industry(self, keywords: List[str], industries: List[str] = None, max_companies: int = 50, max_jobs_per_company: int = 10) -> Iterator[Dict]:
+        """
+        crawl_by_industry와 같은 방식으로 수집하되, 키워드에 매칭된 공고를 파싱하는 즉시 반환
+        (self.pipeline이 설정되어 있으면 반환하기 전에 투입)
+        
+        Yields:
+            키워드에 매칭된 공고 정보
+        """
         self.logger.info(f"산업별 기업 크롤링 시작 (키워드: {keywords})")
         
-        all_jobs = []
+        matched_count = 0
         
         # 산업별로 기업 수집
         if industries:
@@ -581,6 +645,9 @@ class JobKoreaCrawler:
             industry_list = ["반도체", "디스플레이", "이차전지", "조선", "원자력", "우주항공"]
         
         for industry in industry_list:
+            if get_breaker(self.config).is_open():
+                self.logger.error("서킷 브레이커가 열려 남은 산업 수집을 중단합니다")
+                break
             self.logger.info(f"산업 '{industry}' 기업 수집 시작")
             companies = self.get_companies_by_industry(industry)
             
@@ -593,6 +660,8 @@ class JobKoreaCrawler:
             self.logger.info(f"'{industry}' 산업: {len(companies)}개 기업 처리 예정")
             
             for i, company in enumerate(companies, 1):
+                if get_breaker(self.config).is_open():
+                    break
                 try:
                     self.logger.info(f"[{industry}] 기업 진행 중: {i}/{len(companies)} - {company['name']}")
                     
@@ -603,6 +672,10 @@ class JobKoreaCrawler:
                         self.logger.debug(f"기업 '{company['name']}'의 공고가 없습니다")
                         continue
                     
+                    # 이미 수집된 공고는 상세 페이지 접속 생략 (증분 크롤링)
+                    if self.seen_filter:
+                        job_links = self.seen_filter.filter_new(job_links)
+                    
                     # 기업당 최대 개수만큼만 수집
                     job_links = job_links[:max_jobs_per_company]
                     
@@ -614,39 +687,93 @@ class JobKoreaCrawler:
                                 continue
                             
                             # 키워드 필터링
-                            if self._matches_keywords(job_info, keywords):
-                                all_jobs.append(job_info)
-                                self.logger.info(f"✓ 키워드 매칭: {job_info['title']} - {job_info.get('company', 'N/A')}")
-                            else:
+                            if not self._matches_keywords(job_info, keywords):
                                 self.logger.debug(f"✗ 키워드 미매칭: {job_info['title']}")
-                            
-                            time.sleep(1)  # 요청 간 대기
+                                continue
+                            self.logger.info(f"✓ 키워드 매칭: {job_info['title']} - {job_info.get('company', 'N/A')}")
+                            publish_job(self, job_info)
                         except Exception as e:
                             self.logger.error(f"공고 파싱 중 오류 ({job_url}): {e}")
                             continue
-                    
-                    time.sleep(2)  # 기업 간 대기
+                        matched_count += 1
+                        yield job_info
                 except Exception as e:
                     self.logger.error(f"기업 처리 중 오류 ({company['name']}): {e}")
                     continue
         
-        self.logger.info(f"총 {len(all_jobs)}개의 키워드 매칭 공고 수집 완료")
-        return all_jobs
+        self.logger.info(f"총 {matched_count}개의 키워드 매칭 공고 수집 완료")
     
+    def crawl_by_search(self, keywords: List[str], max_jobs: int = 50) -> List[Dict]:
+        """
+        키워드 검색 결과 기반 크롤링 (검색에 걸린 공고만 상세 수집)
+
+        Args:
+            keywords: 검색 키워드 리스트
+            max_jobs: 키워드당 최대 수집할 공고 수
+
+        Returns:
+            수집된 공고 정보 리스트
+        """
+        self.logger.info(f"검색 기반 크롤링 시작 (키워드: {keywords})")
+        return crawl_keywords(self, keywords, max_jobs=max_jobs)
+
+    def crawl_hybrid(self, keywords: List[str], industries: List[str] = None, max_companies: int = 50, max_jobs: int = 50) -> List[Dict]:
+        """
+        하이브리드 크롤링: 키워드 검색 결과 중 산업별 기업 목록에 속한 공고만 수집
+
+        기업 페이지를 일일이 방문하지 않고 산업별 기업 ID 목록만 수집한 뒤,
+        검색 결과와 교집합을 구해 상세 페이지를 방문한다.
+
+        Args:
+            keywords: 검색 키워드 리스트
+            industries: 산업 필터 리스트 (None이면 기술 분야 사용)
+            max_companies: 산업당 최대 기업 수
+            max_jobs: 키워드당 최대 수집할 공고 수
+
+        Returns:
+            수집된 공고 정보 리스트
+        """
+        return list(self.iter_hybrid(keywords, industries, max_companies, max_jobs))
+
+    def iter_hybrid(self, keywords: List[str], industries: List[str] = None, max_companies: int = 50, max_jobs: int = 50) -> Iterator[Dict]:
+        """
+        crawl_hybrid와 같은 방식으로 수집하되, 공고를 파싱하는 즉시 반환
+
+        Yields:
+            산업별 기업 목록에 속한 공고 정보
+        """
+        industry_list = industries or ["반도체", "디스플레이", "이차전지", "조선", "원자력", "우주항공"]
+        self.logger.info(f"하이브리드 크롤링 시작 (키워드: {keywords}, 산업: {industry_list})")
+
+        company_ids = set()
+        for industry in industry_list:
+            companies = self.get_companies_by_industry(industry)[:max_companies]
+            company_ids.update(company['company_id'] for company in companies)
+            self.logger.info(f"'{industry}' 산업: {len(companies)}개 기업 (누적 {len(company_ids)}개)")
+
+        if not company_ids:
+            self.logger.warning("산업별 기업을 찾을 수 없습니다")
+            return
+
+        self.company_filter = company_ids
+        try:
+            yield from iter_keyword_jobs(self, keywords, max_jobs=max_jobs)
+        finally:
+            self.company_filter = None
+
     def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
         """
-        키워드로 검색하여 공고 수집 (기존 방식 - 호환성 유지)
-        
+        키워드로 검색하여 공고 수집
+
         Args:
             keyword: 검색 키워드
             max_jobs: 최대 수집할 공고 수
-            
+
         Returns:
             수집된 공고 정보 리스트
         """
-        # 새로운 방식으로 전환
-        return self.crawl_by_industry([keyword], max_companies=50, max_jobs_per_company=10)
-    
+        return self.crawl_by_search([keyword], max_jobs=max_jobs)
+
     def save_results(self, keyword: str, jobs: List[Dict]):
         """
         수집 결과를 JSON 파일로 저장
@@ -0,0 +1,125 @@
+"""
+잡코리아 공고 상세 HTML 필드 추출 (lxml, 워커 프로세스에서 실행)
+"""
+import re
+from typing import Dict
+
+from utils.html_extractor import closest, find_label, inner_text, parse_html
+
+ADDRESS_PATTERN = re.compile(
+    r'(서울|경기|인천|부산|대구|광주|대전|울산|세종|강원|충북|충남|전북|전남|경북|경남|제주|'
+    r'중국|홍콩|UAE|상하이|베이징|광저우|심천|대만|싱가포르|일본|미국|유럽)[^\n]{0,150}'
+)
+QUALIFICATION_PATTERN = re.compile(r'지원자격[\s\S]{0,1000}?(?=접수기간|기업정보|이 기업과|$)')
+DATE_PATTERN = re.compile(r'(\d{4}\.\d{1,2}\.\d{1,2}[^\n]{0,30})')
+ALT_DATE_PATTERN = re.compile(r'(\d{4}[\s\-./]\d{1,2}[\s\-./]\d{1,2}[^\n]{0,30})')
+
+
+def _label_block(root, *labels: str):
+    """
+    라벨을 포함하는 가장 가까운 div 블록 찾기
+
+    라벨만 감싼 div이면 값까지 포함하도록 상위 div로 한 단계씩 올라간다.
+
+    Returns:
+        (블록 요소, 블록 텍스트) 또는 (None, '')
+    """
+    label = find_label(root, *labels)
+    if label is None:
+        return None, ""
+
+    label_text = inner_text(label)
+    block = closest(label, "div")
+    while block is not None:
+        text = inner_text(block)
+        if len(text) > len(label_text) + 1:
+            return block, text
+        block = closest(block.getparent(), "div") if block.getparent() is not None else None
+    return None, ""
+
+
+def _value_after_label(text: str, labels, stop_words=()) -> str:
+    """블록 텍스트에서 라벨 다음 줄의 값 추출"""
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        if any(label in line for label in labels) and i + 1 < len(lines):
+            value = lines[i + 1]
+            if not any(word in value for word in stop_words):
+                return value
+    return ""
+
+
+def extract_job_fields(html: str) -> Dict:
+    """
+    렌더링된 공고 상세 HTML에서 필드 추출
+
+    Args:
+        html: page.content()로 캡처한 HTML
+
+    Returns:
+        title, company, location, salary, conditions, detail, recruit_summary, posted_date
+    """
+    root = parse_html(html)
+    result = {
+        "title": "",
+        "company": "",
+        "location": "",
+        "salary": "",
+        "conditions": "",
+        "detail": "",
+        "recruit_summary": "",
+        "posted_date": ""
+    }
+
+    # 제목 (h1), 회사명 (h2)
+    titles = root.xpath("//h1")
+    if titles:
+        result["title"] = inner_text(titles[0])
+    companies = root.xpath("//h2")
+    if companies:
+        result["company"] = inner_text(companies[0])
+
+    # 모집요강 섹션
+    section, section_text = _label_block(root, "모집요강")
+    if section is not None:
+        result["recruit_summary"] = section_text
+
+        # 급여/연봉
+        _, salary_text = _label_block(section, "급여", "연봉")
+        if salary_text:
+            result["salary"] = _value_after_label(
+                salary_text, ("급여", "연봉"), stop_words=("근무시간", "급여", "연봉")
+            )
+
+        # 근무지주소
+        _, location_text = _label_block(section, "근무지")
+        if location_text:
+            match = ADDRESS_PATTERN.search(location_text)
+            if match:
+                location = re.sub(r'지도보기|인근지하철|지원자격.*', '', match.group(0)).strip()
+                result["location"] = location
+            if not result["location"]:
+                result["location"] = _value_after_label(
+                    location_text, ("근무지", "주소"), stop_words=("근무지", "지도보기")
+                )
+
+    # 지원자격
+    _, qualification_text = _label_block(root, "지원자격")
+    if qualification_text:
+        match = QUALIFICATION_PATTERN.search(qualification_text)
+        result["conditions"] = match.group(0).strip() if match else qualification_text
+
+    # 상세 내용 (main 섹션)
+    mains = root.xpath("//main")
+    if mains:
+        result["detail"] = inner_text(mains[0])
+
+    # 접수기간에서 마감일 추출 (날짜가 있는 블록을 찾을 때까지 라벨별로 시도)
+    for label in ("마감일", "접수기간"):
+        _, deadline_text = _label_block(root, label)
+        match = DATE_PATTERN.search(deadline_text) or ALT_DATE_PATTERN.search(deadline_text)
+        if match:
+            result["posted_date"] = match.group(1).strip()
+            break
+
+    return result
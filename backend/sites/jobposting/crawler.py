@@ -3,9 +3,8 @@
 """
 import json
 import re
-import time
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 from typing import List, Dict, Optional
 import sys
 
@@ -13,6 +12,11 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.logger import setup_logger
 from utils.file_handler import save_json, create_job_data
+from utils.resilience import get_breaker, record_empty, record_extracted
+from utils.navigation import goto, settle
+from utils.telemetry import TimedPage
+from utils import browser_state
+from utils.pagination import paginate_links
 
 
 class JobPostingCrawler:
@@ -27,7 +31,11 @@ class JobPostingCrawler:
         self.headless = headless
         self.config = self._load_config()
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.seen_filter = None  # 증분 크롤링용 SeenUrlFilter (cli에서 설정)
+        self.checkpoint = None  # 실행 체크포인트 CrawlCheckpoint (cli에서 설정)
+        self.pipeline = None  # 스트리밍 분석/저장 CrawlPipeline (cli에서 설정)
 
     def _load_config(self) -> dict:
         """설정 파일 로드"""
@@ -46,20 +54,25 @@ class JobPostingCrawler:
                 '--disable-dev-shm-usage',
             ]
         )
-        self.page = self.browser.new_page(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        # 결과 페이지 탭(pagination)도 같은 쿠키/user agent/viewport를 쓰도록 컨텍스트를 직접 생성
+        self.context = self.browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={"width": 1920, "height": 1080},
+            **browser_state.context_options(self.config)  # 저장된 쿠키/localStorage
         )
-        self.page.set_viewport_size({"width": 1920, "height": 1080})
-        self.page.add_init_script("""
+        self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
         """)
+        self.page = self.context.new_page()
+        self.page = TimedPage(self.page)  # 준비 대기/추출 시간 계측
         self.logger.info("브라우저 시작 완료 (Bot Detection 회피 적용)")
 
     def close(self):
         """브라우저 종료"""
         if self.browser:
+            browser_state.save_state(self.page, self.config)
             self.browser.close()
         if hasattr(self, 'playwright'):
             self.playwright.stop()
@@ -106,43 +119,16 @@ class JobPostingCrawler:
             search_url = f"{self.config['base_url']}/job/employ.php?keyword={keyword}"
             self.logger.info(f"검색 페이지 접속: {search_url}")
 
-            self.page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(self.config.get("wait_time", 3))
-
-            # employ_detail.php 패턴의 링크 수집 (테이블 내부 h3 태그 안)
-            links_data = self.page.evaluate("""
-                () => {
-                    const links = [];
-                    const baseUrl = 'http://jobposting.co.kr';
-
-                    // 테이블 내부의 h3 > a 링크 (채용공고 제목 링크)
-                    const jobLinks = document.querySelectorAll('table h3 a[href*="employ_detail.php"]');
-
-                    jobLinks.forEach(link => {
-                        const href = link.getAttribute('href');
-                        if (!href) return;
-
-                        // 상대 경로를 절대 경로로 변환
-                        let fullUrl;
-                        if (href.startsWith('http://') || href.startsWith('https://')) {
-                            fullUrl = href;
-                        } else if (href.startsWith('/')) {
-                            fullUrl = baseUrl + href;
-                        } else {
-                            fullUrl = baseUrl + '/job/' + href;
-                        }
+            goto(self.page, self.config, search_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 3))
 
-                        // 중복 방지
-                        if (!links.includes(fullUrl)) {
-                            links.push(fullUrl);
-                        }
-                    });
-
-                    return links;
-                }
-            """)
-
-            job_links = links_data if links_data else []
+            # 결과 페이지를 넘기며 공고 링크 수집 (이미 수집된 공고는 페이지 단위로 제외)
+            job_links = paginate_links(
+                self.page, self.config, self._extract_job_links,
+                first_url=search_url,
+                max_links=max_jobs,
+                filter_new=self.seen_filter.filter_new if self.seen_filter else None
+            )
 
             # 링크가 없는 경우 페이지 상태 확인
             if not job_links:
@@ -150,10 +136,6 @@ class JobPostingCrawler:
                 page_text = self.page.evaluate('() => document.body.innerText.substring(0, 500)')
                 self.logger.debug(f"페이지 내용 샘플: {page_text}")
 
-            # 최대 개수만큼만 반환
-            if len(job_links) > max_jobs:
-                job_links = job_links[:max_jobs]
-
             self.logger.info(f"총 {len(job_links)}개의 공고 링크 수집")
             return job_links
 
@@ -161,6 +143,49 @@ class JobPostingCrawler:
             self.logger.error(f"공고 목록 수집 중 오류: {e}", exc_info=True)
             return []
 
+    def _extract_job_links(self, page: Page) -> List[str]:
+        """
+        결과 페이지에서 공고 링크 추출
+
+        Args:
+            page: 검색 결과가 로드된 페이지
+
+        Returns:
+            공고 링크 리스트
+        """
+        links_data = page.evaluate("""
+            () => {
+                const links = [];
+                const baseUrl = 'http://jobposting.co.kr';
+
+                // 테이블 내부의 h3 > a 링크 (채용공고 제목 링크)
+                const jobLinks = document.querySelectorAll('table h3 a[href*="employ_detail.php"]');
+
+                jobLinks.forEach(link => {
+                    const href = link.getAttribute('href');
+                    if (!href) return;
+
+                    // 상대 경로를 절대 경로로 변환
+                    let fullUrl;
+                    if (href.startsWith('http://') || href.startsWith('https://')) {
+                        fullUrl = href;
+                    } else if (href.startsWith('/')) {
+                        fullUrl = baseUrl + href;
+                    } else {
+                        fullUrl = baseUrl + '/job/' + href;
+                    }
+
+                    // 중복 방지
+                    if (!links.includes(fullUrl)) {
+                        links.push(fullUrl);
+                    }
+                });
+
+                return links;
+            }
+        """)
+        return links_data if links_data else []
+
     def parse_job_detail(self, job_url: str) -> Optional[Dict]:
         """
         공고 상세 페이지에서 정보 파싱
@@ -171,142 +196,135 @@ class JobPostingCrawler:
         Returns:
             파싱된 공고 정보 딕셔너리
         """
-        max_retries = self.config.get("max_retries", 3)
-        for attempt in range(max_retries):
-            try:
-                self.logger.debug(f"공고 상세 페이지 접속: {job_url} (시도 {attempt + 1}/{max_retries})")
-                self.page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(self.config.get("wait_time", 3))
-
-                # JavaScript로 정보 추출
-                parsed_data = self.page.evaluate("""
-                () => {
-                    const result = {
-                        title: '',
-                        company: '',
-                        location: '',
-                        salary: '',
-                        conditions: '',
-                        detail: '',
-                        recruit_summary: '',
-                        posted_date: ''
-                    };
-
-                    // 제목 추출 (h2 태그 - 공고 제목 패턴)
-                    const h2Tags = document.querySelectorAll('h2');
-                    for (const h2 of h2Tags) {
-                        const text = h2.innerText.trim();
-                        // 공고 제목 패턴: 지역이나 회사명을 포함하는 긴 텍스트
-                        if (text && !text.includes('주요업무') && !text.includes('자격요건') &&
-                            !text.includes('추가사항') && !text.includes('Job Description') &&
-                            !text.includes('Job Requirements') && !text.includes('Additional Information')) {
-                            // 제목은 보통 [지역] 형태를 포함하거나 길이가 15자 이상
-                            if (text.includes('[') || text.length > 15) {
-                                result.title = text;
-                                break;
-                            }
+        try:
+            self.logger.debug(f"공고 상세 페이지 접속: {job_url}")
+            goto(self.page, self.config, job_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 3))
+
+            # JavaScript로 정보 추출
+            parsed_data = self.page.evaluate("""
+            () => {
+                const result = {
+                    title: '',
+                    company: '',
+                    location: '',
+                    salary: '',
+                    conditions: '',
+                    detail: '',
+                    recruit_summary: '',
+                    posted_date: ''
+                };
+
+                // 제목 추출 (h2 태그 - 공고 제목 패턴)
+                const h2Tags = document.querySelectorAll('h2');
+                for (const h2 of h2Tags) {
+                    const text = h2.innerText.trim();
+                    // 공고 제목 패턴: 지역이나 회사명을 포함하는 긴 텍스트
+                    if (text && !text.includes('주요업무') && !text.includes('자격요건') &&
+                        !text.includes('추가사항') && !text.includes('Job Description') &&
+                        !text.includes('Job Requirements') && !text.includes('Additional Information')) {
+                        // 제목은 보통 [지역] 형태를 포함하거나 길이가 15자 이상
+                        if (text.includes('[') || text.length > 15) {
+                            result.title = text;
+                            break;
                         }
                     }
+                }
 
-                    // 제목이 없으면 첫 번째 h2 사용 (섹션 제목이 아닌 경우)
-                    if (!result.title && h2Tags.length > 0) {
-                        const firstH2 = h2Tags[0].innerText.trim();
-                        if (firstH2 && !firstH2.includes('주요업무') && !firstH2.includes('자격요건')) {
-                            result.title = firstH2;
-                        }
+                // 제목이 없으면 첫 번째 h2 사용 (섹션 제목이 아닌 경우)
+                if (!result.title && h2Tags.length > 0) {
+                    const firstH2 = h2Tags[0].innerText.trim();
+                    if (firstH2 && !firstH2.includes('주요업무') && !firstH2.includes('자격요건')) {
+                        result.title = firstH2;
                     }
+                }
 
-                    // 회사명 추출 (h3 태그)
-                    const h3 = document.querySelector('h3');
-                    if (h3) result.company = h3.innerText.trim();
-
-                    // 전체 페이지 텍스트
-                    const bodyText = document.body.innerText;
-                    result.detail = bodyText;
-
-                    // 테이블에서 정보 추출
-                    const tables = document.querySelectorAll('table');
-                    tables.forEach(table => {
-                        const rows = table.querySelectorAll('tr');
-                        rows.forEach(row => {
-                            const cells = row.querySelectorAll('td, th');
-                            if (cells.length >= 2) {
-                                const label = cells[0].innerText.trim();
-                                const value = cells[1].innerText.trim();
-
-                                // 근무지
-                                if (label.includes('근무지') || label.includes('위치')) {
-                                    result.location = value;
-                                }
-                                // 급여
-                                if (label.includes('급여') || label.includes('연봉')) {
-                                    result.salary = value;
-                                }
+                // 회사명 추출 (h3 태그)
+                const h3 = document.querySelector('h3');
+                if (h3) result.company = h3.innerText.trim();
+
+                // 전체 페이지 텍스트
+                const bodyText = document.body.innerText;
+                result.detail = bodyText;
+
+                // 테이블에서 정보 추출
+                const tables = document.querySelectorAll('table');
+                tables.forEach(table => {
+                    const rows = table.querySelectorAll('tr');
+                    rows.forEach(row => {
+                        const cells = row.querySelectorAll('td, th');
+                        if (cells.length >= 2) {
+                            const label = cells[0].innerText.trim();
+                            const value = cells[1].innerText.trim();
+
+                            // 근무지
+                            if (label.includes('근무지') || label.includes('위치')) {
+                                result.location = value;
                             }
-                        });
-                    });
-
-                    // 주요업무, 자격요건 추출
-                    const sections = [];
-                    const allH2 = document.querySelectorAll('h2');
-                    allH2.forEach(h2 => {
-                        const sectionTitle = h2.innerText.trim();
-                        if (sectionTitle.includes('주요업무') || sectionTitle.includes('자격요건') ||
-                            sectionTitle.includes('추가사항')) {
-                            // 다음 형제 요소들의 텍스트 수집
-                            let content = sectionTitle + '\\n';
-                            let sibling = h2.nextElementSibling;
-                            while (sibling && sibling.tagName !== 'H2') {
-                                content += sibling.innerText.trim() + '\\n';
-                                sibling = sibling.nextElementSibling;
+                            // 급여
+                            if (label.includes('급여') || label.includes('연봉')) {
+                                result.salary = value;
                             }
-                            sections.push(content);
                         }
                     });
-
-                    if (sections.length > 0) {
-                        result.conditions = sections.join('\\n\\n');
-                        result.recruit_summary = sections.join('\\n\\n');
+                });
+
+                // 주요업무, 자격요건 추출
+                const sections = [];
+                const allH2 = document.querySelectorAll('h2');
+                allH2.forEach(h2 => {
+                    const sectionTitle = h2.innerText.trim();
+                    if (sectionTitle.includes('주요업무') || sectionTitle.includes('자격요건') ||
+                        sectionTitle.includes('추가사항')) {
+                        // 다음 형제 요소들의 텍스트 수집
+                        let content = sectionTitle + '\\n';
+                        let sibling = h2.nextElementSibling;
+                        while (sibling && sibling.tagName !== 'H2') {
+                            content += sibling.innerText.trim() + '\\n';
+                            sibling = sibling.nextElementSibling;
+                        }
+                        sections.push(content);
                     }
+                });
 
-                    return result;
-                }
-            """)
-
-                job_info = {
-                    "url": job_url,
-                    "title": parsed_data.get("title", ""),
-                    "company": parsed_data.get("company", ""),
-                    "location": self._clean_text(parsed_data.get("location", ""), max_length=200),
-                    "salary": self._clean_text(parsed_data.get("salary", ""), max_length=100),
-                    "conditions": self._clean_text(parsed_data.get("conditions", ""), max_length=1000),
-                    "detail": parsed_data.get("detail", ""),
-                    "recruit_summary": self._clean_text(parsed_data.get("recruit_summary", ""), max_length=2000),
-                    "posted_date": self._clean_text(parsed_data.get("posted_date", ""), max_length=50)
+                if (sections.length > 0) {
+                    result.conditions = sections.join('\\n\\n');
+                    result.recruit_summary = sections.join('\\n\\n');
                 }
 
-                # 제목이 없으면 스킵
-                if not job_info["title"]:
-                    self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
-                    return None
-
-                # 정규표현식으로 추가 정보 추출 (fallback)
-                if job_info["detail"]:
-                    job_info = self._extract_fields_from_detail(job_info)
+                return result;
+            }
+        """)
 
-                self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
-                return job_info
+            job_info = {
+                "url": job_url,
+                "title": parsed_data.get("title", ""),
+                "company": parsed_data.get("company", ""),
+                "location": self._clean_text(parsed_data.get("location", ""), max_length=200),
+                "salary": self._clean_text(parsed_data.get("salary", ""), max_length=100),
+                "conditions": self._clean_text(parsed_data.get("conditions", ""), max_length=1000),
+                "detail": parsed_data.get("detail", ""),
+                "recruit_summary": self._clean_text(parsed_data.get("recruit_summary", ""), max_length=2000),
+                "posted_date": self._clean_text(parsed_data.get("posted_date", ""), max_length=50)
+            }
+
+            # 제목이 없으면 스킵
+            if not job_info["title"]:
+                self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
+                record_empty(self.config, job_url)
+                return None
+
+            # 정규표현식으로 추가 정보 추출 (fallback)
+            if job_info["detail"]:
+                job_info = self._extract_fields_from_detail(job_info)
+
+            self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
+            record_extracted(self.config)
+            return job_info
 
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    self.logger.warning(f"공고 상세 파싱 시도 {attempt + 1} 실패, 재시도 중: {e}")
-                    time.sleep(2)
-                    continue
-                else:
-                    self.logger.error(f"공고 상세 파싱 최종 실패 ({job_url}): {e}", exc_info=True)
-                    return None
-        
-        return None
+        except Exception as e:
+            self.logger.error(f"공고 상세 파싱 중 오류 ({job_url}): {e}", exc_info=True)
+            return None
 
     def _extract_fields_from_detail(self, job_info: Dict) -> Dict:
         """
@@ -350,6 +368,24 @@ class JobPostingCrawler:
 
         return job_info
 
+    def get_job_links(self, keyword: str, max_jobs: int = 50) -> List[str]:
+        """
+        키워드로 검색하여 상세 페이지를 방문할 공고 링크 수집
+
+        Args:
+            keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수
+
+        Returns:
+            공고 링크 리스트 (증분 필터 적용 후)
+        """
+        job_links = self.get_job_list(keyword, max_jobs)
+
+        if not job_links:
+            self.logger.warning("공고 링크를 찾을 수 없습니다")
+
+        return job_links
+
     def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
         """
         키워드로 검색하여 공고 수집
@@ -364,15 +400,16 @@ class JobPostingCrawler:
         self.logger.info(f"'{keyword}' 키워드로 크롤링 시작 (최대 {max_jobs}개)")
 
         # 1. 공고 링크 목록 수집
-        job_links = self.get_job_list(keyword, max_jobs)
-
+        job_links = self.get_job_links(keyword, max_jobs)
         if not job_links:
-            self.logger.warning("공고 링크를 찾을 수 없습니다")
             return []
 
         # 2. 각 공고 상세 정보 파싱
         jobs = []
         for i, job_url in enumerate(job_links, 1):
+            if get_breaker(self.config).is_open():
+                self.logger.error("서킷 브레이커가 열려 남은 공고 수집을 중단합니다")
+                break
             try:
                 self.logger.info(f"공고 수집 중: {i}/{len(job_links)}")
                 job_info = self.parse_job_detail(job_url)
@@ -380,9 +417,6 @@ class JobPostingCrawler:
                 if job_info:
                     jobs.append(job_info)
 
-                # 요청 간 대기
-                time.sleep(self.config.get("request_delay", 2))
-
             except Exception as e:
                 self.logger.error(f"공고 처리 중 오류 ({job_url}): {e}")
                 continue
@@ -0,0 +1,54 @@
+"""
+사이트명 → 크롤러 클래스 레지스트리 (지연 로딩)
+크롤러 모듈은 Playwright와 사이트별 의존성을 불러오므로, 실제로 그 사이트의 크롤러 클래스를 꺼낼 때 처음 import한다
+(사이트 목록 조회, --help, 인자 검증에는 import가 일어나지 않음)
+"""
+import importlib
+from collections.abc import Mapping
+from typing import Dict, Iterator, Tuple
+
+# 사이트명 → (모듈 경로, 클래스명)
+CRAWLER_PATHS: Dict[str, Tuple[str, str]] = {
+    "jobkorea": ("sites.jobkorea.crawler", "JobKoreaCrawler"),
+    "incruit": ("sites.incruit.crawler", "IncruitCrawler"),
+    "alba": ("sites.alba.crawler", "AlbaCrawler"),
+    "albamon": ("sites.albamon.crawler", "AlbamonCrawler"),
+    "jobplanet": ("sites.jobplanet.crawler", "JobplanetCrawler"),
+    "jobposting": ("sites.jobposting.crawler", "JobPostingCrawler"),
+    "worknet": ("sites.worknet.crawler", "WorknetCrawler"),
+    "saramin": ("sites.saramin.crawler", "SaraminCrawler"),
+    "hibrain": ("sites.hibrain.crawler", "HibrainCrawler"),
+    "blind": ("sites.blind.crawler", "BlindCrawler"),
+}
+
+
+class CrawlerRegistry(Mapping):
+    """
+    사이트명으로 크롤러 클래스를 찾는 읽기 전용 매핑
+
+    키 순회/포함 여부/개수는 모듈을 불러오지 않고, registry[site]로 꺼낼 때 해당 모듈만 import한다.
+    """
+
+    def __init__(self, paths: Dict[str, Tuple[str, str]]):
+        self._paths = dict(paths)
+        self._classes: Dict[str, type] = {}
+
+    def __getitem__(self, site: str) -> type:
+        crawler_class = self._classes.get(site)
+        if crawler_class is None:
+            module_name, class_name = self._paths[site]
+            crawler_class = getattr(importlib.import_module(module_name), class_name)
+            self._classes[site] = crawler_class
+        return crawler_class
+
+    def __contains__(self, site) -> bool:
+        return site in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+CRAWLER_CLASSES = CrawlerRegistry(CRAWLER_PATHS)
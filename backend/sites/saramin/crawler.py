@@ -3,9 +3,8 @@
 """
 import json
 import re
-import time
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page, Browser
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 from typing import List, Dict, Optional
 import sys
 
@@ -13,6 +12,11 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.logger import setup_logger
 from utils.file_handler import save_json, create_job_data
+from utils.resilience import get_breaker, record_empty, record_extracted
+from utils.navigation import goto, settle
+from utils.telemetry import TimedPage
+from utils import browser_state
+from utils.pagination import paginate_links
 
 
 class SaraminCrawler:
@@ -27,7 +31,11 @@ class SaraminCrawler:
         self.headless = headless
         self.config = self._load_config()
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.seen_filter = None  # 증분 크롤링용 SeenUrlFilter (cli에서 설정)
+        self.checkpoint = None  # 실행 체크포인트 CrawlCheckpoint (cli에서 설정)
+        self.pipeline = None  # 스트리밍 분석/저장 CrawlPipeline (cli에서 설정)
 
     def _load_config(self) -> dict:
         """설정 파일 로드"""
@@ -49,24 +57,27 @@ class SaraminCrawler:
             ]
         )
 
-        # 일반 브라우저처럼 보이도록 user agent 설정
-        self.page = self.browser.new_page(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        # 일반 브라우저처럼 보이도록 user agent 설정 - 결과 페이지 탭(pagination)도 같은 쿠키/user agent/viewport를 쓰도록 컨텍스트에 설정
+        self.context = self.browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={"width": 1920, "height": 1080},
+            **browser_state.context_options(self.config)  # 저장된 쿠키/localStorage
         )
 
         # navigator.webdriver 제거 (bot detection 회피)
-        self.page.add_init_script("""
+        self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
             });
         """)
-
-        self.page.set_viewport_size({"width": 1920, "height": 1080})
+        self.page = self.context.new_page()
+        self.page = TimedPage(self.page)  # 준비 대기/추출 시간 계측
         self.logger.info("브라우저 시작 완료 (bot detection 회피 설정 적용)")
 
     def close(self):
         """브라우저 종료"""
         if self.browser:
+            browser_state.save_state(self.page, self.config)
             self.browser.close()
         if hasattr(self, 'playwright'):
             self.playwright.stop()
@@ -113,7 +124,7 @@ class SaraminCrawler:
             self.logger.info(f"검색 페이지로 이동: {search_url}")
 
             # 1. 기본 DOM 로드까지만 대기 (networkidle은 사람인에서 너무 오래 걸림)
-            self.page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
+            goto(self.page, self.config, search_url, wait_until="domcontentloaded", timeout=60000)
             self.logger.info("초기 페이지 로드 완료 (domcontentloaded)")
 
             # 2. 추가 네트워크 요청 완료 대기 (최대 10초, 실패해도 계속 진행)
@@ -153,67 +164,17 @@ class SaraminCrawler:
                 self.logger.warning("페이지 load 타임아웃 (계속 진행)")
 
             # 5. 동적 콘텐츠 렌더링을 위한 대기 (DOM 안정화)
-            time.sleep(2)
+            settle(2)
 
             self.logger.info("페이지 로드 완료, 공고 링크 수집 시작")
 
-            # 7. 안정적인 상태에서 JavaScript 실행
-            job_links_data = self.page.evaluate("""
-                () => {
-                    const links = [];
-
-                    // 사람인 공고 링크 패턴들을 시도
-                    const selectors = [
-                        'a[href*="/zf_user/jobs/relay/view"]',  // 사람인 상세 페이지 패턴
-                        'a[href*="/zf_user/"]',                  // zf_user 포함 링크
-                        '.item_recruit a',                       // 공고 아이템 링크
-                        'a.job_tit',                            // 공고 제목 링크
-                        'a[class*="tit"]'                       // tit 클래스 링크
-                    ];
-
-                    // 각 셀렉터로 링크 수집 시도
-                    for (const selector of selectors) {
-                        const elements = document.querySelectorAll(selector);
-                        elements.forEach(link => {
-                            const href = link.getAttribute('href');
-                            if (href) {
-                                // rec_idx 파라미터가 있는 링크만 수집
-                                if (href.includes('rec_idx=') || href.includes('/view/')) {
-                                    const fullUrl = href.startsWith('http') ? href : 'https://www.saramin.co.kr' + href;
-                                    if (!links.includes(fullUrl)) {
-                                        links.push(fullUrl);
-                                    }
-                                }
-                            }
-                        });
-
-                        if (links.length > 0) {
-                            console.log(`Found ${links.length} links with selector: ${selector}`);
-                            break;
-                        }
-                    }
-
-                    // 발견된 모든 링크 출력 (디버깅용)
-                    if (links.length === 0) {
-                        console.log('No links found. Sample href patterns:');
-                        const allLinks = document.querySelectorAll('a[href]');
-                        const samples = [];
-                        allLinks.forEach((link, idx) => {
-                            const href = link.getAttribute('href');
-                            if (href && (href.includes('zf_user') || href.includes('recruit') || href.includes('job'))) {
-                                samples.push(href);
-                            }
-                        });
-                        // 중복 제거 후 처음 10개 출력
-                        const uniqueSamples = [...new Set(samples)].slice(0, 10);
-                        uniqueSamples.forEach(href => console.log(href));
-                    }
-
-                    return links;
-                }
-            """)
-
-            job_links = job_links_data[:max_jobs] if job_links_data else []
+            # 6. 결과 페이지를 넘기며 공고 링크 수집 (이미 수집된 공고는 페이지 단위로 제외)
+            job_links = paginate_links(
+                self.page, self.config, self._extract_job_links,
+                first_url=search_url,
+                max_links=max_jobs,
+                filter_new=self.seen_filter.filter_new if self.seen_filter else None
+            )
             self.logger.info(f"총 {len(job_links)}개의 공고 링크 발견")
 
             # 링크가 없으면 페이지 HTML 구조 로깅
@@ -232,6 +193,72 @@ class SaraminCrawler:
             self.logger.error(f"공고 목록 수집 중 오류: {e}", exc_info=True)
             return []
 
+    def _extract_job_links(self, page: Page) -> List[str]:
+        """
+        결과 페이지에서 공고 링크 추출
+
+        Args:
+            page: 검색 결과가 로드된 페이지
+
+        Returns:
+            공고 링크 리스트
+        """
+        links_data = page.evaluate("""
+            () => {
+                const links = [];
+
+                // 사람인 공고 링크 패턴들을 시도
+                const selectors = [
+                    'a[href*="/zf_user/jobs/relay/view"]',  // 사람인 상세 페이지 패턴
+                    'a[href*="/zf_user/"]',                  // zf_user 포함 링크
+                    '.item_recruit a',                       // 공고 아이템 링크
+                    'a.job_tit',                            // 공고 제목 링크
+                    'a[class*="tit"]'                       // tit 클래스 링크
+                ];
+
+                // 각 셀렉터로 링크 수집 시도
+                for (const selector of selectors) {
+                    const elements = document.querySelectorAll(selector);
+                    elements.forEach(link => {
+                        const href = link.getAttribute('href');
+                        if (href) {
+                            // rec_idx 파라미터가 있는 링크만 수집
+                            if (href.includes('rec_idx=') || href.includes('/view/')) {
+                                const fullUrl = href.startsWith('http') ? href : 'https://www.saramin.co.kr' + href;
+                                if (!links.includes(fullUrl)) {
+                                    links.push(fullUrl);
+                                }
+                            }
+                        }
+                    });
+
+                    if (links.length > 0) {
+                        console.log(`Found ${links.length} links with selector: ${selector}`);
+                        break;
+                    }
+                }
+
+                // 발견된 모든 링크 출력 (디버깅용)
+                if (links.length === 0) {
+                    console.log('No links found. Sample href patterns:');
+                    const allLinks = document.querySelectorAll('a[href]');
+                    const samples = [];
+                    allLinks.forEach((link, idx) => {
+                        const href = link.getAttribute('href');
+                        if (href && (href.includes('zf_user') || href.includes('recruit') || href.includes('job'))) {
+                            samples.push(href);
+                        }
+                    });
+                    // 중복 제거 후 처음 10개 출력
+                    const uniqueSamples = [...new Set(samples)].slice(0, 10);
+                    uniqueSamples.forEach(href => console.log(href));
+                }
+
+                return links;
+            }
+        """)
+        return links_data if links_data else []
+
     def parse_job_detail(self, job_url: str) -> Optional[Dict]:
         """
         공고 상세 페이지에서 정보 파싱
@@ -244,8 +271,8 @@ class SaraminCrawler:
         """
         try:
             self.logger.debug(f"공고 상세 페이지 접속: {job_url}")
-            self.page.goto(job_url, wait_until="domcontentloaded", timeout=60000)
-            time.sleep(self.config.get("wait_time", 3))
+            goto(self.page, self.config, job_url, wait_until="domcontentloaded", timeout=60000)
+            settle(self.config.get("wait_time", 3))
 
             job_info = {
                 "url": job_url,
@@ -387,15 +414,35 @@ class SaraminCrawler:
             # 제목이 없으면 스킵
             if not job_info["title"]:
                 self.logger.warning(f"제목을 찾을 수 없어 스킵: {job_url}")
+                record_empty(self.config, job_url)
                 return None
 
             self.logger.info(f"공고 파싱 완료: {job_info['title']} - {job_info.get('company', 'N/A')}")
+            record_extracted(self.config)
             return job_info
 
         except Exception as e:
             self.logger.error(f"공고 상세 파싱 중 오류 ({job_url}): {e}", exc_info=True)
             return None
 
+    def get_job_links(self, keyword: str, max_jobs: int = 50) -> List[str]:
+        """
+        키워드로 검색하여 상세 페이지를 방문할 공고 링크 수집
+
+        Args:
+            keyword: 검색 키워드
+            max_jobs: 최대 수집할 공고 수
+
+        Returns:
+            공고 링크 리스트 (증분 필터 적용 후)
+        """
+        job_links = self.get_job_list(keyword, max_jobs)
+
+        if not job_links:
+            self.logger.warning("수집된 공고 링크가 없습니다")
+
+        return job_links
+
     def crawl(self, keyword: str, max_jobs: int = 50) -> List[Dict]:
         """
         키워드로 검색하여 공고 수집
@@ -410,15 +457,16 @@ class SaraminCrawler:
         self.logger.info(f"사람인 크롤링 시작 (키워드: {keyword}, 최대: {max_jobs}개)")
 
         # 1. 공고 링크 목록 수집
-        job_links = self.get_job_list(keyword, max_jobs)
-
+        job_links = self.get_job_links(keyword, max_jobs)
         if not job_links:
-            self.logger.warning("수집된 공고 링크가 없습니다")
             return []
 
         # 2. 각 공고 상세 정보 파싱
         all_jobs = []
         for i, job_url in enumerate(job_links, 1):
+            if get_breaker(self.config).is_open():
+                self.logger.error("서킷 브레이커가 열려 남은 공고 수집을 중단합니다")
+                break
             try:
                 self.logger.info(f"공고 처리 중: {i}/{len(job_links)}")
                 job_info = self.parse_job_detail(job_url)
@@ -426,9 +474,6 @@ class SaraminCrawler:
                 if job_info:
                     all_jobs.append(job_info)
 
-                # 요청 간 대기
-                time.sleep(self.config.get("request_delay", 2))
-
             except Exception as e:
                 self.logger.error(f"공고 처리 중 오류 ({job_url}): {e}")
                 continue
@@ -0,0 +1,117 @@
+"""
+사이트별 브라우저 세션 상태 저장소
+쿠키/localStorage(Playwright storage_state)를 사이트마다 파일로 보관하여, 다음 실행에서
+동의 화면, 팝업 닫기, 첫 방문 리디렉션 같은 준비 과정을 건너뛴다
+
+봇 차단/로그인 화면이 감지되면(resilience.check_response) 해당 사이트 상태를 즉시 폐기하고,
+그 실행이 끝날 때도 다시 저장하지 않는다.
+
+사이트 config.json 설정 (선택):
+    "browser_state": {
+        "enabled": true,       # 기본값: true
+        "max_age_hours": 24    # 이보다 오래된 상태는 사용하지 않음 (기본값: 24)
+    }
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from utils.logger import setup_logger
+from utils.paths import DATA_DIR
+
+logger = setup_logger("BrowserState")
+
+STATE_DIR = DATA_DIR / "browser_state"
+
+DEFAULT_BROWSER_STATE = {"enabled": True, "max_age_hours": 24}
+
+# 이번 프로세스에서 폐기된 사이트 (실행 종료 시 다시 저장하지 않음)
+_invalidated = set()
+_lock = threading.Lock()
+
+
+def _settings(config: Dict) -> Dict:
+    return {**DEFAULT_BROWSER_STATE, **config.get("browser_state", {})}
+
+
+def state_path(config: Dict, directory: Path = STATE_DIR) -> Path:
+    """사이트 상태 파일 경로 (base_url 호스트 기준)"""
+    return Path(directory) / f"{urlparse(config['base_url']).netloc}.json"
+
+
+def context_options(config: Dict, directory: Path = STATE_DIR) -> Dict:
+    """
+    저장된 상태가 있으면 new_page/new_context에 넘길 storage_state 옵션 반환
+
+    Args:
+        config: 사이트 config.json 내용
+        directory: 상태 파일 디렉토리
+
+    Returns:
+        {"storage_state": 경로} 또는 빈 dict (상태 없음/만료/비활성화)
+    """
+    settings = _settings(config)
+    path = state_path(config, directory)
+    if not settings["enabled"] or not path.exists():
+        return {}
+    age_hours = (time.time() - path.stat().st_mtime) / 3600
+    if age_hours > settings["max_age_hours"]:
+        logger.info(f"[{config['site_name']}] 저장된 세션 상태가 만료되어 사용하지 않습니다 ({age_hours:.0f}시간 경과)")
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"[{config['site_name']}] 세션 상태 파일을 읽을 수 없어 폐기합니다: {e}")
+        path.unlink(missing_ok=True)
+        return {}
+    logger.info(f"[{config['site_name']}] 저장된 세션 상태 사용: {path}")
+    return {"storage_state": str(path)}
+
+
+def save_state(page, config: Dict, directory: Path = STATE_DIR) -> Optional[Path]:
+    """
+    페이지 컨텍스트의 storage_state 저장 (크롤러 종료 시 호출)
+
+    Args:
+        page: Playwright Page (None이면 무시)
+        config: 사이트 config.json 내용
+        directory: 상태 파일 디렉토리
+
+    Returns:
+        저장된 파일 경로 (저장하지 않은 경우 None)
+    """
+    if page is None or not _settings(config)["enabled"]:
+        return None
+    path = state_path(config, directory)
+    with _lock:
+        if path.name in _invalidated:
+            return None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        page.context.storage_state(path=str(path))
+        return path
+    except Exception as e:
+        logger.warning(f"[{config['site_name']}] 세션 상태 저장 실패: {e}")
+        return None
+
+
+def invalidate(config: Dict, reason: str, directory: Path = STATE_DIR):
+    """
+    사이트 상태 폐기 (봇 차단/로그인 화면 감지 시)
+
+    Args:
+        config: 사이트 config.json 내용
+        reason: 폐기 사유 (로그용)
+        directory: 상태 파일 디렉토리
+    """
+    path = state_path(config, directory)
+    with _lock:
+        if path.name in _invalidated:
+            return
+        _invalidated.add(path.name)
+    path.unlink(missing_ok=True)
+    logger.warning(f"[{config.get('site_name')}] 세션 상태 폐기: {reason}")
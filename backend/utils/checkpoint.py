@@ -0,0 +1,186 @@
+"""
+크롤링 체크포인트 저장소
+긴 다중 사이트 실행의 진행 상황을 실행(run)별 SQLite 파일에 즉시 기록하고, --resume 시 완료된 작업을 건너뛴다
+
+기록 단위:
+    - 실행 설정 (키워드, 사이트 목록 등)
+    - 사이트별 키워드 검색 결과 링크 (목록 페이지 수집 완료)
+    - 상세 페이지 처리 완료 URL과 파싱된 공고
+    - 사이트 완료 여부
+"""
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+from utils.logger import setup_logger
+from utils.paths import DATA_DIR
+
+logger = setup_logger("CrawlCheckpoint")
+
+CHECKPOINT_DIR = DATA_DIR / "checkpoints"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS site_status (
+    site TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    job_count INTEGER DEFAULT 0,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_links (
+    site TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    urls TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (site, keyword)
+);
+CREATE TABLE IF NOT EXISTS fetched_urls (
+    site TEXT NOT NULL,
+    url TEXT NOT NULL,
+    job TEXT,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (site, url)
+);
+"""
+
+
+def new_run_id() -> str:
+    """실행 ID 생성 (시작 시각 + 임의 접미사, 같은 초에 시작한 실행끼리도 겹치지 않음)"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+class CrawlCheckpoint:
+    """
+    실행 하나의 체크포인트 (data/checkpoints/<run_id>.sqlite)
+
+    기록은 항목마다 즉시 커밋하므로 프로세스가 중간에 종료되어도 그 직전까지의 진행 상황이 남는다.
+    """
+
+    def __init__(self, run_id: str, directory: Path = CHECKPOINT_DIR):
+        """
+        Args:
+            run_id: 실행 ID
+            directory: 체크포인트 파일 저장 디렉토리
+        """
+        self.run_id = run_id
+        self.path = Path(directory) / f"{run_id}.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open_existing(cls, run_id: str, directory: Path = CHECKPOINT_DIR) -> "CrawlCheckpoint":
+        """
+        재개할 기존 체크포인트 열기
+
+        Raises:
+            FileNotFoundError: 해당 실행의 체크포인트가 없는 경우
+        """
+        path = Path(directory) / f"{run_id}.sqlite"
+        if not path.exists():
+            raise FileNotFoundError(f"체크포인트를 찾을 수 없습니다: {path}")
+        return cls(run_id, directory)
+
+    def _execute(self, sql: str, params: tuple = ()):
+        with self._lock:
+            self.conn.execute(sql, params)
+            self.conn.commit()
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    # 실행 설정
+    def save_meta(self, meta: Dict):
+        """실행 설정 저장 (키워드, 사이트 등, JSON 직렬화 가능한 값)"""
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO run_meta (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in meta.items()]
+            )
+            self.conn.commit()
+
+    def load_meta(self) -> Dict:
+        """저장된 실행 설정"""
+        return {key: json.loads(value) for key, value in self._query("SELECT key, value FROM run_meta")}
+
+    # 사이트 완료 여부
+    def is_site_done(self, site: str) -> bool:
+        """사이트 수집과 결과 저장을 마쳤는지 (site: cli --site 값)"""
+        rows = self._query("SELECT status FROM site_status WHERE site = ?", (site,))
+        return bool(rows) and rows[0][0] == "done"
+
+    def mark_site(self, site: str, status: str, job_count: int = 0):
+        """
+        사이트 상태 기록
+
+        Args:
+            site: 사이트 키 (cli --site 값, 예: 'saramin')
+            status: running / done / failed
+            job_count: 수집된 공고 수
+        """
+        self._execute(
+            "INSERT OR REPLACE INTO site_status (site, status, job_count, updated_at) VALUES (?, ?, ?, ?)",
+            (site, status, job_count, datetime.now().isoformat(timespec="seconds"))
+        )
+
+    # 키워드 검색 결과 (목록 페이지)
+    def get_links(self, site: str, keyword: str) -> Optional[List[str]]:
+        """저장된 검색 결과 링크 (검색을 끝내지 않은 키워드면 None)"""
+        rows = self._query("SELECT urls FROM search_links WHERE site = ? AND keyword = ?", (site, keyword))
+        return json.loads(rows[0][0]) if rows else None
+
+    def save_links(self, site: str, keyword: str, urls: List[str]):
+        self._execute(
+            "INSERT OR REPLACE INTO search_links (site, keyword, urls, created_at) VALUES (?, ?, ?, ?)",
+            (site, keyword, json.dumps(urls, ensure_ascii=False), datetime.now().isoformat(timespec="seconds"))
+        )
+
+    # 상세 페이지
+    def fetched_urls(self, site: str) -> Set[str]:
+        """상세 페이지 처리를 마친 URL (공고가 없던 URL 포함)"""
+        return {url for (url,) in self._query("SELECT url FROM fetched_urls WHERE site = ?", (site,))}
+
+    def save_job(self, site: str, url: str, job: Optional[Dict]):
+        """
+        상세 페이지 처리 결과 기록
+
+        Args:
+            site: 사이트명
+            url: 공고 URL
+            job: 파싱된 공고 (추출 결과가 없으면 None)
+        """
+        self._execute(
+            "INSERT OR REPLACE INTO fetched_urls (site, url, job, fetched_at) VALUES (?, ?, ?, ?)",
+            (site, url, json.dumps(job, ensure_ascii=False) if job else None,
+             datetime.now().isoformat(timespec="seconds"))
+        )
+
+    def fetched_count(self) -> int:
+        """이 실행에서 처리를 마친 상세 페이지 수 (전체 사이트, 진행률 표시용)"""
+        return self._query("SELECT COUNT(*) FROM fetched_urls")[0][0]
+
+    def iter_jobs(self, site: str, batch_size: int = 500) -> Iterator[Dict]:
+        """이전 실행에서 파싱된 공고 (처리 순서 유지, batch_size개씩 읽어 전체를 메모리에 올리지 않음)"""
+        last_rowid = 0
+        while True:
+            rows = self._query(
+                "SELECT rowid, job FROM fetched_urls WHERE site = ? AND job IS NOT NULL AND rowid > ? "
+                "ORDER BY rowid LIMIT ?", (site, last_rowid, batch_size)
+            )
+            for last_rowid, job in rows:
+                yield json.loads(job)
+            if len(rows) < batch_size:
+                return
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -11,6 +11,7 @@ from typing import List, Dict
 sys.path.append(str(Path(__file__).parent.parent))
 
 from database.repositories import JobRepository
+from utils.frontier import canonicalize_url
 from utils.logger import setup_logger
 
 logger = setup_logger("DBHandler")
@@ -41,12 +42,15 @@ def save_jobs_to_db(jobs: List[Dict], site: str, keyword: str) -> int:
         try:
             # 필수 필드 추가
             job_data = job.copy()
+            if job_data.get('url'):
+                job_data['url'] = canonicalize_url(job_data['url'])
             job_data['source_site'] = site
             job_data['search_keyword'] = keyword
+            job_data.setdefault('search_keywords', [keyword])
             job_data['crawled_at'] = datetime.now()
 
-            # DB 저장
-            job_id = job_repo.insert_job(job_data)
+            # DB 저장 (재방문 공고는 내용 갱신)
+            job_id = job_repo.upsert_job(job_data)
             saved_count += 1
 
             logger.debug(f"  [{i}/{len(jobs)}] DB 저장 완료 (ID: {job_id}) - {job.get('title', 'N/A')[:50]}")
@@ -4,10 +4,14 @@
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
+from utils.paths import DATA_DIR
 
-def save_json(data: dict, filename: str, directory: str = "data/json_results") -> Path:
+RESULTS_DIR = DATA_DIR / "json_results"
+
+
+def save_json(data: dict, filename: str, directory: Path = RESULTS_DIR) -> Path:
     """
     JSON 데이터를 파일로 저장
 
@@ -51,3 +55,54 @@ def create_job_data(site: str, keyword: str, jobs: List[Dict]) -> dict:
         "collected_at": datetime.now().isoformat(),
         "jobs": jobs
     }
+
+
+class JsonResultWriter:
+    """
+    공고를 하나씩 JSON 결과 파일에 기록 (create_job_data와 같은 구조, 공고를 메모리에 모으지 않음)
+
+    첫 공고를 기록할 때 파일을 만들고, close()에서 공고 배열을 닫는다.
+    수집된 공고가 없으면 파일을 만들지 않는다.
+    """
+
+    def __init__(self, site: str, keyword: str, filename: str, directory: Path = RESULTS_DIR):
+        """
+        Args:
+            site: 사이트명
+            keyword: 검색 키워드
+            filename: 파일명
+            directory: 저장 디렉토리
+        """
+        self.site = site
+        self.keyword = keyword
+        self.path = Path(directory) / filename
+        self.count = 0
+        self._file = None
+
+    def write(self, job: Dict):
+        """공고 하나 기록"""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+            header = create_job_data(self.site, self.keyword, [])
+            del header["jobs"]
+            # 마지막 "}"를 떼고 공고 배열을 이어서 기록
+            self._file.write(json.dumps(header, ensure_ascii=False, indent=2)[:-2] + ',\n  "jobs": [\n')
+        else:
+            self._file.write(",\n")
+        self._file.write("    " + json.dumps(job, ensure_ascii=False))
+        self.count += 1
+
+    def close(self) -> Optional[Path]:
+        """
+        공고 배열을 닫고 파일 종료
+
+        Returns:
+            저장된 파일 경로 (기록된 공고가 없으면 None)
+        """
+        if self._file is None:
+            return None
+        self._file.write("\n  ]\n}\n")
+        self._file.close()
+        self._file = None
+        return self.path
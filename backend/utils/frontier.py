@@ -0,0 +1,254 @@
+"""
+사이트별 크롤링 프런티어
+여러 키워드의 검색 결과를 하나로 합쳐 공고 상세 페이지를 한 번씩만 수집한다
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from utils.logger import setup_logger
+from utils.resilience import get_breaker
+
+logger = setup_logger("CrawlFrontier")
+
+# 공고를 식별하지 않는 추적/검색 파라미터 (정규화 시 제거)
+TRACKING_PARAMS = {
+    "logpath", "searchrow", "searchword", "keyword", "kw", "stext",
+    "src", "sc", "ref", "referer", "from", "listno", "location",
+    "searchtype", "search_uuid", "paid_fl", "t_ref", "t_content", "t_category",
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    공고 URL 정규화 (중복 판별용)
+
+    - scheme/host 소문자화, fragment 제거, 끝 슬래시 제거
+    - 추적용 쿼리 파라미터 제거 후 나머지 파라미터 정렬
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+class CrawlFrontier:
+    """
+    사이트 단위 공고 URL 프런티어
+
+    키워드별 검색 결과를 정규화된 URL 기준으로 병합하고,
+    각 공고를 노출시킨 검색 키워드를 모두 기록한다.
+    """
+
+    def __init__(self):
+        self._urls: Dict[str, str] = {}            # canonical -> 최초 발견 URL
+        self._keywords: Dict[str, List[str]] = {}  # canonical -> 검색 키워드 목록
+
+    def add(self, urls: Iterable[str], keyword: str) -> int:
+        """
+        키워드 검색 결과 추가
+
+        Args:
+            urls: 검색 결과 공고 URL 목록
+            keyword: 검색 키워드
+
+        Returns:
+            새로 추가된 URL 개수
+        """
+        added = 0
+        for url in urls:
+            if not url:
+                continue
+            key = canonicalize_url(url)
+            if key not in self._urls:
+                self._urls[key] = url
+                self._keywords[key] = []
+                added += 1
+            if keyword not in self._keywords[key]:
+                self._keywords[key].append(keyword)
+        return added
+
+    def keywords_for(self, url: str) -> List[str]:
+        """URL을 노출시킨 검색 키워드 목록"""
+        return list(self._keywords.get(canonicalize_url(url), []))
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __iter__(self) -> Iterator[Tuple[str, List[str]]]:
+        for key, url in self._urls.items():
+            yield url, list(self._keywords[key])
+
+
+def crawl_keywords(crawler, keywords: List[str], max_jobs: int = 50) -> List[Dict]:
+    """
+    모든 키워드의 검색 결과를 프런티어로 합친 뒤 공고 상세를 한 번씩만 수집 (iter_keyword_jobs 결과를 리스트로 반환)
+
+    Args:
+        crawler: 사이트 크롤러 인스턴스 (start() 호출 완료 상태)
+        keywords: 검색 키워드 리스트
+        max_jobs: 키워드당 최대 수집할 공고 수
+
+    Returns:
+        수집된 공고 정보 리스트 (url은 정규화된 URL, search_keyword, search_keywords 포함)
+    """
+    return list(iter_keyword_jobs(crawler, keywords, max_jobs))
+
+
+def iter_keyword_jobs(crawler, keywords: List[str], max_jobs: int = 50) -> Iterator[Dict]:
+    """
+    모든 키워드의 검색 결과를 프런티어로 합친 뒤 공고 상세를 한 번씩만 수집하며, 파싱되는 대로 공고를 반환
+
+    crawler는 get_job_links(keyword, max_jobs)와 parse_job_detail(url)을 제공해야 한다.
+    crawler.checkpoint가 설정되어 있으면 키워드별 검색 결과와 상세 페이지 처리 결과를 즉시 기록하고,
+    이미 기록된 작업은 다시 수행하지 않는다(기록된 공고는 체크포인트에서 복원해 다시 반환).
+    crawler.pipeline이 설정되어 있으면 반환하기 전에 파이프라인에 투입한다.
+
+    Args:
+        crawler: 사이트 크롤러 인스턴스 (start() 호출 완료 상태)
+        keywords: 검색 키워드 리스트
+        max_jobs: 키워드당 최대 수집할 공고 수
+
+    Yields:
+        공고 정보 (url은 정규화된 URL, search_keyword, search_keywords 포함)
+    """
+    frontier = CrawlFrontier()
+    checkpoint = getattr(crawler, "checkpoint", None)
+    site_name = crawler.config["site_name"]
+
+    # 1. 키워드별 검색 결과 병합 (체크포인트에 있으면 목록 페이지 재방문 생략)
+    surfaced = 0
+    for keyword in keywords:
+        job_links = checkpoint.get_links(site_name, keyword) if checkpoint else None
+        if job_links is not None:
+            logger.info(f"'{keyword}': 체크포인트에서 검색 결과 {len(job_links)}개 복원")
+        else:
+            try:
+                job_links = crawler.get_job_links(keyword, max_jobs)
+            except Exception as e:
+                logger.error(f"'{keyword}' 검색 결과 수집 중 오류: {e}")
+                continue
+            if checkpoint:
+                checkpoint.save_links(site_name, keyword, job_links)
+        surfaced += len(job_links)
+        added = frontier.add(job_links, keyword)
+        logger.info(f"'{keyword}': {len(job_links)}개 링크 중 신규 {added}개 (프런티어 {len(frontier)}개)")
+
+    logger.info(f"검색 결과 {surfaced}개 → 중복 제거 후 {len(frontier)}개 공고 상세 수집 예정")
+
+    # 2. 공고 상세는 URL당 한 번만 수집 (체크포인트에 처리 기록이 있는 URL은 생략)
+    count = 0
+    items = list(frontier)
+    if checkpoint:
+        fetched = checkpoint.fetched_urls(site_name)
+        for job_info in checkpoint.iter_jobs(site_name):
+            publish_job(crawler, job_info)
+            count += 1
+            yield job_info
+        items = [(job_url, job_keywords) for job_url, job_keywords in items if job_url not in fetched]
+        if fetched:
+            logger.info(f"체크포인트에서 공고 {count}개 복원, 남은 상세 페이지 {len(items)}개")
+
+    breaker = get_breaker(crawler.config)
+    if hasattr(crawler, "submit_job_detail"):
+        for job_info in _crawl_details_pipelined(crawler, items):
+            count += 1
+            yield job_info
+    else:
+        for i, (job_url, job_keywords) in enumerate(items, 1):
+            if breaker.is_open():
+                logger.error(f"[{breaker.site_name}] 서킷 브레이커가 열려 남은 {len(items) - i + 1}개 공고 수집을 중단합니다")
+                break
+            try:
+                logger.info(f"진행 중: {i}/{len(items)}")
+                job_info = crawler.parse_job_detail(job_url)
+                if job_info:
+                    _tag_job(job_info, job_keywords)
+                _job_parsed(crawler, job_url, job_info)
+            except Exception as e:
+                logger.error(f"공고 처리 중 오류 ({job_url}): {e}")
+                continue
+            if job_info:
+                count += 1
+                yield job_info
+
+    logger.info(f"총 {count}개의 공고 수집 완료")
+
+
+def publish_job(crawler, job_info: Dict):
+    """파싱된 공고를 파이프라인에 즉시 투입 (crawler.pipeline이 설정된 경우만)"""
+    pipeline = getattr(crawler, "pipeline", None)
+    if pipeline:
+        pipeline.submit(crawler.config["site_name"], job_info)
+
+
+def _tag_job(job_info: Dict, job_keywords: List[str]):
+    """공고에 정규화된 URL과 검색 키워드 기록 (DB에는 정규화된 URL과 키워드 전체가 저장됨)"""
+    if job_info.get("url"):
+        job_info["url"] = canonicalize_url(job_info["url"])
+    job_info["search_keyword"] = job_keywords[0]
+    job_info["search_keywords"] = job_keywords
+
+
+def _job_parsed(crawler, job_url: str, job_info):
+    """상세 페이지 처리 결과를 체크포인트에 기록하고 파이프라인에 투입 (설정된 경우만)"""
+    checkpoint = getattr(crawler, "checkpoint", None)
+    if checkpoint:
+        checkpoint.save_job(crawler.config["site_name"], job_url, job_info)
+    if job_info:
+        publish_job(crawler, job_info)
+
+
+def _crawl_details_pipelined(crawler, items: List[Tuple[str, List[str]]]) -> Iterator[Dict]:
+    """
+    HTML 캡처와 필드 추출을 겹쳐서 수행
+
+    crawler.submit_job_detail(url)은 추출 Future를, crawler.finish_job_detail(url, fields)는
+    최종 공고 정보를 반환해야 한다. 브라우저가 다음 페이지를 여는 동안 워커가 이전 페이지를 추출하며,
+    미완료 작업 수는 워커 수의 2배로 제한해 HTML이 메모리에 쌓이지 않도록 한다.
+    """
+    max_pending = max(2, getattr(crawler.extractor, "max_workers", 1) * 2)
+    pending = deque()
+
+    def collect(job_url, job_keywords, future):
+        try:
+            job_info = crawler.finish_job_detail(job_url, future.result())
+        except Exception as e:
+            logger.error(f"공고 추출 중 오류 ({job_url}): {e}")
+            return None
+        if job_info:
+            _tag_job(job_info, job_keywords)
+        _job_parsed(crawler, job_url, job_info)
+        return job_info
+
+    breaker = get_breaker(crawler.config)
+    for i, (job_url, job_keywords) in enumerate(items, 1):
+        if breaker.is_open():
+            logger.error(f"[{breaker.site_name}] 서킷 브레이커가 열려 남은 {len(items) - i + 1}개 공고 수집을 중단합니다")
+            break
+        collected = []
+        try:
+            logger.info(f"진행 중: {i}/{len(items)}")
+            future = crawler.submit_job_detail(job_url)
+            if future is not None:
+                pending.append((job_url, job_keywords, future))
+            while len(pending) > max_pending or (pending and pending[0][2].done()):
+                collected.append(collect(*pending.popleft()))
+        except Exception as e:
+            logger.error(f"공고 처리 중 오류 ({job_url}): {e}")
+        yield from (job_info for job_info in collected if job_info)
+
+    while pending:
+        job_info = collect(*pending.popleft())
+        if job_info:
+            yield job_info
@@ -0,0 +1,311 @@
+"""
+사이트 상태 점검 (cli.py healthcheck)
+야간 크롤링 전에 사이트별 메인/검색/상세 페이지 접속과 공고 링크 셀렉터 동작 여부를 확인하고,
+결과를 DB(site_health_checks)에 누적하여 직전 점검 대비 성능 저하(regression)를 표시한다
+
+셀렉터 후보는 사이트 config.json의 healthcheck 항목에서 읽는다:
+    "healthcheck": {
+        "keyword": "반도체",                       # 검색 페이지 점검용 키워드
+        "link_selectors": ["a[href*='/detail/']"],  # 공고 상세 링크 후보 (첫 링크로 상세 페이지 점검)
+        "item_selectors": [...],                     # 공고 목록 항목 후보 (생략 시 기본값)
+        "title_selectors": [...],                    # 상세 페이지 제목 후보 (생략 시 기본값)
+        "company_selectors": [...]                   # 상세 페이지 회사명 후보 (생략 시 기본값)
+    }
+"""
+import sys
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from playwright.sync_api import sync_playwright
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database.repositories import HealthCheckRepository
+from utils.logger import setup_logger
+from utils.resilience import check_response
+
+logger = setup_logger("HealthCheck")
+
+DEFAULT_PROBE = {
+    "keyword": "반도체",
+    "link_selectors": [],
+    "item_selectors": ["div[class*='job']", "div[class*='recruit']", "article", "li[class*='job']"],
+    "title_selectors": ["h1", "[class*='title']"],
+    "company_selectors": ["[class*='company']", "[class*='corp']"],
+}
+
+# 이 길이 미만의 상세 페이지 HTML은 본문이 없는 것으로 판단
+MIN_CONTENT_LENGTH = 1000
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def probe_settings(config: Dict) -> Dict:
+    """기본 점검 설정에 사이트 config.json의 healthcheck 항목을 덮어쓴 설정"""
+    return {**DEFAULT_PROBE, **config.get("healthcheck", {})}
+
+
+def _load(page, config: Dict, url: str, timeout: int) -> Dict:
+    """페이지 접속 후 접속 가능 여부, 소요 시간, 상태 코드 반환 (봇 차단 화면도 접속 실패로 처리)"""
+    started = time.perf_counter()
+    result = {"accessible": False, "load_time_ms": None, "status_code": None, "error": None}
+    try:
+        response = page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+        result["load_time_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        result["status_code"] = response.status if response else None
+        check_response(page, response, config, url)
+        result["accessible"] = True
+    except Exception as e:
+        result["error"] = str(e).splitlines()[0] if str(e) else type(e).__name__
+    return result
+
+
+def _first_text(page, selectors: List[str]) -> str:
+    """후보 셀렉터 중 처음으로 텍스트가 있는 요소의 텍스트"""
+    for selector in selectors:
+        try:
+            element = page.query_selector(selector)
+            text = element.inner_text().strip() if element else ""
+        except Exception:
+            continue
+        if text:
+            return text
+    return ""
+
+
+def probe_site(site: str, config: Dict, headless: bool = True, timeout: int = 30000) -> Dict:
+    """
+    사이트 하나 점검 (자체 Playwright 인스턴스 사용, 스레드마다 호출 가능)
+
+    Args:
+        site: 사이트명 (cli 사이트 키)
+        config: 사이트 config.json 내용
+        headless: 헤드리스 모드 여부
+        timeout: 페이지별 제한 시간 (ms)
+
+    Returns:
+        점검 결과 (main_page, search_functionality, detail_page, overall_status, issues)
+    """
+    settings = probe_settings(config)
+    result = {
+        "site": site,
+        "site_name": config["site_name"],
+        "checked_at": datetime.now().isoformat(),
+        "base_url": config["base_url"],
+    }
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(
+            headless=headless, args=["--disable-blink-features=AutomationControlled"]
+        )
+        try:
+            page = browser.new_page(user_agent=USER_AGENT)
+
+            # 1. 메인 페이지
+            main = _load(page, config, config["base_url"], timeout)
+            main["page_title"] = page.title() if main["accessible"] else None
+            main["url_after_redirect"] = page.url if main["accessible"] else None
+            result["main_page"] = main
+
+            # 2. 검색 페이지 (검색 URL이 없는 사이트는 목록 페이지)
+            list_url = config.get("search_url") or config.get("recruitment_url") or config.get("jobs_url") or config["base_url"]
+            search = _load(page, config, list_url.format(keyword=urllib.parse.quote_plus(settings["keyword"])), timeout)
+            search.update(search_page_accessible=search.pop("accessible"), search_load_time_ms=search.pop("load_time_ms"))
+            selectors_working = {}
+            links = []
+            if search["search_page_accessible"]:
+                time.sleep(config.get("wait_time", 3))
+                for selector in settings["link_selectors"]:
+                    try:
+                        hrefs = page.eval_on_selector_all(selector, "els => els.map(el => el.href).filter(Boolean)")
+                    except Exception:
+                        hrefs = []
+                    selectors_working[selector] = len(hrefs)
+                    links.extend(href for href in hrefs if href not in links)
+                for selector in settings["item_selectors"]:
+                    try:
+                        selectors_working[selector] = page.eval_on_selector_all(selector, "els => els.length")
+                    except Exception:
+                        selectors_working[selector] = 0
+            item_counts = [selectors_working.get(selector, 0) for selector in settings["item_selectors"]]
+            search.update(
+                search_result_found=bool(links),
+                job_items_count=max(item_counts, default=0),
+                job_links_found=len(links),
+                selectors_working=selectors_working,
+            )
+            result["search_functionality"] = search
+
+            # 3. 상세 페이지 (검색 결과의 첫 공고 링크)
+            detail = {"accessible": False, "load_time_ms": None, "has_content": False, "title_found": False,
+                      "company_found": False, "content_length": 0, "error": None}
+            if links:
+                detail.update(_load(page, config, links[0], timeout))
+                detail.pop("status_code")
+                if detail["accessible"]:
+                    content_length = len(page.content())
+                    detail.update(
+                        url=links[0],
+                        has_content=content_length >= MIN_CONTENT_LENGTH,
+                        title_found=bool(_first_text(page, settings["title_selectors"])),
+                        company_found=bool(_first_text(page, settings["company_selectors"])),
+                        content_length=content_length,
+                    )
+            else:
+                detail["error"] = "점검할 공고 링크 없음"
+            result["detail_page"] = detail
+        finally:
+            browser.close()
+
+    result["overall_status"], result["issues"] = _judge(result)
+    return result
+
+
+def _judge(result: Dict) -> tuple:
+    """점검 결과로 overall_status(healthy/warning/failed)와 문제 목록 결정"""
+    main, search, detail = result["main_page"], result["search_functionality"], result["detail_page"]
+    issues = []
+    if not main["accessible"]:
+        issues.append(f"메인 페이지 접속 실패: {main['error']}")
+    if not search["search_page_accessible"]:
+        issues.append(f"검색 페이지 접속 실패: {search['error']}")
+    if issues:
+        return "failed", issues
+
+    if not search["job_links_found"]:
+        issues.append("검색 결과에서 공고 링크를 찾지 못함 (link_selectors 확인 필요)")
+    elif not detail["accessible"]:
+        issues.append(f"상세 페이지 접속 실패: {detail['error']}")
+    else:
+        if not detail["title_found"]:
+            issues.append("상세 페이지 제목을 찾지 못함")
+        if not detail["company_found"]:
+            issues.append("상세 페이지 회사명을 찾지 못함")
+        if not detail["has_content"]:
+            issues.append(f"상세 페이지 본문이 너무 짧음 ({detail['content_length']}자)")
+    return ("warning" if issues else "healthy"), issues
+
+
+def flatten(result: Dict) -> Dict:
+    """점검 결과를 site_health_checks 행 형태로 변환"""
+    main, search, detail = result["main_page"], result["search_functionality"], result["detail_page"]
+    return {
+        "site": result["site"],
+        "site_name": result["site_name"],
+        "overall_status": result["overall_status"],
+        "main_accessible": int(main["accessible"]),
+        "main_status_code": main["status_code"],
+        "main_load_ms": main["load_time_ms"],
+        "search_accessible": int(search["search_page_accessible"]),
+        "search_load_ms": search["search_load_time_ms"],
+        "job_items_count": search["job_items_count"],
+        "job_links_found": search["job_links_found"],
+        "selectors_working": search["selectors_working"],
+        "detail_accessible": int(detail["accessible"]),
+        "detail_load_ms": detail["load_time_ms"],
+        "title_found": int(detail["title_found"]),
+        "company_found": int(detail["company_found"]),
+        "content_length": detail["content_length"],
+        "issues": result["issues"],
+        "regressions": result.get("regressions", []),
+        "checked_at": result["checked_at"],
+    }
+
+
+STATUS_RANK = {"healthy": 0, "warning": 1, "failed": 2}
+
+
+def find_regressions(current: Dict, previous: Optional[Dict]) -> List[str]:
+    """
+    직전 점검 대비 나빠진 항목
+
+    Args:
+        current: 이번 점검 결과 (flatten 형태)
+        previous: 직전 점검 결과 (site_health_checks 행, 없으면 None)
+
+    Returns:
+        regression 설명 목록
+    """
+    if not previous:
+        return []
+    regressions = []
+    if STATUS_RANK[current["overall_status"]] > STATUS_RANK.get(previous["overall_status"], 0):
+        regressions.append(f"상태 {previous['overall_status']} → {current['overall_status']}")
+
+    for selector, count in previous["selectors_working"].items():
+        if count and not current["selectors_working"].get(selector):
+            regressions.append(f"셀렉터 동작 중단: {selector} ({count}개 → 0개)")
+    if previous["job_links_found"] and current["job_links_found"] < previous["job_links_found"] / 2:
+        regressions.append(f"공고 링크 수 감소: {previous['job_links_found']}개 → {current['job_links_found']}개")
+
+    for field, label in (("title_found", "상세 제목"), ("company_found", "상세 회사명")):
+        if previous[field] and not current[field]:
+            regressions.append(f"{label} 추출 실패")
+
+    # 2배 이상, 1초 이상 느려진 경우만 표시 (네트워크 편차 제외)
+    for field, label in (("main_load_ms", "메인"), ("search_load_ms", "검색"), ("detail_load_ms", "상세")):
+        before, after = previous[field], current[field]
+        if before and after and after > before * 2 and after - before > 1000:
+            regressions.append(f"{label} 페이지 로드 지연: {before:.0f}ms → {after:.0f}ms")
+    return regressions
+
+
+def run_healthcheck(configs: Dict[str, Dict], workers: int = 4, headless: bool = True,
+                    timeout: int = 30000) -> Dict:
+    """
+    여러 사이트를 동시에 점검하고 결과를 DB에 저장
+
+    Args:
+        configs: 사이트명 → config.json 내용
+        workers: 동시에 점검할 사이트 수 (스레드마다 별도 브라우저)
+        headless: 헤드리스 모드 여부
+        timeout: 페이지별 제한 시간 (ms)
+
+    Returns:
+        점검 리포트 (check_id, check_started_at, sites, summary)
+    """
+    started_at = datetime.now()
+    check_id = started_at.strftime("%Y%m%d_%H%M%S")
+    repo = HealthCheckRepository()
+
+    def check(site: str) -> Dict:
+        try:
+            return probe_site(site, configs[site], headless=headless, timeout=timeout)
+        except Exception as e:
+            logger.error(f"{site} 점검 중 오류: {e}", exc_info=True)
+            empty = {"accessible": False, "load_time_ms": None, "status_code": None, "error": str(e)}
+            return {
+                "site": site, "site_name": configs[site]["site_name"], "checked_at": datetime.now().isoformat(),
+                "base_url": configs[site]["base_url"], "main_page": empty,
+                "search_functionality": {"search_page_accessible": False, "search_load_time_ms": None,
+                                         "job_items_count": 0, "job_links_found": 0, "selectors_working": {},
+                                         "error": str(e)},
+                "detail_page": {**empty, "title_found": False, "company_found": False, "content_length": 0},
+                "overall_status": "failed", "issues": [f"점검 실행 실패: {e}"],
+            }
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(executor.map(check, configs))
+
+    for result in results:
+        result["regressions"] = find_regressions(flatten(result), repo.get_latest(result["site"]))
+    repo.save_results(check_id, [flatten(result) for result in results])
+
+    summary = {"total_sites": len(results), "healthy": 0, "warning": 0, "failed": 0,
+               "regressions": sum(len(result["regressions"]) for result in results)}
+    for result in results:
+        summary[result["overall_status"]] += 1
+    return {
+        "check_id": check_id,
+        "check_started_at": started_at.isoformat(),
+        "sites": {result["site_name"]: result for result in results},
+        "summary": summary,
+    }
@@ -0,0 +1,249 @@
+"""
+오프라인 HTML 추출 유틸리티
+브라우저에서는 렌더링된 HTML만 한 번 캡처하고, 필드 추출은 lxml로 워커 프로세스에서 수행한다
+"""
+import gzip
+import hashlib
+import multiprocessing
+import re
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from lxml import html as lxml_html
+
+from utils.logger import setup_logger
+from utils.paths import DATA_DIR
+
+logger = setup_logger("HtmlExtractor")
+
+# 렌더링 시 줄바꿈이 생기는 블록 요소 (innerText 근사용)
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "tbody", "thead", "tfoot", "tr", "td", "th", "ul",
+}
+
+# 텍스트에 포함하지 않는 요소
+SKIP_TAGS = {"script", "style", "noscript", "template", "head", "svg"}
+
+SNAPSHOT_DIR = DATA_DIR / "html_snapshots"
+_SNAPSHOT_URL_PREFIX = "<!-- saved-from: "
+
+
+def parse_html(html: str):
+    """HTML 문자열을 lxml 문서로 파싱"""
+    return lxml_html.fromstring(html or "<html></html>")
+
+
+def inner_text(element) -> str:
+    """
+    요소의 표시 텍스트 추출 (브라우저 innerText 근사)
+
+    블록 요소와 <br>에서 줄을 나누고, 줄 내부 공백을 정리한 뒤 빈 줄을 제거한다.
+
+    Args:
+        element: lxml 요소
+
+    Returns:
+        줄 단위로 정리된 텍스트
+    """
+    if element is None:
+        return ""
+
+    parts = []
+    # (요소, 종료 여부) 스택 - 깊은 DOM에서도 재귀 한도에 걸리지 않도록 반복 처리
+    stack = [(element, False)]
+    while stack:
+        node, closing = stack.pop()
+        tag = node.tag if isinstance(node.tag, str) else None
+
+        if closing:
+            if tag in BLOCK_TAGS:
+                parts.append("\n")
+            if node is not element and node.tail:
+                parts.append(node.tail)
+            continue
+
+        if tag is None or tag in SKIP_TAGS:
+            # 주석/스크립트 등은 본문을 건너뛰고 tail만 유지
+            if node is not element and node.tail:
+                parts.append(node.tail)
+            continue
+
+        if tag in BLOCK_TAGS:
+            parts.append("\n")
+        elif tag == "br":
+            parts.append("\n")
+        if node.text:
+            parts.append(node.text)
+
+        stack.append((node, True))
+        for child in reversed(node):
+            stack.append((child, False))
+
+    lines = (re.sub(r"[ \t\r\f\v\xa0]+", " ", line).strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def find_label(root, *labels: str):
+    """
+    라벨 텍스트를 직접 포함하는 첫 번째 요소 찾기 (문서 순서)
+
+    Args:
+        root: 탐색 시작 요소
+        labels: 찾을 라벨 텍스트 (하나라도 포함되면 매칭)
+
+    Returns:
+        매칭된 lxml 요소 또는 None
+    """
+    condition = " or ".join(f"contains(., '{label}')" for label in labels)
+    matches = root.xpath(f".//text()[{condition}]/parent::*[not(self::script or self::style)]")
+    return matches[0] if matches else None
+
+
+def closest(element, tag: str):
+    """자신 또는 가장 가까운 상위 요소 중 tag와 일치하는 요소 (DOM closest 대응)"""
+    node = element
+    while node is not None:
+        if node.tag == tag:
+            return node
+        node = node.getparent()
+    return None
+
+
+def _run_extractor(extract_fn: Callable[[str], Dict], html: str) -> Dict:
+    """워커 프로세스에서 실행되는 추출 함수 래퍼"""
+    return extract_fn(html)
+
+
+class HtmlExtractor:
+    """
+    HTML 필드 추출 워커 풀
+
+    - 추출 함수는 모듈 최상위 함수여야 한다 (프로세스 간 전달)
+    - 브라우저(Playwright) 스레드와 충돌하지 않도록 spawn 방식으로 워커 생성
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: 워커 프로세스 수 (None이면 CPU 코어 수 기준, 최대 4)
+        """
+        if max_workers is None:
+            max_workers = min(4, multiprocessing.cpu_count())
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def submit(self, extract_fn: Callable[[str], Dict], html: str) -> Future:
+        """
+        추출 작업 제출
+
+        Args:
+            extract_fn: HTML 문자열을 받아 필드 dict를 반환하는 함수
+            html: 렌더링된 HTML
+
+        Returns:
+            추출 결과 Future
+        """
+        return self._get_executor().submit(_run_extractor, extract_fn, html)
+
+    def close(self):
+        """워커 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def snapshot_path(site: str, url: str, directory: Path = SNAPSHOT_DIR) -> Path:
+    """공고 URL의 HTML 스냅샷 파일 경로"""
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return Path(directory) / site / f"{digest}.html.gz"
+
+
+def save_snapshot(site: str, url: str, html: str, directory: Path = SNAPSHOT_DIR) -> Path:
+    """
+    렌더링된 HTML 스냅샷 저장 (재크롤링 없이 재추출 가능하도록)
+
+    Args:
+        site: 사이트 식별자 (예: 'jobkorea')
+        url: 공고 URL
+        html: 렌더링된 HTML
+        directory: 스냅샷 저장 디렉토리
+
+    Returns:
+        저장된 파일 경로
+    """
+    path = snapshot_path(site, url, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(f"{_SNAPSHOT_URL_PREFIX}{url} -->\n")
+        f.write(html)
+    return path
+
+
+def iter_snapshots(site: str, directory: Path = SNAPSHOT_DIR) -> Iterator[Tuple[str, str]]:
+    """
+    저장된 HTML 스냅샷 순회
+
+    Args:
+        site: 사이트 식별자
+        directory: 스냅샷 저장 디렉토리
+
+    Yields:
+        (공고 URL, HTML) 튜플
+    """
+    site_dir = Path(directory) / site
+    if not site_dir.exists():
+        return
+    for path in sorted(site_dir.glob("*.html.gz")):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                header = f.readline()
+                html = f.read()
+        except (OSError, EOFError) as e:
+            logger.warning(f"스냅샷 읽기 실패 ({path}): {e}")
+            continue
+        if not header.startswith(_SNAPSHOT_URL_PREFIX):
+            continue
+        url = header[len(_SNAPSHOT_URL_PREFIX):].rsplit("-->", 1)[0].strip()
+        yield url, html
+
+
+def prune_snapshots(site: str, max_age_days: float, directory: Path = SNAPSHOT_DIR) -> int:
+    """
+    오래된 HTML 스냅샷 삭제
+
+    Args:
+        site: 사이트 식별자
+        max_age_days: 보관 기간 (일, 0 이하이면 삭제하지 않음)
+        directory: 스냅샷 저장 디렉토리
+
+    Returns:
+        삭제한 파일 수
+    """
+    site_dir = Path(directory) / site
+    if max_age_days <= 0 or not site_dir.exists():
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for path in site_dir.glob("*.html.gz"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError as e:
+            logger.warning(f"스냅샷 삭제 실패 ({path}): {e}")
+    if removed:
+        logger.info(f"[{site}] {max_age_days}일이 지난 HTML 스냅샷 {removed}개 삭제")
+    return removed
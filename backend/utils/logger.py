@@ -2,10 +2,17 @@
 로깅 유틸리티
 """
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from datetime import datetime
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 워커 프로세스에서 콘솔 대신 로그를 보낼 부모 프로세스 큐 (redirect_to_queue로 설정)
+_log_queue = None
+_log_tag = ""
+
 
 def setup_logger(name: str = "Crawler", log_file: str = None) -> logging.Logger:
     """
@@ -26,16 +33,10 @@ def setup_logger(name: str = "Crawler", log_file: str = None) -> logging.Logger:
         logger.handlers.clear()
 
     # 포맷터 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = logging.Formatter(LOG_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
 
-    # 콘솔 핸들러
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # 콘솔 핸들러 (워커 프로세스에서는 부모 프로세스 큐)
+    logger.addHandler(_queue_handler() if _log_queue is not None else _console_handler(formatter))
 
     # 파일 핸들러 (옵션)
     if log_file:
@@ -52,3 +53,57 @@ def setup_logger(name: str = "Crawler", log_file: str = None) -> logging.Logger:
         logger.addHandler(file_handler)
 
     return logger
+
+
+def _console_handler(formatter: logging.Formatter) -> logging.Handler:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(logging.INFO)
+    handler.setFormatter(formatter)
+    return handler
+
+
+def _queue_handler() -> logging.Handler:
+    """메시지를 워커 태그와 함께 포맷해 부모 프로세스 큐로 보내는 핸들러"""
+    handler = logging.handlers.QueueHandler(_log_queue)
+    handler.setLevel(logging.INFO)
+    handler.setFormatter(logging.Formatter(
+        f'%(asctime)s - [{_log_tag}] %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    return handler
+
+
+def redirect_to_queue(log_queue, tag: str):
+    """
+    워커 프로세스의 콘솔 로그를 부모 프로세스 큐로 전환
+
+    이미 생성된 로거의 콘솔 핸들러도 교체하며, 이후 setup_logger로 만든 로거는 처음부터 큐를 사용한다.
+    부모 프로세스에서는 start_queue_listener로 큐의 로그를 한곳에서 출력한다.
+
+    Args:
+        log_queue: multiprocessing 큐 (Manager().Queue())
+        tag: 로그 앞에 붙일 워커 이름 (예: 사이트명)
+    """
+    global _log_queue, _log_tag
+    _log_queue, _log_tag = log_queue, tag
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        if not isinstance(logger, logging.Logger):
+            continue
+        for handler in list(logger.handlers):
+            if type(handler) is logging.StreamHandler and handler.stream is sys.stdout:
+                logger.removeHandler(handler)
+                logger.addHandler(_queue_handler())
+
+
+def start_queue_listener(log_queue) -> logging.handlers.QueueListener:
+    """
+    워커 프로세스 로그를 콘솔에 출력하는 리스너 시작 (종료 시 stop() 호출)
+
+    Args:
+        log_queue: 워커들이 redirect_to_queue에 넘긴 큐
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
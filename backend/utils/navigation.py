@@ -0,0 +1,181 @@
+"""
+페이지 이동 헬퍼
+크롤러의 모든 페이지 이동은 이 모듈을 거쳐 장애 대응(재시도/서킷 브레이커)과 사이트별 속도 제어를 받고,
+이동/대기 시간은 실행 계측(utils.telemetry)에 기록된다
+"""
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from utils import browser_state
+from utils.logger import setup_logger
+from utils.resilience import (
+    BOT_WALL, CircuitOpenError, CrawlError, TRANSIENT_KINDS, backoff_delay, check_response,
+    classify_exception, get_breaker, retry_settings,
+)
+from utils.scheduler import get_scheduler
+from utils.telemetry import get_telemetry
+
+logger = setup_logger("Navigation")
+
+
+def goto(page, config: Dict, url: str, wait_until: str = "domcontentloaded", timeout: int = 60000):
+    """
+    장애 대응과 사이트 속도 제어를 거쳐 페이지 이동
+
+    일시적 오류(타임아웃, 네트워크, 5xx/429)는 지터가 적용된 지수 백오프로 재시도하고,
+    최종 실패는 사이트 서킷 브레이커에 기록하고, 봇 차단/로그인 화면이면 저장된 세션 상태를 폐기한다.
+
+    Args:
+        page: Playwright Page
+        config: 사이트 config.json 내용
+        url: 이동할 URL
+        wait_until: 이동 완료 기준 (Playwright goto 옵션, "commit"이면 로드 후 check_loaded 호출 필요)
+        timeout: 제한 시간 (ms)
+
+    Returns:
+        Playwright Response (없으면 None)
+
+    Raises:
+        CircuitOpenError: 사이트 서킷 브레이커가 열린 경우
+        CrawlError: 재시도 후에도 실패한 경우 (오류 종류 포함)
+    """
+    breaker = get_breaker(config)
+    settings = retry_settings(config)
+    # max_retries는 첫 시도 이후의 재시도 횟수
+    attempts = max(0, settings["max_retries"]) + 1
+    telemetry = get_telemetry()
+    traffic = {"requests": 0, "bytes": 0}
+
+    def count_response(response):
+        traffic["requests"] += 1
+        try:
+            traffic["bytes"] += int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            pass
+
+    listening = telemetry.active
+    if listening:
+        page.on("response", count_response)
+    try:
+        # half_open이면 이 호출이 시험 요청이므로 재시도 동안에도 한 번만 확인하고,
+        # 재시도 전에는 다른 요청이 브레이커를 열었는지만 본다
+        breaker.before_request(url)
+        for attempt in range(attempts):
+            if attempt and breaker.is_open():
+                raise CircuitOpenError(breaker.site_name, url)
+            started = loaded_ms = response = None
+            try:
+                with get_scheduler().for_site(config).slot() as waited:
+                    telemetry.record("throttle", waited * 1000, url)
+                    started = time.perf_counter()
+                    response = page.goto(url, wait_until=wait_until, timeout=timeout)
+                    loaded_ms = (time.perf_counter() - started) * 1000
+                # commit 시점에는 본문이 없으므로 상태 코드만 검사
+                check_response(page, response, config if wait_until != "commit" else {}, url)
+            except Exception as e:
+                kind = classify_exception(e)
+                retrying = kind in TRANSIENT_KINDS and attempt < attempts - 1
+                if started is not None and not retrying:
+                    if loaded_ms is None:
+                        loaded_ms = (time.perf_counter() - started) * 1000
+                    _record_navigation(telemetry, url, loaded_ms, response, traffic, attempt, kind)
+                if retrying:
+                    delay = backoff_delay(attempt, settings)
+                    logger.warning(
+                        f"[{config.get('site_name')}] {kind} ({attempt + 1}/{attempts}), "
+                        f"{delay:.1f}초 후 재시도: {url}"
+                    )
+                    settle(delay, url)
+                    continue
+                _report_failure(config, kind, url, e)
+                if isinstance(e, CrawlError):
+                    raise
+                raise CrawlError(kind, str(e), url) from e
+
+            _record_navigation(telemetry, url, loaded_ms, response, traffic, attempt)
+            if wait_until != "commit":
+                # commit 이동은 로드 후 check_loaded가 통과해야 성공으로 기록
+                breaker.record_success()
+            return response
+    finally:
+        if listening:
+            page.remove_listener("response", count_response)
+
+
+def check_loaded(page, config: Dict, url: str):
+    """
+    wait_until="commit"으로 이동한 페이지의 로드 후 검사 (봇 차단/로그인 화면)
+
+    commit 시점의 goto는 상태 코드만 보므로, 로드가 끝난 뒤 본문과 최종 URL을 확인해 사이트 서킷 브레이커에
+    성공 또는 실패로 기록한다. 차단 화면이면 저장된 세션 상태도 폐기한다.
+
+    Raises:
+        CrawlError: 봇 차단/로그인 화면
+    """
+    try:
+        check_response(page, None, config, url)
+    except Exception as e:
+        kind = classify_exception(e)
+        _report_failure(config, kind, url, e)
+        if isinstance(e, CrawlError):
+            raise
+        raise CrawlError(kind, str(e), url) from e
+    get_breaker(config).record_success()
+
+
+def _report_failure(config: Dict, kind: str, url: str, error: Exception):
+    """최종 실패를 사이트 서킷 브레이커에 기록 (봇 차단이면 세션 상태도 폐기)"""
+    get_breaker(config).record_failure(kind, f"{url}: {error}")
+    if kind == BOT_WALL:
+        # 저장된 쿠키가 차단 원인일 수 있으므로 다음 실행은 새 세션으로 시작
+        browser_state.invalidate(config, str(error))
+
+
+def _record_navigation(telemetry, url: str, loaded_ms: float, response, traffic: Dict, attempt: int,
+                       outcome: str = "ok"):
+    """마지막 goto 시도를 navigation 이벤트로 기록 (retries: 앞선 실패 시도 수)"""
+    telemetry.record(
+        "navigation", loaded_ms, url,
+        status_code=response.status if response else None,
+        bytes_=traffic["bytes"], requests=traffic["requests"], retries=attempt, outcome=outcome,
+    )
+
+
+def settle(seconds: float, url: str = None):
+    """
+    페이지 로드 후 고정 대기 (time.sleep 대신 사용하여 대기 시간을 계측에 기록)
+
+    Args:
+        seconds: 대기 시간 (초)
+        url: 대기 중인 페이지 URL (None이면 마지막으로 이동한 페이지)
+    """
+    time.sleep(seconds)
+    get_telemetry().record("sleep", seconds * 1000, url)
+
+
+@contextmanager
+def navigation_slot(config: Dict) -> Iterator[float]:
+    """
+    클릭/검색 제출 등 goto 이외의 페이지 이동에 사용하는 속도 제어 구간
+
+    구간이 예외 없이 끝나면 성공, 예외가 나면 그 종류대로 사이트 서킷 브레이커에 기록한다.
+
+    Args:
+        config: 사이트 config.json 내용
+
+    Yields:
+        슬롯 확보까지 대기한 시간 (초)
+
+    Raises:
+        CircuitOpenError: 사이트 서킷 브레이커가 열린 경우
+    """
+    breaker = get_breaker(config)
+    breaker.before_request()
+    try:
+        with get_scheduler().for_site(config).slot() as waited:
+            yield waited
+    except Exception as e:
+        _report_failure(config, classify_exception(e), "", e)
+        raise
+    breaker.record_success()
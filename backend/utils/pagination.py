@@ -0,0 +1,238 @@
+"""
+검색 결과 목록 페이지네이션 유틸리티
+사이트 config.json의 "pagination" 설정에 따라 여러 결과 페이지에서 공고 링크를 수집한다
+
+설정 예시:
+    "pagination": {"type": "url_param", "param": "page", "start": 1, "step": 1, "max_pages": 5, "concurrency": 3}
+    "pagination": {"type": "next_button", "selector": "a.next", "max_pages": 5}
+    "pagination": {"type": "infinite_scroll", "item_selector": "li.job", "max_pages": 5}
+"""
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from utils.logger import setup_logger
+from utils.navigation import check_loaded, goto, navigation_slot, settle
+from utils.resilience import CrawlError
+
+logger = setup_logger("Pagination")
+
+DEFAULT_PAGINATION = {"type": "none"}
+
+
+def page_url(url: str, param: str, value) -> str:
+    """
+    URL의 페이지 파라미터를 지정한 값으로 설정
+
+    Args:
+        url: 첫 페이지 URL
+        param: 페이지 파라미터명 (예: 'page')
+        value: 페이지 값
+
+    Returns:
+        페이지 파라미터가 반영된 URL
+    """
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != param]
+    query.append((param, str(value)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+class _LinkCollector:
+    """페이지별 추출 결과 누적 (중복 제거, 증분 필터, 최대 개수 관리)"""
+
+    def __init__(self, key: Callable, filter_new: Optional[Callable], max_links: Optional[int]):
+        self.key = key
+        self.filter_new = filter_new
+        self.max_links = max_links
+        self.seen = set()
+        self.items = []
+
+    @property
+    def full(self) -> bool:
+        return self.max_links is not None and len(self.items) >= self.max_links
+
+    def add(self, page_items: List) -> int:
+        """
+        한 페이지의 추출 결과 추가
+
+        Returns:
+            처음 본 항목 수 (0이면 더 이상 새 결과가 없는 것으로 판단)
+        """
+        fresh = []
+        for item in page_items:
+            key = self.key(item)
+            if key and key not in self.seen:
+                self.seen.add(key)
+                fresh.append(item)
+
+        accepted = fresh
+        if self.filter_new and fresh:
+            keep = set(self.filter_new([self.key(item) for item in fresh]))
+            accepted = [item for item in fresh if self.key(item) in keep]
+
+        self.items.extend(accepted)
+        return len(fresh)
+
+
+def paginate_links(
+    page,
+    config: Dict,
+    extract: Callable,
+    first_url: Optional[str] = None,
+    max_links: Optional[int] = None,
+    filter_new: Optional[Callable[[List[str]], List[str]]] = None,
+    key: Callable = lambda item: item,
+) -> List:
+    """
+    첫 결과 페이지(이미 로드된 상태)부터 설정된 방식으로 페이지를 넘기며 공고 링크 수집
+
+    - url_param: 2페이지부터 별도 탭에서 동시에 로드 (concurrency개씩)
+    - next_button: '다음' 버튼 클릭 후 순차 수집
+    - infinite_scroll: 스크롤 후 항목 수가 늘어날 때까지 대기
+    새 URL이 없는 페이지가 나오거나 max_links에 도달하면 중단한다.
+
+    Args:
+        page: 첫 결과 페이지가 로드된 Playwright Page
+        config: 사이트 설정 (pagination, max_pages, wait_time 사용)
+        extract: Page를 받아 해당 페이지의 공고 링크(또는 항목) 리스트를 반환하는 함수
+        first_url: 첫 페이지 URL (url_param 방식에서 사용, None이면 page.url)
+        max_links: 최대 수집 개수 (증분 필터 적용 후 기준)
+        filter_new: 증분 크롤링 필터 (SeenUrlFilter.filter_new)
+        key: 항목에서 URL을 꺼내는 함수 (항목이 dict인 경우)
+
+    Returns:
+        수집된 공고 링크(또는 항목) 리스트 (발견 순서 유지)
+    """
+    settings = {**DEFAULT_PAGINATION, **config.get("pagination", {})}
+    max_pages = settings.get("max_pages", config.get("max_pages", 1))
+    wait_time = config.get("wait_time", 2)
+    collector = _LinkCollector(key, filter_new, max_links)
+
+    added = collector.add(extract(page))
+    logger.debug(f"결과 페이지 1: 신규 {added}개")
+
+    strategy = settings["type"]
+    if max_pages <= 1 or collector.full or added == 0 or strategy == "none":
+        return collector.items[:max_links] if max_links else collector.items
+
+    if strategy == "url_param":
+        _paginate_url_param(page, config, settings, wait_time, max_pages, extract, first_url or page.url, collector)
+    elif strategy == "next_button":
+        _paginate_next_button(page, config, settings, wait_time, max_pages, extract, collector)
+    elif strategy == "infinite_scroll":
+        _paginate_infinite_scroll(page, settings, wait_time, max_pages, extract, collector)
+    else:
+        logger.warning(f"지원하지 않는 페이지네이션 방식: {strategy}")
+
+    logger.info(f"페이지네이션({strategy}) 완료: {len(collector.items)}개 링크 수집")
+    return collector.items[:max_links] if max_links else collector.items
+
+
+def _paginate_url_param(page, config, settings, wait_time, max_pages, extract, first_url, collector):
+    """URL 파라미터 방식: 결과 페이지를 여러 탭에서 동시에 로드"""
+    param = settings.get("param", "page")
+    start = settings.get("start", 1)
+    step = settings.get("step", 1)
+    concurrency = max(1, settings.get("concurrency", 3))
+    urls = [page_url(first_url, param, start + step * n) for n in range(1, max_pages)]
+
+    # 탭은 첫 페이지와 같은 컨텍스트에서 열어 쿠키/user agent를 공유 (크롤러는 browser.new_context()로 페이지 생성)
+    tabs = []
+    try:
+        for _ in range(min(concurrency, len(urls))):
+            try:
+                tabs.append(page.context.new_page())
+            except Exception as e:
+                logger.warning(f"결과 페이지 탭을 열 수 없습니다 (열린 탭 {len(tabs)}개로 진행): {e}")
+                break
+        if not tabs:
+            return
+        for batch_start in range(0, len(urls), len(tabs)):
+            batch = list(zip(tabs, urls[batch_start:batch_start + len(tabs)]))
+
+            # 모든 탭의 요청을 먼저 보내고 (commit), 로드 완료는 한꺼번에 대기
+            loaded = []
+            for tab, url in batch:
+                try:
+                    goto(tab, config, url, wait_until="commit", timeout=60000)
+                    loaded.append((tab, url))
+                except Exception as e:
+                    logger.warning(f"결과 페이지 요청 실패 ({url}): {e}")
+            blocked = set()
+            for tab, url in loaded:
+                try:
+                    tab.wait_for_load_state("domcontentloaded", timeout=60000)
+                except Exception as e:
+                    logger.warning(f"결과 페이지 로드 실패 ({url}): {e}")
+                # commit 시점에는 상태 코드만 검사했으므로 차단/로그인 화면은 여기서 확인
+                try:
+                    check_loaded(tab, config, url)
+                except CrawlError as e:
+                    logger.warning(f"결과 페이지 차단 ({url}): {e}")
+                    blocked.add(url)
+            settle(wait_time)
+
+            # 페이지 순서대로 반영하고, 새 URL이 없는 페이지에서 중단
+            # (차단된 페이지는 결과 끝이 아니므로 건너뛰고, 차단이 이어지면 브레이커가 열려 goto에서 중단된다)
+            for tab, url in loaded:
+                if url in blocked:
+                    continue
+                try:
+                    added = collector.add(extract(tab))
+                except Exception as e:
+                    logger.warning(f"결과 페이지 추출 실패 ({url}): {e}")
+                    added = 0
+                logger.debug(f"결과 페이지 {url}: 신규 {added}개")
+                if added == 0 or collector.full:
+                    return
+            if len(loaded) < len(batch):
+                return
+    finally:
+        for tab in tabs:
+            try:
+                tab.close()
+            except Exception:
+                pass
+
+
+def _paginate_next_button(page, config, settings, wait_time, max_pages, extract, collector):
+    """'다음' 버튼 방식: 버튼을 눌러 순차적으로 이동"""
+    selector = settings.get("selector", "a.next, button.next, a[rel='next']")
+    for page_no in range(2, max_pages + 1):
+        button = page.query_selector(selector)
+        if not button or not button.is_visible() or button.get_attribute("disabled") is not None:
+            logger.debug("다음 페이지 버튼이 없어 중단")
+            return
+        try:
+            with navigation_slot(config):
+                button.click()
+                page.wait_for_load_state("domcontentloaded", timeout=60000)
+            settle(wait_time)
+        except Exception as e:
+            logger.warning(f"다음 페이지 이동 실패 ({page_no}페이지): {e}")
+            return
+        added = collector.add(extract(page))
+        logger.debug(f"결과 페이지 {page_no}: 신규 {added}개")
+        if added == 0 or collector.full:
+            return
+
+
+def _paginate_infinite_scroll(page, settings, wait_time, max_pages, extract, collector):
+    """무한 스크롤 방식: 스크롤 후 항목 수가 늘어날 때까지 대기"""
+    item_selector = settings.get("item_selector", "a[href]")
+    for page_no in range(2, max_pages + 1):
+        count = page.evaluate("(sel) => document.querySelectorAll(sel).length", item_selector)
+        page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
+        try:
+            page.wait_for_function(
+                "([sel, n]) => document.querySelectorAll(sel).length > n",
+                arg=[item_selector, count],
+                timeout=wait_time * 1000
+            )
+        except Exception:
+            logger.debug("더 이상 로드되는 항목이 없어 중단")
+            return
+        added = collector.add(extract(page))
+        logger.debug(f"스크롤 {page_no}: 신규 {added}개")
+        if added == 0 or collector.full:
+            return
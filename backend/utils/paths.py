@@ -0,0 +1,8 @@
+"""
+데이터 디렉토리 경로
+실행 위치(cwd)와 관계없이 같은 곳에 저장하도록 파일을 쓰는 모듈은 모두 이 경로를 기준으로 한다
+"""
+from pathlib import Path
+
+# backend/data (cli.py, crawl_worker.py, distributed.py 어디서 실행해도 동일)
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
@@ -0,0 +1,213 @@
+"""
+스트리밍 수집 → 분석 → 저장 파이프라인
+크롤러가 공고를 파싱하는 즉시 분석/DB 저장까지 진행하여 고위험 공고가 수 초 안에 API에 노출되도록 한다
+
+    crawler ──submit──▶ [분석 대기 큐] ──▶ 분석 워커 N개 ──▶ [저장 대기 큐] ──▶ 일괄 저장 스레드 1개
+
+두 큐 모두 크기가 제한되어 있어, 분석이나 저장이 밀리면 submit이 대기(backpressure)하므로
+실행 규모와 관계없이 대기 중인 공고 수가 일정하게 유지된다.
+"""
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from analyzers.keyword_detector import KeywordDetector
+from analyzers.risk_scorer import RiskScorer
+from database.connection import get_db_connection
+from database.repositories import AnalysisRepository
+from utils.frontier import canonicalize_url
+from utils.logger import setup_logger
+
+logger = setup_logger("CrawlPipeline")
+
+_STOP = object()
+
+
+class CrawlPipeline:
+    """
+    공고 스트리밍 분석/저장 파이프라인
+
+    사용 예:
+        pipeline = CrawlPipeline()
+        pipeline.start()
+        pipeline.submit("사람인", job_info)   # 크롤러가 공고를 파싱할 때마다 호출
+        stats = pipeline.close()              # 남은 공고를 모두 저장하고 종료
+    """
+
+    def __init__(self, queue_size: int = 100, analysis_workers: int = 2, batch_size: int = 20,
+                 flush_interval: float = 2.0):
+        """
+        Args:
+            queue_size: 분석/저장 대기 큐 최대 크기 (가득 차면 submit 대기)
+            analysis_workers: 분석 워커 스레드 수
+            batch_size: 한 트랜잭션으로 저장할 최대 공고 수
+            flush_interval: 배치가 차지 않아도 저장하는 주기 (초)
+        """
+        self.analysis_workers = max(1, analysis_workers)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._analysis_queue = queue.Queue(maxsize=queue_size)
+        self._write_queue = queue.Queue(maxsize=queue_size)
+        self._threads: List[threading.Thread] = []
+        self._submitted_urls = set()
+        self._lock = threading.Lock()
+        self.stats = {
+            "submitted": 0, "duplicates": 0, "analyzed": 0, "written": 0, "failed": 0,
+            "high_risk": 0, "max_latency": 0.0, "total_latency": 0.0,
+        }
+
+    def start(self):
+        """분석 워커와 저장 스레드 시작"""
+        self._enable_wal()
+        for i in range(self.analysis_workers):
+            thread = threading.Thread(target=self._analysis_worker, name=f"pipeline-analysis-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self._writer = threading.Thread(target=self._writer_loop, name="pipeline-writer", daemon=True)
+        self._writer.start()
+        logger.info(
+            f"파이프라인 시작: 분석 워커 {self.analysis_workers}개, "
+            f"배치 {self.batch_size}개/{self.flush_interval}초"
+        )
+
+    @staticmethod
+    def _enable_wal():
+        """저장 중에도 API 조회가 막히지 않도록 WAL 모드 사용"""
+        conn = get_db_connection()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+
+    def submit(self, site_name: str, job_info: Dict):
+        """
+        파싱된 공고 투입 (큐가 가득 차면 빌 때까지 대기)
+
+        URL은 정규화해서 저장하며(추적/검색 파라미터 제거), 같은 공고는 실행당 한 번만 처리한다.
+
+        Args:
+            site_name: 출처 사이트명 (jobs.source_site 값)
+            job_info: 파싱된 공고 정보 (url 필수)
+        """
+        url = canonicalize_url(job_info["url"]) if job_info.get("url") else None
+        with self._lock:
+            if not url or url in self._submitted_urls:
+                self.stats["duplicates"] += 1
+                return
+            self._submitted_urls.add(url)
+            self.stats["submitted"] += 1
+        self._analysis_queue.put((time.monotonic(), site_name, {**job_info, "url": url}))
+
+    def _analysis_worker(self):
+        detector = KeywordDetector()
+        scorer = RiskScorer()
+        while True:
+            item = self._analysis_queue.get()
+            if item is _STOP:
+                break
+            submitted_at, site_name, job_info = item
+            try:
+                detection = detector.analyze(job_info)
+                risk = scorer.calculate_risk_score(detection)
+            except Exception as e:
+                logger.error(f"공고 분석 실패 ({job_info.get('url')}): {e}")
+                self._count("failed")
+                continue
+            # DB에 저장하지 않는 필드는 큐에 올리지 않음
+            detection = {key: value for key, value in detection.items() if key != "job_info"}
+            risk.pop("risk_level_enum", None)
+            self._count("analyzed")
+            self._write_queue.put((submitted_at, site_name, job_info, detection, risk))
+
+    def _writer_loop(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        stopping = False
+        while not stopping:
+            try:
+                item = self._write_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            except queue.Empty:
+                pass
+            if batch and (stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch: List[tuple]):
+        """배치를 한 트랜잭션으로 저장 (실패 시 공고별로 다시 시도하여 문제 공고만 제외)"""
+        repo = AnalysisRepository()
+        crawled_at = datetime.now()
+        rows = [
+            ({**job_info, "source_site": site_name, "search_keyword": job_info.get("search_keyword", ""),
+              "crawled_at": crawled_at}, detection, risk)
+            for _, site_name, job_info, detection, risk in batch
+        ]
+        try:
+            repo.save_jobs_with_analysis(rows)
+            saved = batch
+        except Exception as e:
+            logger.warning(f"일괄 저장 실패, 공고별로 재시도: {e}")
+            saved = []
+            for item, row in zip(batch, rows):
+                try:
+                    repo.save_jobs_with_analysis([row])
+                    saved.append(item)
+                except Exception as item_error:
+                    logger.error(f"공고 저장 실패 ({row[0].get('url')}): {item_error}")
+                    self._count("failed")
+
+        now = time.monotonic()
+        with self._lock:
+            for submitted_at, _, job_info, _, risk in saved:
+                latency = now - submitted_at
+                self.stats["written"] += 1
+                self.stats["total_latency"] += latency
+                self.stats["max_latency"] = max(self.stats["max_latency"], latency)
+                if risk["risk_level"] == "고위험":
+                    self.stats["high_risk"] += 1
+                    logger.warning(
+                        f"고위험 공고 저장 ({risk['final_score']}점, {latency:.1f}초): "
+                        f"{job_info.get('title', '')[:50]} - {job_info.get('url')}"
+                    )
+        logger.debug(f"배치 저장 완료: {len(saved)}/{len(batch)}개")
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def close(self) -> Dict:
+        """
+        남은 공고를 모두 분석/저장한 뒤 종료
+
+        Returns:
+            처리 통계 (투입/분석/저장/실패/고위험 수, 투입→저장 지연 시간)
+        """
+        for _ in self._threads:
+            self._analysis_queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._write_queue.put(_STOP)
+        self._writer.join()
+        return self.report()
+
+    def report(self) -> Dict:
+        with self._lock:
+            written = self.stats["written"]
+            return {
+                **{key: value for key, value in self.stats.items() if key != "total_latency"},
+                "max_latency": round(self.stats["max_latency"], 2),
+                "avg_latency": round(self.stats["total_latency"] / written, 2) if written else 0.0,
+            }
+
@@ -0,0 +1,293 @@
+"""
+크롤링 장애 대응 유틸리티
+오류 분류, 지수 백오프 재시도, 사이트별 서킷 브레이커
+
+사이트 config.json 설정 예시:
+    "retry": {"max_retries": 3, "backoff_base": 1, "backoff_max": 30}  # 첫 시도 + 재시도 3회
+    "circuit_breaker": {"failure_threshold": 5, "cooldown": 300}
+    "bot_wall_markers": ["Oops", "Something went wrong"]
+"""
+import json
+import random
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger("Resilience")
+
+# 오류 종류
+TIMEOUT = "timeout"
+NETWORK = "network"
+HTTP_4XX = "http_4xx"
+HTTP_GONE = "http_gone"  # 404/410: 삭제/만료된 공고 (사이트 장애 아님)
+HTTP_5XX = "http_5xx"
+BOT_WALL = "bot_wall"
+EMPTY = "empty"
+OTHER = "other"
+
+# 재시도할 가치가 있는 일시적 오류
+TRANSIENT_KINDS = {TIMEOUT, NETWORK, HTTP_5XX}
+
+DEFAULT_RETRY = {"max_retries": 3, "backoff_base": 1, "backoff_max": 30}
+DEFAULT_BREAKER = {"failure_threshold": 5, "cooldown": 300}
+
+
+class CrawlError(Exception):
+    """분류된 크롤링 오류"""
+
+    def __init__(self, kind: str, message: str, url: str = ""):
+        super().__init__(f"[{kind}] {message}")
+        self.kind = kind
+        self.url = url
+
+    @property
+    def transient(self) -> bool:
+        return self.kind in TRANSIENT_KINDS
+
+
+class CircuitOpenError(CrawlError):
+    """서킷 브레이커가 열려 요청을 보내지 않음"""
+
+    def __init__(self, site_name: str, url: str = ""):
+        super().__init__("circuit_open", f"{site_name} 서킷 브레이커 열림 - 요청 차단", url)
+
+
+def classify_exception(exc: Exception) -> str:
+    """
+    예외를 오류 종류로 분류
+
+    Args:
+        exc: 발생한 예외
+
+    Returns:
+        오류 종류 (timeout, network, other 등)
+    """
+    if isinstance(exc, CrawlError):
+        return exc.kind
+    if "Timeout" in type(exc).__name__ or "Timeout" in str(exc):
+        return TIMEOUT
+    if "net::ERR" in str(exc) or "NS_ERROR" in str(exc):
+        return NETWORK
+    return OTHER
+
+
+def classify_status(status: int) -> Optional[str]:
+    """HTTP 상태 코드 분류 (정상이면 None, 429는 일시적 오류, 404/410은 삭제된 페이지로 취급)"""
+    if status == 429 or status >= 500:
+        return HTTP_5XX
+    if status in (404, 410):
+        return HTTP_GONE
+    if status >= 400:
+        return HTTP_4XX
+    return None
+
+
+def check_response(page, response, config: Dict, url: str):
+    """
+    페이지 이동 결과 검사 (HTTP 상태, 봇 차단 화면)
+
+    Args:
+        page: Playwright Page
+        response: page.goto 결과 (없을 수 있음)
+        config: 사이트 설정 (bot_wall_markers: 본문 문구, login_wall_markers: 이동한 URL 일부)
+        url: 요청 URL
+
+    Raises:
+        CrawlError: 오류 응답 또는 봇 차단 화면
+    """
+    if response is not None:
+        kind = classify_status(response.status)
+        if kind:
+            raise CrawlError(kind, f"HTTP {response.status}", url)
+
+    login_markers = config.get("login_wall_markers")
+    if login_markers and url not in page.url:
+        for marker in login_markers:
+            if marker in page.url:
+                raise CrawlError(BOT_WALL, f"로그인 화면으로 이동 ({page.url})", url)
+
+    markers = config.get("bot_wall_markers")
+    if markers:
+        text = page.evaluate("() => document.body ? document.body.innerText.slice(0, 3000) : ''") or ""
+        for marker in markers:
+            if marker in text:
+                raise CrawlError(BOT_WALL, f"봇 차단 화면 감지 ('{marker}')", url)
+
+
+def backoff_delay(attempt: int, settings: Dict) -> float:
+    """지터가 적용된 지수 백오프 대기 시간 (full jitter)"""
+    cap = min(settings["backoff_max"], settings["backoff_base"] * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+class CircuitBreaker:
+    """
+    사이트별 서킷 브레이커
+
+    - closed: 정상 요청
+    - open: 연속 실패가 failure_threshold에 도달하면 cooldown 동안 요청 차단
+    - half_open: cooldown 후 시험 요청 하나만 허용, 성공하면 closed / 실패하면 다시 open
+      (시험 요청이 끝나기 전의 다른 요청은 CircuitOpenError)
+    """
+
+    def __init__(self, site_name: str, failure_threshold: int = 5, cooldown: float = 300):
+        self.site_name = site_name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.consecutive_failures = 0  # 연속 요청 실패 (페이지 이동 성공 시 초기화)
+        self.consecutive_empty = 0     # 연속 빈 추출 (추출 성공 시 초기화)
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False  # half_open 시험 요청 진행 중
+        self.counts = {"success": 0, "failure": 0, "rejected": 0, "opened": 0}
+        self.failure_kinds: Dict[str, int] = {}
+        self.last_error = ""
+        self._lock = threading.Lock()
+
+    def before_request(self, url: str = ""):
+        """
+        요청 전 호출 (열린 상태면 CircuitOpenError)
+
+        Raises:
+            CircuitOpenError: 브레이커가 열려 있고 cooldown이 지나지 않았거나, half_open 시험 요청이 진행 중인 경우
+        """
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at >= self.cooldown:
+                    self.state = "half_open"
+                    logger.info(f"[{self.site_name}] 서킷 브레이커 half-open - 시험 요청 허용")
+                else:
+                    self.counts["rejected"] += 1
+                    raise CircuitOpenError(self.site_name, url)
+            if self.state == "half_open":
+                if self._trial_in_flight:
+                    self.counts["rejected"] += 1
+                    raise CircuitOpenError(self.site_name, url)
+                self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.counts["success"] += 1
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+            if self.state != "closed":
+                logger.info(f"[{self.site_name}] 서킷 브레이커 closed - 요청 재개")
+            self.state = "closed"
+
+    def record_extracted(self):
+        """공고 추출 성공 (연속 빈 추출 초기화)"""
+        with self._lock:
+            self.consecutive_empty = 0
+
+    def record_failure(self, kind: str, message: str = ""):
+        with self._lock:
+            self.counts["failure"] += 1
+            self.failure_kinds[kind] = self.failure_kinds.get(kind, 0) + 1
+            self.last_error = message
+            self._trial_in_flight = False
+            if kind == HTTP_GONE:
+                # 삭제/만료된 공고는 사이트가 정상 응답한 것이므로 연속 실패에 포함하지 않음
+                self.consecutive_failures = 0
+                if self.state == "half_open":
+                    self.state = "closed"
+                return
+            if kind == EMPTY:
+                self.consecutive_empty += 1
+            else:
+                self.consecutive_failures += 1
+            streak = max(self.consecutive_failures, self.consecutive_empty)
+            if self.state == "half_open" or (self.state == "closed" and streak >= self.failure_threshold):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self.counts["opened"] += 1
+                logger.error(
+                    f"[{self.site_name}] 서킷 브레이커 open - 연속 실패 {streak}회 "
+                    f"({kind}), {self.cooldown}초 동안 요청 중단"
+                )
+
+    def is_open(self) -> bool:
+        """요청이 차단되는 상태인지 (cooldown 경과 시 half-open 허용)"""
+        with self._lock:
+            return self.state == "open" and time.monotonic() - self.opened_at < self.cooldown
+
+    def snapshot(self) -> Dict:
+        """현재 상태 (내보내기용)"""
+        with self._lock:
+            return {
+                "site": self.site_name,
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "consecutive_empty": self.consecutive_empty,
+                "failure_kinds": dict(self.failure_kinds),
+                "last_error": self.last_error,
+                **self.counts,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(config: Dict) -> CircuitBreaker:
+    """사이트 설정에 해당하는 서킷 브레이커 (프로세스 내 공유)"""
+    site_name = config.get("site_name", "default")
+    with _breakers_lock:
+        if site_name not in _breakers:
+            settings = {**DEFAULT_BREAKER, **config.get("circuit_breaker", {})}
+            _breakers[site_name] = CircuitBreaker(site_name, settings["failure_threshold"], settings["cooldown"])
+        return _breakers[site_name]
+
+
+def retry_settings(config: Dict) -> Dict:
+    """사이트 재시도 설정 (기존 max_retries 키도 지원)"""
+    settings = dict(DEFAULT_RETRY)
+    if "max_retries" in config:
+        settings["max_retries"] = config["max_retries"]
+    settings.update(config.get("retry", {}))
+    return settings
+
+
+def record_empty(config: Dict, url: str):
+    """
+    추출 결과가 비어 있는 경우 기록 (재시도하지 않고 브레이커 실패로만 집계)
+
+    Args:
+        config: 사이트 설정
+        url: 공고 URL
+    """
+    get_breaker(config).record_failure(EMPTY, f"추출 결과 없음: {url}")
+
+
+def record_extracted(config: Dict):
+    """공고 추출 성공 기록"""
+    get_breaker(config).record_extracted()
+
+
+def export_breaker_states(path: Path, snapshots: Optional[Dict[str, Dict]] = None) -> Path:
+    """
+    이번 실행의 사이트별 서킷 브레이커 상태를 JSON으로 저장
+
+    Args:
+        path: 저장할 파일 경로
+        snapshots: 사이트별 상태 (워커 프로세스에서 수집한 경우, None이면 현재 프로세스의 브레이커)
+
+    Returns:
+        저장된 파일 경로
+    """
+    if snapshots is None:
+        with _breakers_lock:
+            breakers = list(_breakers.values())
+        snapshots = {breaker.site_name: breaker.snapshot() for breaker in breakers}
+    data = {
+        "exported_at": datetime.now().isoformat(timespec="seconds"),
+        "sites": snapshots,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
@@ -0,0 +1,151 @@
+"""
+사이트별 요청 속도 제어 (politeness scheduler)
+모든 페이지 이동은 사이트별 토큰 버킷과 동시 이동 제한을 거친다
+
+사이트 config.json 설정 예시:
+    "politeness": {"requests_per_second": 0.5, "burst": 2, "max_concurrent": 2}
+politeness 설정이 없으면 request_delay(초)로부터 requests_per_second를 계산한다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger("PolitenessScheduler")
+
+DEFAULT_POLITENESS = {"requests_per_second": 0.5, "burst": 1, "max_concurrent": 1}
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (rate개/초로 충전, 최대 burst개 보관)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 충전 토큰 수
+            burst: 최대 보관 토큰 수 (연속 요청 허용 개수)
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개 획득 (없으면 충전될 때까지 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class SiteScheduler:
+    """사이트 하나의 요청 속도/동시성 제어와 대기 시간 통계"""
+
+    def __init__(self, site_name: str, requests_per_second: float, burst: int, max_concurrent: int):
+        self.site_name = site_name
+        self.requests_per_second = requests_per_second
+        self.max_concurrent = max(1, max_concurrent)
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        # 여러 프로세스/호스트가 공유하는 전역 속도 제한 (예: 분산 작업 큐의 reserve_slot, 대기할 초를 반환)
+        self.global_limiter: Optional[Callable[[], float]] = None
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "total_wait": 0.0, "max_wait": 0.0}
+
+    @contextmanager
+    def slot(self) -> Iterator[float]:
+        """
+        페이지 이동 슬롯 확보 (동시 이동 수 제한 + 토큰 획득 + 전역 속도 제한)
+
+        Yields:
+            슬롯 확보까지 대기한 시간 (초)
+        """
+        start = time.monotonic()
+        self._slots.acquire()
+        try:
+            self.bucket.acquire()
+            if self.global_limiter:
+                delay = self.global_limiter()
+                if delay > 0:
+                    time.sleep(delay)
+            waited = time.monotonic() - start
+            with self._stats_lock:
+                self.stats["requests"] += 1
+                self.stats["total_wait"] += waited
+                self.stats["max_wait"] = max(self.stats["max_wait"], waited)
+            yield waited
+        finally:
+            self._slots.release()
+
+    def report(self) -> Dict:
+        """대기 시간 통계 (평균/최대 대기 포함)"""
+        with self._stats_lock:
+            requests = self.stats["requests"]
+            return {
+                "site": self.site_name,
+                "requests": requests,
+                "total_wait": round(self.stats["total_wait"], 2),
+                "avg_wait": round(self.stats["total_wait"] / requests, 2) if requests else 0.0,
+                "max_wait": round(self.stats["max_wait"], 2),
+            }
+
+
+class PolitenessScheduler:
+    """사이트별 SiteScheduler 레지스트리 (프로세스 내 공유)"""
+
+    def __init__(self):
+        self._sites: Dict[str, SiteScheduler] = {}
+        self._lock = threading.Lock()
+
+    def for_site(self, config: Dict) -> SiteScheduler:
+        """
+        사이트 설정에 해당하는 스케줄러 반환 (최초 호출 시 생성)
+
+        Args:
+            config: 사이트 config.json 내용 (site_name, politeness/request_delay 사용)
+        """
+        site_name = config.get("site_name", "default")
+        with self._lock:
+            if site_name not in self._sites:
+                settings = dict(DEFAULT_POLITENESS)
+                if "request_delay" in config:
+                    settings["requests_per_second"] = 1 / max(config["request_delay"], 0.01)
+                settings.update(config.get("politeness", {}))
+                self._sites[site_name] = SiteScheduler(
+                    site_name,
+                    requests_per_second=settings["requests_per_second"],
+                    burst=settings["burst"],
+                    max_concurrent=settings["max_concurrent"],
+                )
+                logger.debug(f"[{site_name}] 속도 제어 설정: {settings}")
+            return self._sites[site_name]
+
+    def report(self) -> Dict[str, Dict]:
+        """사이트별 대기 시간 통계"""
+        with self._lock:
+            sites = list(self._sites.values())
+        return {site.site_name: site.report() for site in sites}
+
+
+_scheduler = PolitenessScheduler()
+
+
+def get_scheduler() -> PolitenessScheduler:
+    """프로세스 공용 스케줄러"""
+    return _scheduler
@@ -0,0 +1,130 @@
+"""
+증분 크롤링 유틸리티
+이미 수집된 공고 URL을 상세 페이지 접속 전에 걸러낸다
+"""
+import hashlib
+import math
+import sys
+from pathlib import Path
+from typing import Iterable, List
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database.repositories import JobRepository
+from utils.frontier import canonicalize_url
+from utils.logger import setup_logger
+
+logger = setup_logger("SeenUrlFilter")
+
+
+class BloomFilter:
+    """메모리 기반 Bloom filter (false positive만 존재, false negative 없음)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Args:
+            capacity: 예상 원소 개수
+            error_rate: 허용 false positive 비율
+        """
+        capacity = max(capacity, 1000)
+        self.size = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.hash_count = max(1, int(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class SeenUrlFilter:
+    """
+    이미 수집된 공고 URL 필터
+
+    - 리스트 페이지 단위로 jobs.url을 한 번에 조회 (배치 조회)
+    - 저장된 URL은 정규화된 URL이므로 정규화해서 조회 (정규화 이전에 저장된 공고를 위해 원본 URL도 함께 조회)
+    - 시작 시 사이트별 URL을 Bloom filter에 적재하여 신규 URL은 DB 조회 생략
+    - 마지막 수집 후 revisit_days가 지난 공고는 재방문 대상으로 통과
+    """
+
+    def __init__(self, site_name: str, revisit_days: int = 7, use_bloom: bool = True):
+        """
+        Args:
+            site_name: 출처 사이트명 (jobs.source_site 값, 예: '인크루트')
+            revisit_days: 재방문 주기 (일). 0 이하이면 재방문하지 않음
+            use_bloom: Bloom filter 사용 여부
+        """
+        self.site_name = site_name
+        self.revisit_days = revisit_days
+        self.job_repo = JobRepository()
+        self.bloom = self._load_bloom() if use_bloom else None
+        self.stats = {"checked": 0, "new": 0, "revisit": 0, "skipped": 0}
+
+    def _load_bloom(self) -> BloomFilter:
+        """사이트별 기존 URL을 Bloom filter에 적재"""
+        urls = self.job_repo.get_urls_by_site(self.site_name)
+        bloom = BloomFilter(capacity=len(urls) * 2)
+        for url in urls:
+            bloom.add(url)
+        logger.info(f"[{self.site_name}] Bloom filter 적재 완료: {len(urls)}개 URL")
+        return bloom
+
+    def filter_new(self, urls: Iterable[str]) -> List[str]:
+        """
+        신규 또는 재방문 대상 URL만 반환 (입력 순서 유지)
+
+        Args:
+            urls: 리스트 페이지에서 수집한 공고 URL 목록
+
+        Returns:
+            상세 페이지를 방문해야 하는 URL 목록
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return []
+
+        # URL -> 조회 키 (정규화된 URL, 원본 URL)
+        lookup_keys = {url: list(dict.fromkeys((canonicalize_url(url), url))) for url in urls}
+
+        # Bloom filter에 없는 URL은 확실히 신규이므로 DB 조회 대상에서 제외
+        candidates = [
+            key for keys in lookup_keys.values()
+            if self.bloom is None or any(key in self.bloom for key in keys)
+            for key in keys
+        ]
+
+        # 저장된 url -> 재방문 주기 내 수집 여부 (리스트 페이지당 1회 조회)
+        stored = self.job_repo.get_known_urls(candidates, self.revisit_days) if candidates else {}
+
+        result = []
+        counts = {"new": 0, "revisit": 0, "skipped": 0}
+        for url in urls:
+            states = [stored[key] for key in lookup_keys[url] if key in stored]
+            if not states:
+                counts["new"] += 1
+                result.append(url)
+            elif not any(states):
+                counts["revisit"] += 1
+                result.append(url)
+            else:
+                counts["skipped"] += 1
+
+        for key, value in counts.items():
+            self.stats[key] += value
+        self.stats["checked"] += len(urls)
+
+        logger.info(
+            f"[{self.site_name}] 증분 필터: {len(urls)}개 중 신규 {counts['new']}개, "
+            f"재방문 {counts['revisit']}개, 건너뜀 {counts['skipped']}개"
+        )
+        return result
@@ -0,0 +1,203 @@
+"""
+크롤링 구간별 소요 시간 계측
+페이지 이동(goto), 속도 제한 대기, 준비 대기(wait_for_*), 추출(evaluate 등), 고정 대기(sleep)를
+실행/사이트별로 crawl_events 테이블에 기록하여 대기 시간과 동시성 조정의 근거로 사용한다
+
+    telemetry = get_telemetry()
+    telemetry.start_run(run_id, "saramin")   # 시작 전에는 모든 기록이 무시됨
+    ...                                      # goto / TimedPage / settle 이 자동 기록
+    timings = telemetry.finish_run("ok", 120) # 남은 이벤트 저장 후 구간별 p50/p95 반환
+
+navigation 이벤트는 이동마다 한 행으로 저장하고, 나머지 구간은 같은 페이지(URL)의 호출을
+합산해 한 행으로 저장하므로 행 수는 이동 횟수에 비례한다.
+"""
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database.repositories import TelemetryRepository
+from utils.logger import setup_logger
+
+logger = setup_logger("Telemetry")
+
+# 이 크기만큼 이벤트가 쌓이면 DB에 저장
+FLUSH_SIZE = 200
+
+
+class CrawlTelemetry:
+    """프로세스 단위 계측 버퍼 (실행 중인 사이트 하나에 대해 기록)"""
+
+    def __init__(self, flush_size: int = FLUSH_SIZE):
+        self.flush_size = flush_size
+        self.run_id: Optional[str] = None
+        self.site: Optional[str] = None
+        self._events: List[Dict] = []
+        self._merged: Dict[tuple, Dict] = {}
+        self._last_url = ""
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.run_id is not None
+
+    def start_run(self, run_id: str, site: str):
+        """
+        사이트 실행 계측 시작
+
+        Args:
+            run_id: 실행 ID (체크포인트 실행 ID와 동일)
+            site: 사이트명 (cli 사이트 키)
+        """
+        self.run_id = run_id
+        self.site = site
+        self._last_url = ""
+        try:
+            TelemetryRepository().start_run(run_id, site)
+        except Exception as e:
+            logger.warning(f"계측 실행 기록 실패: {e}")
+
+    def record(self, stage: str, duration_ms: float, url: Optional[str] = None, status_code: int = None,
+               bytes_: int = 0, requests: int = 0, retries: int = 0, outcome: str = "ok"):
+        """
+        구간 소요 시간 기록 (start_run 전에는 무시)
+
+        Args:
+            stage: navigation, throttle, ready_wait, extract, sleep
+            duration_ms: 소요 시간 (ms)
+            url: 대상 페이지 URL (None이면 마지막으로 이동한 페이지)
+            status_code: HTTP 상태 코드 (navigation)
+            bytes_: 응답 크기 합계 (navigation, content-length 기준)
+            requests: 응답 수 (navigation)
+            retries: 재시도 횟수 (navigation)
+            outcome: ok 또는 오류 종류
+        """
+        if not self.active:
+            return
+        with self._lock:
+            if stage == "navigation":
+                self._last_url = url or self._last_url
+                self._events.append(self._event(stage, duration_ms, url, status_code, bytes_, requests,
+                                                retries, outcome))
+            else:
+                url = url or self._last_url
+                merged = self._merged.get((url, stage))
+                if merged is None:
+                    self._merged[(url, stage)] = self._event(stage, duration_ms, url, outcome=outcome)
+                else:
+                    merged["duration_ms"] += duration_ms
+                    merged["calls"] += 1
+                    if outcome != "ok":
+                        merged["outcome"] = outcome
+            pending = len(self._events) + len(self._merged)
+        if pending >= self.flush_size:
+            self.flush()
+
+    def _event(self, stage: str, duration_ms: float, url: Optional[str], status_code: int = None,
+               bytes_: int = 0, requests: int = 0, retries: int = 0, outcome: str = "ok") -> Dict:
+        return {
+            "run_id": self.run_id, "site": self.site, "stage": stage, "url": url,
+            "duration_ms": duration_ms, "calls": 1, "status_code": status_code, "bytes": bytes_,
+            "requests": requests, "retries": retries, "outcome": outcome, "created_at": datetime.now(),
+        }
+
+    def flush(self):
+        """버퍼에 쌓인 이벤트 저장 (실패해도 크롤링은 계속)"""
+        with self._lock:
+            events = self._events + list(self._merged.values())
+            self._events = []
+            self._merged = {}
+        if not events:
+            return
+        try:
+            TelemetryRepository().insert_events(events)
+        except Exception as e:
+            logger.warning(f"계측 이벤트 {len(events)}개 저장 실패: {e}")
+
+    def finish_run(self, status: str, jobs: int) -> List[Dict]:
+        """
+        사이트 실행 계측 종료
+
+        Args:
+            status: 실행 결과 (ok, failed)
+            jobs: 수집 공고 수
+
+        Returns:
+            이번 실행의 구간별 소요 시간 분포 (TelemetryRepository.get_stage_timings)
+        """
+        if not self.active:
+            return []
+        self.flush()
+        run_id, site = self.run_id, self.site
+        self.run_id = self.site = None
+        try:
+            repo = TelemetryRepository()
+            repo.finish_run(run_id, site, status, jobs)
+            return repo.get_stage_timings(run_id=run_id, site=site)
+        except Exception as e:
+            logger.warning(f"계측 실행 종료 기록 실패: {e}")
+            return []
+
+
+_telemetry = CrawlTelemetry()
+
+
+def get_telemetry() -> CrawlTelemetry:
+    """프로세스 공용 계측 버퍼 반환"""
+    return _telemetry
+
+
+class TimedPage:
+    """
+    Playwright Page 래퍼: 준비 대기/추출 호출 시간을 계측하고 나머지는 그대로 위임
+
+    사용 예:
+        self.page = TimedPage(self.browser.new_page())
+    """
+
+    STAGES = {
+        "wait_for_load_state": "ready_wait",
+        "wait_for_selector": "ready_wait",
+        "wait_for_function": "ready_wait",
+        "wait_for_url": "ready_wait",
+        "wait_for_timeout": "sleep",
+        "evaluate": "extract",
+        "content": "extract",
+        "inner_text": "extract",
+        "text_content": "extract",
+        "query_selector": "extract",
+        "query_selector_all": "extract",
+        "eval_on_selector": "extract",
+        "eval_on_selector_all": "extract",
+    }
+
+    def __init__(self, page):
+        object.__setattr__(self, "_page", page)
+
+    def __getattr__(self, name):
+        attr = getattr(self._page, name)
+        stage = self.STAGES.get(name)
+        if stage is None or not _telemetry.active:
+            return attr
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "ok"
+            try:
+                return attr(*args, **kwargs)
+            except Exception as e:
+                outcome = type(e).__name__
+                raise
+            finally:
+                _telemetry.record(stage, (time.perf_counter() - started) * 1000, self._page.url, outcome=outcome)
+
+        return timed
+
+    def __setattr__(self, name, value):
+        setattr(self._page, name, value)
+
@@ -0,0 +1,440 @@
+"""
+분산 크롤링 작업 큐
+여러 워커 호스트가 (사이트, 작업 종류, 대상) 단위 작업을 임대(lease)해 처리하고 결과를 돌려준다
+
+- SqliteWorkQueue: SQLite 파일 기반 로컬 구현 (코디네이터 또는 단일 호스트에서 사용)
+- HttpWorkQueue: 코디네이터 HTTP 서버에 접속하는 원격 구현 (워커 호스트에서 사용)
+- serve_work_queue: SqliteWorkQueue를 HTTP로 공개하는 코디네이터 서버 (모든 요청에 공유 토큰 헤더 필요)
+
+두 구현은 같은 메서드(enqueue/lease/reserve_slot/complete/fail/extend/stats)를 제공하므로 워커 코드는 어느 쪽이든 그대로 사용한다.
+
+작업 상태: pending → leased → done / failed
+    - 임대 기간(visibility timeout) 안에 완료되지 않으면 다른 워커가 다시 임대할 수 있다
+    - 사이트별 최소 요청 간격은 큐에서 전역으로 적용된다 (모든 워커의 페이지 이동마다 reserve_slot으로 차감)
+    - 같은 (사이트, 종류, dedupe_key) 작업은 한 번만 등록되고, 완료 보고는 여러 번 와도 한 번만 반영된다
+"""
+import hmac
+import json
+import sqlite3
+import threading
+import time
+import urllib.request
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger("WorkQueue")
+
+DEFAULT_VISIBILITY_TIMEOUT = 300
+DEFAULT_MAX_ATTEMPTS = 3
+
+# 코디네이터 요청 인증 헤더 (코디네이터와 워커가 같은 토큰 사용)
+TOKEN_HEADER = "X-Work-Queue-Token"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    site TEXT NOT NULL,
+    kind TEXT NOT NULL,                -- search / detail
+    dedupe_key TEXT NOT NULL,
+    payload TEXT NOT NULL,             -- JSON
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_token TEXT,
+    lease_expires REAL,
+    result TEXT,                       -- JSON
+    error TEXT,
+    created_at REAL NOT NULL,
+    completed_at REAL,
+    UNIQUE (site, kind, dedupe_key)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, available_at);
+CREATE TABLE IF NOT EXISTS site_limits (
+    site TEXT PRIMARY KEY,
+    min_interval REAL NOT NULL,
+    next_allowed_at REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+class SqliteWorkQueue:
+    """SQLite 기반 작업 큐 (여러 프로세스가 같은 파일을 공유해도 안전)"""
+
+    def __init__(self, path: Path, visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT):
+        """
+        Args:
+            path: 큐 SQLite 파일 경로
+            visibility_timeout: 기본 임대 기간 (초)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.visibility_timeout = visibility_timeout
+        # 트랜잭션은 직접 관리 (임대 시 BEGIN IMMEDIATE로 쓰기 잠금 선점)
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def _write(self, fn: Callable):
+        """쓰기 트랜잭션 안에서 fn(conn) 실행"""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self.conn)
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            return result
+
+    def set_site_rate(self, site: str, requests_per_second: float):
+        """사이트 전역 요청 속도 설정 (모든 워커 합산 기준)"""
+        min_interval = 1 / requests_per_second if requests_per_second > 0 else 0
+        self._write(lambda conn: conn.execute(
+            "INSERT INTO site_limits (site, min_interval) VALUES (?, ?) "
+            "ON CONFLICT(site) DO UPDATE SET min_interval = excluded.min_interval",
+            (site, min_interval)
+        ))
+
+    def enqueue(self, site: str, kind: str, payload: Dict, dedupe_key: str = None, priority: int = 0,
+                max_attempts: int = DEFAULT_MAX_ATTEMPTS, merge: str = None) -> Optional[int]:
+        """
+        작업 등록 (같은 사이트/종류/dedupe_key 작업이 이미 있으면 무시)
+
+        Args:
+            site: 사이트 키 (예: 'saramin')
+            kind: 작업 종류 (search / detail)
+            payload: 작업 내용 (JSON 직렬화 가능)
+            dedupe_key: 중복 판별 키 (None이면 payload 전체)
+            priority: 클수록 먼저 임대
+            max_attempts: 최대 시도 횟수
+            merge: 이미 등록된 작업이 아직 완료되지 않았으면 payload[merge] 리스트에 새 값을 합침
+                   (예: 'keywords' - 같은 공고를 노출시킨 검색 키워드 누적)
+
+        Returns:
+            새 작업 ID (이미 등록된 작업이면 None)
+        """
+        payload_json = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        dedupe_key = dedupe_key or payload_json
+        now = time.time()
+
+        def insert(conn):
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO tasks (site, kind, dedupe_key, payload, priority, max_attempts, "
+                "available_at, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (site, kind, dedupe_key, payload_json, priority, max_attempts, now, now)
+            )
+            if cursor.rowcount:
+                return cursor.lastrowid
+            if merge:
+                row = conn.execute(
+                    "SELECT id, payload FROM tasks WHERE site = ? AND kind = ? AND dedupe_key = ? "
+                    "AND status IN ('pending', 'leased')", (site, kind, dedupe_key)
+                ).fetchone()
+                if row:
+                    existing = json.loads(row["payload"])
+                    values = existing.get(merge, [])
+                    added = [value for value in payload.get(merge, []) if value not in values]
+                    if added:
+                        existing[merge] = values + added
+                        conn.execute("UPDATE tasks SET payload = ? WHERE id = ?",
+                                     (json.dumps(existing, ensure_ascii=False, sort_keys=True), row["id"]))
+            return None
+
+        return self._write(insert)
+
+    def lease(self, worker_id: str, sites: List[str] = None, visibility_timeout: float = None) -> Optional[Dict]:
+        """
+        처리할 작업 하나를 임대
+
+        대기 중이거나 임대 기간이 지난 작업 중, 사이트 요청 간격이 허용하는 작업을 우선순위 순으로 고른다.
+        (임대는 요청 간격을 차감하지 않는다 - 실제 페이지 이동마다 reserve_slot으로 차감)
+
+        Args:
+            worker_id: 워커 식별자
+            sites: 처리 가능한 사이트 목록 (None이면 전체)
+            visibility_timeout: 임대 기간 (초, None이면 큐 기본값)
+
+        Returns:
+            {id, site, kind, payload, lease_token, attempts} 또는 None (지금 처리할 작업 없음)
+        """
+        timeout = visibility_timeout or self.visibility_timeout
+
+        def take(conn):
+            now = time.time()  # 쓰기 잠금을 얻은 뒤의 시각 기준
+            # 임대 기간이 지났고 시도 횟수를 모두 쓴 작업은 실패 처리
+            conn.execute(
+                "UPDATE tasks SET status = 'failed', error = '임대 기간 초과', lease_token = NULL "
+                "WHERE status = 'leased' AND lease_expires <= ? AND attempts >= max_attempts", (now,)
+            )
+            site_filter = ""
+            params = [now, now, now]
+            if sites:
+                site_filter = f"AND t.site IN ({', '.join('?' * len(sites))})"
+                params.extend(sites)
+            row = conn.execute(f"""
+                SELECT t.id, t.site, t.kind, t.payload, t.attempts
+                FROM tasks t
+                LEFT JOIN site_limits s ON s.site = t.site
+                WHERE ((t.status = 'pending' AND t.available_at <= ?)
+                       OR (t.status = 'leased' AND t.lease_expires <= ?))
+                  AND COALESCE(s.next_allowed_at, 0) <= ?
+                  {site_filter}
+                ORDER BY t.priority DESC, t.id
+                LIMIT 1
+            """, params).fetchone()
+            if row is None:
+                return None
+
+            token = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', lease_owner = ?, lease_token = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (worker_id, token, now + timeout, row["id"])
+            )
+            return {
+                "id": row["id"],
+                "site": row["site"],
+                "kind": row["kind"],
+                "payload": json.loads(row["payload"]),
+                "lease_token": token,
+                "attempts": row["attempts"] + 1,
+            }
+
+        return self._write(take)
+
+    def reserve_slot(self, site: str) -> float:
+        """
+        사이트 전역 요청 슬롯 예약 (워커가 페이지 이동 직전마다 호출)
+
+        다음 허용 시각을 요청 간격만큼 미루고, 예약한 슬롯까지 기다려야 하는 시간을 반환한다.
+
+        Returns:
+            대기 시간 (초, 속도 설정이 없는 사이트면 0)
+        """
+        def reserve(conn):
+            now = time.time()
+            row = conn.execute(
+                "SELECT min_interval, next_allowed_at FROM site_limits WHERE site = ?", (site,)
+            ).fetchone()
+            if row is None or not row["min_interval"]:
+                return 0.0
+            slot = max(now, row["next_allowed_at"])
+            conn.execute("UPDATE site_limits SET next_allowed_at = ? WHERE site = ?",
+                         (slot + row["min_interval"], site))
+            return slot - now
+
+        return self._write(reserve)
+
+    def extend(self, task_id: int, lease_token: str, visibility_timeout: float = None) -> bool:
+        """임대 기간 연장 (긴 작업의 heartbeat). 임대를 잃었으면 False"""
+        expires = time.time() + (visibility_timeout or self.visibility_timeout)
+        cursor = self._write(lambda conn: conn.execute(
+            "UPDATE tasks SET lease_expires = ? WHERE id = ? AND status = 'leased' AND lease_token = ?",
+            (expires, task_id, lease_token)
+        ))
+        return cursor.rowcount > 0
+
+    def complete(self, task_id: int, lease_token: str, result: Dict = None) -> bool:
+        """
+        작업 완료 보고 (멱등)
+
+        임대 기간이 지나 다른 워커에게 넘어간 작업이라도 먼저 도착한 결과를 반영하고,
+        이미 완료된 작업에 대한 보고는 무시한다.
+
+        Returns:
+            이번 보고로 완료 처리되었으면 True, 이미 완료된 작업이면 False
+        """
+        result_json = json.dumps(result, ensure_ascii=False) if result is not None else None
+        cursor = self._write(lambda conn: conn.execute(
+            "UPDATE tasks SET status = 'done', result = ?, error = NULL, lease_token = NULL, completed_at = ? "
+            "WHERE id = ? AND status != 'done'",
+            (result_json, time.time(), task_id)
+        ))
+        return cursor.rowcount > 0
+
+    def fail(self, task_id: int, lease_token: str, error: str, retry_after: float = None) -> str:
+        """
+        작업 실패 보고
+
+        시도 횟수가 남아 있으면 retry_after초(기본: 30초 × 시도 횟수) 뒤 다시 임대 가능하게 한다.
+        임대를 잃은 워커의 보고는 무시한다.
+
+        Returns:
+            변경된 상태 (pending / failed, 무시된 경우 빈 문자열)
+        """
+        def mark(conn):
+            now = time.time()
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM tasks WHERE id = ? AND status = 'leased' AND lease_token = ?",
+                (task_id, lease_token)
+            ).fetchone()
+            if row is None:
+                return ""
+            if row["attempts"] >= row["max_attempts"]:
+                status, available_at = "failed", now
+            else:
+                status, available_at = "pending", now + (retry_after if retry_after is not None else 30 * row["attempts"])
+            conn.execute(
+                "UPDATE tasks SET status = ?, error = ?, available_at = ?, lease_token = NULL WHERE id = ?",
+                (status, error[:2000], available_at, task_id)
+            )
+            return status
+
+        return self._write(mark)
+
+    def stats(self) -> Dict:
+        """사이트/작업 종류/상태별 작업 수"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT site, kind, status, COUNT(*) AS count FROM tasks GROUP BY site, kind, status"
+            ).fetchall()
+        totals: Dict[str, int] = {}
+        sites: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            totals[row["status"]] = totals.get(row["status"], 0) + row["count"]
+            site = sites.setdefault(row["site"], {})
+            key = f"{row['kind']}_{row['status']}"
+            site[key] = site.get(key, 0) + row["count"]
+        return {"totals": totals, "sites": sites}
+
+    def iter_results(self, kind: str = "detail") -> Iterator[Dict]:
+        """완료된 작업 결과 ({site, payload, result})"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT site, payload, result FROM tasks WHERE kind = ? AND status = 'done' ORDER BY completed_at",
+                (kind,)
+            ).fetchall()
+        for row in rows:
+            yield {
+                "site": row["site"],
+                "payload": json.loads(row["payload"]),
+                "result": json.loads(row["result"]) if row["result"] else None,
+            }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class HttpWorkQueue:
+    """코디네이터 HTTP 서버에 접속하는 작업 큐 클라이언트 (SqliteWorkQueue와 같은 메서드)"""
+
+    def __init__(self, base_url: str, token: str, timeout: float = 30):
+        """
+        Args:
+            base_url: 코디네이터 주소 (예: http://10.0.0.5:8765)
+            token: 코디네이터 공유 토큰
+            timeout: 요청 제한 시간 (초)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+
+    def _call(self, method: str, **params):
+        request = urllib.request.Request(
+            f"{self.base_url}/{method}",
+            data=json.dumps(params, ensure_ascii=False).encode("utf-8"),
+            headers={"Content-Type": "application/json", TOKEN_HEADER: self.token},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8"))["result"]
+
+    def enqueue(self, site: str, kind: str, payload: Dict, dedupe_key: str = None, priority: int = 0,
+                max_attempts: int = DEFAULT_MAX_ATTEMPTS, merge: str = None) -> Optional[int]:
+        return self._call("enqueue", site=site, kind=kind, payload=payload, dedupe_key=dedupe_key,
+                          priority=priority, max_attempts=max_attempts, merge=merge)
+
+    def lease(self, worker_id: str, sites: List[str] = None, visibility_timeout: float = None) -> Optional[Dict]:
+        return self._call("lease", worker_id=worker_id, sites=sites, visibility_timeout=visibility_timeout)
+
+    def reserve_slot(self, site: str) -> float:
+        return self._call("reserve_slot", site=site)
+
+    def extend(self, task_id: int, lease_token: str, visibility_timeout: float = None) -> bool:
+        return self._call("extend", task_id=task_id, lease_token=lease_token, visibility_timeout=visibility_timeout)
+
+    def complete(self, task_id: int, lease_token: str, result: Dict = None) -> bool:
+        return self._call("complete", task_id=task_id, lease_token=lease_token, result=result)
+
+    def fail(self, task_id: int, lease_token: str, error: str, retry_after: float = None) -> str:
+        return self._call("fail", task_id=task_id, lease_token=lease_token, error=error, retry_after=retry_after)
+
+    def stats(self) -> Dict:
+        return self._call("stats")
+
+    def close(self):
+        pass
+
+
+# 코디네이터가 HTTP로 공개하는 큐 메서드
+_RPC_METHODS = {"enqueue", "lease", "reserve_slot", "extend", "complete", "fail", "stats"}
+
+
+def serve_work_queue(queue: SqliteWorkQueue, token: str, host: str = "127.0.0.1", port: int = 8765,
+                     on_complete: Callable[[int, Dict], None] = None) -> ThreadingHTTPServer:
+    """
+    작업 큐 코디네이터 HTTP 서버 생성 (serve_forever()로 실행)
+
+    POST /<메서드> 에 JSON 인자를 보내면 {"result": ...}를 반환한다.
+    TOKEN_HEADER 헤더의 토큰이 일치하지 않는 요청은 401로 거부한다.
+
+    Args:
+        queue: 공개할 SqliteWorkQueue
+        token: 워커와 공유하는 토큰
+        host: 바인딩 주소 (기본값은 로컬 전용, 다른 호스트의 워커를 받으려면 0.0.0.0)
+        port: 포트
+        on_complete: 작업이 처음 완료될 때 호출할 함수 (task_id, complete 인자) - 예: 파이프라인 투입
+
+    Returns:
+        ThreadingHTTPServer
+
+    Raises:
+        ValueError: 토큰이 비어 있는 경우
+    """
+    if not token:
+        raise ValueError("코디네이터 토큰이 필요합니다")
+    expected = token.encode("utf-8")
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if not hmac.compare_digest(self.headers.get(TOKEN_HEADER, "").encode("utf-8"), expected):
+                self._send(401, {"error": "인증 토큰이 올바르지 않습니다"})
+                return
+            method = self.path.strip("/")
+            if method not in _RPC_METHODS:
+                self._send(404, {"error": f"알 수 없는 메서드: {method}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                params = json.loads(self.rfile.read(length) or b"{}")
+                result = getattr(queue, method)(**params)
+                if method == "complete" and result and on_complete:
+                    on_complete(params["task_id"], params.get("result") or {})
+            except Exception as e:
+                logger.error(f"코디네이터 요청 처리 실패 ({method}): {e}")
+                self._send(400, {"error": str(e)})
+                return
+            self._send(200, {"result": result})
+
+        def _send(self, status: int, body: Dict):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    return ThreadingHTTPServer((host, port), Handler)
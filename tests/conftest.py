@@ -0,0 +1,90 @@
+"""
+API 테스트 공통 픽스처 (임시 DB를 쓰는 FastAPI TestClient)
+
+앱 코드는 backend.database..., 크롤러/유틸은 database...로 import하므로 두 경로를 모두 추가한다.
+DB 연결과 패싯 인덱스/응답 캐시는 프로세스 싱글톤이라 세션 전체가 임시 DB 하나를 공유하며,
+테스트마다 고유한 URL/사이트 이름으로 공고를 저장해 서로의 데이터와 구분한다.
+"""
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+for _path in (ROOT, ROOT / "backend"):
+    if str(_path) not in sys.path:
+        sys.path.append(str(_path))
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """임시 DB를 쓰는 TestClient (크롤 워커 프로세스는 띄우지 않음)"""
+    pytest.importorskip("httpx")
+    os.environ["CRAWL_WORKERS"] = "0"
+    from backend.database.connection import DatabaseConnection
+    DatabaseConnection._db_path = Path(tempfile.mkdtemp()) / "recruitment.db"
+
+    from fastapi.testclient import TestClient
+    from backend.app.main import app
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def crawler_job_repo():
+    """크롤러/유틸(database... 모듈)이 쓰는 임시 DB의 JobRepository"""
+    from database.connection import DatabaseConnection
+    DatabaseConnection._db_path = Path(tempfile.mkdtemp()) / "recruitment.db"
+
+    from database.repositories import JobRepository
+    return JobRepository()
+
+
+@pytest.fixture
+def save_postings(api_client):
+    """
+    공고 + 분석 결과 저장 함수
+
+        job_ids = save_postings([{"url": ..., "keywords": [("반도체", "technology")], "risk_level": "고위험"}])
+
+    Returns:
+        저장된 job_id 리스트 (postings 순서)
+    """
+    from backend.database.repositories import AnalysisRepository
+    repo = AnalysisRepository()
+
+    def save(postings):
+        items = []
+        for posting in postings:
+            job = {
+                "title": posting.get("title", "공고"),
+                "company": posting.get("company", "회사"),
+                "url": posting["url"],
+                "source_site": posting.get("source_site", "test_site"),
+                "search_keyword": posting.get("search_keyword", "반도체"),
+                "crawled_at": posting.get("crawled_at", datetime(2024, 1, 1, 10)),
+            }
+            detection = {
+                "tier1_matches": [
+                    {"keyword": keyword, "category": category, "weight": 10, "count": 1}
+                    for keyword, category in posting.get("keywords", [])
+                ],
+                "tier2_matches": [],
+                "tier3_matches": [],
+                "pattern_matches": [
+                    {"pattern_id": name, "pattern_name": name, "keywords": [], "weight": 5, "description": ""}
+                    for name in posting.get("patterns", [])
+                ],
+            }
+            risk = {
+                "base_score": 10, "combo_multiplier": 1.0, "final_score": posting.get("final_score", 10),
+                "risk_level": posting.get("risk_level", "저위험"), "risk_factors": [], "recommendations": [],
+                "analysis_summary": "",
+            }
+            items.append((job, detection, risk))
+        return repo.save_jobs_with_analysis(items)
+
+    return save
@@ -0,0 +1,163 @@
+"""
+패싯 검색 테스트 (GET /api/jobs/search의 메모리 인덱스 결과를 같은 조건의 SQL 결과와 비교)
+
+공고 저장 → 재분석 → 삭제 순서로 DB를 바꾸면서 매번 개수/페이지/패싯 값별 개수가 SQL과 같은지 확인한다.
+"""
+import random
+from datetime import datetime
+
+import pytest
+
+from backend.app.facets import FACETS, get_facet_index
+from backend.database.connection import get_db_connection
+
+SITES = ["facet_a", "facet_b", "facet_c"]
+SEARCH_KEYWORDS = ["반도체", "OLED", "배터리"]
+RISK_LEVELS = ["고위험", "중위험", "저위험"]
+KEYWORDS = [("반도체", "technology"), ("중국", "location"), ("삼성", "company"), ("기술이전", "collaboration")]
+
+QUERIES = [
+    {},
+    {"site": ["facet_a"]},
+    {"site": ["facet_a", "facet_c"], "risk_level": ["고위험"]},
+    {"search_keyword": ["OLED"], "keyword": ["중국"]},
+    {"category": ["technology", "company"], "risk_level": ["중위험", "저위험"]},
+    {"keyword": ["삼성"], "date_from": "2024-01-03"},
+    {"site": ["facet_b"], "date_from": "2024-01-02", "date_to": "2024-01-06"},
+    {"search_keyword": ["반도체", "배터리"], "category": ["location"], "date_to": "2024-01-05"},
+    {"site": ["facet_c"], "keyword": ["없는 키워드"]},
+]
+
+# 수집 검색 키워드: job_search_keywords가 있으면 그 값, 없으면 jobs.search_keyword
+SEARCH_KEYWORD_ROWS = """
+    SELECT job_id, keyword FROM job_search_keywords
+    UNION
+    SELECT id, search_keyword FROM jobs
+    WHERE search_keyword IS NOT NULL AND search_keyword != ''
+      AND id NOT IN (SELECT job_id FROM job_search_keywords)
+"""
+LATEST_RISK_LEVEL = "(SELECT risk_level FROM risk_analysis r WHERE r.job_id = j.id ORDER BY r.id DESC LIMIT 1)"
+# 패싯 값별 개수 SQL (FROM/JOIN 부분, 값 열 이름은 value)
+FACET_SOURCES = {
+    "site": "SELECT j.source_site AS value, j.id AS job_id FROM jobs j",
+    "search_keyword": f"SELECT sk.keyword AS value, j.id AS job_id FROM jobs j JOIN ({SEARCH_KEYWORD_ROWS}) sk ON sk.job_id = j.id",
+    "risk_level": f"SELECT {LATEST_RISK_LEVEL} AS value, j.id AS job_id FROM jobs j",
+    "keyword": "SELECT km.keyword AS value, j.id AS job_id FROM jobs j JOIN keyword_matches km ON km.job_id = j.id",
+    "category": "SELECT km.category AS value, j.id AS job_id FROM jobs j JOIN keyword_matches km ON km.job_id = j.id",
+    "crawled_date": "SELECT j.crawled_date AS value, j.id AS job_id FROM jobs j",
+}
+
+
+def _where(query, skip_facet=None):
+    """패싯 선택 → WHERE 조건과 파라미터 (skip_facet의 선택은 제외)"""
+    conditions, params = ["1 = 1"], []
+
+    def values_in(facet, expression):
+        values = query.get(facet)
+        if values and facet != skip_facet:
+            conditions.append(f"{expression} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+
+    values_in("site", "j.source_site")
+    values_in("risk_level", LATEST_RISK_LEVEL)
+    if query.get("search_keyword") and skip_facet != "search_keyword":
+        values = query["search_keyword"]
+        conditions.append(
+            f"j.id IN (SELECT job_id FROM ({SEARCH_KEYWORD_ROWS}) WHERE keyword IN ({', '.join('?' * len(values))}))"
+        )
+        params.extend(values)
+    for facet in ("keyword", "category"):
+        values = query.get(facet)
+        if values and facet != skip_facet:
+            conditions.append(
+                f"j.id IN (SELECT job_id FROM keyword_matches WHERE {facet} IN ({', '.join('?' * len(values))}))"
+            )
+            params.extend(values)
+    if skip_facet != "crawled_date":
+        if query.get("date_from"):
+            conditions.append("j.crawled_date >= ?")
+            params.append(query["date_from"])
+        if query.get("date_to"):
+            conditions.append("j.crawled_date <= ?")
+            params.append(query["date_to"])
+    return " AND ".join(conditions), params
+
+
+def _sql_search(query):
+    """SQL로 계산한 (최신순 공고 ID, 패싯 값별 개수)"""
+    conn = get_db_connection()
+    try:
+        where, params = _where(query)
+        ids = [row[0] for row in conn.execute(f"SELECT j.id FROM jobs j WHERE {where} ORDER BY j.id DESC", params)]
+        facets = {}
+        for facet in FACETS:
+            where, params = _where(query, skip_facet=facet)
+            rows = conn.execute(f"""
+                SELECT value, COUNT(DISTINCT job_id) FROM ({FACET_SOURCES[facet]} WHERE {where})
+                WHERE value IS NOT NULL AND value != ''
+                GROUP BY value
+            """, params)
+            facets[facet] = dict(rows.fetchall())
+        return ids, facets
+    finally:
+        conn.close()
+
+
+def _assert_matches_sql(client):
+    for query in QUERIES:
+        expected_ids, expected_facets = _sql_search(query)
+
+        response = client.get("/api/jobs/search", params={**query, "limit": 200})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body["total"] == len(expected_ids), query
+        assert [item["id"] for item in body["items"]] == expected_ids[:200], query
+        assert body["facets"] == expected_facets, query
+
+        page = client.get("/api/jobs/search", params={**query, "skip": 5, "limit": 7, "counts": False}).json()
+        assert [item["id"] for item in page["items"]] == expected_ids[5:12], query
+
+
+def _posting(rng, n):
+    return {
+        "url": f"https://facets.example.com/{n}",
+        "source_site": rng.choice(SITES),
+        "search_keyword": rng.choice(SEARCH_KEYWORDS),
+        "crawled_at": datetime(2024, 1, rng.randint(1, 9), 10),
+        "keywords": rng.sample(KEYWORDS, rng.randint(0, 3)),
+        "risk_level": rng.choice(RISK_LEVELS),
+    }
+
+
+@pytest.fixture
+def facet_client(api_client):
+    """DB 변경을 매 요청 반영하는 패싯 인덱스"""
+    index = get_facet_index()
+    check_interval = index.check_interval
+    index.check_interval = 0
+    yield api_client
+    index.check_interval = check_interval
+
+
+def test_facet_search_matches_sql(facet_client, save_postings):
+    """저장/재분석/삭제 후에도 패싯 검색 결과가 SQL 결과와 같음"""
+    rng = random.Random(49)
+    job_ids = save_postings([_posting(rng, n) for n in range(120)])
+    _assert_matches_sql(facet_client)
+
+    # 새 공고
+    save_postings([_posting(rng, n) for n in range(120, 150)])
+    _assert_matches_sql(facet_client)
+
+    # 재분석 (같은 URL의 키워드/위험도 교체)
+    save_postings([_posting(rng, n) for n in rng.sample(range(150), 30)])
+    _assert_matches_sql(facet_client)
+
+    # 삭제 (매칭 행은 남아 있어도 결과에 포함되지 않아야 함)
+    conn = get_db_connection()
+    try:
+        conn.executemany("DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id in job_ids[10:20]])
+        conn.commit()
+    finally:
+        conn.close()
+    _assert_matches_sql(facet_client)
@@ -0,0 +1,102 @@
+"""
+공고 API 테스트 (임시 DB + TestClient, 픽스처는 conftest.py)
+"""
+import csv
+import io
+import json
+
+import pytest
+
+from backend.app.api.jobs import EXPORT_FIELDS
+from backend.database.connection import get_db_connection
+
+
+def test_batch_details_skip_orphan_matches(api_client, save_postings):
+    """삭제된 공고의 매칭 행이 남아 있어도(외래 키 미사용) 일괄 상세 조회는 나머지 공고를 반환"""
+    kept, deleted = save_postings([
+        {"url": "https://batch.example.com/1", "keywords": [("반도체", "technology")], "patterns": ["기술유출"]},
+        {"url": "https://batch.example.com/2", "keywords": [("중국", "location")], "patterns": ["해외이직"]},
+    ])
+    conn = get_db_connection()
+    try:
+        conn.execute("DELETE FROM jobs WHERE id = ?", (deleted,))
+        conn.commit()
+    finally:
+        conn.close()
+
+    response = api_client.post("/api/jobs/batch", json={"ids": [kept, deleted]})
+    assert response.status_code == 200
+    body = response.json()
+    assert [detail["job"]["id"] for detail in body["jobs"]] == [kept]
+    assert body["not_found"] == [deleted]
+    assert [match["keyword"] for match in body["jobs"][0]["keyword_matches"]] == ["반도체"]
+    assert len(body["jobs"][0]["pattern_matches"]) == 1
+
+
+EXPORT_SITE = "export_test"
+# EXPORT_CHUNK_SIZE(1000)를 넘겨 fetchmany 청크 경계를 지나도록
+EXPORT_ROWS = 1205
+# (키워드, 가중치) - 내보내기는 가중치 내림차순으로 이어 붙인다
+EXPORT_KEYWORDS = [("반도체", 20), ("중국", 10)]
+
+
+@pytest.fixture(scope="module")
+def export_ids(api_client):
+    """n % 3에 따라 키워드/패턴 매칭 수가 다른 공고 EXPORT_ROWS개"""
+    from backend.database.repositories import AnalysisRepository
+    items = []
+    for n in range(EXPORT_ROWS):
+        job = {"title": f"공고 {n}", "company": "회사", "url": f"https://export.example.com/{n}",
+               "source_site": EXPORT_SITE, "search_keyword": "반도체"}
+        detection = {
+            "tier1_matches": [{"keyword": keyword, "category": "technology", "weight": weight, "count": 1}
+                              for keyword, weight in EXPORT_KEYWORDS[:n % 3]],
+            "tier2_matches": [], "tier3_matches": [],
+            "pattern_matches": [{"pattern_id": "p", "pattern_name": "기술유출", "keywords": [], "weight": 5,
+                                 "description": ""}] if n % 3 == 2 else [],
+        }
+        risk = {"base_score": n, "combo_multiplier": 1.0, "final_score": n, "risk_level": "저위험",
+                "risk_factors": ["요인"], "recommendations": [], "analysis_summary": ""}
+        items.append((job, detection, risk))
+    return AnalysisRepository().save_jobs_with_analysis(items)
+
+
+def _expected_matches(n):
+    return [keyword for keyword, _ in EXPORT_KEYWORDS[:n % 3]], ["기술유출"] if n % 3 == 2 else []
+
+
+def test_export_csv_streams_every_row(api_client, export_ids):
+    """CSV 내보내기는 헤더 + 청크 경계를 넘는 모든 행, keywords/patterns는 | 로 연결"""
+    response = api_client.get("/api/jobs/export", params={"format": "csv", "site": EXPORT_SITE})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.startswith("\ufeff")
+
+    header, *rows = list(csv.reader(io.StringIO(response.text.lstrip("\ufeff"))))
+    assert header == ["id", *EXPORT_FIELDS, "keywords", "patterns"]
+    assert [int(row[0]) for row in rows] == export_ids
+    for n, row in enumerate(rows):
+        record = dict(zip(header, row))
+        keywords, patterns = _expected_matches(n)
+        assert record["keywords"] == "|".join(keywords)
+        assert record["patterns"] == "|".join(patterns)
+        assert record["url"] == f"https://export.example.com/{n}"
+
+
+def test_export_ndjson_streams_every_row(api_client, export_ids):
+    """NDJSON 내보내기는 한 줄에 공고 하나, 매칭은 목록, JSON 필드는 디코드"""
+    response = api_client.get("/api/jobs/export", params={
+        "site": EXPORT_SITE, "fields": "title,final_score,risk_factors",
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["id"] for record in records] == export_ids
+    for n, record in enumerate(records):
+        keywords, patterns = _expected_matches(n)
+        assert record == {"id": export_ids[n], "title": f"공고 {n}", "final_score": n, "risk_factors": ["요인"],
+                          "keywords": keywords, "patterns": patterns}
+
+    resumed = api_client.get("/api/jobs/export", params={"site": EXPORT_SITE, "after_id": export_ids[999], "limit": 3})
+    assert [json.loads(line)["id"] for line in resumed.text.splitlines()] == export_ids[1000:1003]
@@ -0,0 +1,126 @@
+"""
+페이지네이션 테스트 (로컬 HTTP 서버의 검색 결과 페이지로 검증)
+"""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# 백엔드 경로 추가
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+sync_api = pytest.importorskip("playwright.sync_api")
+
+from utils.pagination import paginate_links
+from utils.resilience import BOT_WALL, get_breaker
+
+PAGES = 4
+LINKS_PER_PAGE = 5
+# 이 페이지 번호는 봇 차단 화면을 보여준다 (_BlockedSearchHandler)
+BLOCKED_PAGE = 2
+BOT_WALL_TEXT = "비정상적인 접근이 감지되었습니다"
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+    """?page=N 마다 공고 링크 LINKS_PER_PAGE개를 보여주는 검색 결과 페이지 (PAGES 초과는 빈 페이지)"""
+
+    def do_GET(self):
+        page = int(parse_qs(urlparse(self.path).query).get("page", ["1"])[0])
+        body = f"<html><body>{self.render(page)}</body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def render(self, page: int) -> str:
+        if page > PAGES:
+            return ""
+        return "".join(f'<a class="job" href="/job/{page}-{n}">공고 {page}-{n}</a>' for n in range(LINKS_PER_PAGE))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _BlockedSearchHandler(_SearchHandler):
+    """BLOCKED_PAGE만 링크 없이 봇 차단 문구를 보여주는 검색 결과 페이지 (상태 코드는 200)"""
+
+    def render(self, page: int) -> str:
+        if page == BLOCKED_PAGE:
+            return f"<p>{BOT_WALL_TEXT}</p>"
+        return super().render(page)
+
+
+def _serve(handler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def search_server():
+    server = _serve(_SearchHandler)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def blocked_search_server():
+    server = _serve(_BlockedSearchHandler)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _extract(page):
+    return page.eval_on_selector_all("a.job", "links => links.map(a => a.href)")
+
+
+def _collect(config, first_url):
+    with sync_api.sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            context = browser.new_context()
+            page = context.new_page()
+            page.goto(first_url)
+            return paginate_links(page, config, _extract, first_url=first_url)
+        finally:
+            browser.close()
+
+
+def test_url_param_collects_every_page(search_server):
+    """크롤러와 같은 방식(browser.new_context())으로 만든 페이지에서 url_param 탭 수집"""
+    config = {
+        "site_name": "pagination_test",
+        "wait_time": 0,
+        "max_pages": PAGES + 2,
+        "pagination": {"type": "url_param", "param": "page", "concurrency": 2},
+    }
+    links = _collect(config, f"{search_server}/search?page=1")
+
+    expected = [f"{search_server}/job/{page}-{n}" for page in range(1, PAGES + 1) for n in range(LINKS_PER_PAGE)]
+    assert sorted(links) == sorted(expected)
+
+
+def test_url_param_skips_blocked_page(blocked_search_server):
+    """200 응답의 봇 차단 화면은 결과 끝이 아니라 브레이커 실패로 기록하고 다음 페이지를 계속 수집"""
+    config = {
+        "site_name": "pagination_blocked_test",
+        "base_url": blocked_search_server,
+        "wait_time": 0,
+        "max_pages": PAGES + 2,
+        "bot_wall_markers": [BOT_WALL_TEXT],
+        "pagination": {"type": "url_param", "param": "page", "concurrency": 2},
+    }
+    links = _collect(config, f"{blocked_search_server}/search?page=1")
+
+    expected = [
+        f"{blocked_search_server}/job/{page}-{n}"
+        for page in range(1, PAGES + 1) if page != BLOCKED_PAGE for n in range(LINKS_PER_PAGE)
+    ]
+    assert sorted(links) == sorted(expected)
+    assert get_breaker(config).snapshot()["failure_kinds"] == {BOT_WALL: 1}
@@ -0,0 +1,181 @@
+"""
+크롤링 장애 대응 테스트 (서킷 브레이커 상태 전이, 오류 분류, 재시도 횟수 - 브라우저 없이 검증)
+"""
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# 백엔드 경로 추가
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+from utils.navigation import goto
+from utils.resilience import (
+    EMPTY, HTTP_4XX, HTTP_5XX, HTTP_GONE, TIMEOUT, CircuitBreaker, CircuitOpenError, CrawlError,
+    classify_status, retry_settings,
+)
+
+COOLDOWN = 0.05
+
+
+def _open_breaker(threshold: int = 3) -> CircuitBreaker:
+    breaker = CircuitBreaker("resilience_test", failure_threshold=threshold, cooldown=COOLDOWN)
+    for _ in range(threshold):
+        breaker.before_request()
+        breaker.record_failure(TIMEOUT)
+    return breaker
+
+
+def test_breaker_opens_at_threshold_and_rejects():
+    """연속 실패가 failure_threshold에 도달하면 open, cooldown 동안 요청 거부"""
+    breaker = CircuitBreaker("resilience_test", failure_threshold=3, cooldown=COOLDOWN)
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure(TIMEOUT)
+    assert breaker.state == "closed"
+
+    breaker.before_request()
+    breaker.record_failure(TIMEOUT)
+    assert breaker.state == "open" and breaker.is_open()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_success_resets_failure_streak():
+    """중간에 성공하면 연속 실패 수가 초기화되어 열리지 않음"""
+    breaker = CircuitBreaker("resilience_test", failure_threshold=3, cooldown=COOLDOWN)
+    for outcome in (TIMEOUT, TIMEOUT, None, TIMEOUT, TIMEOUT):
+        breaker.before_request()
+        if outcome:
+            breaker.record_failure(outcome)
+        else:
+            breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.consecutive_failures == 2
+
+
+def test_half_open_allows_single_trial():
+    """cooldown 후 시험 요청 하나만 허용하고, 끝나기 전의 다른 요청은 거부"""
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN * 2)
+
+    breaker.before_request()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_request()
+    breaker.before_request()
+
+
+def test_half_open_trial_failure_reopens():
+    """시험 요청이 실패하면 다시 open, 다음 cooldown 후 새 시험 요청 허용"""
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN * 2)
+
+    breaker.before_request()
+    breaker.record_failure(TIMEOUT)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    time.sleep(COOLDOWN * 2)
+    breaker.before_request()
+    assert breaker.state == "half_open"
+
+
+def test_gone_pages_do_not_trip_breaker():
+    """404/410은 삭제된 공고로 분류되어 연속 실패에 포함되지 않고, half_open 시험도 성공으로 닫음"""
+    assert classify_status(404) == HTTP_GONE
+    assert classify_status(410) == HTTP_GONE
+
+    breaker = CircuitBreaker("resilience_test", failure_threshold=2, cooldown=COOLDOWN)
+    for _ in range(5):
+        breaker.before_request()
+        breaker.record_failure(HTTP_GONE)
+    assert breaker.state == "closed"
+    assert breaker.consecutive_failures == 0
+
+    breaker = _open_breaker()
+    time.sleep(COOLDOWN * 2)
+    breaker.before_request()
+    breaker.record_failure(HTTP_GONE)
+    assert breaker.state == "closed"
+
+
+def test_status_classification():
+    """429는 5xx와 같은 일시적 오류, 그 외 4xx는 재시도하지 않는 오류, 2xx/3xx는 정상"""
+    assert classify_status(429) == HTTP_5XX
+    assert classify_status(503) == HTTP_5XX
+    assert classify_status(403) == HTTP_4XX
+    assert classify_status(200) is None
+    assert classify_status(302) is None
+    assert CrawlError(HTTP_5XX, "HTTP 429").transient
+    assert not CrawlError(HTTP_4XX, "HTTP 403").transient
+
+
+def test_empty_streak_trips_breaker():
+    """연속 빈 추출도 failure_threshold에 도달하면 open, 추출 성공 시 초기화"""
+    breaker = CircuitBreaker("resilience_test", failure_threshold=3, cooldown=COOLDOWN)
+    breaker.record_failure(EMPTY)
+    breaker.record_failure(EMPTY)
+    breaker.record_extracted()
+    breaker.record_failure(EMPTY)
+    breaker.record_failure(EMPTY)
+    assert breaker.state == "closed"
+
+    breaker.record_failure(EMPTY)
+    assert breaker.state == "open"
+
+
+def test_retry_settings_legacy_and_nested_keys():
+    """최상위 max_retries(기존 설정)와 retry 블록 모두 지원, retry 블록이 우선"""
+    assert retry_settings({})["max_retries"] == 3
+    assert retry_settings({"max_retries": 5})["max_retries"] == 5
+    settings = retry_settings({"max_retries": 5, "retry": {"max_retries": 1, "backoff_max": 2}})
+    assert settings["max_retries"] == 1
+    assert settings["backoff_max"] == 2
+
+
+class _TimeoutPage:
+    """goto가 항상 타임아웃되는 가짜 페이지"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def goto(self, url, wait_until=None, timeout=None):
+        self.calls += 1
+        raise TimeoutError(f"Timeout {timeout}ms exceeded")
+
+
+@pytest.mark.parametrize("max_retries", [0, 2])
+def test_goto_attempts_first_try_plus_retries(max_retries):
+    """max_retries는 재시도 횟수 - 일시적 오류면 첫 시도 포함 max_retries + 1번 요청"""
+    config = {
+        "site_name": f"resilience_goto_{max_retries}",
+        "retry": {"max_retries": max_retries, "backoff_base": 0, "backoff_max": 0},
+        "politeness": {"requests_per_second": 1000, "burst": 10},
+    }
+    page = _TimeoutPage()
+    with pytest.raises(CrawlError) as excinfo:
+        goto(page, config, "https://example.com/job/1")
+    assert excinfo.value.kind == TIMEOUT
+    assert page.calls == max_retries + 1
+
+
+if __name__ == "__main__":
+    test_breaker_opens_at_threshold_and_rejects()
+    test_success_resets_failure_streak()
+    test_half_open_allows_single_trial()
+    test_half_open_trial_failure_reopens()
+    test_gone_pages_do_not_trip_breaker()
+    test_status_classification()
+    test_empty_streak_trips_breaker()
+    test_retry_settings_legacy_and_nested_keys()
+    test_goto_attempts_first_try_plus_retries(0)
+    test_goto_attempts_first_try_plus_retries(2)
+    print("장애 대응 테스트 통과")
@@ -0,0 +1,119 @@
+"""
+API 응답 캐시 미들웨어 테스트 (임시 DB + TestClient, 픽스처는 conftest.py)
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from backend.app.cache import ResponseCacheMiddleware
+from backend.database.connection import get_db_connection
+from backend.database.repositories import JobRepository
+
+CACHED = "/cached"
+FAILING = "/failing"
+
+
+@pytest.fixture
+def cached_client(api_client):
+    """호출 횟수를 세는 엔드포인트에 캐시 미들웨어를 붙인 앱 (DB 세대는 매 요청 확인)"""
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    calls = {CACHED: 0, FAILING: 0}
+
+    @app.get(CACHED)
+    def cached(days: int = 7):
+        calls[CACHED] += 1
+        conn = get_db_connection()
+        try:
+            total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        finally:
+            conn.close()
+        return {"total": total, "days": days}
+
+    @app.get(FAILING)
+    def failing():
+        calls[FAILING] += 1
+        return JSONResponse({"detail": "unavailable"}, status_code=503)
+
+    app.add_middleware(ResponseCacheMiddleware, paths=[CACHED, FAILING], check_interval=0)
+    return TestClient(app), calls
+
+
+def _bump_generation_with_risk_analysis(job_id: int):
+    conn = get_db_connection()
+    try:
+        conn.execute("""
+            INSERT INTO risk_analysis (job_id, base_score, combo_multiplier, final_score, risk_level,
+                                       risk_factors, recommendations)
+            VALUES (?, 0, 1.0, 0, '저위험', '[]', '[]')
+        """, (job_id,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_miss_then_hit(cached_client):
+    """첫 요청은 MISS(계산), 같은 경로+쿼리의 다음 요청은 HIT(재사용), 쿼리 순서는 무관"""
+    client, calls = cached_client
+    first = client.get(CACHED, params={"days": 3})
+    second = client.get(CACHED, params={"days": 3})
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+    assert calls[CACHED] == 1
+
+    assert client.get(CACHED, params={"days": 5}).headers["x-cache"] == "MISS"
+    assert calls[CACHED] == 2
+
+
+def test_insert_invalidates(cached_client):
+    """jobs/risk_analysis INSERT 트리거가 data_generation을 올리면 캐시 항목을 다시 계산"""
+    client, calls = cached_client
+    before = client.get(CACHED).json()["total"]
+    assert client.get(CACHED).headers["x-cache"] == "HIT"
+
+    job_id = JobRepository().upsert_job({"url": "https://cache.example.com/1", "title": "공고", "source_site": "cache"})
+    refreshed = client.get(CACHED)
+    assert refreshed.headers["x-cache"] == "MISS"
+    assert refreshed.json()["total"] == before + 1
+
+    _bump_generation_with_risk_analysis(job_id)
+    assert client.get(CACHED).headers["x-cache"] == "MISS"
+    assert calls[CACHED] == 3
+
+
+def test_if_none_match_returns_304(cached_client):
+    """ETag가 일치하면 본문 없이 304, 데이터가 바뀐 뒤에는 새 ETag로 200"""
+    client, _ = cached_client
+    etag = client.get(CACHED).headers["etag"]
+    not_modified = client.get(CACHED, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    JobRepository().upsert_job({"url": "https://cache.example.com/2", "title": "공고", "source_site": "cache"})
+    changed = client.get(CACHED, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_error_responses_not_cached(cached_client):
+    """200이 아닌 응답은 캐시하지 않고 ETag도 붙이지 않음"""
+    client, calls = cached_client
+    for _ in range(2):
+        response = client.get(FAILING)
+        assert response.status_code == 503
+        assert response.headers["x-cache"] == "MISS"
+        assert "etag" not in response.headers
+    assert calls[FAILING] == 2
+
+
+def test_app_caches_stats_overview(api_client):
+    """실제 앱의 집계 엔드포인트에 캐시가 적용됨"""
+    first = api_client.get("/api/stats/overview")
+    second = api_client.get("/api/stats/overview")
+    assert first.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
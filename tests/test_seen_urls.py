@@ -0,0 +1,89 @@
+"""
+증분 크롤링 테스트 (URL 정규화, Bloom filter, 이미 수집된 공고 URL 필터 - 임시 DB 사용)
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 백엔드 경로 추가
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+from utils.frontier import canonicalize_url
+from utils.seen_urls import BloomFilter, SeenUrlFilter
+
+SITE = "seen_url_test"
+
+
+def test_canonicalize_removes_tracking_params_and_sorts_query():
+    """추적/검색 파라미터 제거, 나머지 파라미터 정렬, scheme/host 소문자화, fragment/끝 슬래시 제거"""
+    url = "HTTPS://Www.Example.com/zf_user/jobs/relay/view/?view_type=list&rec_idx=123&searchword=반도체&utm_source=x#apply"
+    assert canonicalize_url(url) == "https://www.example.com/zf_user/jobs/relay/view?rec_idx=123&view_type=list"
+    assert canonicalize_url(canonicalize_url(url)) == canonicalize_url(url)
+
+
+def test_canonicalize_merges_variants_of_same_posting():
+    """같은 공고를 가리키는 검색 결과 URL은 파라미터 순서/추적값과 무관하게 같은 URL"""
+    variants = [
+        "https://example.com/job?id=7&page=1",
+        "https://example.com/job?page=1&id=7&keyword=OLED&logpath=search",
+        "https://example.com/job/?id=7&page=1&SearchWord=배터리",
+    ]
+    assert len({canonicalize_url(url) for url in variants}) == 1
+    assert canonicalize_url("https://example.com/job?id=7") != canonicalize_url("https://example.com/job?id=8")
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """추가한 값은 항상 포함, 추가하지 않은 값의 오탐률은 설정값 근처"""
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    added = [f"https://example.com/job/{n}" for n in range(2000)]
+    for url in added:
+        bloom.add(url)
+    assert all(url in bloom for url in added)
+
+    false_positives = sum(f"https://example.com/other/{n}" in bloom for n in range(5000))
+    assert false_positives / 5000 < 0.03
+
+
+def _save(repo, url: str, days_ago: int = 0):
+    job_id = repo.upsert_job({"url": url, "title": "공고", "source_site": SITE})
+    if days_ago:
+        with repo.db as conn:
+            conn.execute(
+                "UPDATE jobs SET updated_at = datetime('now', ?) WHERE id = ?", (f"-{days_ago} days", job_id)
+            )
+
+
+@pytest.mark.parametrize("use_bloom", [True, False])
+def test_filter_new_checks_canonical_and_raw_urls(crawler_job_repo, use_bloom):
+    """정규화된 URL로 저장된 공고와 정규화 이전 원본 URL로 저장된 공고를 모두 수집된 것으로 판단"""
+    canonical = canonicalize_url(f"https://example.com/job?id=1&bloom={use_bloom}")
+    legacy = f"https://example.com/legacy?searchword=반도체&id=2&bloom={use_bloom}"
+    _save(crawler_job_repo, canonical)
+    _save(crawler_job_repo, legacy)
+
+    seen = SeenUrlFilter(SITE, revisit_days=7, use_bloom=use_bloom)
+    fresh = f"https://example.com/job?id=3&bloom={use_bloom}"
+    urls = [
+        f"https://example.com/job?bloom={use_bloom}&id=1&logpath=search",  # 정규화하면 저장된 URL
+        legacy,                                                           # 원본 그대로 저장된 URL
+        fresh,
+        fresh,
+    ]
+    assert seen.filter_new(urls) == [fresh]
+    assert seen.stats == {"checked": 3, "new": 1, "revisit": 0, "skipped": 2}
+
+
+@pytest.mark.parametrize("use_bloom", [True, False])
+def test_filter_new_revisits_stale_postings(crawler_job_repo, use_bloom):
+    """마지막 수집(updated_at) 후 revisit_days가 지난 공고는 재방문, revisit_days=0이면 재방문하지 않음"""
+    recent = f"https://example.com/job?id=10&bloom={use_bloom}"
+    stale = f"https://example.com/job?id=11&bloom={use_bloom}"
+    _save(crawler_job_repo, recent, days_ago=2)
+    _save(crawler_job_repo, stale, days_ago=30)
+
+    seen = SeenUrlFilter(SITE, revisit_days=7, use_bloom=use_bloom)
+    assert seen.filter_new([recent, stale]) == [stale]
+    assert seen.stats["revisit"] == 1 and seen.stats["skipped"] == 1
+
+    assert SeenUrlFilter(SITE, revisit_days=0, use_bloom=use_bloom).filter_new([recent, stale]) == []
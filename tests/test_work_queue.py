@@ -0,0 +1,147 @@
+"""
+분산 크롤링 작업 큐 테스트 (브라우저 없이 여러 로컬 워커 프로세스로 검증)
+"""
+import multiprocessing
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+from pathlib import Path
+
+import pytest
+
+# 백엔드 경로 추가
+sys.path.append(str(Path(__file__).parent.parent / "backend"))
+
+from utils.work_queue import HttpWorkQueue, SqliteWorkQueue, serve_work_queue
+
+
+def _worker(queue_path: str, worker_id: str):
+    """작업을 임대해 payload를 그대로 결과로 보고하는 가짜 워커"""
+    queue = SqliteWorkQueue(queue_path)
+    while True:
+        task = queue.lease(worker_id)
+        if task is None:
+            totals = queue.stats()["totals"]
+            if not totals.get("pending") and not totals.get("leased"):
+                break
+            time.sleep(0.05)
+            continue
+        queue.complete(task["id"], task["lease_token"], {"worker": worker_id, **task["payload"]})
+    queue.close()
+
+
+def test_local_workers_process_each_task_once():
+    """여러 워커 프로세스가 같은 큐 파일을 공유해도 작업마다 한 번씩만 완료"""
+    queue_path = Path(tempfile.mkdtemp()) / "queue.sqlite"
+    queue = SqliteWorkQueue(queue_path)
+    for i in range(60):
+        queue.enqueue("saramin", "detail", {"url": f"https://example.com/{i}"}, dedupe_key=str(i))
+    # 중복 등록은 무시
+    assert queue.enqueue("saramin", "detail", {"url": "https://example.com/0"}, dedupe_key="0") is None
+
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_worker, args=(str(queue_path), f"w{i}")) for i in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=60)
+
+    results = list(queue.iter_results("detail"))
+    assert len(results) == 60
+    assert sorted(item["result"]["url"] for item in results) == sorted(f"https://example.com/{i}" for i in range(60))
+    assert queue.stats()["totals"] == {"done": 60}
+    queue.close()
+
+
+def test_lease_expiry_and_idempotent_completion():
+    """임대 기간이 지나면 다른 워커가 가져가고, 완료 보고는 한 번만 반영"""
+    queue = SqliteWorkQueue(Path(tempfile.mkdtemp()) / "queue.sqlite")
+    queue.enqueue("incruit", "search", {"keyword": "반도체"})
+
+    first = queue.lease("w1", visibility_timeout=0.1)
+    assert queue.lease("w2") is None
+    time.sleep(0.2)
+    second = queue.lease("w2")
+    assert second["id"] == first["id"] and second["attempts"] == 2
+
+    # 임대를 잃은 워커의 실패 보고는 무시
+    assert queue.fail(first["id"], first["lease_token"], "timeout") == ""
+    assert queue.complete(second["id"], second["lease_token"], {"links": []}) is True
+    assert queue.complete(first["id"], first["lease_token"], {"links": []}) is False
+    queue.close()
+
+
+def test_site_rate_limit_is_global():
+    """사이트 요청 간격은 워커와 관계없이 페이지 이동마다 큐 전체에 적용"""
+    queue = SqliteWorkQueue(Path(tempfile.mkdtemp()) / "queue.sqlite")
+    queue.set_site_rate("alba", requests_per_second=2)
+    queue.enqueue("alba", "detail", {"url": "a"})
+    queue.enqueue("alba", "detail", {"url": "b"})
+    queue.enqueue("worknet", "detail", {"url": "c"})
+
+    # 임대 자체는 요청 간격을 차감하지 않음
+    assert queue.lease("w1")["site"] == "alba"
+    assert queue.lease("w2")["payload"] == {"url": "b"}
+
+    # 한 작업이 여러 페이지를 열면 이동마다 0.5초씩 뒤의 슬롯을 예약
+    waits = [queue.reserve_slot("alba") for _ in range(3)]
+    assert waits[0] == 0
+    assert 0.4 < waits[1] <= 0.5 and 0.9 < waits[2] <= 1.0
+    assert queue.reserve_slot("worknet") == 0
+
+    # 예약된 슬롯이 지나기 전에는 다른 워커도 alba 작업을 임대하지 않음
+    queue.enqueue("alba", "detail", {"url": "d"})
+    assert queue.lease("w3")["site"] == "worknet"
+    assert queue.lease("w4") is None
+    queue.close()
+
+
+def test_enqueue_merges_keywords_into_pending_task():
+    """같은 공고가 여러 키워드 검색에 걸리면 대기 중인 상세 작업에 키워드를 누적"""
+    queue = SqliteWorkQueue(Path(tempfile.mkdtemp()) / "queue.sqlite")
+    first = queue.enqueue("saramin", "detail", {"url": "u", "keywords": ["반도체"]}, dedupe_key="u", merge="keywords")
+    assert queue.enqueue("saramin", "detail", {"url": "u", "keywords": ["중국"]}, dedupe_key="u", merge="keywords") is None
+    assert queue.enqueue("saramin", "detail", {"url": "u", "keywords": ["반도체"]}, dedupe_key="u", merge="keywords") is None
+
+    task = queue.lease("w1")
+    assert task["id"] == first and task["payload"]["keywords"] == ["반도체", "중국"]
+    queue.close()
+
+
+def test_http_coordinator():
+    """HTTP 코디네이터를 거친 임대/완료"""
+    queue = SqliteWorkQueue(Path(tempfile.mkdtemp()) / "queue.sqlite")
+    completed = []
+    server = serve_work_queue(queue, "secret", "127.0.0.1", 0,
+                              on_complete=lambda task_id, result: completed.append(task_id))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        # 토큰이 없거나 다르면 거부
+        with pytest.raises(urllib.error.HTTPError) as rejected:
+            HttpWorkQueue(base_url, "wrong").enqueue("saramin", "detail", {"url": "https://example.com/0"})
+        assert rejected.value.code == 401
+
+        client = HttpWorkQueue(base_url, "secret")
+        task_id = client.enqueue("saramin", "detail", {"url": "https://example.com/1"})
+        task = client.lease("remote-1")
+        assert task["id"] == task_id
+        assert client.complete(task["id"], task["lease_token"], {"job": {"title": "t"}, "site_name": "사람인"})
+        assert not client.complete(task["id"], task["lease_token"], {"job": {"title": "t"}, "site_name": "사람인"})
+        assert completed == [task_id]
+        assert client.stats()["totals"] == {"done": 1}
+    finally:
+        server.shutdown()
+        server.server_close()
+        queue.close()
+
+
+if __name__ == "__main__":
+    test_local_workers_process_each_task_once()
+    test_lease_expiry_and_idempotent_completion()
+    test_site_rate_limit_is_global()
+    test_enqueue_merges_keywords_into_pending_task()
+    test_http_coordinator()
+    print("작업 큐 테스트 통과")